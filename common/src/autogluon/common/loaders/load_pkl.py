@@ -3,12 +3,19 @@ import logging
 import pickle
 
 from ..loaders import load_pointer
-from ..utils import compression_utils, s3_utils
+from ..utils import compression_utils, pickle_buffer_utils, s3_utils
 
 logger = logging.getLogger(__name__)
 
 
-def load(path, format=None, verbose=True, **kwargs):
+def load(path, format=None, verbose=True, mmap_buffers: bool = True, **kwargs):
+    """
+    Loads a pickled object from `path`.
+
+    If the object was saved with out-of-band buffers (refer to `save_pkl.save`), the buffers are loaded from the buffers directory referenced by the pickle file.
+    If `mmap_buffers=True`, they are memory-mapped copy-on-write instead of read into memory:
+    numpy arrays backed by these buffers are writable, but modifications are private to the process and never written to disk.
+    """
     compression_fn = kwargs.get("compression_fn", None)
     compression_fn_kwargs = kwargs.get("compression_fn_kwargs", None)
 
@@ -20,7 +27,7 @@ def load(path, format=None, verbose=True, **kwargs):
         content_path = load_pointer.get_pointer_content(path)
         if content_path == path:
             raise RecursionError("content_path == path! : " + str(path))
-        return load(path=content_path)
+        return load(path=content_path, mmap_buffers=mmap_buffers)
     elif format == "s3":
         import boto3
 
@@ -41,7 +48,10 @@ def load(path, format=None, verbose=True, **kwargs):
 
     if compression_fn in compression_fn_map:
         with compression_fn_map[compression_fn]["open"](validated_path, "rb", **compression_fn_kwargs) as fin:
-            object = pickle.load(fin)
+            if compression_fn is None:
+                object = pickle_buffer_utils.load(fin, path=validated_path, mmap_mode=mmap_buffers)
+            else:
+                object = pickle.load(fin)
     else:
         raise ValueError(
             f"compression_fn={compression_fn} or compression_fn_kwargs={compression_fn_kwargs} are not valid."
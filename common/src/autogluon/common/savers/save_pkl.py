@@ -4,7 +4,7 @@ import os
 import pickle
 import tempfile
 
-from ..utils import compression_utils, s3_utils
+from ..utils import compression_utils, pickle_buffer_utils, s3_utils
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,17 @@ compression_fn_map = compression_utils.get_compression_map()
 
 
 # TODO: object -> obj?
-def save(path, object, format=None, verbose=True, **kwargs):
+def save(path, object, format=None, verbose=True, oob_buffer_min_size: int = None, **kwargs):
+    """
+    Pickles `object` to `path`.
+
+    If `oob_buffer_min_size` is specified, the object is pickled with protocol 5 and every buffer (such as the data of a numpy array)
+    of at least `oob_buffer_min_size` bytes is stored out-of-band as a separate file in a new buffers directory next to `path`.
+    The pickle file references this directory by name, and `load_pkl.load` memory-maps its files instead of reading them into memory.
+    Out-of-band buffers are only used for uncompressed local files, otherwise the object is pickled with all buffers in-band.
+    The pickle file is written to a temporary file that atomically replaces `path` once its buffers are fully written.
+    Only then are the buffers referenced by the previous pickle file at `path` deleted.
+    """
     compression_fn = kwargs.get("compression_fn", None)
     compression_fn_kwargs = kwargs.get("compression_fn_kwargs", None)
 
@@ -21,10 +31,44 @@ def save(path, object, format=None, verbose=True, **kwargs):
     else:
         raise ValueError(f"compression_fn={compression_fn} is not a valid compression_fn. Valid values: {compression_fn_map.keys()}")
 
+    is_local = format != "s3" and not s3_utils.is_s3_url(validated_path)
+    old_buffers_dir = pickle_buffer_utils.get_buffers_dir(validated_path) if is_local else None
+    if oob_buffer_min_size is not None and is_local and compression_fn is None:
+        buffers_dir = None
+
+        def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            return buffer.raw().nbytes < oob_buffer_min_size  # serialize small buffers in-band
+
+        def pickle_fn(o, buffer):
+            nonlocal buffers_dir
+            buffers_dir = pickle_buffer_utils.dump(o, buffer, path=validated_path, buffer_callback=buffer_callback)
+
+        if verbose:
+            logger.log(15, "Saving " + str(validated_path))
+        path_parent = os.path.dirname(validated_path)
+        if path_parent == "":
+            path_parent = "."
+        os.makedirs(path_parent, exist_ok=True)
+        fd, path_tmp = tempfile.mkstemp(prefix=os.path.basename(validated_path) + ".tmp", dir=path_parent)
+        os.close(fd)
+        try:
+            save_with_fn(path_tmp, object, pickle_fn, format=format, verbose=False)
+            os.replace(path_tmp, validated_path)
+        except Exception:
+            if os.path.exists(path_tmp):
+                os.remove(path_tmp)
+            pickle_buffer_utils.remove_buffers_dir(buffers_dir)
+            raise
+        # The previous pickle file at `path` was replaced, so its out-of-band buffers are no longer referenced
+        pickle_buffer_utils.remove_buffers_dir(old_buffers_dir)
+        return
+
     def pickle_fn(o, buffer):
         return pickle.dump(o, buffer, protocol=4)
 
     save_with_fn(validated_path, object, pickle_fn, format=format, verbose=verbose, compression_fn=compression_fn, compression_fn_kwargs=compression_fn_kwargs)
+    # Avoid keeping out-of-band buffers of a previous save to the same path that are no longer referenced
+    pickle_buffer_utils.remove_buffers_dir(old_buffers_dir)
 
 
 def save_with_fn(path, object, pickle_fn, format=None, verbose=True, compression_fn=None, compression_fn_kwargs=None):
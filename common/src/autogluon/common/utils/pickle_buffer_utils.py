@@ -0,0 +1,159 @@
+"""
+Utilities to store the out-of-band buffers of a pickle protocol 5 artifact as separate files.
+
+An artifact saved to `path` with out-of-band buffers consists of the pickle file at `path` and a buffers directory next to it
+containing one file per buffer, named by the buffer's position in the pickle stream.
+Each buffer is stored in its own file so that it starts at a page-aligned offset and can be memory-mapped on load.
+
+Every save writes its buffers to a new, uniquely named directory. The pickle file starts with `MAGIC` and ends with a footer
+that stores the name of this directory and the number of buffers, so a pickle file only ever references the buffers it was saved with.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+from typing import IO, List, Optional, Union
+
+# Pickle streams of protocol >= 2 start with the PROTO opcode (b"\x80"), so plain pickle files never start with MAGIC
+MAGIC = b"\x00AGPKLOOB"
+BUFFERS_DIR_SUFFIX = ".buffers"
+_FOOTER_SIZE = struct.Struct("<Q")
+
+
+def _get_parent_dir(path: str) -> str:
+    path_parent = os.path.dirname(path)
+    if path_parent == "":
+        path_parent = "."
+    return path_parent
+
+
+def _get_buffer_file_path(buffers_dir: str, index: int) -> str:
+    return os.path.join(buffers_dir, f"{index}.bin")
+
+
+def _read_footer(f: IO[bytes]) -> Optional[dict]:
+    f.seek(0)
+    if f.read(len(MAGIC)) != MAGIC:
+        f.seek(0)
+        return None
+    f.seek(-_FOOTER_SIZE.size, os.SEEK_END)
+    (footer_size,) = _FOOTER_SIZE.unpack(f.read(_FOOTER_SIZE.size))
+    f.seek(-_FOOTER_SIZE.size - footer_size, os.SEEK_END)
+    footer = pickle.loads(f.read(footer_size))
+    f.seek(len(MAGIC))
+    return footer
+
+
+def get_buffers_dir(path: str) -> Optional[str]:
+    """Returns the directory that holds the out-of-band buffers of the pickle file at `path`, or None if it has no out-of-band buffers."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        footer = _read_footer(f)
+    if footer is None:
+        return None
+    return os.path.join(_get_parent_dir(path), footer["buffers_dir"])
+
+
+def save_buffers(path: str, buffers: List[pickle.PickleBuffer]) -> str:
+    """
+    Saves the out-of-band `buffers` of the pickle file at `path` to a new, uniquely named directory and returns its path.
+
+    Previously saved buffers are left untouched, so that the pickle file currently at `path` and processes
+    which memory-mapped its buffers stay valid. Use `remove_buffers_dir` once they are no longer referenced.
+    """
+    buffers_dir = tempfile.mkdtemp(prefix=os.path.basename(path) + BUFFERS_DIR_SUFFIX + ".", dir=_get_parent_dir(path))
+    try:
+        for i, buffer in enumerate(buffers):
+            with open(_get_buffer_file_path(buffers_dir, i), "wb") as f:
+                f.write(buffer.raw())
+    except OSError:
+        shutil.rmtree(buffers_dir, ignore_errors=True)
+        raise
+    return buffers_dir
+
+
+def remove_buffers_dir(buffers_dir: Optional[str]):
+    """Deletes the buffers directory `buffers_dir` if it exists."""
+    if buffers_dir is not None and os.path.isdir(buffers_dir):
+        shutil.rmtree(buffers_dir)
+
+
+def dump(obj, f: IO[bytes], path: str, buffer_callback) -> Optional[str]:
+    """
+    Pickles `obj` with protocol 5 to the file object `f` that will be stored at `path`.
+
+    Buffers for which `buffer_callback` returns False are saved out-of-band with `save_buffers`.
+    The pickle stream is preceded by `MAGIC` and followed by a footer referencing the buffers directory.
+
+    Returns
+    -------
+    Path of the new buffers directory, or None if all buffers were stored in-band.
+    """
+    buffers = []
+
+    def _buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        if buffer_callback(buffer):
+            return True
+        buffers.append(buffer)
+        return False
+
+    f.write(MAGIC)
+    pickle.dump(obj, f, protocol=5, buffer_callback=_buffer_callback)
+    buffers_dir = save_buffers(path, buffers)
+    try:
+        footer = pickle.dumps({"buffers_dir": os.path.basename(buffers_dir), "num_buffers": len(buffers)}, protocol=4)
+        f.write(footer)
+        f.write(_FOOTER_SIZE.pack(len(footer)))
+    except Exception:
+        remove_buffers_dir(buffers_dir)
+        raise
+    return buffers_dir
+
+
+def load(f: IO[bytes], path: str, mmap_mode: bool = True):
+    """
+    Loads a pickled object from the file object `f` opened from `path`, including its out-of-band buffers if it was saved with `dump`.
+
+    Parameters
+    ----------
+    f : IO[bytes]
+        Seekable file object of the pickle file.
+    path : str
+        Path to the pickle file, used to locate the buffers directory.
+    mmap_mode : bool, default = True
+        If True, buffers are memory-mapped copy-on-write, so that multiple processes loading the same artifact share one physical copy
+        and pages are only read from disk when accessed. Objects reconstructed from these buffers (such as numpy arrays) are writable,
+        and a page is only copied into private memory when it is modified. Modifications are never written back to the file.
+        If False, buffers are read into memory.
+    """
+    footer = _read_footer(f)
+    if footer is None:
+        return pickle.load(f)
+    buffers_dir = os.path.join(_get_parent_dir(path), footer["buffers_dir"])
+    buffers = load_buffers(buffers_dir, num_buffers=footer["num_buffers"], mmap_mode=mmap_mode)
+    return pickle.load(f, buffers=buffers)
+
+
+def load_buffers(buffers_dir: str, num_buffers: int, mmap_mode: bool = True) -> List[Union[mmap.mmap, bytes]]:
+    """
+    Loads the first `num_buffers` out-of-band buffers from `buffers_dir`. Other files in the directory are ignored.
+
+    Returns
+    -------
+    List of buffers in the order expected by `pickle.load(..., buffers=...)`.
+    """
+    buffers = []
+    for i in range(num_buffers):
+        with open(_get_buffer_file_path(buffers_dir, i), "rb") as f:
+            # Empty files cannot be memory-mapped
+            if mmap_mode and os.fstat(f.fileno()).st_size > 0:
+                buffers.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+            else:
+                buffers.append(f.read())
+    return buffers
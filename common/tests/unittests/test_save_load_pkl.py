@@ -0,0 +1,128 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.common.loaders import load_pkl
+from autogluon.common.savers import save_pkl
+from autogluon.common.utils import pickle_buffer_utils
+
+
+def _get_dummy_object():
+    return {
+        "large": np.arange(10000, dtype=np.float64),
+        "small": np.ones(3),
+        "fortran": np.asfortranarray(np.arange(200 * 300, dtype=np.float32).reshape(200, 300)),
+        "df": pd.DataFrame({"a": np.arange(5000), "b": np.arange(5000) * 0.5}),
+        "meta": "foo",
+    }
+
+
+def _assert_equal(obj, expected):
+    assert obj.keys() == expected.keys()
+    np.testing.assert_array_equal(obj["large"], expected["large"])
+    np.testing.assert_array_equal(obj["small"], expected["small"])
+    np.testing.assert_array_equal(obj["fortran"], expected["fortran"])
+    assert obj["fortran"].flags.f_contiguous
+    pd.testing.assert_frame_equal(obj["df"], expected["df"])
+    assert obj["meta"] == expected["meta"]
+
+
+def test_save_load_pkl_oob_buffers(tmp_path):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    save_pkl.save(path=path, object=expected, oob_buffer_min_size=1024)
+    assert os.path.isdir(pickle_buffer_utils.get_buffers_dir(path))
+    # Stray files in the buffers directory are ignored
+    with open(os.path.join(pickle_buffer_utils.get_buffers_dir(path), "stray.bin"), "wb") as f:
+        f.write(b"foo")
+
+    obj = load_pkl.load(path=path)
+    _assert_equal(obj, expected)
+    # Large buffers are memory-mapped copy-on-write, small buffers are stored in-band
+    assert obj["large"].flags.writeable
+    assert obj["small"].flags.writeable
+    obj["large"][0] = -1
+    # Modifications of memory-mapped buffers are not written back to disk
+    _assert_equal(load_pkl.load(path=path), expected)
+
+    obj = load_pkl.load(path=path, mmap_buffers=False)
+    _assert_equal(obj, expected)
+
+
+def test_save_pkl_overwrite_removes_stale_buffers(tmp_path):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    save_pkl.save(path=path, object=expected, oob_buffer_min_size=1024)
+    buffers_dir = pickle_buffer_utils.get_buffers_dir(path)
+    obj_mmap = load_pkl.load(path=path)
+
+    # Overwriting an artifact writes new buffers, deletes the previous ones and keeps previously memory-mapped buffers valid
+    save_pkl.save(path=path, object=expected, oob_buffer_min_size=1024)
+    new_buffers_dir = pickle_buffer_utils.get_buffers_dir(path)
+    assert new_buffers_dir != buffers_dir
+    assert not os.path.exists(buffers_dir)
+    assert sorted(os.listdir(tmp_path)) == sorted(["obj.pkl", os.path.basename(new_buffers_dir)])
+    _assert_equal(obj_mmap, expected)
+
+    save_pkl.save(path=path, object=expected)
+    assert pickle_buffer_utils.get_buffers_dir(path) is None
+    assert os.listdir(tmp_path) == ["obj.pkl"]
+    obj = load_pkl.load(path=path)
+    _assert_equal(obj, expected)
+    assert obj["large"].flags.writeable
+
+
+def test_save_pkl_oob_buffers_ignored_with_compression(tmp_path):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    save_pkl.save(path=path, object=expected, compression_fn="gzip", oob_buffer_min_size=1024)
+    validated_path = path + ".gz"
+    assert os.path.isfile(validated_path)
+    assert pickle_buffer_utils.get_buffers_dir(validated_path) is None
+    assert os.listdir(tmp_path) == ["obj.pkl.gz"]
+    obj = load_pkl.load(path=path, compression_fn="gzip")
+    _assert_equal(obj, expected)
+
+
+def test_save_pkl_oob_buffers_failure_keeps_previous_artifact(tmp_path):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    save_pkl.save(path=path, object=expected, oob_buffer_min_size=1024)
+    buffers_dir = pickle_buffer_utils.get_buffers_dir(path)
+
+    unpicklable = dict(expected, meta=lambda x: x)
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        save_pkl.save(path=path, object=unpicklable, oob_buffer_min_size=1024)
+    # The failed save neither replaced the pickle file nor left temporary files behind
+    assert sorted(os.listdir(tmp_path)) == sorted(["obj.pkl", os.path.basename(buffers_dir)])
+    _assert_equal(load_pkl.load(path=path), expected)
+
+
+def test_save_pkl_oob_buffers_keeps_previous_artifact_loadable_until_replaced(tmp_path, monkeypatch):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    save_pkl.save(path=path, object=expected, oob_buffer_min_size=1024)
+    new_expected = dict(expected, large=np.arange(20000, dtype=np.float64))
+
+    os_replace = os.replace
+
+    def replace(src, dst):
+        # The new buffers are fully written, but the previous pickle file still references its own buffers
+        _assert_equal(load_pkl.load(path=path), expected)
+        os_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace)
+    save_pkl.save(path=path, object=new_expected, oob_buffer_min_size=1024)
+    _assert_equal(load_pkl.load(path=path), new_expected)
+
+
+def test_load_pkl_plain_pickle_file(tmp_path):
+    path = str(tmp_path / "obj.pkl")
+    expected = _get_dummy_object()
+    with open(path, "wb") as f:
+        pickle.dump(expected, f, protocol=5)
+    assert pickle_buffer_utils.get_buffers_dir(path) is None
+    _assert_equal(load_pkl.load(path=path), expected)
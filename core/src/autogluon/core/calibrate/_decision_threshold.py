@@ -5,16 +5,15 @@ from typing import Callable, List, Union
 
 import numpy as np
 import pandas as pd
+import sklearn.metrics
 
 from ..constants import BINARY
-from ..metrics import Scorer
+from ..metrics import Scorer, classification_metrics
 from ..utils import get_pred_from_proba
 
 logger = logging.getLogger(__name__)
 
 
-# TODO: docstring
-# TODO: Can use a smarter search strategy than brute force for faster speed, such as bayes opt.
 def calibrate_decision_threshold(
     y: np.array,
     y_pred_proba: np.array,
@@ -27,6 +26,48 @@ def calibrate_decision_threshold(
     metric_name: str | None = None,
     verbose: bool = True,
 ) -> float:
+    """
+    Finds the decision threshold for the positive class that maximizes `metric` on (y, y_pred_proba) for binary classification.
+
+    If `metric` is a confusion matrix based Scorer (accuracy, balanced_accuracy, f1, precision, recall, mcc) without extra arguments
+    and `decision_thresholds` is an int, an exact search is performed: every unique value of `y_pred_proba` (and 0.5) is checked
+    in a single O(n log n) pass based on cumulative true positive and false positive counts, which covers every distinct prediction.
+
+    Otherwise, a grid of `decision_thresholds` thresholds is checked first, followed by a finer grid of `secondary_decision_thresholds` thresholds
+    around the best threshold found, calling `metric` once per threshold.
+
+    In both cases, ties are broken in favor of the threshold closest to 0.5.
+
+    Parameters
+    ----------
+    y : np.array
+        Ground truth labels, with 1 as the positive class.
+    y_pred_proba : np.array
+        Predicted probabilities of the positive class.
+    metric : Union[Callable, Scorer]
+        The metric to maximize. Called as `metric(y, y_pred, **metric_kwargs)`.
+    metric_kwargs : dict, default = None
+        Extra arguments passed to `metric`.
+    decision_thresholds : int | List[float], default = 25
+        If int, checks `decision_thresholds * 2 + 1` thresholds evenly spaced between 0 and 1.
+        Ignored if the exact search is used.
+        If List[float], checks only the given thresholds. This also disables the exact search.
+    secondary_decision_thresholds : int | None, default = 19
+        The number of thresholds checked between the best threshold and its neighbors. If None, skips the secondary search.
+        Ignored if the exact search is used.
+    subsample_size : int | None, default = None
+        If specified, subsamples y and y_pred_proba to at most `subsample_size` rows.
+    seed : int, default = 0
+        Random seed used for subsampling.
+    metric_name : str | None, default = None
+        Name of the metric used in logging. Inferred from `metric` if it is a Scorer.
+    verbose : bool, default = True
+        If True, logs the score of each checked threshold.
+
+    Returns
+    -------
+    The optimal decision threshold.
+    """
     assert isinstance(decision_thresholds, (int, list)), f"decision_thresholds must be int or List[float] (decision_thresholds={decision_thresholds})"
     assert secondary_decision_thresholds is None or isinstance(
         secondary_decision_thresholds, int
@@ -66,6 +107,18 @@ def calibrate_decision_threshold(
             return 0.5
     metric_name_log = f" {metric_name}" if metric_name is not None else ""
 
+    # For confusion matrix metrics, all thresholds are scored at once from the cumulative true positive and false positive counts.
+    score_thresholds_func_confusion_matrix = _get_score_thresholds_func_confusion_matrix(
+        y=y, y_pred_proba=y_pred_proba, metric=metric, metric_kwargs=metric_kwargs
+    )
+    if score_thresholds_func_confusion_matrix is not None and isinstance(decision_thresholds, int):
+        return _calibrate_decision_threshold_exact(
+            y_pred_proba=y_pred_proba,
+            score_thresholds_func=score_thresholds_func_confusion_matrix,
+            metric_name_log=metric_name_log,
+            verbose=verbose,
+        )
+
     if isinstance(decision_thresholds, int):
         # Order thresholds by their proximity to 0.5
         num_checks_half = decision_thresholds
@@ -79,25 +132,28 @@ def calibrate_decision_threshold(
     best_score_val = None
     best_threshold = None
 
-    y_pred_val = get_pred_from_proba(
-        y_pred_proba=y_pred_proba,
-        problem_type=problem_type,
-        decision_threshold=0.5,
-    )
-    # TODO: Avoid calling like this, reuse logic that works with weights + extra args
-    score_val_baseline = metric(y, y_pred_val, **metric_kwargs)
+    # Otherwise, the metric is called on the class predictions of each threshold.
+    score_thresholds_func = score_thresholds_func_confusion_matrix
+    if score_thresholds_func is None:
+
+        def score_thresholds_func(thresholds: List[float]) -> List[float]:
+            scores = []
+            for threshold in thresholds:
+                y_pred_val = get_pred_from_proba(
+                    y_pred_proba=y_pred_proba,
+                    problem_type=problem_type,
+                    decision_threshold=threshold,
+                )
+                # TODO: Avoid calling like this, reuse logic that works with weights + extra args
+                scores.append(metric(y, y_pred_val, **metric_kwargs))
+            return scores
+
+    score_val_baseline = score_thresholds_func([0.5])[0]
 
     if verbose:
         logger.log(20, f"Calibrating decision threshold to optimize metric{metric_name_log} " f"| Checking {len(decision_thresholds)} thresholds...")
-    for decision_threshold in decision_thresholds:
+    for decision_threshold, score_val in zip(decision_thresholds, score_thresholds_func(decision_thresholds)):
         extra_log = ""
-        y_pred_val = get_pred_from_proba(
-            y_pred_proba=y_pred_proba,
-            problem_type=problem_type,
-            decision_threshold=decision_threshold,
-        )
-        # TODO: Avoid calling like this, reuse logic that works with weights + extra args
-        score_val = metric(y, y_pred_val, **metric_kwargs)
 
         if best_score_val is None or score_val > best_score_val:
             best_threshold = decision_threshold
@@ -133,14 +189,8 @@ def calibrate_decision_threshold(
         if verbose and secondary_thresholds:
             logger.log(20, f"Calibrating decision threshold via fine-grained search " f"| Checking {len(secondary_thresholds)} thresholds...")
 
-        for decision_threshold in secondary_thresholds:
+        for decision_threshold, score_val in zip(secondary_thresholds, score_thresholds_func(secondary_thresholds)):
             extra_log = ""
-            y_pred_val = get_pred_from_proba(
-                y_pred_proba=y_pred_proba,
-                problem_type=problem_type,
-                decision_threshold=decision_threshold,
-            )
-            score_val = metric(y, y_pred_val, **metric_kwargs)
 
             if best_score_val is None or score_val > best_score_val:
                 best_threshold = decision_threshold
@@ -160,3 +210,141 @@ def calibrate_decision_threshold(
         logger.log(20, f"\tBase Threshold: {0.5:.3f}\t| val: {score_val_baseline:.4f}")
         logger.log(20, f"\tBest Threshold: {best_threshold:.3f}\t| val: {best_score_val:.4f}")
     return best_threshold
+
+
+def _calibrate_decision_threshold_exact(
+    y_pred_proba: np.ndarray,
+    score_thresholds_func: Callable[[List[float]], np.ndarray],
+    metric_name_log: str = "",
+    verbose: bool = True,
+) -> float:
+    """
+    Scores every unique value of `y_pred_proba` as a decision threshold and returns the best one.
+    Because the class predictions are `y_pred_proba > threshold`, any other threshold produces the same predictions as one of these.
+    0.5 is always checked, and ties are broken in favor of the threshold closest to 0.5.
+    """
+    decision_thresholds = np.unique(np.concatenate([y_pred_proba, [0.5]]))
+    decision_thresholds = decision_thresholds[(decision_thresholds >= 0) & (decision_thresholds <= 1)]
+    if verbose:
+        logger.log(
+            20, f"Calibrating decision threshold to optimize metric{metric_name_log} " f"| Checking {len(decision_thresholds)} thresholds (exact search)..."
+        )
+    scores = score_thresholds_func(decision_thresholds)
+    score_val_baseline = scores[np.searchsorted(decision_thresholds, 0.5)]
+    best_score_val = scores.max()
+    is_best = scores == best_score_val
+    best_threshold = float(decision_thresholds[is_best][np.argmin(np.abs(decision_thresholds[is_best] - 0.5))])
+    if verbose:
+        logger.log(20, f"\tBase Threshold: {0.5:.3f}\t| val: {score_val_baseline:.4f}")
+        logger.log(20, f"\tBest Threshold: {best_threshold:.3f}\t| val: {best_score_val:.4f}")
+    return best_threshold
+
+
+def _get_confusion_matrix_counts(y: np.ndarray, y_pred_proba: np.ndarray, thresholds: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    Computes the binary confusion matrix counts (tp, fp, fn, tn) of `y_pred_proba > threshold` for every threshold in `thresholds`.
+    Requires a single sort of `y_pred_proba`, and is thus O(n log n + k log n) for n samples and k thresholds instead of O(n * k).
+    """
+    sort_indices = np.argsort(y_pred_proba, kind="stable")
+    y_pred_proba_sorted = y_pred_proba[sort_indices]
+    # num_pos_cumsum[i] is the number of positive samples among the i samples with the lowest y_pred_proba
+    num_pos_cumsum = np.concatenate([[0], np.cumsum(y[sort_indices], dtype=np.int64)])
+    num_samples = len(y)
+    num_pos = num_pos_cumsum[-1]
+    num_neg = num_samples - num_pos
+
+    # Number of samples predicted as negative, matching the `y_pred_proba > threshold` logic in `get_pred_from_proba`
+    num_pred_neg = np.searchsorted(y_pred_proba_sorted, thresholds, side="right")
+    fn = num_pos_cumsum[num_pred_neg]
+    tn = num_pred_neg - fn
+    tp = num_pos - fn
+    fp = num_neg - tn
+    return tp, fp, fn, tn
+
+
+def _accuracy_from_confusion_matrix(tp, fp, fn, tn):
+    return (tp + tn) / (tp + fp + fn + tn)
+
+
+def _prf_divide(numerator, denominator):
+    # Equivalent to sklearn's `zero_division="warn"` logic, returning 0 when the denominator is 0
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator), dtype=np.float64), where=denominator != 0)
+
+
+def _precision_from_confusion_matrix(tp, fp, fn, tn):
+    return _prf_divide(tp, tp + fp)
+
+
+def _recall_from_confusion_matrix(tp, fp, fn, tn):
+    return _prf_divide(tp, tp + fn)
+
+
+def _f1_from_confusion_matrix(tp, fp, fn, tn):
+    # Same operation order as sklearn's `fbeta_score` with beta=1
+    return _prf_divide(2 * tp, (tp + fn) + (tp + fp))
+
+
+def _mcc_from_confusion_matrix(tp, fp, fn, tn):
+    # Same operation order as `sklearn.metrics.matthews_corrcoef`
+    tp, fp, fn, tn = tp.astype(np.float64), fp.astype(np.float64), fn.astype(np.float64), tn.astype(np.float64)
+    t_sum_neg, t_sum_pos = tn + fp, fn + tp
+    p_sum_neg, p_sum_pos = tn + fn, fp + tp
+    n_correct = tn + tp
+    n_samples = p_sum_neg + p_sum_pos
+    cov_ytyp = n_correct * n_samples - (t_sum_neg * p_sum_neg + t_sum_pos * p_sum_pos)
+    cov_ypyp = n_samples**2 - (p_sum_neg * p_sum_neg + p_sum_pos * p_sum_pos)
+    cov_ytyt = n_samples**2 - (t_sum_neg * t_sum_neg + t_sum_pos * t_sum_pos)
+    denominator = cov_ytyt * cov_ypyp
+    return np.divide(cov_ytyp, np.sqrt(denominator), out=np.zeros(len(tp), dtype=np.float64), where=denominator != 0)
+
+
+def _balanced_accuracy_from_confusion_matrix(tp, fp, fn, tn):
+    # Same operation order as `classification_metrics.balanced_accuracy` for binary inputs
+    eps = 1e-15
+    tp = np.maximum(eps, tp.astype(np.float64))
+    tpr = tp / np.maximum(eps, tp + fn)
+    tn = np.maximum(eps, tn.astype(np.float64))
+    tnr = tn / np.maximum(eps, tn + fp)
+    return 0.5 * (tpr + tnr)
+
+
+_CONFUSION_MATRIX_SCORE_FUNCS = {
+    sklearn.metrics.accuracy_score: _accuracy_from_confusion_matrix,
+    sklearn.metrics.precision_score: _precision_from_confusion_matrix,
+    sklearn.metrics.recall_score: _recall_from_confusion_matrix,
+    sklearn.metrics.f1_score: _f1_from_confusion_matrix,
+    sklearn.metrics.matthews_corrcoef: _mcc_from_confusion_matrix,
+    classification_metrics.balanced_accuracy: _balanced_accuracy_from_confusion_matrix,
+}
+
+
+def _get_score_thresholds_func_confusion_matrix(
+    y: np.ndarray, y_pred_proba: np.ndarray, metric: Union[Callable, Scorer], metric_kwargs: dict
+) -> Callable[[List[float]], np.ndarray] | None:
+    """
+    Returns a function that scores a list of decision thresholds in a single vectorized pass if `metric` is a confusion matrix based metric,
+    with identical scores to calling `metric` on the class predictions of each threshold.
+    Returns None if the metric is not supported, such as custom metrics, metrics with extra arguments, or non 0/1 labels.
+    """
+    if not isinstance(metric, Scorer) or metric_kwargs or metric._kwargs:
+        return None
+    score_func = metric._score_func
+    try:
+        confusion_matrix_score_func = _CONFUSION_MATRIX_SCORE_FUNCS.get(score_func, None)
+    except TypeError:
+        # unhashable score_func
+        return None
+    if confusion_matrix_score_func is None:
+        return None
+    if not np.isin(y, [0, 1]).all() or np.isnan(y_pred_proba).any():
+        return None
+    y = y.astype(np.int64)
+    sign = metric._sign
+
+    def _score_thresholds(thresholds: List[float]) -> np.ndarray:
+        if len(thresholds) == 0:
+            return np.array([], dtype=np.float64)
+        tp, fp, fn, tn = _get_confusion_matrix_counts(y=y, y_pred_proba=y_pred_proba, thresholds=np.asarray(thresholds))
+        return sign * confusion_matrix_score_func(tp, fp, fn, tn)
+
+    return _score_thresholds
@@ -51,6 +51,11 @@ class HpoExecutor(ABC):
     def time_limit(self, value):
         self._time_limit = value
 
+    @property
+    def runs_trials_in_parallel(self) -> bool:
+        """Whether multiple trials run at the same time, sharing the registered resources"""
+        return True
+
     @abstractmethod
     def initialize(self, hyperparameter_tune_kwargs: Union[str, dict], default_num_trials: Optional[int] = None, time_limit: Optional[float] = None):
         """
@@ -195,15 +200,13 @@ class HpoExecutor(ABC):
                     num_trials_in_parallel = 1
                 else:
                     num_trials_in_parallel = num_jobs_in_parallel // k_fold
-                if self.executor_type == "custom":
-                    # custom backend runs sequentially
+                if not self.runs_trials_in_parallel:
                     num_trials_in_parallel = 1
                 cpu_per_trial = int(num_cpus // num_trials_in_parallel)
                 gpu_per_trial = num_gpus // num_trials_in_parallel
             else:
                 num_trials = self.hyperparameter_tune_kwargs.get("num_trials", math.inf)
-                if self.executor_type == "custom":
-                    # custom backend runs sequentially
+                if not self.runs_trials_in_parallel:
                     num_jobs_in_parallel = 1
                 cpu_per_trial = int(num_cpus // min(num_jobs_in_parallel, num_trials))
                 gpu_per_trial = num_gpus / min(num_jobs_in_parallel, num_trials)
@@ -304,11 +307,13 @@ class RayHpoExecutor(HpoExecutor):
     custom_to_ray_preset_map = {
         "auto": {"scheduler": "FIFO", "searcher": "bayes"},
         "local_random": {"scheduler": "FIFO", "searcher": "random"},
+        "local_parallel_random": {"scheduler": "FIFO", "searcher": "random"},
         "distributed_random": {"scheduler": "FIFO", "searcher": "random"},
         "random": {"scheduler": "FIFO", "searcher": "random"},
     }
     custom_to_ray_scheduler_preset_map = {
         "local": "FIFO",
+        "local_parallel": "FIFO",
         "distributed": "FIFO",
     }
     custom_to_ray_searcher_preset_map = {
@@ -478,6 +483,11 @@ class CustomHpoExecutor(HpoExecutor):
         self.scheduler_options[1]["time_out"] = value
         self._time_limit = value
 
+    @property
+    def runs_trials_in_parallel(self):
+        # LocalSequentialScheduler runs trials one after another, LocalParallelScheduler runs them in a process pool
+        return self.scheduler_options is not None and getattr(self.scheduler_options[0], "runs_trials_in_parallel", False)
+
     def initialize(self, hyperparameter_tune_kwargs, default_num_trials=None, time_limit=None):
         if not isinstance(hyperparameter_tune_kwargs, tuple):
             if isinstance(hyperparameter_tune_kwargs, dict):
@@ -500,7 +510,7 @@ class CustomHpoExecutor(HpoExecutor):
         assert self.scheduler_options is not None, "Call `initialize()` before register resources"
         super().register_resources(initialized_model, **kwargs)
         if self.hyperparameter_tune_kwargs.get("resources_per_trial", None) is not None:
-            # Custom backend only run trials sequentially
+            # Each trial of the custom backend uses resources_per_trial, LocalParallelScheduler runs several of them at once
             self.scheduler_options[1]["resource"] = self.hyperparameter_tune_kwargs["resources_per_trial"]
         logger.debug(f"custom backend resource: {self.resources}, per trial resource: {self.hyperparameter_tune_kwargs}")
 
@@ -522,7 +532,9 @@ class CustomHpoExecutor(HpoExecutor):
         if scheduler_cls is None or scheduler_params is None:
             raise ValueError("scheduler_cls and scheduler_params cannot be None for hyperparameter tuning")
         train_fn_kwargs["fit_kwargs"].update(scheduler_params["resource"].copy())
-        scheduler = scheduler_cls(model_trial, search_space=self.search_space, train_fn_kwargs=train_fn_kwargs, **scheduler_params)
+        scheduler = scheduler_cls(
+            model_trial, search_space=self.search_space, train_fn_kwargs=train_fn_kwargs, total_resources=self.resources, **scheduler_params
+        )
         self.scheduler = scheduler
 
         scheduler.run()
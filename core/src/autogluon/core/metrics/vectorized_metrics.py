@@ -0,0 +1,90 @@
+"""
+Vectorized implementations of common metrics that score a batch of predictions against the same ground truth in a single array operation.
+
+Each function takes `y_true` of shape (n_samples,) and `y_pred_batch` of shape (n_batch, n_samples) or (n_batch, n_samples, n_classes),
+where `y_pred_batch[i]` is in the format that the corresponding Scorer expects as `y_pred`.
+Each function returns an array of shape (n_batch,) containing the metric value of each batch element in the original (unsigned) format of the score_func.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import scipy.stats
+import sklearn.metrics
+
+from . import Scorer, classification_metrics, customized_log_loss, rmse_func
+
+
+def log_loss_batch(y_true: np.ndarray, y_pred_batch: np.ndarray) -> np.ndarray:
+    """Vectorized `customized_log_loss`. Multiclass inputs follow the clipping and renormalization logic of `sklearn.metrics.log_loss`."""
+    if y_pred_batch.ndim == 2:
+        eps = 1e-15
+        y_pred_batch = np.clip(y_pred_batch.astype(float), eps, 1 - eps)
+        return -(y_true * np.log(y_pred_batch) + (1 - y_true) * np.log(1 - y_pred_batch)).mean(axis=1)
+    eps = np.finfo(y_pred_batch.dtype).eps
+    y_pred_batch = np.clip(y_pred_batch, eps, 1 - eps)
+    y_true = y_true.astype(np.int64)
+    y_pred_true = np.take_along_axis(y_pred_batch, y_true[np.newaxis, :, np.newaxis], axis=2)[:, :, 0]
+    y_pred_true = y_pred_true / y_pred_batch.sum(axis=2)
+    return -np.log(y_pred_true).mean(axis=1)
+
+
+def accuracy_batch(y_true: np.ndarray, y_pred_batch: np.ndarray) -> np.ndarray:
+    """Vectorized `sklearn.metrics.accuracy_score` given class predictions."""
+    return (y_pred_batch == y_true).mean(axis=1)
+
+
+def rmse_batch(y_true: np.ndarray, y_pred_batch: np.ndarray) -> np.ndarray:
+    """Vectorized `rmse_func`."""
+    return np.sqrt(((y_true - y_pred_batch) ** 2).mean(axis=1))
+
+
+def roc_auc_batch(y_true: np.ndarray, y_pred_batch: np.ndarray) -> np.ndarray:
+    """
+    Vectorized binary `customized_binary_roc_auc_score`.
+    Computed via the Mann-Whitney U statistic, where tied scores receive the average rank.
+    """
+    y_true = y_true.astype(bool)
+    num_pos = y_true.sum()
+    num_neg = y_true.size - num_pos
+    if num_pos == 0 or num_neg == 0:
+        raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+    ranks = scipy.stats.rankdata(y_pred_batch, axis=1)
+    rank_sum_pos = ranks[:, y_true].sum(axis=1)
+    return (rank_sum_pos - num_pos * (num_pos + 1) / 2) / (num_pos * num_neg)
+
+
+_VECTORIZED_SCORE_FUNCS: Dict[Callable, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    customized_log_loss: log_loss_batch,
+    sklearn.metrics.accuracy_score: accuracy_batch,
+    rmse_func: rmse_batch,
+    classification_metrics.customized_binary_roc_auc_score: roc_auc_batch,
+}
+
+
+def get_vectorized_score_func(metric: Scorer) -> Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]]:
+    """
+    Returns a function that computes the scores of `metric` for a batch of predictions in higher_is_better format,
+    such that `func(y_true, y_pred_batch)[i] == metric(y_true, y_pred_batch[i])` up to floating point precision.
+
+    Returns None if `metric` has no vectorized implementation, such as for custom metrics or metrics with non-default kwargs.
+    Sample weights are not supported by the returned function.
+    """
+    score_func = getattr(metric, "_score_func", None)
+    if score_func is None or metric._kwargs:
+        return None
+    try:
+        vectorized_score_func = _VECTORIZED_SCORE_FUNCS.get(score_func, None)
+    except TypeError:
+        # unhashable score_func
+        return None
+    if vectorized_score_func is None:
+        return None
+    sign = metric._sign
+
+    def _score_batch(y_true: np.ndarray, y_pred_batch: np.ndarray) -> np.ndarray:
+        return sign * vectorized_score_func(np.asarray(y_true), y_pred_batch)
+
+    return _score_batch
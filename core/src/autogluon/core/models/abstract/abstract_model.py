@@ -342,6 +342,7 @@ class AbstractModel:
             get_features_kwargs_extra=None,  # If not None, applies an additional feature filter to the result of get_feature_kwargs. This should be reserved for users and be None by default. | Currently undocumented in task.
             predict_1_batch_size=None,  # If not None, calculates `self.predict_1_time` at end of fit call by predicting on this many rows of data.
             temperature_scalar=None,  # Temperature scaling parameter that is set post-fit if calibrate=True during TabularPredictor.fit() on the model with the best validation score and eval_metric="log_loss".
+            oob_buffer_min_size=None,  # If not None, saves the model with pickle protocol 5, storing buffers (such as numpy arrays) of at least this many bytes out-of-band in separate files that are memory-mapped on load.
         )
         return default_auxiliary_params
 
@@ -1093,7 +1094,7 @@ class AbstractModel:
                     self._compiler.save(model=self.model, path=path)
             if self._compiler is not None and not self._compiler.save_in_pkl:
                 self.model = None  # Don't save model in pkl
-        save_pkl.save(path=file_path, object=self, verbose=verbose)
+        save_pkl.save(path=file_path, object=self, verbose=verbose, oob_buffer_min_size=self.params_aux.get("oob_buffer_min_size", None))
         self.model = _model
         return path
 
@@ -4,10 +4,12 @@ import copy
 import inspect
 import logging
 import math
+import multiprocessing
 import os
 import platform
 import time
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from statistics import mean
 from typing import Dict, List, Type, Union
 
@@ -16,6 +18,7 @@ import pandas as pd
 
 from autogluon.common.utils.distribute_utils import DistributedContext
 from autogluon.common.utils.log_utils import DuplicateFilter
+from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.common.utils.try_import import try_import_ray
 
 from ...constants import MULTICLASS, QUANTILE, REFIT_FULL_SUFFIX, REGRESSION, SOFTCLASS
@@ -103,6 +106,8 @@ class BaggedEnsembleModel(AbstractModel):
             # 'refit_folds': False,  # [Advanced, Experimental] Whether to refit bags immediately to a refit_full model in a single .fit call.
             # 'num_folds' None,  # Number of bagged folds per set. If specified, overrides .fit `k_fold` value.
             # 'max_sets': None,  # Maximum bagged repeats to allow, if specified, will set `self.can_fit()` to `self._n_repeats_finished < max_repeats`
+            # 'fold_predict_strategy': 'sequential',  # How to predict with the fold models, one of ['sequential', 'thread', 'process']. Refer to `_predict_proba_children_iter`.
+            # 'fold_predict_num_workers': 'auto',  # Maximum fold models to predict with at the same time if `fold_predict_strategy != 'sequential'`.
         }
         for param, val in default_params.items():
             self._set_default_param_value(param, val)
@@ -399,12 +404,8 @@ class BaggedEnsembleModel(AbstractModel):
         model = self.load_child(children[0])
         if preprocess_nonadaptive:
             X = self.preprocess(X, model=model, **kwargs)
-        pred_proba_children = []
-        pred_proba_children.append(model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize))
-        for model in children[1:]:
-            model = self.load_child(model)
-            pred_proba_children.append(model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize))
-        return pred_proba_children
+        children = [model] + children[1:]
+        return list(self._predict_proba_children_iter(X=X, children=children, normalize=normalize))
 
     def predict_children(
         self,
@@ -453,13 +454,108 @@ class BaggedEnsembleModel(AbstractModel):
     def _predict_proba_internal(self, X, *, normalize: bool | None = None, **kwargs):
         model = self.load_child(self.models[0])
         X = self.preprocess(X, model=model, **kwargs)
-        y_pred_proba = model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
-        for model in self.models[1:]:
-            model = self.load_child(model)
-            y_pred_proba += model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
-        y_pred_proba = y_pred_proba / self.n_children
+        children = [model] + self.models[1:]
+        num_workers = self._get_fold_predict_num_workers(children=children)
+        if num_workers <= 1:
+            y_pred_proba = model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
+            for model in self.models[1:]:
+                model = self.load_child(model)
+                y_pred_proba += model.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
+            y_pred_proba = y_pred_proba / self.n_children
+            return y_pred_proba
+
+        y_pred_proba = None
+        # The concurrently predicted outputs are summed in child order into a single buffer with the dtype of the children's outputs
+        # (float32 for all AbstractModel children), allocated once the output shape is known.
+        for y_pred_proba_child in self._predict_proba_children_iter(X=X, children=children, normalize=normalize, num_workers=num_workers):
+            if y_pred_proba is None:
+                y_pred_proba = np.zeros(y_pred_proba_child.shape, dtype=y_pred_proba_child.dtype)
+            y_pred_proba += y_pred_proba_child
+        y_pred_proba /= self.n_children
         return y_pred_proba
 
+    def _predict_proba_children_iter(self, X: pd.DataFrame, children: List[AbstractModel | str], normalize: bool | None = None, num_workers: int = None):
+        """
+        Yields the prediction probabilities of each child in `children` order, given `X` that was already preprocessed in the non-adaptive stage.
+
+        The `fold_predict_strategy` parameter controls how the children are predicted with:
+            "sequential": Load and predict with each child one after the other.
+            "thread": Predict with up to `fold_predict_num_workers` children at the same time in a thread pool.
+                All threads share the same `X` object without copying it.
+            "process": Predict with up to `fold_predict_num_workers` children at the same time in a fork-based process pool.
+                `X` and the in-memory children are inherited by the worker processes via copy-on-write instead of being pickled.
+                Falls back to "thread" on platforms that do not support forking.
+        The number of workers is additionally capped so that the loaded children fit in the available memory.
+        At most `num_workers` children are predicted at the same time: the next child is only submitted once the result of an earlier child is consumed,
+        so that no more than `num_workers` predictions are held in memory.
+        If `num_workers` is None, it is determined with `_get_fold_predict_num_workers`.
+        """
+        if num_workers is None:
+            num_workers = self._get_fold_predict_num_workers(children=children)
+        if num_workers <= 1:
+            for child in children:
+                child = self.load_child(child)
+                yield child.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
+            return
+
+        fold_predict_strategy = self.params.get("fold_predict_strategy", "sequential")
+        if fold_predict_strategy == "process" and "fork" in multiprocessing.get_all_start_methods():
+            executor = ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_fold_predict_worker,
+                initargs=(self, X, children, normalize),
+            )
+            predict_func = _predict_proba_child_in_worker
+        else:
+            executor = ThreadPoolExecutor(max_workers=num_workers)
+
+            def predict_func(child_idx: int) -> np.ndarray:
+                return self._predict_proba_child(child=children[child_idx], X=X, normalize=normalize)
+
+        with executor:
+            futures = deque(executor.submit(predict_func, i) for i in range(num_workers))
+            for i in range(num_workers, len(children) + num_workers):
+                y_pred_proba_child = futures.popleft().result()
+                if i < len(children):
+                    futures.append(executor.submit(predict_func, i))
+                yield y_pred_proba_child
+
+    def _predict_proba_child(self, child: AbstractModel | str, X: pd.DataFrame, normalize: bool | None = None) -> np.ndarray:
+        child = self.load_child(child)
+        return child.predict_proba(X=X, preprocess_nonadaptive=False, normalize=normalize)
+
+    def _get_fold_predict_num_workers(self, children: List[AbstractModel | str]) -> int:
+        fold_predict_strategy = self.params.get("fold_predict_strategy", "sequential")
+        valid_fold_predict_strategies = ["sequential", "thread", "process"]
+        if fold_predict_strategy not in valid_fold_predict_strategies:
+            raise ValueError(f"fold_predict_strategy must be one of {valid_fold_predict_strategies}, but found: {fold_predict_strategy}")
+        if fold_predict_strategy == "sequential" or len(children) <= 1:
+            return 1
+        num_workers = self.params.get("fold_predict_num_workers", "auto")
+        if num_workers == "auto":
+            num_workers = ResourceManager.get_cpu_count()
+        num_workers = min(num_workers, len(children))
+
+        # Each worker holds one loaded child in memory at a time, so cap the workers to what fits in the available memory.
+        child_file_sizes = [
+            os.path.getsize(os.path.join(self.path, child, self._child_type.model_file_name))
+            for child in children
+            if isinstance(child, str) and os.path.exists(os.path.join(self.path, child, self._child_type.model_file_name))
+        ]
+        if child_file_sizes:
+            max_memory_usage_ratio = self.params_aux.get("max_memory_usage_ratio", 1.0)
+            mem_available = ResourceManager.get_available_virtual_mem() * 0.5 * max_memory_usage_ratio
+            num_workers_max_memory = max(1, int(mem_available // max(child_file_sizes)))
+            if num_workers_max_memory < num_workers:
+                logger.log(
+                    15,
+                    f"\tReducing fold prediction workers from {num_workers} to {num_workers_max_memory} to avoid running out of memory "
+                    f"({round(max(child_file_sizes) / 1e6, 1)} MB per fold model, {round(mem_available / 1e6, 1)} MB available)",
+                )
+                num_workers = num_workers_max_memory
+        return num_workers
+
     def _predict_proba(self, X, normalize=False, **kwargs) -> np.ndarray:
         return self.predict_proba(X=X, normalize=normalize, **kwargs)
 
@@ -1415,3 +1511,18 @@ class BaggedEnsembleModel(AbstractModel):
     def _get_tags_child(self):
         """Gets the tags of the child model."""
         return self._get_model_base()._get_tags()
+
+
+# Set in the fork-based worker processes of `BaggedEnsembleModel._predict_proba_children_iter`.
+# Inherited from the parent process via copy-on-write so that `X` and the children are not pickled for each task.
+_fold_predict_worker_state = None
+
+
+def _init_fold_predict_worker(bagged_model: BaggedEnsembleModel, X: pd.DataFrame, children: list, normalize: bool | None):
+    global _fold_predict_worker_state
+    _fold_predict_worker_state = (bagged_model, X, children, normalize)
+
+
+def _predict_proba_child_in_worker(child_idx: int) -> np.ndarray:
+    bagged_model, X, children, normalize = _fold_predict_worker_state
+    return bagged_model._predict_proba_child(child=children[child_idx], X=X, normalize=normalize)
@@ -3,17 +3,21 @@ from __future__ import annotations
 import logging
 import time
 from collections import Counter
-from typing import List
+from typing import Callable, List
 
 import numpy as np
 import pandas as pd
 
-from ...constants import PROBLEM_TYPES
+from ...constants import BINARY, PROBLEM_TYPES, QUANTILE, REGRESSION
 from ...metrics import log_loss
+from ...metrics.vectorized_metrics import get_vectorized_score_func
 from ...utils import compute_weighted_metric, get_pred_from_proba
 
 logger = logging.getLogger(__name__)
 
+# Maximum size in bytes of the array holding the fantasy ensemble predictions of candidates scored together in a single batch
+_MAX_FANTASY_BATCH_BYTES = 2**28
+
 
 class AbstractWeightedEnsemble:
     def predict(self, X):
@@ -110,28 +114,45 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         round_scores = False
         epsilon = 1e-4
         round_decimals = 6
+
+        regret_batch_func = self._get_regret_batch_func(sample_weight=sample_weight)
+        # Running sum of the predictions of the ensemble members, updated once per iteration
+        ensemble_prediction_sum = np.zeros(predictions[0].shape)
+        if regret_batch_func is not None:
+            fantasy_nbytes = max(ensemble_prediction_sum.nbytes, 1)
+            batch_size = int(min(len(predictions), max(1, _MAX_FANTASY_BATCH_BYTES // fantasy_nbytes)))
+        else:
+            # Candidates are scored one at a time, so a single fantasy prediction is enough
+            batch_size = 1
+        # Candidates are scored in batches written into a single reused buffer, without copying all predictions into one stacked array.
+        fant_ensemble_predictions = np.zeros((batch_size,) + ensemble_prediction_sum.shape)
         for i in range(ensemble_size):
             scores = np.zeros((len(predictions)))
             s = len(ensemble)
             if s == 0:
                 weighted_ensemble_prediction = np.zeros(predictions[0].shape)
             else:
-                # Memory-efficient averaging!
-                ensemble_prediction = np.zeros(ensemble[0].shape)
-                for pred in ensemble:
-                    ensemble_prediction += pred
-                ensemble_prediction /= s
-
+                ensemble_prediction = ensemble_prediction_sum / s
                 weighted_ensemble_prediction = (s / float(s + 1)) * ensemble_prediction
-            fant_ensemble_prediction = np.zeros(weighted_ensemble_prediction.shape)
-            for j, pred in enumerate(predictions):
-                fant_ensemble_prediction[:] = weighted_ensemble_prediction + (1.0 / float(s + 1)) * pred
+            for batch_start in range(0, len(predictions), batch_size):
+                batch_end = min(batch_start + batch_size, len(predictions))
+                fant_ensemble_prediction_batch = fant_ensemble_predictions[: batch_end - batch_start]
+                for j in range(batch_start, batch_end):
+                    fant_ensemble_prediction = fant_ensemble_prediction_batch[j - batch_start]
+                    np.multiply(predictions[j], 1.0 / float(s + 1), out=fant_ensemble_prediction)
+                    fant_ensemble_prediction += weighted_ensemble_prediction
                 if self.problem_type in ["multiclass", "softclass"]:
                     # Renormalize
-                    fant_ensemble_prediction[:] = fant_ensemble_prediction / fant_ensemble_prediction.sum(axis=1)[:, np.newaxis]
-                scores[j] = self._calculate_regret(y_true=labels, y_pred_proba=fant_ensemble_prediction, metric=self.metric, sample_weight=sample_weight)
-                if round_scores:
-                    scores[j] = scores[j].round(round_decimals)
+                    fant_ensemble_prediction_batch /= fant_ensemble_prediction_batch.sum(axis=-1, keepdims=True)
+                if regret_batch_func is not None:
+                    scores[batch_start:batch_end] = regret_batch_func(labels, fant_ensemble_prediction_batch)
+                else:
+                    for j in range(batch_start, batch_end):
+                        scores[j] = self._calculate_regret(
+                            y_true=labels, y_pred_proba=fant_ensemble_prediction_batch[j - batch_start], metric=self.metric, sample_weight=sample_weight
+                        )
+            if round_scores:
+                scores = scores.round(round_decimals)
 
             all_best = np.argwhere(scores == np.nanmin(scores)).flatten()
 
@@ -172,6 +193,7 @@ class EnsembleSelection(AbstractWeightedEnsemble):
                     best_score = best_score.round(round_decimals)
 
             ensemble.append(predictions[best])
+            ensemble_prediction_sum += predictions[best]
             trajectory.append(best_score)
             order.append(best)
             used_models.add(best)
@@ -206,6 +228,39 @@ class EnsembleSelection(AbstractWeightedEnsemble):
 
         logger.debug("Ensemble indices: " + str(self.indices_))
 
+    def _get_regret_batch_func(self, sample_weight=None) -> Callable[[np.ndarray, np.ndarray], np.ndarray] | None:
+        """
+        Returns a function that computes the regret of a batch of fantasy ensemble predictions,
+        such that `func(y_true, y_pred_proba_batch)[i] == self._calculate_regret(y_true, y_pred_proba_batch[i], self.metric)`.
+
+        Returns None if the metric has no vectorized implementation, in which case each candidate is scored with `_calculate_regret`.
+        """
+        if sample_weight is not None:
+            return None
+        score_batch_func = get_vectorized_score_func(self.metric)
+        if score_batch_func is None:
+            return None
+
+        def regret_batch_func(y_true: np.ndarray, y_pred_proba_batch: np.ndarray) -> np.ndarray:
+            if self.metric.needs_pred or self.metric.needs_quantile:
+                preds_batch = self._get_pred_from_proba_batch(y_pred_proba_batch=y_pred_proba_batch)
+            else:
+                preds_batch = y_pred_proba_batch
+            return self.metric._optimum - score_batch_func(y_true, preds_batch)
+
+        return regret_batch_func
+
+    def _get_pred_from_proba_batch(self, y_pred_proba_batch: np.ndarray) -> np.ndarray:
+        """Vectorized `get_pred_from_proba` over the leading batch axis of `y_pred_proba_batch`."""
+        if self.problem_type == BINARY:
+            if y_pred_proba_batch.ndim == 3:
+                y_pred_proba_batch = y_pred_proba_batch[:, :, 1]
+            return (y_pred_proba_batch > 0.5).astype(int)
+        elif self.problem_type in [REGRESSION, QUANTILE]:
+            return y_pred_proba_batch
+        else:
+            return np.argmax(y_pred_proba_batch, axis=-1)
+
     def _calculate_regret(self, y_true: np.ndarray, y_pred_proba: np.ndarray, metric, sample_weight=None):
         if metric.needs_pred or metric.needs_quantile:
             preds = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type=self.problem_type)
@@ -1,2 +1,3 @@
 # schedulers
+from .parallel_scheduler import LocalParallelScheduler
 from .seq_scheduler import LocalSequentialScheduler
@@ -0,0 +1,210 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from copy import deepcopy
+
+from tqdm.auto import tqdm
+
+from autogluon.common.utils.resource_utils import ResourceManager
+
+from ..searcher.exceptions import ExhaustedSearchSpaceError
+from .seq_scheduler import LocalReporter, LocalSequentialScheduler
+
+logger = logging.getLogger(__name__)
+
+
+def _run_trial_in_worker(train_fn, args: dict, task_id, searcher_config: dict, train_fn_kwargs: dict):
+    """Run a single trial inside a worker process and return everything the scheduler needs to record its outcome.
+
+    The reporter only lives in the worker process, so its training history is sent back to the scheduler together
+    with the result instead of being written to the scheduler's dicts in-place.
+    """
+    training_history = OrderedDict()
+    config_history = OrderedDict()
+    reporter = LocalReporter(task_id, searcher_config, training_history, config_history)
+    exception = None
+    result = None
+    try:
+        result = train_fn(args, reporter=reporter, **train_fn_kwargs)
+    except Exception as e:
+        exception = e
+        reporter(traceback=e)
+    return result, exception, training_history[task_id], config_history.get(task_id), reporter.last_result
+
+
+class LocalParallelScheduler(LocalSequentialScheduler):
+    """Scheduler which runs multiple HPO trials at the same time in a local process pool.
+
+    The number of concurrent trials is the number of times the per-trial `resource` fits into `total_resources`.
+    Configurations are sampled in the main process and registered as pending with the searcher before the trial is
+    started, so that concurrently running trials are not assigned the same configuration. A new trial is only started
+    if `has_enough_time_for_trial_` allows it, based on the average runtime of the trials that have finished so far.
+
+    Parameters
+    ----------
+    train_fn : callable
+        A task launch function for training. Must be picklable (e.g., defined at the module level).
+    resource : dict
+        Computation resources used by each trial. For example, `{'num_cpus':2, 'num_gpus':1}`
+    total_resources : dict, default = None
+        Computation resources shared by all concurrently running trials. For example, `{'num_cpus':64, 'num_gpus':0}`.
+        If None, all CPUs and GPUs of the machine are used.
+    max_concurrent_trials : int, default = None
+        If given, at most this many trials are run at the same time.
+    **kwargs :
+        See :class:`LocalSequentialScheduler` for the remaining arguments.
+    """
+
+    runs_trials_in_parallel = True
+
+    def __init__(self, train_fn, search_space, train_fn_kwargs=None, searcher="auto", reward_attr="reward", resource=None, **kwargs):
+        super().__init__(train_fn, search_space, train_fn_kwargs=train_fn_kwargs, searcher=searcher, reward_attr=reward_attr, resource=resource, **kwargs)
+        self.num_concurrent_trials = self._get_num_concurrent_trials(
+            total_resources=kwargs.get("total_resources", None), max_concurrent_trials=kwargs.get("max_concurrent_trials", None)
+        )
+
+    def _get_num_concurrent_trials(self, total_resources=None, max_concurrent_trials=None) -> int:
+        if total_resources is None:
+            total_resources = dict(num_cpus=ResourceManager.get_cpu_count(), num_gpus=ResourceManager.get_gpu_count())
+        resource = self.resource if self.resource is not None else dict()
+        num_concurrent_trials = self.num_trials
+        for key in ["num_cpus", "num_gpus"]:
+            per_trial = resource.get(key, None)
+            total = total_resources.get(key, None)
+            if not isinstance(per_trial, (int, float)) or not isinstance(total, (int, float)):
+                # Non-numeric values such as 'all' or 'auto' mean that a trial may use the whole machine
+                if per_trial is not None and per_trial != 0:
+                    return 1
+                continue
+            if per_trial > 0:
+                num_concurrent_trials = min(num_concurrent_trials, math.floor(total / per_trial))
+        if max_concurrent_trials is not None:
+            num_concurrent_trials = min(num_concurrent_trials, max_concurrent_trials)
+        return max(1, num_concurrent_trials)
+
+    def run(self, **kwargs):
+        """Run multiple trials in parallel given specific time and trial numbers limits."""
+        self.searcher.configure_scheduler(self)
+
+        self.training_history = OrderedDict()
+        self.config_history = OrderedDict()
+
+        failure_count = 0
+        trial_count = 0
+        trials_total_time = 0
+        min_failure_threshold = 5
+        failure_rate_threshold = 0.8
+        time_start = time.time()
+
+        logger.log(15, f"\tRunning up to {self.num_concurrent_trials} HPO trials in parallel")
+        progress_bar = tqdm(total=self.num_trials) if self.num_trials < 1000 else None
+        running_trials = dict()  # future -> (task_id, searcher_config, trial_start_time)
+        num_trials_started = 0
+        stop_scheduling = False
+        with ProcessPoolExecutor(max_workers=self.num_concurrent_trials) as executor:
+            while True:
+                while not stop_scheduling and len(running_trials) < self.num_concurrent_trials and num_trials_started < self.num_trials:
+                    if self.time_out is not None:
+                        # Same check as in LocalSequentialScheduler, applied whenever a slot in the pool becomes free
+                        now = time.time()
+                        avg_trial_run_time = 0 if trial_count == failure_count else trials_total_time / (trial_count - failure_count)
+                        if not self.has_enough_time_for_trial_(self.time_out, time_start, now, now, avg_trial_run_time):
+                            logger.log(20, "\tStopping HPO to satisfy time limit...")
+                            stop_scheduling = True
+                            break
+                    try:
+                        future, searcher_config = self.submit_trial_(executor, task_id=num_trials_started)
+                    except ExhaustedSearchSpaceError:
+                        stop_scheduling = True
+                        break
+                    except Exception:
+                        logger.log(30, f"\tWARNING: Encountered unexpected exception when starting trial {num_trials_started}, stopping HPO early.")
+                        logger.exception("Detailed Traceback:")
+                        stop_scheduling = True
+                        break
+                    running_trials[future] = (num_trials_started, searcher_config, time.time())
+                    num_trials_started += 1
+
+                if not running_trials:
+                    break
+
+                finished, _ = wait(running_trials, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    task_id, searcher_config, trial_start_time = running_trials.pop(future)
+                    try:
+                        is_failed, _ = self.process_trial_result_(future, task_id, searcher_config)
+                    except Exception:
+                        logger.log(30, f"\tWARNING: Encountered unexpected exception during trial {task_id}, stopping HPO early.")
+                        logger.exception("Detailed Traceback:")
+                        stop_scheduling = True
+                        continue
+                    trial_end_time = time.time()
+                    if progress_bar is not None:
+                        progress_bar.update(1)
+
+                    trial_count += 1
+                    if is_failed:
+                        failure_count += 1
+                    else:
+                        trials_total_time += trial_end_time - trial_start_time
+
+                    if stop_scheduling:
+                        continue
+
+                    if self.max_reward and self.get_best_reward() >= self.max_reward:
+                        logger.log(20, "\tStopping HPO: Max reward reached")
+                        stop_scheduling = True
+
+                    if failure_count >= min_failure_threshold and (failure_count / trial_count) >= failure_rate_threshold:
+                        logger.warning(
+                            f"Warning: Detected a large trial failure rate: "
+                            f"{failure_count}/{trial_count} attempted trials failed ({round((failure_count / trial_count) * 100, 1)}%)! "
+                            f"Stopping HPO early due to reaching failure threshold ({round(failure_rate_threshold*100, 1)}%).\n"
+                            f"\tFailures may be caused by invalid configurations within the provided search space."
+                        )
+                        stop_scheduling = True
+        if progress_bar is not None:
+            progress_bar.close()
+
+    def submit_trial_(self, executor: ProcessPoolExecutor, task_id=0):
+        """Sample a new configuration, register it as pending with the searcher and start the trial in the executor."""
+        new_searcher_config = self.searcher.get_config()
+        searcher_config = deepcopy(self.metadata["search_space"])
+        searcher_config.update(new_searcher_config)
+
+        args = dict()
+        args.update(searcher_config)
+        args["task_id"] = task_id
+        train_fn_kwargs = deepcopy(self.train_fn_kwargs) if self.train_fn_kwargs is not None else dict()
+
+        self.searcher.register_pending(searcher_config)
+        future = executor.submit(_run_trial_in_worker, self.train_fn, args, task_id, searcher_config, train_fn_kwargs)
+        return future, searcher_config
+
+    def process_trial_result_(self, future, task_id, searcher_config):
+        """Record the outcome of a finished trial in the training history and update the searcher."""
+        try:
+            result, exception, training_history, config, last_result = future.result()
+        except Exception as e:
+            # The worker process itself failed (e.g., the trial could not be pickled or the process was killed)
+            result, exception, last_result = None, e, None
+            reporter = LocalReporter(task_id, searcher_config, self.training_history, self.config_history)
+            reporter(traceback=e)
+        else:
+            self.training_history[task_id] = training_history
+            if config is not None:
+                self.config_history[task_id] = config
+
+        is_failed = False
+        if exception is not None:
+            logger.error(f"Exception during a trial: {exception}")
+            self.searcher.evaluation_failed(config=searcher_config)
+            is_failed = True
+            result = {"traceback": str(exception)}
+        elif last_result:
+            self.searcher.update(config=searcher_config, **last_result)
+        else:
+            is_failed = True
+        return is_failed, result
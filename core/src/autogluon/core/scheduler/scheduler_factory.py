@@ -3,17 +3,20 @@ import inspect
 import logging
 
 from ..utils.utils import setup_compute
+from .parallel_scheduler import LocalParallelScheduler
 from .seq_scheduler import LocalSequentialScheduler
 
 logger = logging.getLogger(__name__)
 
 schedulers = {
     "local": LocalSequentialScheduler,
+    "local_parallel": LocalParallelScheduler,
 }
 
 _scheduler_presets = {
     "auto": {"scheduler": "local", "searcher": "local_random"},
     "local_random": {"scheduler": "local", "searcher": "local_random"},
+    "local_parallel_random": {"scheduler": "local_parallel", "searcher": "local_random"},
     "random": {"scheduler": "local", "searcher": "random"},
 }
 
@@ -148,6 +151,7 @@ def scheduler_factory(hyperparameter_tune_kwargs, time_out: float = None, num_tr
         Valid preset values:
             'auto': Uses the 'random' preset.
             'random': Performs HPO via random search using local scheduler.
+            'local_parallel_random': Performs HPO via random search, running multiple trials at once in a local process pool.
         The 'searcher' key is required when providing a dict. Some schedulers may have different valid keys.
     time_out : float, default = None
         Same as hyperparameter_tune_kwargs['time_out']. Ignored if specified in hyperparameter_tune_kwargs.
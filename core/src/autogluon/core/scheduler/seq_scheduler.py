@@ -86,6 +86,8 @@ class LocalSequentialScheduler(object):
         Note: The type of resource must be int.
     """
 
+    runs_trials_in_parallel = False
+
     def __init__(self, train_fn, search_space, train_fn_kwargs=None, searcher="auto", reward_attr="reward", resource=None, **kwargs):
         self.train_fn = train_fn
         self.training_history = None
@@ -8,6 +8,7 @@ import sys
 import time
 import traceback
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -971,6 +972,31 @@ class AbstractTrainer:
         # Get model prediction order
         return list(nx.lexicographical_topological_sort(subgraph))
 
+    def _construct_model_pred_levels(self, model_pred_order: List[str]) -> List[List[str]]:
+        """
+        Groups a list of model names in inference call order into levels of models that can be inferred at the same time.
+
+        Parameters
+        ----------
+        model_pred_order : List[str]
+            The list of models in inference call order, such as the output of `_construct_model_pred_order`.
+            Dependency models not present in the list are assumed to already be computed.
+
+        Returns
+        -------
+        Returns a list of levels, where each level is a list of models whose dependencies are all contained in earlier levels.
+        The relative order of models in `model_pred_order` is preserved within each level.
+        """
+        model_depth = dict()
+        model_pred_levels = []
+        for model in model_pred_order:
+            depth = max((model_depth[m] + 1 for m in self.model_graph.predecessors(model) if m in model_depth), default=0)
+            model_depth[model] = depth
+            if depth == len(model_pred_levels):
+                model_pred_levels.append([])
+            model_pred_levels[depth].append(model)
+        return model_pred_levels
+
     # TODO: Consider adding persist to disk functionality for pred_proba dictionary to lessen memory burden on large multiclass problems.
     #  For datasets with 100+ classes, this function could potentially run the system OOM due to each pred_proba numpy array taking significant amounts of space.
     #  This issue already existed in the previous level-based version but only had the minimum required predictions in memory at a time, whereas this has all model predictions in memory.
@@ -985,6 +1011,8 @@ class AbstractTrainer:
         use_val_cache: bool = False,
         cascade: bool = False,
         cascade_threshold: float = 0.9,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ):
         """
         Optimally computes pred_probas (or predictions if regression) for each model in `models`.
@@ -1029,6 +1057,20 @@ class AbstractTrainer:
             Threshold to use for determining if a row should exit the cascaded prediction early.
             If any one class has pred_proba>=cascade_threshold, then it exits early.
             Ignored if `cascade=False`.
+        num_workers : int, default = 1
+            The number of models to predict with at the same time.
+            If greater than 1, models are grouped into levels of the model graph and all models within a level are predicted in parallel,
+            starting a level only once all models in the previous level have finished predicting.
+            This is most effective when there are many base models whose own inference does not already use all available cores.
+            Results are identical to `num_workers=1`. Cannot be used together with `cascade=True`.
+        parallel_backend : str, default = "thread"
+            The executor to use when `num_workers > 1`. Ignored if `num_workers=1`.
+            Valid values:
+                "thread": Predict in a thread pool. Models share the memory of X and of the predictions of their dependency models.
+                "process": Predict in a process pool. Models not persisted in memory are loaded from disk in the worker process.
+                    X and the predictions required by each model are serialized to the worker, so this is only beneficial
+                    for models whose inference holds the GIL.
+            If `record_pred_time=True`, the time recorded for each model is the time taken by the worker, excluding time spent waiting in the queue.
 
         Returns
         -------
@@ -1047,6 +1089,10 @@ class AbstractTrainer:
             raise AssertionError(f"Ensemble Cascade not implemented for problem_type=={self.problem_type}")
         if cascade and use_val_cache:
             raise AssertionError("cascade and use_val_cache cannot both be True.")
+        if cascade and num_workers > 1:
+            raise AssertionError("cascade cannot be True when num_workers > 1.")
+        if parallel_backend not in ["thread", "process"]:
+            raise ValueError(f'parallel_backend must be one of ["thread", "process"], but found: "{parallel_backend}"')
 
         if use_val_cache:
             _, model_pred_proba_dict = self._update_pred_proba_dict_with_val_cache(model_set=set(models), model_pred_proba_dict=model_pred_proba_dict)
@@ -1061,6 +1107,19 @@ class AbstractTrainer:
             )
             model_pred_order = [model for model in model_pred_order if model in model_set]
 
+        if num_workers > 1 and len(model_pred_order) > 1:
+            self._get_model_pred_proba_dict_parallel(
+                X=X,
+                model_pred_order=model_pred_order,
+                model_pred_proba_dict=model_pred_proba_dict,
+                model_pred_time_dict=model_pred_time_dict,
+                record_pred_time=record_pred_time,
+                num_workers=num_workers,
+                parallel_backend=parallel_backend,
+            )
+            # All predictions have been computed, skip the sequential inference loop below
+            model_pred_order = []
+
         iloc_model_dict = dict()
         model_pred_proba_dict_cascade = dict()
 
@@ -1153,6 +1212,66 @@ class AbstractTrainer:
         else:
             return model_pred_proba_dict
 
+    def _get_model_pred_proba_dict_parallel(
+        self,
+        X: pd.DataFrame,
+        model_pred_order: List[str],
+        model_pred_proba_dict: dict,
+        model_pred_time_dict: dict,
+        record_pred_time: bool,
+        num_workers: int,
+        parallel_backend: str,
+    ):
+        """
+        Computes pred_probas for each model in `model_pred_order`, predicting with all models in the same level of the model graph in parallel.
+        Refer to `get_model_pred_proba_dict` for documentation of the arguments.
+
+        Note: Mutates model_pred_proba_dict and model_pred_time_dict in-place.
+        """
+        model_pred_levels = self._construct_model_pred_levels(model_pred_order=model_pred_order)
+        num_workers = min(num_workers, max(len(level) for level in model_pred_levels))
+        if parallel_backend == "process":
+            executor_cls = ProcessPoolExecutor
+        else:
+            executor_cls = ThreadPoolExecutor
+        with executor_cls(max_workers=num_workers) as executor:
+            for models_in_level in model_pred_levels:
+                futures = dict()
+                for model_name in models_in_level:
+                    # Only send the predictions of the dependency models to avoid copying all predictions to each worker
+                    base_model_pred_proba_dict = {m: model_pred_proba_dict[m] for m in self.model_graph.predecessors(model_name)}
+                    if model_name in self.models:
+                        futures[model_name] = executor.submit(
+                            _predict_proba_child, model=self.models[model_name], X=X, model_pred_proba_dict=base_model_pred_proba_dict
+                        )
+                    elif parallel_backend == "process":
+                        # Load the model inside the worker process to avoid pickling it in the main process
+                        futures[model_name] = executor.submit(
+                            _predict_proba_child,
+                            model=None,
+                            X=X,
+                            model_pred_proba_dict=base_model_pred_proba_dict,
+                            path=os.path.join(self.path, self.get_model_attribute(model=model_name, attribute="path")),
+                            model_type=self.get_model_attribute(model=model_name, attribute="type"),
+                            reset_paths=self.reset_paths,
+                        )
+                    else:
+                        futures[model_name] = executor.submit(
+                            self._predict_proba_with_load_time, model_name=model_name, X=X, model_pred_proba_dict=base_model_pred_proba_dict
+                        )
+                # Results are collected in model_pred_order so that the output is identical to sequential inference
+                for model_name in models_in_level:
+                    y_pred_proba, time_pred = futures[model_name].result()
+                    model_pred_proba_dict[model_name] = y_pred_proba
+                    if record_pred_time:
+                        model_pred_time_dict[model_name] = time_pred
+
+    def _predict_proba_with_load_time(self, model_name: str, X: pd.DataFrame, model_pred_proba_dict: dict) -> Tuple[np.ndarray, float]:
+        time_start = time.time()
+        model = self.load_model(model_name=model_name)
+        y_pred_proba, _ = _predict_proba_child(model=model, X=X, model_pred_proba_dict=model_pred_proba_dict)
+        return y_pred_proba, time.time() - time_start
+
     def get_model_oof_dict(self, models: List[str]) -> dict:
         """
         Returns a dictionary of out-of-fold prediction probabilities, keyed by model name
@@ -3890,10 +4009,16 @@ class AbstractTrainer:
             )
             return 0.5
 
+        if self.weight_evaluation:
+            metric_func = lambda y, y_pred: self._score_with_y_pred(y=y, y_pred=y_pred, weights=weights, metric=metric)
+        else:
+            # Pass the Scorer directly to enable the vectorized threshold search for confusion matrix metrics
+            metric_func = metric
+
         return calibrate_decision_threshold(
             y=y,
             y_pred_proba=y_pred_proba,
-            metric=lambda y, y_pred: self._score_with_y_pred(y=y, y_pred=y_pred, weights=weights, metric=metric),
+            metric=metric_func,
             decision_thresholds=decision_thresholds,
             secondary_decision_thresholds=secondary_decision_thresholds,
             metric_name=metric.name,
@@ -3920,3 +4045,23 @@ class AbstractTrainer:
             assert len(quantile_levels) > 0, f"quantile_levels must not be an empty list (quantile_levels={quantile_levels})"
         else:
             assert quantile_levels is None, f"quantile_levels must be None when problem_type='{problem_type}' (quantile_levels={quantile_levels})"
+
+
+def _predict_proba_child(
+    model: AbstractModel | None, X: pd.DataFrame, model_pred_proba_dict: dict, path: str = None, model_type=None, reset_paths: bool = False
+) -> Tuple[np.ndarray, float]:
+    """
+    Predicts with a single model given the predictions of its dependency models.
+    Defined at the module level so that it can be sent to a process pool worker.
+    If `model` is None, the model is loaded from `path` via `model_type`.
+
+    Returns a tuple of (pred_proba, inference time in seconds)
+    """
+    time_start = time.time()
+    if model is None:
+        model = model_type.load(path=path, reset_paths=reset_paths)
+    if isinstance(model, StackerEnsembleModel):
+        y_pred_proba = model.predict_proba(X, infer=False, model_pred_proba_dict=model_pred_proba_dict)
+    else:
+        y_pred_proba = model.predict_proba(X)
+    return y_pred_proba, time.time() - time_start
@@ -3,7 +3,9 @@ import math
 import pickle
 import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Tuple, Union
 
 import numpy as np
@@ -27,10 +29,13 @@ from ..constants import (
     SOFTCLASS,
 )
 from ..metrics import Scorer, accuracy, pinball_loss, root_mean_squared_error
+from ..metrics.vectorized_metrics import get_vectorized_score_func
 from .miscs import warning_filter
 
 logger = logging.getLogger(__name__)
 
+_FI_EARLY_STOP_MIN_SHUFFLE_SETS = 3  # Minimum shuffle sets evaluated before a feature can be early stopped by p-value
+
 
 class CVSplitter:
     def __init__(self, splitter_cls=None, n_splits=5, n_repeats=1, random_state=0, stratified=False, groups=None):
@@ -659,6 +664,56 @@ def extract_column(X, col_name):
     return X, w
 
 
+def has_sparse_features(X: DataFrame) -> bool:
+    """Returns True if any column of X has a pandas sparse dtype."""
+    return any(isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes)
+
+
+def convert_df_to_csr(X: DataFrame, dtype=None) -> scipy.sparse.csr_matrix:
+    """
+    Converts X to a scipy CSR matrix with the same column order, without densifying pandas sparse columns.
+
+    Pandas sparse columns with a fill value of 0 are converted directly from their sparse representation.
+    All other columns are converted in contiguous dense blocks, with category columns represented by their category codes (-1 for missing values).
+
+    Parameters
+    ----------
+    X : DataFrame
+        The data to convert. All columns must be numeric, boolean or category.
+    dtype : numpy dtype, default = None
+        The dtype of the output. If None, the dtype is inferred from the columns of X.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix of shape (len(X), len(X.columns))
+    """
+    import scipy.sparse
+
+    def _is_sparse_zero_fill(column_dtype) -> bool:
+        return isinstance(column_dtype, pd.SparseDtype) and column_dtype.fill_value == 0
+
+    blocks = []
+    columns = list(X.columns)
+    start = 0
+    while start < len(columns):
+        is_sparse_block = _is_sparse_zero_fill(X.dtypes.iloc[start])
+        end = start + 1
+        while end < len(columns) and _is_sparse_zero_fill(X.dtypes.iloc[end]) == is_sparse_block:
+            end += 1
+        X_block = X.iloc[:, start:end]
+        if is_sparse_block:
+            block = X_block.sparse.to_coo()
+        else:
+            X_block = X_block.apply(lambda column: column.cat.codes if isinstance(column.dtype, pd.CategoricalDtype) else column)
+            X_block = X_block.apply(lambda column: column.sparse.to_dense() if isinstance(column.dtype, pd.SparseDtype) else column)
+            block = scipy.sparse.csr_matrix(X_block.to_numpy(dtype=dtype if dtype is not None else np.result_type(*X_block.dtypes)))
+        blocks.append(block)
+        start = end
+    if not blocks:
+        return scipy.sparse.csr_matrix((len(X), 0), dtype=dtype)
+    return scipy.sparse.hstack(blocks, format="csr", dtype=dtype)
+
+
 def compute_weighted_metric(y, y_pred, metric, weights, weight_evaluation=None, **kwargs):
     """Report weighted metric if: weights is not None, weight_evaluation=True, and the given metric supports sample weights.
     If weight_evaluation=None, it will be set to False if weights=None, True otherwise.
@@ -701,6 +756,8 @@ def compute_permutation_feature_importance(
     log_prefix="",
     importance_as_list=False,
     random_state=0,
+    num_workers: int = 1,
+    early_stop_p_value: float = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
@@ -774,6 +831,17 @@ def compute_permutation_feature_importance(
         Whether to return the 'importance' column values as a list of the importance from each shuffle (True) or a single averaged value (False).
     random_state : int, default 0
         Acts as a seed for data subsampling and permuting feature values.
+    num_workers : int, default 1
+        Number of threads used to concurrently transform, predict and score permuted batches.
+        Batches of all features and shuffle sets are processed by a single shared thread pool.
+        Values greater than 1 are most useful when `predict_func` does not already use all available CPU cores, such as for single-threaded models.
+        The number of features permuted per batch is divided by `num_workers` so that peak memory usage is unchanged.
+    early_stop_p_value : float, default None
+        If specified, features stop being shuffled once they are confidently unimportant, saving the time spent on them in the remaining shuffle sets.
+        A feature is confidently unimportant once at least 3 shuffle sets were evaluated, its mean importance is not positive,
+        and its running p-value is at least `early_stop_p_value` or its importance was identical in every shuffle set.
+        Early stopped features will have a smaller 'n' in the output than the other features.
+        Only used when `num_shuffle_sets > 3`.
 
     Returns
     -------
@@ -792,6 +860,8 @@ def compute_permutation_feature_importance(
 
     if num_shuffle_sets is None:
         num_shuffle_sets = 1 if time_limit is None else 10
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be >= 1, but was: {num_workers}")
 
     time_start = time.time()
     if predict_func_kwargs is None:
@@ -817,26 +887,32 @@ def compute_permutation_feature_importance(
             logging_message = f"{logging_message} Time limit: {time_limit}s..."
         logger.log(20, logging_message)
 
+    # Scores all permuted copies in a predict batch with a single array operation if the metric supports it
+    score_batch_func = get_vectorized_score_func(eval_metric) if not kwargs else None
+
     time_permutation_start = time.time()
-    fi_dict_list = []
+    fi_list_dict = {_get_fi_feature_name(feature): [] for feature in features}
+    features_active = list(features)
     shuffle_repeats_completed = 0
     log_final_suffix = ""
 
     X_orig = X
     y_orig = y
-    feature_batch_count = None
-    X_raw = None
-    score_baseline = None
     initial_random_state = random_state
-    # TODO: Can speedup shuffle_repeats by incorporating into X_raw (do multiple repeats in a single predict call)
-    for shuffle_repeat in range(num_shuffle_sets):
-        fi = dict()
-        random_state = initial_random_state + shuffle_repeat
+    feature_batch_count = None
+    shuffle_set_data = dict()  # shuffle_repeat -> (X, y, X_shuffled, score_baseline)
+    worker_buffers = dict()  # thread id -> (X, X_raw)
 
+    def _prepare_shuffle_set(shuffle_repeat: int):
+        nonlocal feature_batch_count
+        random_state = initial_random_state + shuffle_repeat
         if subsample:
             # TODO: Stratify? We currently don't know in this function the problem_type (could pass as additional arg).
             X = X_orig.sample(subsample_size, random_state=random_state)
             y = y_orig.loc[X.index]
+        else:
+            X = X_orig
+            y = y_orig
 
         if subsample or shuffle_repeat == 0:
             time_start_score = time.time()
@@ -854,73 +930,122 @@ def compute_permutation_feature_importance(
                     feature_batch_count = _get_safe_fi_batch_count(X=X, num_features=num_features)
                 else:
                     feature_batch_count = _get_safe_fi_batch_count(X=X, num_features=num_features, X_transformed=X_transformed)
-
-            # creating copy of original data N=feature_batch_count times for parallel processing
-            X_raw = pd.concat([X.copy() for _ in range(feature_batch_count)], ignore_index=True, sort=False).reset_index(drop=True)
-
-        row_count = len(X)
-
+                # Each worker holds its own permuted batch in memory
+                feature_batch_count = max(1, feature_batch_count // num_workers)
+        else:
+            score_baseline = shuffle_set_data[0][3]
         X_shuffled = shuffle_df_rows(X=X, seed=random_state)
+        shuffle_set_data[shuffle_repeat] = (X, y, X_shuffled, score_baseline)
 
-        for i in range(0, num_features, feature_batch_count):
-            parallel_computed_features = features[i : i + feature_batch_count]
+    def _compute_fi_batch(shuffle_repeat: int, batch_features: list) -> dict:
+        X, y, X_shuffled, score_baseline = shuffle_set_data[shuffle_repeat]
+        row_count = len(X)
+        num_features_processing = len(batch_features)
 
-            # if final iteration, leaving only necessary part of X_raw
-            num_features_processing = len(parallel_computed_features)
-            final_iteration = i + num_features_processing == num_features
+        # Each worker thread permutes and restores its own copy of the data N=feature_batch_count times
+        thread_id = threading.get_ident()
+        if thread_id not in worker_buffers:
+            X_raw = pd.concat([X.copy() for _ in range(feature_batch_count)], ignore_index=True, sort=False).reset_index(drop=True)
+            worker_buffers[thread_id] = (X, X_raw)
+        elif worker_buffers[thread_id][0] is not X:
+            # The copy is allocated once per thread, switching to the subsample of another shuffle set overwrites it in place
+            X_raw = worker_buffers[thread_id][1]
+            for column_index in range(X.shape[1]):
+                X_raw.iloc[:, column_index] = np.tile(X.iloc[:, column_index].to_numpy(), feature_batch_count)
+            worker_buffers[thread_id] = (X, X_raw)
+        X_raw = worker_buffers[thread_id][1]
+
+        row_index = 0
+        for feature in batch_features:
+            feature_list = _get_fi_feature_list(feature)
+            row_index_end = row_index + row_count
+            X_raw.loc[row_index : row_index_end - 1, feature_list] = X_shuffled[feature_list].values
+            row_index = row_index_end
+
+        if num_features_processing < feature_batch_count:
+            X_raw_transformed = X_raw.loc[: row_count * num_features_processing - 1]
+        else:
+            X_raw_transformed = X_raw
+        X_raw_transformed = X_raw_transformed if transform_func is None else transform_func(X_raw_transformed, **transform_func_kwargs)
+        y_pred = predict_func(X_raw_transformed, **predict_func_kwargs)
 
-            row_index = 0
-            for feature in parallel_computed_features:
-                if isinstance(feature, tuple):
-                    feature = feature[1]
-                row_index_end = row_index + row_count
-                X_raw.loc[row_index : row_index_end - 1, feature] = X_shuffled[feature].values
-                row_index = row_index_end
+        if score_batch_func is not None and isinstance(y_pred, np.ndarray):
+            y_pred_batch = y_pred.reshape(num_features_processing, row_count, *y_pred.shape[1:])
+            scores = score_batch_func(y, y_pred_batch)
+        else:
+            scores = [eval_metric(y, y_pred[i * row_count : (i + 1) * row_count], **kwargs) for i in range(num_features_processing)]
 
-            if (num_features_processing < feature_batch_count) and final_iteration:
-                X_raw_transformed = X_raw.loc[: row_count * num_features_processing - 1]
-                X_raw_transformed = X_raw_transformed if transform_func is None else transform_func(X_raw_transformed, **transform_func_kwargs)
+        fi = dict()
+        row_index = 0
+        for feature, score in zip(batch_features, scores):
+            fi[_get_fi_feature_name(feature)] = score_baseline - score
+            # resetting to original values for processed feature
+            feature_list = _get_fi_feature_list(feature)
+            row_index_end = row_index + row_count
+            X_raw.loc[row_index : row_index_end - 1, feature_list] = X[feature_list].values
+            row_index = row_index_end
+        return fi
+
+    # Shuffle sets are evaluated together unless early stopping requires the results of each shuffle set before starting the next
+    if time_limit is None and early_stop_p_value is None:
+        shuffle_sets_per_round = num_shuffle_sets
+    else:
+        shuffle_sets_per_round = 1
+    num_features_early_stopped = 0
+    executor = ThreadPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+    try:
+        for round_start in range(0, num_shuffle_sets, shuffle_sets_per_round):
+            shuffle_repeats = list(range(round_start, min(round_start + shuffle_sets_per_round, num_shuffle_sets)))
+            batches = []
+            for shuffle_repeat in shuffle_repeats:
+                _prepare_shuffle_set(shuffle_repeat)
+                for i in range(0, len(features_active), feature_batch_count):
+                    batches.append((shuffle_repeat, features_active[i : i + feature_batch_count]))
+            if executor is not None:
+                fi_batch_list = [future.result() for future in [executor.submit(_compute_fi_batch, *batch) for batch in batches]]
             else:
-                X_raw_transformed = X_raw if transform_func is None else transform_func(X_raw, **transform_func_kwargs)
-            y_pred = predict_func(X_raw_transformed, **predict_func_kwargs)
-
-            row_index = 0
-            for feature in parallel_computed_features:
-                if isinstance(feature, tuple):
-                    feature_name = feature[0]
-                    feature_list = feature[1]
-                else:
-                    feature_name = feature
-                    feature_list = feature
-                # calculating importance score for given feature
-                row_index_end = row_index + row_count
-                y_pred_cur = y_pred[row_index:row_index_end]
-                score = eval_metric(y, y_pred_cur, **kwargs)
-                fi[feature_name] = score_baseline - score
-
-                # resetting to original values for processed feature
-                X_raw.loc[row_index : row_index_end - 1, feature_list] = X[feature_list].values
-
-                row_index = row_index_end
-        fi_dict_list.append(fi)
-        shuffle_repeats_completed = shuffle_repeat + 1
-        if time_limit is not None and shuffle_repeat != (num_shuffle_sets - 1):
-            time_now = time.time()
-            time_left = time_limit - (time_now - time_start)
-            time_permutation_average = (time_now - time_permutation_start) / (shuffle_repeat + 1)
-            if time_left < (time_permutation_average * 1.1):
-                log_final_suffix = " (Early stopping due to lack of time...)"
+                fi_batch_list = [_compute_fi_batch(*batch) for batch in batches]
+            # Results are collected in shuffle set order regardless of the order the batches completed in
+            for fi_batch in fi_batch_list:
+                for feature_name, importance in fi_batch.items():
+                    fi_list_dict[feature_name].append(importance)
+            for shuffle_repeat in shuffle_repeats:
+                if subsample:
+                    shuffle_set_data.pop(shuffle_repeat)
+            shuffle_repeats_completed = shuffle_repeats[-1] + 1
+            if shuffle_repeats_completed == num_shuffle_sets:
                 break
 
-    fi_list_dict = dict()
-    for val in fi_dict_list:
-        for key in val:
-            if key not in fi_list_dict:
-                fi_list_dict[key] = []
-            fi_list_dict[key].append(val[key])
+            if early_stop_p_value is not None and shuffle_repeats_completed >= _FI_EARLY_STOP_MIN_SHUFFLE_SETS:
+                features_active_prev = features_active
+                features_active = [
+                    feature
+                    for feature in features_active
+                    if not _is_fi_early_stop(fi_list_dict[_get_fi_feature_name(feature)], p_value_threshold=early_stop_p_value)
+                ]
+                num_features_early_stopped += len(features_active_prev) - len(features_active)
+                if not features_active:
+                    log_final_suffix = " (Early stopping as all features are confidently unimportant...)"
+                    break
+            if time_limit is not None:
+                time_now = time.time()
+                time_left = time_limit - (time_now - time_start)
+                time_permutation_average = (time_now - time_permutation_start) / shuffle_repeats_completed
+                if time_left < (time_permutation_average * 1.1):
+                    log_final_suffix = " (Early stopping due to lack of time...)"
+                    break
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        worker_buffers.clear()
+
     fi_df = _compute_fi_with_stddev(fi_list_dict, importance_as_list=importance_as_list)
 
     if not silent:
+        if num_features_early_stopped:
+            log_final_suffix = (
+                f"{log_final_suffix} ({num_features_early_stopped} of {num_features} features stopped early with p_value >= {early_stop_p_value})"
+            )
         logger.log(
             20,
             f"{log_prefix}\t{round(time.time() - time_start, 2)}s\t= Actual runtime (Completed {shuffle_repeats_completed} of {num_shuffle_sets} shuffle sets){log_final_suffix}",
@@ -929,6 +1054,25 @@ def compute_permutation_feature_importance(
     return fi_df
 
 
+def _get_fi_feature_name(feature: Union[str, Tuple[str, List[str]]]) -> str:
+    return feature[0] if isinstance(feature, tuple) else feature
+
+
+def _get_fi_feature_list(feature: Union[str, Tuple[str, List[str]]]) -> Union[str, List[str]]:
+    return feature[1] if isinstance(feature, tuple) else feature
+
+
+def _is_fi_early_stop(values: list, p_value_threshold: float) -> bool:
+    """
+    Returns True if a feature is confidently unimportant given the importance values of the completed shuffle sets.
+    Features with a constant importance of 0 have no variance and thus a p-value of 0.5, but are unimportant regardless of the threshold.
+    """
+    mean, stddev, p_value, _ = _compute_mean_stddev_and_p_value(values)
+    if mean > 0:
+        return False
+    return stddev == 0 or p_value >= p_value_threshold
+
+
 def _validate_features(features: list, valid_features: list):
     """Raises exception if features list contains invalid features or duplicate features"""
     valid_features = set(valid_features)
@@ -2,7 +2,9 @@ import numpy as np
 import pytest
 
 from autogluon.core.calibrate import calibrate_decision_threshold
-from autogluon.core.metrics import balanced_accuracy, f1, roc_auc
+from autogluon.core.calibrate._decision_threshold import _get_score_thresholds_func_confusion_matrix
+from autogluon.core.metrics import accuracy, balanced_accuracy, f1, f1_macro, mcc, precision, recall, roc_auc
+from autogluon.core.utils import get_pred_from_proba
 
 
 def _get_sample_data():
@@ -45,14 +47,14 @@ def test_calibrate_decision_threshold():
         y_pred_proba=y_pred_proba,
         metric=f1,
     )
-    assert decision_threshold == 0.249
+    assert decision_threshold == 0.24
 
     decision_threshold = calibrate_decision_threshold(
         y=y,
         y_pred_proba=y_pred_proba,
         metric=balanced_accuracy,
     )
-    assert decision_threshold == 0.249
+    assert decision_threshold == 0.24
 
     decision_threshold = calibrate_decision_threshold(
         y=y,
@@ -60,6 +62,22 @@ def test_calibrate_decision_threshold():
         metric=balanced_accuracy,
         decision_thresholds=10,
     )
+    assert decision_threshold == 0.24
+
+    # Wrapping the metric in a lambda disables the exact search
+    decision_threshold = calibrate_decision_threshold(
+        y=y,
+        y_pred_proba=y_pred_proba,
+        metric=lambda y, y_pred: balanced_accuracy(y, y_pred),
+    )
+    assert decision_threshold == 0.249
+
+    decision_threshold = calibrate_decision_threshold(
+        y=y,
+        y_pred_proba=y_pred_proba,
+        metric=lambda y, y_pred: balanced_accuracy(y, y_pred),
+        decision_thresholds=10,
+    )
     assert decision_threshold == 1.0
 
     decision_threshold = calibrate_decision_threshold(
@@ -159,3 +177,72 @@ def test_calibrate_decision_threshold_invalid_args():
             metric=balanced_accuracy,
             secondary_decision_thresholds=[0.2, 0.4],
         )
+
+
+@pytest.mark.parametrize("metric", [accuracy, balanced_accuracy, f1, mcc, precision, recall])
+def test_calibrate_decision_threshold_vectorized_scores_match_metric(metric):
+    """Test that the vectorized confusion matrix scores are identical to calling the metric on the predictions of each threshold"""
+    rng = np.random.default_rng(seed=0)
+    y = rng.integers(0, 2, size=500)
+    # Rounded probabilities so that thresholds coincide with predicted probabilities
+    y_pred_proba = np.round(np.clip(y * 0.3 + rng.random(500) * 0.7, 0, 1), 2)
+    thresholds = [0.0, 0.01, 0.25, 0.3, 0.333, 0.5, 0.65, 0.99, 1.0]
+
+    score_thresholds_func = _get_score_thresholds_func_confusion_matrix(y=y, y_pred_proba=y_pred_proba, metric=metric, metric_kwargs=dict())
+    assert score_thresholds_func is not None
+    scores = score_thresholds_func(thresholds)
+    for threshold, score in zip(thresholds, scores):
+        y_pred = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type="binary", decision_threshold=threshold)
+        assert score == metric(y, y_pred)
+
+    # Degenerate case with only a single class in y
+    y = np.zeros(10, dtype=int)
+    score_thresholds_func = _get_score_thresholds_func_confusion_matrix(y=y, y_pred_proba=y_pred_proba[:10], metric=metric, metric_kwargs=dict())
+    scores = score_thresholds_func(thresholds)
+    for threshold, score in zip(thresholds, scores):
+        y_pred = get_pred_from_proba(y_pred_proba=y_pred_proba[:10], problem_type="binary", decision_threshold=threshold)
+        assert score == metric(y, y_pred)
+
+
+@pytest.mark.parametrize("metric", [accuracy, balanced_accuracy, f1, mcc, precision, recall])
+def test_calibrate_decision_threshold_exact_is_at_least_as_good_as_grid(metric):
+    """Test that the exact search scores at least as well as the grid search, and strictly better when the optimum lies between grid points"""
+    rng = np.random.default_rng(seed=1)
+    y = rng.integers(0, 2, size=300)
+    y_pred_proba = np.round(np.clip(y * 0.2 + rng.random(300) * 0.8, 0, 1), 3)
+
+    decision_threshold = calibrate_decision_threshold(y=y, y_pred_proba=y_pred_proba, metric=metric)
+    # Wrapping the metric in a lambda forces the grid search with per-threshold evaluation
+    decision_threshold_grid = calibrate_decision_threshold(y=y, y_pred_proba=y_pred_proba, metric=lambda y, y_pred: metric(y, y_pred), metric_name=metric.name)
+
+    def _score(threshold):
+        return metric(y, get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type="binary", decision_threshold=threshold))
+
+    assert _score(decision_threshold) >= _score(decision_threshold_grid)
+    # The exact search checks every distinct prediction, so no threshold scores better
+    for threshold in np.linspace(0, 1, 1001):
+        assert _score(threshold) <= _score(decision_threshold)
+
+
+def test_calibrate_decision_threshold_exact_finds_threshold_between_grid_points():
+    # Only thresholds in [0.301, 0.309) separate the classes perfectly, which the default grid and secondary search miss
+    y = np.array([0, 0, 0, 1, 1, 1])
+    y_pred_proba = np.array([0.1, 0.2, 0.301, 0.309, 0.34, 0.9])
+
+    decision_threshold = calibrate_decision_threshold(y=y, y_pred_proba=y_pred_proba, metric=accuracy, secondary_decision_thresholds=None)
+    decision_threshold_grid = calibrate_decision_threshold(
+        y=y, y_pred_proba=y_pred_proba, metric=lambda y, y_pred: accuracy(y, y_pred), secondary_decision_thresholds=None
+    )
+    assert decision_threshold == 0.301
+    y_pred = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type="binary", decision_threshold=decision_threshold)
+    y_pred_grid = get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type="binary", decision_threshold=decision_threshold_grid)
+    assert accuracy(y, y_pred) == 1.0
+    assert accuracy(y, y_pred_grid) < 1.0
+
+
+def test_calibrate_decision_threshold_vectorized_unsupported():
+    y, y_pred_proba = _get_sample_data()
+    assert _get_score_thresholds_func_confusion_matrix(y=y, y_pred_proba=y_pred_proba, metric=f1_macro, metric_kwargs=dict()) is None
+    assert _get_score_thresholds_func_confusion_matrix(y=y, y_pred_proba=y_pred_proba, metric=f1, metric_kwargs=dict(sample_weight=y)) is None
+    assert _get_score_thresholds_func_confusion_matrix(y=y + 1, y_pred_proba=y_pred_proba, metric=f1, metric_kwargs=dict()) is None
+    assert _get_score_thresholds_func_confusion_matrix(y=y, y_pred_proba=y_pred_proba, metric=lambda y, y_pred: 0, metric_kwargs=dict()) is None
@@ -1,5 +1,6 @@
 import pytest
 
+from autogluon.core.scheduler.parallel_scheduler import LocalParallelScheduler
 from autogluon.core.scheduler.scheduler_factory import get_hyperparameter_tune_kwargs_preset, scheduler_factory
 from autogluon.core.scheduler.seq_scheduler import LocalSequentialScheduler
 
@@ -55,3 +56,8 @@ def test_get_hyperparameter_tune_kwargs_preset__preset_exists():
 def test_get_hyperparameter_tune_kwargs_preset__preset_missing():
     with pytest.raises(ValueError, match='Invalid hyperparameter_tune_kwargs preset value "unknown"'):
         get_hyperparameter_tune_kwargs_preset(preset="unknown")
+
+
+def test_scheduler_factory__can_construct_parallel_scheduler_from_preset():
+    scheduler_cls, _ = scheduler_factory(hyperparameter_tune_kwargs="local_parallel_random", num_trials=2)
+    assert scheduler_cls == LocalParallelScheduler, "scheduler_cls must be correct"
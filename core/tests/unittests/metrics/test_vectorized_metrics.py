@@ -0,0 +1,89 @@
+import warnings
+
+import numpy as np
+import pytest
+import sklearn.metrics
+
+from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION
+from autogluon.core.metrics import get_metric, make_scorer
+from autogluon.core.metrics.vectorized_metrics import get_vectorized_score_func
+
+
+def _get_y_pred_batch(problem_type: str, metric_name: str, n_batch: int = 5, n_samples: int = 200, n_classes: int = 4):
+    rng = np.random.default_rng(0)
+    if problem_type == REGRESSION:
+        y_true = rng.normal(size=n_samples)
+        y_pred_batch = y_true + rng.normal(size=(n_batch, n_samples))
+    elif problem_type == BINARY:
+        y_true = rng.integers(0, 2, size=n_samples)
+        y_pred_batch = rng.uniform(size=(n_batch, n_samples))
+        if metric_name == "accuracy":
+            y_pred_batch = (y_pred_batch > 0.5).astype(int)
+    else:
+        y_true = rng.integers(0, n_classes, size=n_samples)
+        y_pred_batch = rng.dirichlet(np.ones(n_classes), size=(n_batch, n_samples))
+        if metric_name == "accuracy":
+            y_pred_batch = y_pred_batch.argmax(axis=-1)
+    return y_true, y_pred_batch
+
+
+@pytest.mark.parametrize(
+    "problem_type,metric_name",
+    [
+        (BINARY, "log_loss"),
+        (BINARY, "accuracy"),
+        (BINARY, "roc_auc"),
+        (MULTICLASS, "log_loss"),
+        (MULTICLASS, "accuracy"),
+        (REGRESSION, "root_mean_squared_error"),
+    ],
+)
+def test_when_vectorized_score_func_called_then_scores_match_scorer(problem_type, metric_name):
+    metric = get_metric(metric_name, problem_type=problem_type)
+    score_batch_func = get_vectorized_score_func(metric)
+    assert score_batch_func is not None
+    y_true, y_pred_batch = _get_y_pred_batch(problem_type=problem_type, metric_name=metric_name)
+    scores = score_batch_func(y_true, y_pred_batch)
+    expected_scores = np.array([metric(y_true, y_pred) for y_pred in y_pred_batch])
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-10)
+
+
+def test_when_roc_auc_has_tied_scores_then_vectorized_score_matches_scorer():
+    metric = get_metric("roc_auc", problem_type=BINARY)
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=100)
+    y_pred_batch = rng.integers(0, 5, size=(3, 100)) / 4
+    scores = get_vectorized_score_func(metric)(y_true, y_pred_batch)
+    np.testing.assert_allclose(scores, [metric(y_true, y_pred) for y_pred in y_pred_batch], rtol=1e-10)
+
+
+@pytest.mark.parametrize("metric_name", ["f1", "mcc", "balanced_accuracy"])
+def test_when_metric_has_no_vectorized_implementation_then_none_is_returned(metric_name):
+    assert get_vectorized_score_func(get_metric(metric_name, problem_type=BINARY)) is None
+
+
+def test_when_metric_has_custom_kwargs_then_none_is_returned():
+    from autogluon.core.metrics import rmse_func
+
+    metric = make_scorer("custom_rmse", rmse_func, optimum=0, greater_is_better=False, metric_kwargs={"multioutput": "raw_values"})
+    assert get_vectorized_score_func(metric) is None
+
+
+@pytest.mark.parametrize("dtype,rtol", [(np.float64, 1e-10), (np.float32, 1e-5)])
+def test_when_multiclass_predictions_need_clipping_then_vectorized_log_loss_matches_sklearn(dtype, rtol):
+    rng = np.random.default_rng(0)
+    n_classes = 4
+    y_true = rng.integers(0, n_classes, size=200)
+    y_pred_batch = rng.dirichlet(np.ones(n_classes), size=(3, 200))
+    # Probabilities of exactly 0 and 1 are clipped, and rows that do not sum to 1 are renormalized
+    y_pred_batch[0, :50] = np.eye(n_classes)[(y_true[:50] + 1) % n_classes]
+    y_pred_batch[1, :50] = np.eye(n_classes)[y_true[:50]]
+    y_pred_batch[2] *= rng.uniform(0.9, 1.1, size=(200, 1))
+    y_pred_batch = y_pred_batch.astype(dtype)
+
+    log_loss = get_metric("log_loss", problem_type=MULTICLASS)
+    scores = get_vectorized_score_func(log_loss)(y_true, y_pred_batch)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected_scores = [-sklearn.metrics.log_loss(y_true, y_pred, labels=np.arange(n_classes)) for y_pred in y_pred_batch]
+    np.testing.assert_allclose(scores, expected_scores, rtol=rtol)
@@ -0,0 +1,129 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION
+from autogluon.core.metrics import get_metric
+from autogluon.core.models.greedy_ensemble import ensemble_selection
+from autogluon.core.models.greedy_ensemble.ensemble_selection import EnsembleSelection
+from autogluon.core.utils import compute_weighted_metric, get_pred_from_proba
+
+
+def _reference_weights(predictions, labels, problem_type, metric, ensemble_size):
+    """Straightforward greedy ensemble selection that rebuilds the ensemble prediction and scores each candidate separately."""
+    random_state = np.random.RandomState(0)
+    ensemble = []
+    trajectory = []
+    round_scores = False
+    for i in range(ensemble_size):
+        s = len(ensemble)
+        if s == 0:
+            weighted = np.zeros(predictions[0].shape)
+        else:
+            ensemble_prediction = np.zeros(predictions[0].shape)
+            for idx in ensemble:
+                ensemble_prediction += predictions[idx]
+            weighted = (s / float(s + 1)) * (ensemble_prediction / s)
+        scores = np.zeros(len(predictions))
+        for j, pred in enumerate(predictions):
+            fant = weighted + (1.0 / float(s + 1)) * pred
+            if problem_type == MULTICLASS:
+                fant = fant / fant.sum(axis=1)[:, np.newaxis]
+            if metric.needs_pred:
+                fant = get_pred_from_proba(y_pred_proba=fant, problem_type=problem_type)
+            scores[j] = metric._optimum - compute_weighted_metric(labels, fant, metric, None)
+            if round_scores:
+                scores[j] = scores[j].round(6)
+        all_best = np.argwhere(scores == np.nanmin(scores)).flatten()
+        if len(all_best) > 1 and ensemble:
+            in_ensemble = [m for m in all_best if m in set(ensemble)]
+            if in_ensemble:
+                all_best = in_ensemble
+        best = random_state.choice(all_best)
+        best_score = scores[best]
+        if i == 0 and np.abs(best_score) > 1e-4:
+            round_scores = True
+            best_score = best_score.round(6)
+        ensemble.append(best)
+        trajectory.append(best_score)
+    ensemble = ensemble[: trajectory.index(np.min(trajectory)) + 1]
+    weights = np.zeros(len(predictions))
+    for idx, count in Counter(ensemble).items():
+        weights[idx] = count / len(ensemble)
+    return weights
+
+
+def _get_predictions(problem_type, n_models=8, n_samples=500, n_classes=3):
+    rng = np.random.default_rng(0)
+    if problem_type == REGRESSION:
+        labels = rng.normal(size=n_samples)
+        predictions = [labels + rng.normal(scale=rng.uniform(0.5, 2), size=n_samples) for _ in range(n_models)]
+    elif problem_type == BINARY:
+        labels = rng.integers(0, 2, size=n_samples)
+        predictions = [np.clip(0.3 * labels + 0.7 * rng.uniform(size=n_samples), 0, 1) for _ in range(n_models)]
+    else:
+        labels = rng.integers(0, n_classes, size=n_samples)
+        predictions = []
+        for _ in range(n_models):
+            pred = rng.dirichlet(np.ones(n_classes), size=n_samples)
+            pred[np.arange(n_samples), labels] += rng.uniform()
+            predictions.append(pred / pred.sum(axis=1, keepdims=True))
+    return predictions, labels
+
+
+@pytest.mark.parametrize(
+    "problem_type,metric_name",
+    [
+        (BINARY, "log_loss"),
+        (BINARY, "accuracy"),
+        (BINARY, "roc_auc"),
+        (BINARY, "f1"),
+        (MULTICLASS, "log_loss"),
+        (MULTICLASS, "accuracy"),
+        (MULTICLASS, "balanced_accuracy"),
+        (REGRESSION, "root_mean_squared_error"),
+        (REGRESSION, "r2"),
+    ],
+)
+@pytest.mark.parametrize("max_batch_bytes", [1, 2**28])
+def test_when_ensemble_selection_fit_then_weights_match_reference_implementation(problem_type, metric_name, max_batch_bytes, monkeypatch):
+    monkeypatch.setattr(ensemble_selection, "_MAX_FANTASY_BATCH_BYTES", max_batch_bytes)
+    metric = get_metric(metric_name, problem_type=problem_type)
+    predictions, labels = _get_predictions(problem_type=problem_type)
+    ensemble = EnsembleSelection(ensemble_size=25, problem_type=problem_type, metric=metric, random_state=np.random.RandomState(0))
+    ensemble.fit(predictions=predictions, labels=labels)
+    expected_weights = _reference_weights(predictions, labels, problem_type=problem_type, metric=metric, ensemble_size=25)
+    np.testing.assert_array_equal(ensemble.weights_, expected_weights)
+
+
+@pytest.mark.parametrize("problem_type,metric_name", [(BINARY, "log_loss"), (MULTICLASS, "accuracy"), (REGRESSION, "root_mean_squared_error")])
+def test_when_candidates_scored_in_chunks_then_weights_are_identical(problem_type, metric_name, monkeypatch):
+    metric = get_metric(metric_name, problem_type=problem_type)
+    predictions, labels = _get_predictions(problem_type=problem_type)
+    fantasy_nbytes = predictions[0].astype(np.float64).nbytes
+    weights = []
+    # Chunks of 1 candidate, 3 candidates (with a smaller last chunk) and all candidates at once
+    for max_batch_bytes in [1, 3 * fantasy_nbytes, 2**28]:
+        monkeypatch.setattr(ensemble_selection, "_MAX_FANTASY_BATCH_BYTES", max_batch_bytes)
+        ensemble = EnsembleSelection(ensemble_size=25, problem_type=problem_type, metric=metric, random_state=np.random.RandomState(0))
+        ensemble.fit(predictions=list(predictions), labels=labels)
+        weights.append(ensemble.weights_)
+    for weights_chunked in weights[:-1]:
+        np.testing.assert_array_equal(weights_chunked, weights[-1])
+
+
+def test_when_candidates_scored_one_at_a_time_then_batch_buffer_is_not_allocated(monkeypatch):
+    metric = get_metric("f1", problem_type=BINARY)
+    predictions, labels = _get_predictions(problem_type=BINARY)
+    ensemble = EnsembleSelection(ensemble_size=5, problem_type=BINARY, metric=metric, random_state=np.random.RandomState(0))
+    zeros = np.zeros
+    allocated_shapes = []
+
+    def recording_zeros(shape, *args, **kwargs):
+        allocated_shapes.append(shape)
+        return zeros(shape, *args, **kwargs)
+
+    monkeypatch.setattr(ensemble_selection.np, "zeros", recording_zeros)
+    ensemble.fit(predictions=predictions, labels=labels, sample_weight=np.ones(len(labels)))
+    assert all(np.prod(shape) <= predictions[0].size for shape in allocated_shapes)
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from autogluon.common import space
+from autogluon.core.hpo.executors import CustomHpoExecutor
+from autogluon.core.scheduler import LocalParallelScheduler
+
+# Trial functions are executed in worker processes, so they must be defined at the module level
+
+
+def _train_fn_reward_equals_a(args, reporter):
+    reporter(epoch=1, accuracy=args["a"])
+
+
+def _train_fn_fails_for_large_a(args, reporter):
+    if args["a"] > 0.7:
+        raise Exception("Failed Trial")
+    reporter(epoch=1, accuracy=args["a"])
+
+
+def _train_fn_sleep(args, reporter):
+    time.sleep(0.2)
+    reporter(epoch=1, accuracy=args["a"])
+
+
+def _get_scheduler(train_fn, **kwargs):
+    return LocalParallelScheduler(
+        train_fn,
+        search_space=dict(a=space.Real(0, 1)),
+        reward_attr="accuracy",
+        time_attr="epoch",
+        **{"resource": {"num_cpus": 1, "num_gpus": 0}, "total_resources": {"num_cpus": 2, "num_gpus": 0}, **kwargs},
+    )
+
+
+def test_when_trials_run_in_parallel_then_each_trial_gets_a_different_config_and_best_config_is_found():
+    scheduler = _get_scheduler(_train_fn_reward_equals_a, num_trials=8)
+    scheduler.run()
+
+    assert sorted(scheduler.config_history.keys()) == list(range(8))
+    sampled_values = [config["a"] for config in scheduler.config_history.values()]
+    assert len(set(sampled_values)) == 8
+    assert scheduler.get_best_reward() == max(sampled_values)
+    assert scheduler.get_best_config() == {"a": max(sampled_values)}
+    assert scheduler.config_history[scheduler.get_best_task_id()] == scheduler.get_best_config()
+    for task_id, history in scheduler.training_history.items():
+        assert history[0]["trial"] == task_id
+
+
+def test_when_trials_fail_then_failures_are_recorded_in_training_history():
+    scheduler = _get_scheduler(_train_fn_fails_for_large_a, num_trials=10)
+    scheduler.run()
+
+    for task_id, history in scheduler.training_history.items():
+        should_fail = scheduler.config_history[task_id]["a"] > 0.7
+        assert any("traceback" in result for result in history) == should_fail
+    successful_values = [c["a"] for c in scheduler.config_history.values() if c["a"] <= 0.7]
+    assert scheduler.get_best_reward() == max(successful_values)
+
+
+def test_when_time_out_is_set_then_no_trials_are_started_after_time_runs_out():
+    scheduler = _get_scheduler(_train_fn_sleep, num_trials=100, time_out=0.5)
+    time_start = time.time()
+    scheduler.run()
+
+    assert len(scheduler.config_history) < 100
+    assert time.time() - time_start < 5
+
+
+@pytest.mark.parametrize(
+    "resource, total_resources, max_concurrent_trials, expected_num_concurrent_trials",
+    [
+        ({"num_cpus": 2, "num_gpus": 0}, {"num_cpus": 8, "num_gpus": 0}, None, 4),
+        ({"num_cpus": 3, "num_gpus": 0}, {"num_cpus": 8, "num_gpus": 0}, None, 2),
+        ({"num_cpus": 1, "num_gpus": 1}, {"num_cpus": 8, "num_gpus": 2}, None, 2),
+        ({"num_cpus": 1, "num_gpus": 0}, {"num_cpus": 8, "num_gpus": 0}, 3, 3),
+        ({"num_cpus": 16, "num_gpus": 0}, {"num_cpus": 8, "num_gpus": 0}, None, 1),
+        ({"num_cpus": "all", "num_gpus": 0}, {"num_cpus": 8, "num_gpus": 0}, None, 1),
+    ],
+)
+def test_when_scheduler_created_then_number_of_concurrent_trials_respects_resources(
+    resource, total_resources, max_concurrent_trials, expected_num_concurrent_trials
+):
+    scheduler = _get_scheduler(
+        _train_fn_reward_equals_a, num_trials=10, resource=resource, total_resources=total_resources, max_concurrent_trials=max_concurrent_trials
+    )
+    assert scheduler.num_concurrent_trials == expected_num_concurrent_trials
+
+
+def test_when_num_trials_is_small_then_number_of_concurrent_trials_does_not_exceed_num_trials():
+    scheduler = _get_scheduler(_train_fn_reward_equals_a, num_trials=2, total_resources={"num_cpus": 8, "num_gpus": 0})
+    assert scheduler.num_concurrent_trials == 2
+
+
+@pytest.mark.parametrize("hyperparameter_tune_kwargs, expected_runs_trials_in_parallel", [("local_parallel_random", True), ("auto", False)])
+def test_when_custom_hpo_executor_initialized_then_parallel_trials_depend_on_scheduler(hyperparameter_tune_kwargs, expected_runs_trials_in_parallel):
+    executor = CustomHpoExecutor()
+    executor.initialize(hyperparameter_tune_kwargs, default_num_trials=4)
+    assert executor.runs_trials_in_parallel == expected_runs_trials_in_parallel
@@ -1,12 +1,19 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from autogluon.core.constants import BINARY, MULTICLASS, MULTICLASS_UPPER_LIMIT, REGRESSION
+from autogluon.core.metrics import log_loss, mean_absolute_error
 from autogluon.core.utils import infer_problem_type
-from autogluon.core.utils.utils import generate_train_test_split
+from autogluon.core.utils.utils import (
+    compute_permutation_feature_importance,
+    convert_df_to_csr,
+    generate_train_test_split,
+    has_sparse_features,
+)
 
 
 class TestInferProblemType(unittest.TestCase):
@@ -133,3 +140,115 @@ def test_generate_train_test_split_edgecase():
         """
         with pytest.raises(ValueError):
             X_train, X_test, y_train, y_test = generate_train_test_split(X=data, y=data["label"], problem_type="multiclass", test_size=test_size)
+
+
+def test_convert_df_to_csr():
+    X = pd.DataFrame(
+        {
+            "float": [1.5, 0.0, np.nan, 2.0],
+            "cat": pd.Categorical(["a", None, "b", "a"]),
+            "sparse_1": pd.arrays.SparseArray([0, 2, 0, 0], dtype=np.uint16),
+            "sparse_2": pd.arrays.SparseArray([1, 0, 0, 3], dtype=np.uint16),
+            "bool": [True, False, True, False],
+            "sparse_nonzero_fill": pd.arrays.SparseArray([5, 5, 1, 5], fill_value=5),
+        }
+    )
+    expected = np.array(
+        [
+            [1.5, 0, 0, 1, 1, 5],
+            [0, -1, 2, 0, 0, 5],
+            [np.nan, 1, 0, 0, 1, 1],
+            [2, 0, 0, 3, 0, 5],
+        ],
+        dtype=np.float32,
+    )
+
+    X_csr = convert_df_to_csr(X, dtype=np.float32)
+
+    assert has_sparse_features(X)
+    assert not has_sparse_features(X[["float", "cat", "bool"]])
+    assert X_csr.format == "csr"
+    assert X_csr.dtype == np.float32
+    np.testing.assert_array_equal(X_csr.toarray(), expected)
+    assert convert_df_to_csr(X[[]]).shape == (4, 0)
+
+
+def _get_permutation_fi_data():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 6)), columns=[f"f{i}" for i in range(6)])
+    y = pd.Series(X["f0"] * 2 + X["f1"] + rng.normal(size=200) * 0.1)
+    return X, y
+
+
+def _predict_linear(X: pd.DataFrame) -> np.ndarray:
+    # f2 has a small random effect, the remaining features are unused
+    return (X["f0"] * 2 + X["f1"] + X["f2"] * 0.01).to_numpy()
+
+
+@pytest.mark.parametrize("subsample_size", [None, 100])
+def test_compute_permutation_feature_importance_num_workers(subsample_size):
+    X, y = _get_permutation_fi_data()
+    features = ["f0", "f1", "f2", "f3", ("f0_f1", ["f0", "f1"])]
+    fi_kwargs = dict(
+        X=X, y=y, predict_func=_predict_linear, eval_metric=mean_absolute_error, features=features, num_shuffle_sets=4, subsample_size=subsample_size
+    )
+
+    fi_df = compute_permutation_feature_importance(**fi_kwargs)
+    fi_df_parallel = compute_permutation_feature_importance(**fi_kwargs, num_workers=3)
+
+    pd.testing.assert_frame_equal(fi_df, fi_df_parallel)
+    assert list(fi_df.index[:3]) == ["f0_f1", "f0", "f1"]
+    assert (fi_df["n"] == 4).all()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_compute_permutation_feature_importance_subsample_reuses_worker_buffers(num_workers):
+    X, y = _get_permutation_fi_data()
+    X["f4"] = pd.Categorical(np.where(X["f4"] > 0, "a", "b"))
+    X["f5"] = (X["f5"] * 10).astype(int)
+    fi_kwargs = dict(X=X, y=y, predict_func=_predict_linear, eval_metric=mean_absolute_error, num_shuffle_sets=5, subsample_size=100)
+
+    with mock.patch.object(pd, "concat", wraps=pd.concat) as mock_concat:
+        fi_df = compute_permutation_feature_importance(**fi_kwargs, num_workers=num_workers)
+    # Each worker allocates its permuted copies once, and overwrites them with the subsample of each shuffle set
+    assert mock_concat.call_count <= num_workers
+
+    # Each shuffle set computed on its own starts from a newly allocated copy of its subsample
+    fi_df_as_list = compute_permutation_feature_importance(**fi_kwargs, num_workers=num_workers, importance_as_list=True)
+    for shuffle_repeat in range(5):
+        fi_df_shuffle_set = compute_permutation_feature_importance(**{**fi_kwargs, "num_shuffle_sets": 1}, random_state=shuffle_repeat)
+        for feature in X.columns:
+            assert fi_df_as_list.loc[feature, "importance"][shuffle_repeat] == fi_df_shuffle_set.loc[feature, "importance"]
+    assert fi_df.loc["f0", "importance"] > 0
+
+
+def test_compute_permutation_feature_importance_vectorized_metric_matches_metric():
+    X, y = _get_permutation_fi_data()
+    y = (y > 0).astype(int)
+
+    def predict_proba(X: pd.DataFrame) -> np.ndarray:
+        y_pred = 1 / (1 + np.exp(-_predict_linear(X)))
+        return np.stack([1 - y_pred, y_pred], axis=1)
+
+    fi_kwargs = dict(X=X, y=y, predict_func=predict_proba, num_shuffle_sets=3)
+    fi_df = compute_permutation_feature_importance(**fi_kwargs, eval_metric=log_loss)
+    # A wrapper without a vectorized implementation scores each permuted copy individually
+    fi_df_expected = compute_permutation_feature_importance(**fi_kwargs, eval_metric=log_loss, quantile_levels=None, sample_weight=None)
+
+    pd.testing.assert_frame_equal(fi_df, fi_df_expected)
+
+
+def test_compute_permutation_feature_importance_early_stop_p_value():
+    X, y = _get_permutation_fi_data()
+    fi_kwargs = dict(X=X, y=y, predict_func=_predict_linear, eval_metric=mean_absolute_error, num_shuffle_sets=8)
+
+    fi_df = compute_permutation_feature_importance(**fi_kwargs)
+    fi_df_early_stop = compute_permutation_feature_importance(**fi_kwargs, early_stop_p_value=0.9)
+
+    # Unused features have an importance of exactly 0 and are stopped after the minimum number of shuffle sets
+    for feature in ["f3", "f4", "f5"]:
+        assert fi_df_early_stop.loc[feature, "n"] == 3
+        assert fi_df_early_stop.loc[feature, "importance"] == 0
+    for feature in ["f0", "f1"]:
+        assert fi_df_early_stop.loc[feature, "n"] == 8
+        assert fi_df_early_stop.loc[feature, "importance"] == fi_df.loc[feature, "importance"]
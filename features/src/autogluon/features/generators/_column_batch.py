@@ -0,0 +1,111 @@
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index, Series
+from pandas.api.extensions import ExtensionArray, ExtensionDtype
+
+ArrayLike = Union[np.ndarray, ExtensionArray]
+
+
+def get_column_array(series: Series) -> ArrayLike:
+    """Returns the values of a Series as a 1-dimensional array, preserving extension dtypes such as category or sparse."""
+    if isinstance(series.dtype, ExtensionDtype):
+        return series.array
+    return series.to_numpy()
+
+
+class ColumnBatch:
+    """
+    Column-oriented batch of rows used by compiled feature generator transforms (refer to `AbstractFeatureGenerator._compile_transform`).
+
+    Columns are either stored as 1-dimensional arrays or lazily referenced from a DataFrame.
+    Lazy references allow generators without a compiled transform to pass their DataFrame output through the plan
+    without splitting it into individual columns, which is important for wide outputs such as text ngrams.
+    Columns referenced from a DataFrame are only materialized as arrays when accessed via `batch[name]`.
+
+    Parameters
+    ----------
+    index : Index
+        The row index of the batch. Used as the index of DataFrames constructed from the batch.
+    arrays : Dict[str, ArrayLike], optional
+        Mapping of column name to 1-dimensional array of length `len(index)`.
+    """
+
+    def __init__(self, index: Index, arrays: Dict[str, ArrayLike] = None):
+        self.index = index
+        self._arrays: Dict[str, ArrayLike] = arrays if arrays is not None else dict()
+        self._frame_columns: Dict[str, DataFrame] = dict()
+
+    @classmethod
+    def from_frame(cls, X: DataFrame, columns: List[str] = None, index: Index = None) -> "ColumnBatch":
+        """Creates a batch which lazily references `columns` of X. X is never altered by operations on the batch."""
+        batch = cls(index=X.index if index is None else index)
+        if columns is None:
+            columns = X.columns
+        batch._frame_columns = {column: X for column in columns}
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays or name in self._frame_columns
+
+    def __getitem__(self, name: str) -> ArrayLike:
+        array = self._arrays.get(name)
+        if array is None:
+            array = get_column_array(self._frame_columns.pop(name)[name])
+            self._arrays[name] = array
+        return array
+
+    def __setitem__(self, name: str, array: ArrayLike):
+        self._arrays[name] = array
+        self._frame_columns.pop(name, None)
+
+    def select(self, columns: List[str]) -> "ColumnBatch":
+        """Returns a new batch containing only `columns`, without copying any data. Raises a KeyError if a column is missing."""
+        batch = ColumnBatch(index=self.index)
+        for column in columns:
+            array = self._arrays.get(column)
+            if array is not None:
+                batch._arrays[column] = array
+            else:
+                batch._frame_columns[column] = self._frame_columns[column]
+        return batch
+
+    def update(self, other: "ColumnBatch"):
+        """Adds all columns of `other` to this batch, overwriting columns with identical names."""
+        for column, array in other._arrays.items():
+            self[column] = array
+        for column, X in other._frame_columns.items():
+            self._arrays.pop(column, None)
+            self._frame_columns[column] = X
+
+    def to_frame(self, columns: List[str], index: Index = None) -> DataFrame:
+        """
+        Constructs a DataFrame of `columns` in the given order.
+        All array columns are combined in a single DataFrame construction, with DataFrame references concatenated afterwards.
+        The output never shares memory with a DataFrame referenced by this batch.
+        """
+        if index is None:
+            index = self.index
+        array_columns = []
+        frame_columns = dict()
+        for column in columns:
+            if column in self._arrays:
+                array_columns.append(column)
+            else:
+                X = self._frame_columns[column]
+                frame_columns.setdefault(id(X), (X, []))[1].append(column)
+        X_out = DataFrame({column: self._arrays[column] for column in array_columns}, index=index, columns=array_columns)
+        if frame_columns:
+            X_out_list = [X_out] if array_columns else []
+            for X, X_columns in frame_columns.values():
+                X = X[X_columns]
+                X.index = index
+                X_out_list.append(X)
+            X_out = pd.concat(X_out_list, axis=1) if len(X_out_list) > 1 else X_out_list[0]
+            if list(X_out.columns) != columns:
+                X_out = X_out[columns]
+        return X_out
@@ -3,7 +3,7 @@ import inspect
 import logging
 import time
 from collections import defaultdict
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 from pandas import DataFrame, Series
 
@@ -12,6 +12,7 @@ from autogluon.common.features.infer_types import get_type_group_map_special, ge
 from autogluon.common.savers import save_pkl
 
 from ..utils import is_useless_feature
+from ._column_batch import ColumnBatch
 
 logger = logging.getLogger(__name__)
 
@@ -337,15 +338,7 @@ class AbstractFeatureGenerator:
                 # therefore, try avoid copying by checking the expected features first.
                 X = X[self.features_in]
         except KeyError:
-            missing_cols = []
-            for col in self.features_in:
-                if col not in X.columns:
-                    missing_cols.append(col)
-            raise KeyError(
-                f"{len(missing_cols)} required columns are missing from the provided dataset to transform using {self.__class__.__name__}. "
-                f"{len(missing_cols)} missing columns: {missing_cols} | "
-                f"{len(list(X.columns))} available columns: {list(X.columns)}"
-            )
+            self._raise_missing_features_in(X)
         if self._pre_astype_generator:
             X = self._pre_astype_generator.transform(X)
         X_out = self._transform(X)
@@ -407,6 +400,62 @@ class AbstractFeatureGenerator:
         """
         raise NotImplementedError
 
+    def _compile_transform(self) -> Optional[Callable[[ColumnBatch], ColumnBatch]]:
+        """
+        Returns a function equivalent to `_transform` which operates on a :class:`ColumnBatch` of 1-dimensional arrays instead of a DataFrame.
+        This is used by `PipelineFeatureGenerator.compile_transform` to flatten a fitted generator tree into a single transform plan,
+        avoiding the per-generator DataFrame construction, selection and concatenation overhead that dominates small batch inference.
+        Any fitted state should be precomputed when this method is called rather than inside the returned function.
+
+        The returned function receives a batch already limited to the columns present in self.features_in,
+        and must return a batch containing every feature in self.features_out with identical values and dtypes to the output of `_transform`.
+        Input arrays must not be altered inplace.
+
+        Returns
+        -------
+        transform_fn : Callable[[ColumnBatch], ColumnBatch], or None
+            If None, the compiled transform falls back to calling `_transform` on a DataFrame constructed from the batch.
+        """
+        return None
+
+    def _get_compiled_transform(self) -> Callable[[ColumnBatch], ColumnBatch]:
+        """
+        Returns the compiled equivalent of the `transform` method (excluding `reset_index` and `column_names_as_str` logic).
+        This chains the compiled transforms of the pre-astype generator, this generator and the post generators.
+        """
+        if not self._is_fit:
+            raise AssertionError(f"{self.__class__.__name__} is not fit.")
+        transform_fn = self._compile_transform()
+        if transform_fn is None:
+            transform_fn = self._transform_compiled_fallback
+        transform_fns = [transform_fn] + [generator._get_compiled_transform() for generator in self._post_generators]
+        if self._pre_astype_generator:
+            transform_fns = [self._pre_astype_generator._get_compiled_transform()] + transform_fns
+        features_in = self.features_in
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch = batch.select(features_in)
+            for fn in transform_fns:
+                batch = fn(batch)
+            return batch
+
+        return _transform_compiled
+
+    def _transform_compiled_fallback(self, batch: ColumnBatch) -> ColumnBatch:
+        X_out = self._transform(batch.to_frame(self.features_in))
+        return ColumnBatch.from_frame(X_out, index=batch.index)
+
+    def _raise_missing_features_in(self, X: DataFrame):
+        missing_cols = []
+        for col in self.features_in:
+            if col not in X.columns:
+                missing_cols.append(col)
+        raise KeyError(
+            f"{len(missing_cols)} required columns are missing from the provided dataset to transform using {self.__class__.__name__}. "
+            f"{len(missing_cols)} missing columns: {missing_cols} | "
+            f"{len(list(X.columns))} available columns: {list(X.columns)}"
+        )
+
     def _infer_features_in_full(self, X: DataFrame, feature_metadata_in: FeatureMetadata = None):
         """
         Infers all input related feature information of X.
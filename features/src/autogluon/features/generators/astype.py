@@ -3,11 +3,13 @@ import logging
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from pandas.api.types import pandas_dtype
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
 from autogluon.common.features.infer_types import get_bool_true_val, get_type_map_raw, get_type_map_real
 from autogluon.common.features.types import R_INT, S_BOOL
 
+from ._column_batch import ColumnBatch, get_column_array
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -161,6 +163,51 @@ class AsTypeFeatureGenerator(AbstractFeatureGenerator):
                     raise e
         return X
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        bool_features = dict(self._bool_features) if self._bool_features else dict()
+        type_map_real_opt = {feature: pandas_dtype(dtype) for feature, dtype in self._type_map_real_opt.items()}
+        int_features = set(self._int_features.tolist())
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for feature in features_in:
+                array = batch[feature]
+                if feature in bool_features:
+                    array = (np.asarray(array, dtype=object) == bool_features[feature]).astype(np.int8)
+                batch_out[feature] = array
+            features_to_convert = [feature for feature, dtype in type_map_real_opt.items() if batch_out[feature].dtype != dtype]
+            if not features_to_convert:
+                return batch_out
+
+            with_null_features = [feature for feature in features_to_convert if feature in int_features and pd.isnull(batch_out[feature]).any()]
+            if with_null_features:
+                logger.warning(
+                    "WARNING: Int features without null values "
+                    "at train time contain null values at inference time! "
+                    "Imputing nulls to 0. To avoid this, pass the features as floats during fit!"
+                )
+                logger.warning(f"WARNING: Int features with nulls: {with_null_features}")
+                for feature in with_null_features:
+                    batch_out[feature] = get_column_array(pd.Series(batch_out[feature], copy=False).fillna(0))
+            try:
+                for feature in features_to_convert:
+                    batch_out[feature] = self._astype_array(batch_out[feature], type_map_real_opt[feature])
+            except Exception as e:
+                self._log_invalid_dtypes(X=batch_out.to_frame(features_in))
+                raise e
+            return batch_out
+
+        return _transform_compiled
+
+    @staticmethod
+    def _astype_array(array, dtype):
+        if isinstance(array, np.ndarray) and isinstance(dtype, np.dtype) and array.dtype.kind in "biuf":
+            # Casting float to int is left to pandas, which raises on non-finite values instead of silently overflowing
+            if dtype.kind == "f" or (dtype.kind in "biu" and array.dtype.kind in "biu"):
+                return array.astype(dtype)
+        return get_column_array(pd.Series(array, copy=False).astype(dtype))
+
     def _log_invalid_dtypes(self, X: pd.DataFrame):
         """
         Logs detailed information on all feature transformations, including exceptions that occur.
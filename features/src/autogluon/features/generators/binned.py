@@ -8,6 +8,7 @@ from autogluon.common.features.types import R_FLOAT, R_INT, S_BINNED
 
 from .. import binning
 from ..utils import get_smallest_valid_dtype_int
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,18 @@ class BinnedFeatureGenerator(AbstractFeatureGenerator):
         X_out = pd.DataFrame(X_out, index=X.index)
         return X_out
 
+    def _compile_transform(self):
+        bin_map = dict(self._bin_map)
+        astype_map = dict(self._astype_map)
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for column, bins in bin_map.items():
+                batch_out[column] = binning.bin_column(series=batch[column], bins=bins, dtype=astype_map[column])
+            return batch_out
+
+        return _transform_compiled
+
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
         if self._bin_map:
@@ -6,6 +6,7 @@ from pandas import DataFrame
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -184,6 +185,19 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
 
         return X_out
 
+    def _compile_transform(self):
+        transform_fns_by_group = [[generator._get_compiled_transform() for generator in generator_group] for generator_group in self.generators]
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            for transform_fns in transform_fns_by_group:
+                batch_out = ColumnBatch(index=batch.index)
+                for fn in transform_fns:
+                    batch_out.update(fn(batch))
+                batch = batch_out
+            return batch
+
+        return _transform_compiled
+
     def get_feature_links_chain(self):
         feature_links_chain = []
         for i in range(len(self.generators)):
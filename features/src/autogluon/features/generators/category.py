@@ -16,6 +16,7 @@ from autogluon.common.features.types import (
     S_TEXT_AS_CATEGORY,
 )
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 from .memory_minimize import CategoryMemoryMinimizeFeatureGenerator
 
@@ -131,6 +132,23 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
             X_category = DataFrame(index=X.index)
         return X_category
 
+    def _compile_transform(self):
+        if self.features_in and self.category_map is None:
+            return None
+        category_dtypes = {column: CategoricalDtype(categories=column_map) for column, column_map in (self.category_map or dict()).items()}
+        fillna_map = dict(self._fillna_map) if self._fillna_map is not None else dict()
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for column, dtype in category_dtypes.items():
+                array = pd.Categorical(batch[column], dtype=dtype)
+                if column in fillna_map:
+                    array = array.fillna(fillna_map[column])
+                batch_out[column] = array
+            return batch_out
+
+        return _transform_compiled
+
     def _generate_category_map(self, X: DataFrame) -> (DataFrame, dict):
         if self.features_in:
             fill_nan_map = dict()
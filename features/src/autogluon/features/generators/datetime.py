@@ -6,6 +6,7 @@ from pandas import DataFrame
 
 from autogluon.common.features.types import R_DATETIME, S_DATETIME_AS_OBJECT
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -71,6 +72,25 @@ class DatetimeFeatureGenerator(AbstractFeatureGenerator):
             X_datetime[datetime_feature] = pd.to_numeric(X_datetime[datetime_feature])
         return X_datetime
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        features = list(self.features)
+        fillna_map = dict(self._fillna_map)
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for datetime_feature in features_in:
+                series = pd.to_datetime(pd.Series(batch[datetime_feature]), utc=True, errors="coerce", format="mixed")
+                broken = series.isna()
+                if broken.any():
+                    series[broken] = fillna_map[datetime_feature]
+                for feature in features:
+                    batch_out[datetime_feature + "." + feature] = getattr(series.dt, feature).astype(np.int64).to_numpy()
+                batch_out[datetime_feature] = pd.to_numeric(series).to_numpy()
+            return batch_out
+
+        return _transform_compiled
+
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
         if self._fillna_map:
@@ -8,6 +8,7 @@ from pandas import DataFrame
 
 from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,13 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _compile_transform(self):
+        return self._transform_compiled
+
+    @staticmethod
+    def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+        return batch
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
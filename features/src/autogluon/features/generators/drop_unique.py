@@ -5,6 +5,7 @@ from pandas import DataFrame
 from autogluon.common.features.feature_metadata import FeatureMetadata
 from autogluon.common.features.types import R_CATEGORY, R_OBJECT, S_IMAGE_BYTEARRAY, S_IMAGE_PATH, S_TEXT
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,13 @@ class DropUniqueFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _compile_transform(self):
+        return self._transform_compiled
+
+    @staticmethod
+    def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+        return batch
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -2,10 +2,12 @@ import logging
 import warnings
 
 import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from autogluon.common.features.types import R_OBJECT
 
+from ._column_batch import ColumnBatch, get_column_array
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -72,6 +74,30 @@ class FillNaFeatureGenerator(AbstractFeatureGenerator):
                     X = X.fillna(self._fillna_feature_map, inplace=False, downcast=False)
         return X
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        # Filling with NaN is a no-op, so only features with a non-null fill value are processed.
+        fillna_feature_map = {feature: value for feature, value in self._fillna_feature_map.items() if not pd.isnull(value)}
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = batch.select(features_in)
+            for feature, value in fillna_feature_map.items():
+                array = batch[feature]
+                if isinstance(array, np.ndarray) and array.dtype == object:
+                    mask = pd.isnull(array)
+                    if mask.any():
+                        array = array.copy()
+                        array[mask] = value
+                else:
+                    with warnings.catch_warnings():
+                        # Refer to the comment in `_transform` for why `downcast=False` is used.
+                        warnings.simplefilter(action="ignore", category=FutureWarning)
+                        array = get_column_array(pd.Series(array, copy=False).fillna(value, downcast=False))
+                batch_out[feature] = array
+            return batch_out
+
+        return _transform_compiled
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -2,6 +2,7 @@ import logging
 
 from pandas import DataFrame
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,13 @@ class IdentityFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _compile_transform(self):
+        return self._transform_compiled
+
+    @staticmethod
+    def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+        return batch
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -6,6 +6,7 @@ from pandas import DataFrame
 
 from autogluon.common.features.types import R_OBJECT, S_BOOL
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,21 @@ class IsNanFeatureGenerator(AbstractFeatureGenerator):
                 is_nan_features["__nan__." + feature] = X[feature].isnull().astype(np.uint8)
         return pd.DataFrame(is_nan_features, index=X.index)
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        null_feature_map = dict(self._null_feature_map) if self._null_feature_map else dict()
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for feature in features_in:
+                if feature in null_feature_map:
+                    batch_out["__nan__." + feature] = np.asarray(batch[feature] == null_feature_map[feature]).astype(np.uint8)
+                else:
+                    batch_out["__nan__." + feature] = pd.isnull(batch[feature]).astype(np.uint8)
+            return batch_out
+
+        return _transform_compiled
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
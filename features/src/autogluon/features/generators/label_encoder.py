@@ -5,6 +5,7 @@ from pandas import DataFrame
 
 from autogluon.common.features.types import R_CATEGORY, S_TEXT_AS_CATEGORY
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,14 @@ class LabelEncoderFeatureGenerator(AbstractFeatureGenerator):
     def get_default_infer_features_in_args() -> dict:
         return dict(valid_raw_types=[R_CATEGORY])
 
+    def _compile_transform(self):
+        features_in = self.features_in
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            return ColumnBatch(index=batch.index, arrays={feature: batch[feature].codes for feature in features_in})
+
+        return _transform_compiled
+
     @staticmethod
     def convert_category_to_int(X: DataFrame) -> DataFrame:
         # TODO: add inplace option?
@@ -7,6 +7,7 @@ from autogluon.common.features.types import R_CATEGORY, R_INT
 
 from ..utils import clip_and_astype
 from . import AbstractFeatureGenerator
+from ._column_batch import ColumnBatch
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +48,23 @@ class CategoryMemoryMinimizeFeatureGenerator(AbstractFeatureGenerator):
             X = DataFrame(X_renamed)
         return X
 
+    def _compile_transform(self):
+        if not self._category_maps:
+            return self._transform_compiled_identity
+        category_maps = dict(self._category_maps)
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for column, column_map in category_maps.items():
+                batch_out[column] = batch[column].rename_categories(column_map)
+            return batch_out
+
+        return _transform_compiled
+
+    @staticmethod
+    def _transform_compiled_identity(batch: ColumnBatch) -> ColumnBatch:
+        return batch
+
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
         if self._category_maps:
@@ -96,5 +114,17 @@ class NumericMemoryMinimizeFeatureGenerator(AbstractFeatureGenerator):
     def _minimize_numeric_memory_usage(self, X: DataFrame):
         return clip_and_astype(df=X, clip_min=self._clip_min, clip_max=self._clip_max, dtype=self.dtype_out)
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        clip_min, clip_max, dtype_out = self._clip_min, self._clip_max, self.dtype_out
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for feature in features_in:
+                batch_out[feature] = np.clip(batch[feature], clip_min, clip_max).astype(dtype_out)
+            return batch_out
+
+        return _transform_compiled
+
     def _more_tags(self):
         return {"feature_interactions": False}
@@ -1,13 +1,14 @@
 import copy
 import logging
 
-from pandas import DataFrame
+from pandas import DataFrame, RangeIndex
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
 from autogluon.common.features.infer_types import get_type_map_real
 from autogluon.common.utils.pandas_utils import get_approximate_df_mem_usage
 from autogluon.common.utils.resource_utils import ResourceManager
 
+from ._column_batch import ColumnBatch
 from .bulk import BulkFeatureGenerator
 from .drop_unique import DropUniqueFeatureGenerator
 from .dummy import DummyFeatureGenerator
@@ -64,6 +65,9 @@ class PipelineFeatureGenerator(BulkFeatureGenerator):
         self.post_memory_usage = None
         self.post_memory_usage_per_row = None
 
+        self._use_compiled_transform = False  # If True, transform uses the compiled transform plan. Set by `compile_transform`.
+        self._compiled_transform = None
+
     def fit_transform(self, X: DataFrame, y=None, feature_metadata_in: FeatureMetadata = None, **kwargs) -> DataFrame:
         X_out = super().fit_transform(X=X, y=y, feature_metadata_in=feature_metadata_in, **kwargs)
         self._compute_post_memory_usage(X_out)
@@ -71,6 +75,43 @@ class PipelineFeatureGenerator(BulkFeatureGenerator):
 
         return X_out
 
+    def transform(self, X: DataFrame) -> DataFrame:
+        if getattr(self, "_use_compiled_transform", False):
+            return self._transform_compiled(X)
+        return super().transform(X)
+
+    def compile_transform(self):
+        """
+        Compiles the fitted generator tree into a single-pass transform plan used by all future calls to `transform`.
+        This is intended to reduce the latency of transforming small batches (1-100 rows), such as in online inference.
+
+        Rather than every inner generator constructing, selecting and concatenating intermediate DataFrames,
+        the plan operates on the individual column arrays of the input: category remapping, fillna, datetime and dtype conversions
+        are applied to each column array directly, with fitted state precomputed once,
+        and the output DataFrame is constructed in a single step at the end.
+        Generators which do not implement a compiled transform (refer to `AbstractFeatureGenerator._compile_transform`)
+        are still called with a DataFrame of their input features, so the output is identical to the uncompiled `transform`.
+
+        The compiled plan is not saved when the generator is pickled, and is instead recreated on the first call to `transform` after loading.
+        """
+        if not self._is_fit:
+            raise AssertionError(f"{self.__class__.__name__} is not fit.")
+        self._compiled_transform = self._get_compiled_transform()
+        self._use_compiled_transform = True
+
+    def _transform_compiled(self, X: DataFrame) -> DataFrame:
+        if self._compiled_transform is None:
+            self._compiled_transform = self._get_compiled_transform()
+        if self.column_names_as_str:
+            X = X.set_axis(X.columns.astype(str), axis=1, copy=False)  # Ensure all column names are strings
+        for feature in self.features_in:
+            if feature not in X.columns:
+                self._raise_missing_features_in(X)
+        index = RangeIndex(len(X)) if self.reset_index else X.index
+        batch = ColumnBatch.from_frame(X, columns=self.features_in, index=index)
+        batch = self._compiled_transform(batch)
+        return batch.to_frame(self.features_out, index=X.index)
+
     def _fit_transform(self, X: DataFrame, y=None, **kwargs):
         X_out, type_group_map_special = super()._fit_transform(X=X, y=y, **kwargs)
         X_out, type_group_map_special = self._fit_transform_custom(X_out=X_out, type_group_map_special=type_group_map_special, y=y)
@@ -100,6 +141,7 @@ class PipelineFeatureGenerator(BulkFeatureGenerator):
         super()._remove_features_in(features)
         if features:
             self._feature_metadata_in_real = self._feature_metadata_in_real.remove_features(features=features)
+            self._compiled_transform = None  # The compiled plan captures fitted state, recompile lazily
 
     def _pre_fit_validate(self, X: DataFrame, **kwargs):
         super()._pre_fit_validate(X=X, **kwargs)
@@ -144,6 +186,11 @@ class PipelineFeatureGenerator(BulkFeatureGenerator):
                 f"Consider increasing memory or subsampling the data to avoid instability.",
             )
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_compiled_transform"] = None  # Closures can't be pickled, the plan is recompiled on the next call to transform
+        return state
+
     def print_feature_metadata_info(self, log_level=20):
         if self._useless_features_in:
             self._log(log_level, f"\tUseless Original Features (Count: {len(self._useless_features_in)}): {list(self._useless_features_in)}")
@@ -3,6 +3,7 @@ import logging
 
 from pandas import DataFrame
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -50,6 +51,23 @@ class RenameFeatureGenerator(AbstractFeatureGenerator):
             X.columns = self.features_out
         return X
 
+    def _compile_transform(self):
+        if not self._is_updated_name:
+            return self._transform_compiled_identity
+        column_rename_map = {orig: new for orig, new in zip(self.features_in, self.features_out)}
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            batch_out = ColumnBatch(index=batch.index)
+            for orig, new in column_rename_map.items():
+                batch_out[new] = batch[orig]
+            return batch_out
+
+        return _transform_compiled
+
+    @staticmethod
+    def _transform_compiled_identity(batch: ColumnBatch) -> ColumnBatch:
+        return batch
+
     def _get_renamed_features(self, X: DataFrame) -> (DataFrame, dict):
         X_columns_orig = list(X.columns)
         X_columns_new = list(X.columns)
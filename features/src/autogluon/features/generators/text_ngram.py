@@ -4,10 +4,11 @@ import traceback
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 from pandas import DataFrame, Series
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression
 
-from autogluon.common.features.types import S_IMAGE_BYTEARRAY, S_IMAGE_PATH, S_TEXT, S_TEXT_NGRAM
+from autogluon.common.features.types import S_IMAGE_BYTEARRAY, S_IMAGE_PATH, S_SPARSE, S_TEXT, S_TEXT_NGRAM
 from autogluon.common.utils.lite import disable_if_lite_mode
 
 from ..vectorizers import downscale_vectorizer, get_ngram_freq, vectorizer_auto_ml_default
@@ -17,7 +18,6 @@ logger = logging.getLogger(__name__)
 
 
 # TODO: Add argument to define the text preprocessing logic
-# TODO: Add argument to output ngrams as a sparse matrix
 # TODO: Add HashingVectorizer support
 # TODO: Documentation
 class TextNgramFeatureGenerator(AbstractFeatureGenerator):
@@ -45,17 +45,26 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         ngram features will be removed in least frequent to most frequent order.
         Note: For vectorizer_strategy values other than 'combined', the resulting ngrams may use more than this value.
         It is recommended to only increase this value above 0.15 if confident that higher values will not result in out-of-memory errors.
+        If `sparse=True`, the memory usage is estimated from the number of non-zero ngram counts instead of the dense size.
+    sparse : bool, default False
+        If True, the ngram features are output as pandas sparse columns built directly from the vectorizer's sparse matrix,
+        and are marked with the 'sparse' special type.
+        This avoids materializing a dense (n_rows, n_ngrams) array, which greatly reduces memory usage on text-heavy data.
+        Models which accept sparse input (such as LightGBM, XGBoost and LinearModel) train on these features without densifying them.
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
     """
 
-    def __init__(self, vectorizer=None, vectorizer_strategy="combined", max_memory_ratio=0.15, prefilter_tokens=False, prefilter_token_count=100, **kwargs):
+    def __init__(
+        self, vectorizer=None, vectorizer_strategy="combined", max_memory_ratio=0.15, prefilter_tokens=False, prefilter_token_count=100, sparse=False, **kwargs
+    ):
         super().__init__(**kwargs)
         self.vectorizers = []
         # TODO: 0.20 causes OOM error with 64 GB ram on NN with several datasets. LightGBM and CatBoost succeed
         # TODO: Finetune this, or find a better way to ensure stability
         # TODO: adjust max_memory_ratio correspondingly if prefilter_tokens==True
         self.max_memory_ratio = max_memory_ratio  # Ratio of maximum memory the output ngram features are allowed to use in dense int32 form.
+        self.sparse = sparse
 
         if vectorizer is None:
             self.vectorizer_default_raw = vectorizer_auto_ml_default()
@@ -94,6 +103,8 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
             X_out = X_out[X_out.columns[self.token_mask]]  # select the columns that are most correlated with y
 
         type_family_groups_special = {S_TEXT_NGRAM: list(X_out.columns)}
+        if self.sparse:
+            type_family_groups_special[S_SPARSE] = list(X_out.columns)
         return X_out, type_family_groups_special
 
     def _transform(self, X: DataFrame) -> DataFrame:
@@ -217,11 +228,17 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
                 nlp_features_names_final = np.array([f"{nlp_feature}.{x}" for x in nlp_features_names] + [f"{nlp_feature}._total_"])
                 self._feature_names_dict[nlp_feature] = nlp_features_names_final
 
-            transform_array = transform_matrix.toarray()
-            # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
-            nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
-            transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
-            X_nlp_features = pd.DataFrame(transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index)  # TODO: Consider keeping sparse
+            if self.sparse:
+                transform_matrix.eliminate_zeros()
+                nonzero_count = np.diff(transform_matrix.indptr).astype(np.uint16)
+                transform_matrix = scipy.sparse.hstack([transform_matrix, np.expand_dims(nonzero_count, axis=1)], format="csr")
+                X_nlp_features = pd.DataFrame.sparse.from_spmatrix(transform_matrix, columns=self._feature_names_dict[nlp_feature], index=X.index)
+            else:
+                transform_array = transform_matrix.toarray()
+                # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
+                nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
+                transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
+                X_nlp_features = pd.DataFrame(transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index)
             X_nlp_features_combined.append(X_nlp_features)
 
         if X_nlp_features_combined:
@@ -240,8 +257,12 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         def _adjust_per_memory_constraints(downsample_ratio: int):
             import psutil
 
-            # This assumes that the ngrams eventually turn into int32/float32 downstream
-            predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
+            if self.sparse:
+                # This assumes that the ngrams eventually turn into a float32 CSR matrix downstream (value + column index per non-zero entry)
+                predicted_ngrams_memory_usage_bytes = (transform_matrix.nnz + len(text_data)) * 8 + 80
+            else:
+                # This assumes that the ngrams eventually turn into int32/float32 downstream
+                predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
             mem_avail = psutil.virtual_memory().available
             mem_rss = psutil.Process().memory_info().rss
             predicted_rss = mem_rss + predicted_ngrams_memory_usage_bytes
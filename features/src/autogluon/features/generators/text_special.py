@@ -7,6 +7,7 @@ from pandas import DataFrame, Series
 
 from autogluon.common.features.types import S_IMAGE_BYTEARRAY, S_IMAGE_PATH, S_TEXT, S_TEXT_SPECIAL
 
+from ._column_batch import ColumnBatch
 from .abstract import AbstractFeatureGenerator
 from .binned import BinnedFeatureGenerator
 
@@ -62,6 +63,20 @@ class TextSpecialFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return self._generate_features_text_special(X)
 
+    def _compile_transform(self):
+        features_in = self.features_in
+        symbols_per_feature = dict(self._symbols_per_feature)
+
+        def _transform_compiled(batch: ColumnBatch) -> ColumnBatch:
+            X_text_special_combined = {}
+            for text_feature in features_in:
+                X_text_special_combined = self._generate_text_special(
+                    Series(batch[text_feature]), text_feature, symbols=symbols_per_feature[text_feature], X_dict=X_text_special_combined
+                )
+            return ColumnBatch(index=batch.index, arrays=X_text_special_combined)
+
+        return _transform_compiled
+
     def _compute_feature_names_dict(self) -> dict:
         feature_names = {}
         for feature in self.features_in:
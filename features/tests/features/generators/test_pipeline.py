@@ -1,8 +1,15 @@
+import copy
+import pickle
+import time
+
 import numpy as np
+import pytest
+from pandas.testing import assert_frame_equal
 from sklearn.feature_extraction.text import CountVectorizer
 
 from autogluon.common.features.types import R_CATEGORY, R_FLOAT, R_INT
 from autogluon.features.generators import (
+    AutoMLPipelineFeatureGenerator,
     CategoryFeatureGenerator,
     DatetimeFeatureGenerator,
     IdentityFeatureGenerator,
@@ -174,3 +181,67 @@ def test_pipeline_feature_generator_removal_advanced(generator_helper, data_help
     assert list(output_data["cat"].values) == [0, np.nan, 0, 1, 1, 1, np.nan, np.nan, np.nan]
 
     assert feature_metadata_in_unused_full == expected_feature_metadata_in_unused_full
+
+
+def test_pipeline_feature_generator_compile_transform(data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+    generator = AutoMLPipelineFeatureGenerator(enable_raw_text_features=True)
+    generator.fit_transform(input_data.copy())
+
+    input_data_transform = input_data.copy()
+    input_data_transform.index = [f"row_{i}" for i in range(len(input_data_transform))]
+    input_data_transform.loc["row_0", "obj"] = "unseen_category"
+    input_data_transform.loc["row_1", "datetime_as_object"] = "invalid_datetime"
+    expected_output_data = generator.transform(input_data_transform.copy())
+
+    # When
+    generator_compiled = copy.deepcopy(generator)
+    generator_compiled.compile_transform()
+    output_data = generator_compiled.transform(input_data_transform)
+
+    # Then
+    assert_frame_equal(output_data, expected_output_data)
+    # Input data is not altered
+    assert input_data_transform.loc["row_0", "obj"] == "unseen_category"
+    for i in range(len(input_data_transform)):
+        input_row = input_data_transform.iloc[[i]]
+        assert_frame_equal(generator_compiled.transform(input_row), generator.transform(input_row.copy()))
+
+    # The compiled plan is recreated after pickling
+    generator_loaded = pickle.loads(pickle.dumps(generator_compiled))
+    assert generator_loaded._compiled_transform is None
+    assert_frame_equal(generator_loaded.transform(input_data_transform), expected_output_data)
+
+    with pytest.raises(KeyError):
+        generator_compiled.transform(input_data_transform.drop(columns=["obj"]))
+
+
+@pytest.mark.slow
+def test_pipeline_feature_generator_compile_transform_small_batches(data_helper):
+    """Compares the latency of the compiled transform to the uncompiled transform at batch sizes of 1, 10 and 100 rows"""
+    input_data = data_helper.generate_multi_feature_full()
+    generator = AutoMLPipelineFeatureGenerator(verbosity=0)
+    generator.fit_transform(input_data.copy())
+    generator_compiled = copy.deepcopy(generator)
+    generator_compiled.compile_transform()
+
+    def _time(func, X, repeats):
+        func(X.copy())
+        time_total = 0
+        for _ in range(repeats):
+            X_copy = X.copy()
+            ts = time.perf_counter()
+            func(X_copy)
+            time_total += time.perf_counter() - ts
+        return time_total / repeats
+
+    for num_rows, repeats in [(1, 200), (10, 100), (100, 50)]:
+        X = input_data.sample(n=num_rows, replace=True, random_state=0)
+        assert_frame_equal(generator_compiled.transform(X.copy()), generator.transform(X.copy()))
+        time_uncompiled = _time(generator.transform, X, repeats)
+        time_compiled = _time(generator_compiled.transform, X, repeats)
+        print(
+            f"{num_rows} rows: uncompiled={time_uncompiled * 1000:.3f}ms, compiled={time_compiled * 1000:.3f}ms, "
+            f"speedup={time_uncompiled / time_compiled:.2f}x"
+        )
@@ -266,6 +266,9 @@ class AbstractTabularLearner(AbstractLearner):
         as_multiclass: bool = True,
         transform_features: bool = True,
         inverse_transform: bool = True,
+        *,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ) -> dict:
         """
         Returns a dictionary of prediction probabilities where the key is
@@ -301,6 +304,10 @@ class AbstractTabularLearner(AbstractLearner):
         inverse_transform : bool, default = True
             If True, will return prediction probabilities in the original format.
             If False (advanced), will return prediction probabilities in AutoGluon's internal format.
+        num_workers : int, default = 1
+            The number of models to predict with at the same time. Refer to `trainer.get_model_pred_proba_dict` for details.
+        parallel_backend : str, default = "thread"
+            The executor used when `num_workers > 1`. Refer to `trainer.get_model_pred_proba_dict` for details.
 
         Returns
         -------
@@ -314,13 +321,15 @@ class AbstractTabularLearner(AbstractLearner):
             X_index = copy.deepcopy(X.index) if as_pandas else None
             if transform_features:
                 X = self.transform_features(X)
-            predict_proba_dict = trainer.get_model_pred_proba_dict(X=X, models=models)
+            predict_proba_dict = trainer.get_model_pred_proba_dict(X=X, models=models, num_workers=num_workers, parallel_backend=parallel_backend)
         else:
             if trainer.has_val:
                 # Return validation pred proba
                 X = trainer.load_X_val()
                 X_index = copy.deepcopy(X.index) if as_pandas else None
-                predict_proba_dict = trainer.get_model_pred_proba_dict(X=X, models=models, use_val_cache=True)
+                predict_proba_dict = trainer.get_model_pred_proba_dict(
+                    X=X, models=models, use_val_cache=True, num_workers=num_workers, parallel_backend=parallel_backend
+                )
             else:
                 # Return out-of-fold pred proba
                 X = trainer.load_X()
@@ -345,12 +354,20 @@ class AbstractTabularLearner(AbstractLearner):
         inverse_transform: bool = True,
         *,
         decision_threshold: float = None,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ) -> dict:
         """
         Identical to predict_proba_multi, except returns predictions instead of probabilities.
         """
         predict_proba_dict = self.predict_proba_multi(
-            X=X, models=models, as_pandas=as_pandas, transform_features=transform_features, inverse_transform=inverse_transform
+            X=X,
+            models=models,
+            as_pandas=as_pandas,
+            transform_features=transform_features,
+            inverse_transform=inverse_transform,
+            num_workers=num_workers,
+            parallel_backend=parallel_backend,
         )
         predict_dict = {}
         for m in predict_proba_dict:
@@ -497,6 +514,8 @@ class AbstractTabularLearner(AbstractLearner):
         refit_full=None,
         set_refit_score_to_parent=False,
         display=False,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ):
         leaderboard_df = self.leaderboard(extra_info=extra_info, refit_full=refit_full, set_refit_score_to_parent=set_refit_score_to_parent, display=display)
         if extra_metrics is None:
@@ -523,7 +542,9 @@ class AbstractTabularLearner(AbstractLearner):
         all_trained_models = [m for m in all_trained_models if m in leaderboard_models]
         all_trained_models_can_infer = trainer.get_model_names(models=all_trained_models, can_infer=True)
         all_trained_models_original = all_trained_models.copy()
-        model_pred_proba_dict, pred_time_test_marginal = trainer.get_model_pred_proba_dict(X=X, models=all_trained_models_can_infer, record_pred_time=True)
+        model_pred_proba_dict, pred_time_test_marginal = trainer.get_model_pred_proba_dict(
+            X=X, models=all_trained_models_can_infer, record_pred_time=True, num_workers=num_workers, parallel_backend=parallel_backend
+        )
 
         if compute_oracle:
             pred_probas = list(model_pred_proba_dict.values())
@@ -843,6 +864,8 @@ class AbstractTabularLearner(AbstractLearner):
         refit_full: bool = None,
         set_refit_score_to_parent: bool = False,
         display=False,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ) -> pd.DataFrame:
         assert score_format in ["score", "error"]
         if X is not None:
@@ -856,6 +879,8 @@ class AbstractTabularLearner(AbstractLearner):
                 refit_full=refit_full,
                 set_refit_score_to_parent=set_refit_score_to_parent,
                 display=False,
+                num_workers=num_workers,
+                parallel_backend=parallel_backend,
             )
         else:
             if extra_metrics:
@@ -0,0 +1,120 @@
+"""
+Numba kernels evaluating the flat node arrays of `tree_utils.CompiledTreeEnsemble` and `tree_utils.CompiledObliviousTreeEnsemble`.
+Importing this module raises an ImportError if numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+# Rows are processed in blocks, evaluating each tree for all rows of a block at once to keep the nodes of the tree in cache
+_BLOCK_SIZE = 64
+
+# LightGBM treats values with an absolute value below this threshold as zero
+_ZERO_THRESHOLD = 1e-35
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def _predict_tree_ensemble(
+    X, feature, threshold, first_child, nan_right, zero_missing, zero_left, cat_index, cat_bitsets, leaf_value, roots, tree_outputs, strict_less, out
+):
+    num_rows = X.shape[0]
+    num_cats = cat_bitsets.shape[1]
+    num_blocks = (num_rows + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    for block in numba.prange(num_blocks):
+        row_end = min(num_rows, (block + 1) * _BLOCK_SIZE)
+        for tree in range(roots.shape[0]):
+            output = tree_outputs[tree]
+            for row in range(block * _BLOCK_SIZE, row_end):
+                node = roots[tree]
+                # Leaves point to themselves
+                while first_child[node] != node:
+                    x = X[row, feature[node]]
+                    if cat_index[node] >= 0:
+                        go_right = True
+                        if not np.isnan(x):
+                            code = np.int64(x)
+                            if 0 <= code < num_cats:
+                                go_right = not cat_bitsets[cat_index[node], code]
+                    elif np.isnan(x):
+                        go_right = nan_right[node]
+                    elif zero_missing[node] and abs(x) <= _ZERO_THRESHOLD:
+                        go_right = not zero_left[node]
+                    elif strict_less:
+                        go_right = x >= threshold[node]
+                    else:
+                        go_right = x > threshold[node]
+                    node = first_child[node] + go_right
+                out[row, output] += leaf_value[node]
+
+
+@numba.njit(parallel=True, nogil=True, cache=True)
+def _predict_oblivious_tree_ensemble(X, split_features, split_borders, split_nan_values, leaf_values, out):
+    num_rows = X.shape[0]
+    num_trees, max_depth = split_features.shape
+    num_outputs = leaf_values.shape[2]
+    num_blocks = (num_rows + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    for block in numba.prange(num_blocks):
+        row_end = min(num_rows, (block + 1) * _BLOCK_SIZE)
+        for tree in range(num_trees):
+            for row in range(block * _BLOCK_SIZE, row_end):
+                leaf = 0
+                for depth in range(max_depth):
+                    x = X[row, split_features[tree, depth]]
+                    if np.isnan(x):
+                        bit = split_nan_values[tree, depth]
+                    else:
+                        bit = x > split_borders[tree, depth]
+                    if bit:
+                        leaf |= 1 << depth
+                for output in range(num_outputs):
+                    out[row, output] += leaf_values[tree, leaf, output]
+
+
+def _run(kernel, num_threads: int | None, *args):
+    if num_threads is None or num_threads <= 0:
+        kernel(*args)
+        return
+    num_threads_og = numba.get_num_threads()
+    numba.set_num_threads(min(num_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        kernel(*args)
+    finally:
+        numba.set_num_threads(num_threads_og)
+
+
+def predict_tree_ensemble(ensemble, X: np.ndarray, out: np.ndarray, num_threads: int | None = None):
+    """Adds the leaf values of all trees of the `CompiledTreeEnsemble` to `out` of shape (n_rows, num_outputs)."""
+    _run(
+        _predict_tree_ensemble,
+        num_threads,
+        X,
+        ensemble.feature,
+        ensemble.threshold,
+        ensemble.first_child,
+        ensemble.nan_right,
+        ensemble.zero_missing,
+        ensemble.zero_left,
+        ensemble.cat_index,
+        ensemble.cat_bitsets,
+        ensemble.leaf_value,
+        ensemble.roots,
+        ensemble.tree_outputs,
+        ensemble.strict_less,
+        out,
+    )
+
+
+def predict_oblivious_tree_ensemble(ensemble, X: np.ndarray, out: np.ndarray, num_threads: int | None = None):
+    """Adds the leaf values of all trees of the `CompiledObliviousTreeEnsemble` to `out` of shape (n_rows, num_outputs)."""
+    _run(
+        _predict_oblivious_tree_ensemble,
+        num_threads,
+        X,
+        ensemble.split_features,
+        ensemble.split_borders,
+        ensemble.split_nan_values,
+        ensemble.leaf_values,
+        out,
+    )
@@ -0,0 +1,417 @@
+"""
+Compiled tree ensembles, used by the "numba" compilers of the gradient boosting models.
+
+Fitted boosters are converted into flat, contiguous node arrays. These are evaluated by numba kernels if numba is installed,
+and otherwise with vectorized numpy operations, avoiding the per-call overhead of the native predict methods
+(DataFrame validation and conversion, DMatrix / Pool construction).
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import scipy.sparse
+
+# LightGBM treats values with an absolute value below this threshold as zero
+_ZERO_THRESHOLD = 1e-35
+
+# Upper bound of the number of (row, tree) pairs evaluated at once, limiting the memory usage of the intermediate arrays
+_MAX_CHUNK_ELEMENTS = 1 << 20
+
+
+class TreeEnsembleBuilder:
+    """
+    Builds a `CompiledTreeEnsemble` one node at a time.
+
+    Nodes are added in breadth-first order per tree. Every split reserves two consecutive node ids for its children,
+    so that the next node is computed as `first_child + (not go_left)` during evaluation.
+
+    Parameters
+    ----------
+    num_outputs : int
+        The number of raw outputs, such as the number of classes for multiclass classification.
+    strict_less : bool, default = False
+        If True, numerical splits go left if `x < threshold` (XGBoost). Otherwise, if `x <= threshold` (LightGBM).
+    """
+
+    def __init__(self, num_outputs: int = 1, strict_less: bool = False):
+        self.num_outputs = num_outputs
+        self.strict_less = strict_less
+        self._feature = []
+        self._threshold = []
+        self._first_child = []
+        self._nan_left = []
+        self._zero_missing = []
+        self._zero_left = []
+        self._cat_index = []
+        self._leaf_value = []
+        self._categories: List[List[int]] = []
+        self._roots = []
+        self._tree_outputs = []
+        self._max_depth = 0
+
+    def add_tree(self, root, get_children, add_node, output: int = 0):
+        """
+        Adds a tree with breadth-first traversal.
+
+        Parameters
+        ----------
+        root
+            The root node in the format of the converted model.
+        get_children : Callable
+            Returns the (left, right) children of a node, or None if the node is a leaf.
+        add_node : Callable
+            Called as `add_node(node_id, node)`, must call exactly one of `set_leaf`, `set_numerical_split` or `set_categorical_split` with `node_id`.
+        output : int, default = 0
+            The raw output index that the leaf values of this tree are added to.
+        """
+        root_id = self._allocate(1)
+        self._roots.append(root_id)
+        self._tree_outputs.append(output)
+        level = [(root, root_id)]
+        depth = 0
+        while level:
+            next_level = []
+            for node, node_id in level:
+                add_node(node_id, node)
+                children = get_children(node)
+                if children is not None:
+                    first_child = self._allocate(2)
+                    self._first_child[node_id] = first_child
+                    next_level.append((children[0], first_child))
+                    next_level.append((children[1], first_child + 1))
+            if next_level:
+                depth += 1
+            level = next_level
+        self._max_depth = max(self._max_depth, depth)
+
+    def set_leaf(self, node_id: int, value: float):
+        # Leaves always go "left" onto themselves, so that rows stay at their leaf until all trees are fully evaluated
+        self._first_child[node_id] = node_id
+        self._threshold[node_id] = np.nan
+        self._nan_left[node_id] = True
+        self._leaf_value[node_id] = value
+
+    def set_numerical_split(self, node_id: int, feature: int, threshold: float, nan_left: bool, zero_missing: bool = False, zero_left: bool = False):
+        """
+        Parameters
+        ----------
+        node_id : int
+            The id of the node passed to `add_node`.
+        feature : int
+            The index of the feature column.
+        threshold : float
+            The split threshold.
+        nan_left : bool
+            Whether NaN values go to the left child.
+        zero_missing : bool, default = False
+            If True, zero values are treated as missing and go to the left child if `zero_left`.
+        zero_left : bool, default = False
+            Whether zero values go to the left child if `zero_missing`.
+        """
+        self._feature[node_id] = feature
+        self._threshold[node_id] = threshold
+        self._nan_left[node_id] = nan_left
+        self._zero_missing[node_id] = zero_missing
+        self._zero_left[node_id] = zero_left
+
+    def set_categorical_split(self, node_id: int, feature: int, categories_left: List[int]):
+        """Categorical split where rows go left if the integer category code is in `categories_left`, and right otherwise or if missing."""
+        self._feature[node_id] = feature
+        self._threshold[node_id] = np.nan
+        self._nan_left[node_id] = False
+        self._cat_index[node_id] = len(self._categories)
+        self._categories.append(categories_left)
+
+    def _allocate(self, n: int) -> int:
+        node_id = len(self._feature)
+        for _ in range(n):
+            self._feature.append(0)
+            self._threshold.append(np.nan)
+            self._first_child.append(-1)
+            self._nan_left.append(False)
+            self._zero_missing.append(False)
+            self._zero_left.append(False)
+            self._cat_index.append(-1)
+            self._leaf_value.append(0.0)
+        return node_id
+
+    def build(self, base_score: np.ndarray = None, threshold_dtype=np.float64) -> "CompiledTreeEnsemble":
+        """
+        Parameters
+        ----------
+        base_score : np.ndarray, default = None
+            Raw score added to the sum of leaf values of each output.
+        threshold_dtype : default = np.float64
+            The dtype thresholds are stored and compared in. Input features are converted to this dtype.
+        """
+        if base_score is None:
+            base_score = np.zeros(self.num_outputs, dtype=np.float64)
+        max_category = max([max(categories, default=-1) for categories in self._categories], default=-1)
+        cat_bitsets = np.zeros((len(self._categories), max_category + 1), dtype=bool)
+        for i, categories in enumerate(self._categories):
+            cat_bitsets[i, categories] = True
+        return CompiledTreeEnsemble(
+            feature=np.array(self._feature, dtype=np.intp),
+            threshold=np.array(self._threshold, dtype=threshold_dtype),
+            first_child=np.array(self._first_child, dtype=np.intp),
+            nan_left=np.array(self._nan_left, dtype=bool),
+            zero_missing=np.array(self._zero_missing, dtype=bool),
+            zero_left=np.array(self._zero_left, dtype=bool),
+            cat_index=np.array(self._cat_index, dtype=np.intp),
+            cat_bitsets=cat_bitsets,
+            leaf_value=np.array(self._leaf_value, dtype=np.float64),
+            roots=np.array(self._roots, dtype=np.intp),
+            tree_outputs=np.array(self._tree_outputs, dtype=np.intp),
+            num_outputs=self.num_outputs,
+            max_depth=self._max_depth,
+            base_score=np.asarray(base_score, dtype=np.float64),
+            strict_less=self.strict_less,
+        )
+
+
+class CompiledTreeEnsemble:
+    """
+    Ensemble of binary decision trees stored as flat node arrays. Construct via `TreeEnsembleBuilder`.
+
+    If numba is installed, trees are evaluated by a compiled kernel in parallel over blocks of rows.
+    Otherwise, all trees are evaluated level by level for a chunk of rows at once: each step gathers the split feature value of the current node
+    of every (row, tree) pair and moves to the left or right child. Leaves point to themselves, so `max_depth` steps reach all leaves.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        first_child: np.ndarray,
+        nan_left: np.ndarray,
+        zero_missing: np.ndarray,
+        zero_left: np.ndarray,
+        cat_index: np.ndarray,
+        cat_bitsets: np.ndarray,
+        leaf_value: np.ndarray,
+        roots: np.ndarray,
+        tree_outputs: np.ndarray,
+        num_outputs: int,
+        max_depth: int,
+        base_score: np.ndarray,
+        strict_less: bool,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.first_child = first_child
+        self.nan_right = ~nan_left
+        self.zero_missing = zero_missing
+        self.zero_left = zero_left
+        self.cat_index = cat_index
+        self.cat_bitsets = cat_bitsets
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.tree_outputs = tree_outputs
+        self.num_outputs = num_outputs
+        self.max_depth = max_depth
+        self.base_score = base_score
+        self.strict_less = strict_less
+        if num_outputs > 1:
+            self.tree_output_matrix = np.zeros((len(roots), num_outputs), dtype=np.float64)
+            self.tree_output_matrix[np.arange(len(roots)), tree_outputs] = 1
+        else:
+            self.tree_output_matrix = None
+
+    @property
+    def dtype(self):
+        return self.threshold.dtype
+
+    @property
+    def num_trees(self) -> int:
+        return len(self.roots)
+
+    def predict_raw(self, X: np.ndarray, num_threads: int | None = None, use_numba: bool = True) -> np.ndarray:
+        """
+        Returns the raw scores of shape (n_rows, num_outputs) for the 2-dimensional feature array X.
+        X is converted to a C-contiguous array of `self.dtype` if necessary.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The feature array.
+        num_threads : int, default = None
+            The number of threads used by the numba kernel. If None or <= 0, uses the numba default.
+        use_numba : bool, default = True
+            If True, uses the numba kernel if numba is installed.
+        """
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        num_rows = X.shape[0]
+        kernels = _get_numba_kernels() if use_numba else None
+        if kernels is not None:
+            out = np.zeros((num_rows, self.num_outputs), dtype=np.float64)
+            kernels.predict_tree_ensemble(self, X, out=out, num_threads=num_threads)
+            out += self.base_score
+            return out
+        out = np.empty((num_rows, self.num_outputs), dtype=np.float64)
+        chunk_size = max(1, _MAX_CHUNK_ELEMENTS // max(1, self.num_trees))
+        for start in range(0, num_rows, chunk_size):
+            out[start : start + chunk_size] = self._predict_raw_chunk(X[start : start + chunk_size])
+        return out
+
+    def _predict_raw_chunk(self, X: np.ndarray) -> np.ndarray:
+        num_rows, num_features = X.shape
+        X_flat = X.ravel()
+        row_offsets = (np.arange(num_rows, dtype=np.intp) * num_features)[:, None]
+        has_nan = np.isnan(X_flat).any()
+        has_zero_missing = self.zero_missing.any()
+        has_categorical = self.cat_bitsets.shape[0] > 0
+        node = np.repeat(self.roots[None, :], num_rows, axis=0)
+        for _ in range(self.max_depth):
+            x = np.take(X_flat, row_offsets + np.take(self.feature, node))
+            threshold = np.take(self.threshold, node)
+            # Written as negated comparisons so that leaves (NaN threshold) always go left onto themselves
+            if self.strict_less:
+                go_right = x >= threshold
+            else:
+                go_right = x > threshold
+            if has_nan:
+                go_right |= np.isnan(x) & np.take(self.nan_right, node)
+            if has_zero_missing:
+                is_zero_missing = np.take(self.zero_missing, node) & (np.abs(x) <= _ZERO_THRESHOLD)
+                if is_zero_missing.any():
+                    go_right[is_zero_missing] = ~np.take(self.zero_left, node[is_zero_missing])
+            if has_categorical:
+                cat_index = np.take(self.cat_index, node)
+                is_cat = cat_index >= 0
+                if is_cat.any():
+                    go_right[is_cat] = ~self._categorical_go_left(x[is_cat], cat_index[is_cat])
+            node = np.take(self.first_child, node) + go_right
+        leaf_values = np.take(self.leaf_value, node)
+        if self.tree_output_matrix is None:
+            raw = leaf_values.sum(axis=1, keepdims=True)
+        else:
+            raw = leaf_values @ self.tree_output_matrix
+        raw += self.base_score
+        return raw
+
+    def _categorical_go_left(self, x: np.ndarray, cat_index: np.ndarray) -> np.ndarray:
+        # Missing, negative and unseen category codes go right
+        with np.errstate(invalid="ignore"):
+            codes = np.where(np.isnan(x), -1, x).astype(np.int64)
+        valid = (codes >= 0) & (codes < self.cat_bitsets.shape[1])
+        go_left = np.zeros(len(x), dtype=bool)
+        go_left[valid] = self.cat_bitsets[cat_index[valid], codes[valid]]
+        return go_left
+
+
+class CompiledObliviousTreeEnsemble:
+    """
+    Ensemble of oblivious (symmetric) decision trees, such as CatBoost trees, where all nodes at the same depth share one split.
+
+    The leaf index of a tree is the bitmask of its split outcomes `x[feature] > border`.
+
+    Parameters
+    ----------
+    split_features : np.ndarray
+        Feature index of each split, of shape (num_trees, max_depth). Trees with fewer splits are padded with splits that always evaluate to 0.
+    split_borders : np.ndarray
+        Border of each split, of shape (num_trees, max_depth).
+    split_nan_values : np.ndarray
+        The outcome of each split for NaN feature values, of shape (num_trees, max_depth).
+    leaf_values : np.ndarray
+        Leaf values of shape (num_trees, 2 ** max_depth, num_outputs).
+    base_score : np.ndarray
+        Raw score added to the sum of leaf values of each output.
+    scale : float, default = 1.0
+        Scale applied to the sum of leaf values before adding `base_score`.
+    """
+
+    def __init__(
+        self,
+        split_features: np.ndarray,
+        split_borders: np.ndarray,
+        split_nan_values: np.ndarray,
+        leaf_values: np.ndarray,
+        base_score: np.ndarray,
+        scale: float = 1.0,
+    ):
+        self.split_features = np.ascontiguousarray(split_features, dtype=np.intp)
+        self.split_borders = np.ascontiguousarray(split_borders)
+        self.split_nan_values = np.ascontiguousarray(split_nan_values, dtype=bool)
+        self.leaf_values = np.ascontiguousarray(leaf_values, dtype=np.float64)
+        self.base_score = np.asarray(base_score, dtype=np.float64)
+        self.scale = scale
+        num_trees, max_depth = self.split_features.shape
+        self.num_outputs = self.leaf_values.shape[2]
+        self._leaf_offsets = (np.arange(num_trees, dtype=np.intp) << max_depth)[None, :]
+        self._bit_values = (1 << np.arange(max_depth, dtype=np.intp))[None, None, :]
+
+    @property
+    def dtype(self):
+        return self.split_borders.dtype
+
+    @property
+    def num_trees(self) -> int:
+        return self.split_features.shape[0]
+
+    def predict_raw(self, X: np.ndarray, num_threads: int | None = None, use_numba: bool = True) -> np.ndarray:
+        """
+        Returns the raw scores of shape (n_rows, num_outputs) for the 2-dimensional feature array X.
+        Refer to `CompiledTreeEnsemble.predict_raw` for the parameters.
+        """
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        num_rows = X.shape[0]
+        kernels = _get_numba_kernels() if use_numba else None
+        if kernels is not None:
+            out = np.zeros((num_rows, self.num_outputs), dtype=np.float64)
+            kernels.predict_oblivious_tree_ensemble(self, X, out=out, num_threads=num_threads)
+            out *= self.scale
+            out += self.base_score
+            return out
+        out = np.empty((num_rows, self.num_outputs), dtype=np.float64)
+        chunk_size = max(1, _MAX_CHUNK_ELEMENTS // max(1, self.split_features.size))
+        leaf_values_flat = self.leaf_values.reshape(-1, self.num_outputs)
+        for start in range(0, num_rows, chunk_size):
+            X_chunk = X[start : start + chunk_size]
+            x = X_chunk[:, self.split_features]
+            bits = x > self.split_borders
+            is_nan = np.isnan(x)
+            if is_nan.any():
+                bits = np.where(is_nan, self.split_nan_values, bits)
+            leaf_index = (bits * self._bit_values).sum(axis=2) + self._leaf_offsets
+            out[start : start + chunk_size] = leaf_values_flat[leaf_index].sum(axis=1)
+        out *= self.scale
+        out += self.base_score
+        return out
+
+
+def _get_numba_kernels():
+    """Returns the `tree_numba_kernels` module, or None if numba is not installed."""
+    try:
+        from . import tree_numba_kernels
+    except ImportError:
+        return None
+    return tree_numba_kernels
+
+
+def convert_sparse_to_dense(X: scipy.sparse.spmatrix, dtype, fill_value: float = 0.0) -> np.ndarray:
+    """
+    Converts a sparse matrix to a dense array where entries that are not stored are set to `fill_value`.
+
+    The compiled trees only operate on dense arrays, so the whole matrix is materialized, using `X.shape[0] * X.shape[1] * dtype.itemsize` bytes
+    regardless of the sparsity of `X`. For very wide and sparse inputs (such as one-hot encoded features with many categories),
+    this can use much more memory than predicting with the native model, and it is preferable to predict in smaller batches of rows.
+    """
+    if fill_value == 0:
+        return X.toarray().astype(dtype, copy=False)
+    X = X.tocoo()
+    X_dense = np.full(X.shape, fill_value, dtype=dtype)
+    X_dense[X.row, X.col] = X.data
+    return X_dense
+
+
+def sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def softmax(x: np.ndarray) -> np.ndarray:
+    x = np.exp(x - x.max(axis=1, keepdims=True))
+    x /= x.sum(axis=1, keepdims=True)
+    return x
@@ -17,6 +17,8 @@ from autogluon.core.utils.exceptions import TimeLimitExceeded
 
 from .callbacks import EarlyStoppingCallback, MemoryCheckCallback, TimeCheckCallback
 from .catboost_utils import get_catboost_metric_from_ag_metric
+from .compilers.native import CatBoostNativeCompiler
+from .compilers.numba import CatBoostNumbaCompiler
 from .hyperparameters.parameters import get_param_baseline
 from .hyperparameters.searchspaces import get_default_searchspace
 
@@ -306,6 +308,20 @@ class CatBoostModel(AbstractModel):
     def _ag_params(self) -> set:
         return {"early_stop"}
 
+    def can_compile(self, compiler_configs: dict = None) -> bool:
+        if not super().can_compile(compiler_configs=compiler_configs):
+            return False
+        if compiler_configs.get("compiler", "native") == CatBoostNumbaCompiler.name and CatBoostNumbaCompiler.can_compile():
+            # Categorical features and custom loss functions (softclass) are not supported by the compiler
+            return CatBoostNumbaCompiler.can_compile_model(self.model)
+        return True
+
+    def _valid_compilers(self):
+        return [CatBoostNativeCompiler, CatBoostNumbaCompiler]
+
+    def _default_compiler(self):
+        return CatBoostNativeCompiler
+
     def _validate_fit_memory_usage(self, mem_error_threshold: float = 1, mem_warning_threshold: float = 0.75, mem_size_threshold: int = 1e9, **kwargs):
         return super()._validate_fit_memory_usage(
             mem_error_threshold=mem_error_threshold, mem_warning_threshold=mem_warning_threshold, mem_size_threshold=mem_size_threshold, **kwargs
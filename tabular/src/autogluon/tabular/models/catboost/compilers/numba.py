@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from ..._utils.tree_utils import CompiledObliviousTreeEnsemble, sigmoid, softmax
+from ...rf.compilers.native import AbstractNativeCompiler
+
+# Output transform of the raw scores for each CatBoost loss function
+_LOSS_FUNCTION_TRANSFORMS = {
+    "RMSE": "identity",
+    "MAE": "identity",
+    "Logloss": "sigmoid",
+    "CrossEntropy": "sigmoid",
+    "MultiClass": "softmax",
+}
+
+# The split outcome of NaN values for each nan_value_treatment. "AsIs" is used if NaN values were not present during training.
+_NAN_VALUE_TREATMENT_BITS = {
+    "AsIs": False,
+    "AsFalse": False,
+    "AsTrue": True,
+}
+
+
+def _get_loss_function_name(model) -> str | None:
+    loss_function = model.get_all_params().get("loss_function", None)
+    if not isinstance(loss_function, str):
+        return None
+    return loss_function.split(":", 1)[0]
+
+
+class CatBoostCompiledPredictor:
+    """
+    Compiled CatBoost model with oblivious trees and only numerical features,
+    with the same `predict` and `predict_proba` outputs as the CatBoost scikit-learn estimators.
+    The compiled trees are evaluated by numba kernels on contiguous float32 arrays, falling back to numpy if numba is not installed.
+
+    Parameters
+    ----------
+    ensemble : CompiledObliviousTreeEnsemble
+        The compiled trees, including the scale and bias.
+    transform : str
+        The output transform applied to the raw scores, one of the values of `_LOSS_FUNCTION_TRANSFORMS`.
+    """
+
+    def __init__(self, ensemble: CompiledObliviousTreeEnsemble, transform: str):
+        self.ensemble = ensemble
+        self.transform = transform
+
+    @classmethod
+    def from_model(cls, model) -> "CatBoostCompiledPredictor":
+        loss_function = _get_loss_function_name(model)
+        if loss_function not in _LOSS_FUNCTION_TRANSFORMS:
+            raise ValueError(f"Unsupported CatBoost loss function for compilation: {loss_function}")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            model_path = os.path.join(temp_dir, "model.json")
+            model.save_model(model_path, format="json")
+            with open(model_path, "r") as f:
+                model_json = json.load(f)
+        if "oblivious_trees" not in model_json:
+            raise ValueError("Only CatBoost models with oblivious trees are supported for compilation.")
+
+        float_features = {feature["feature_index"]: feature for feature in model_json["features_info"].get("float_features", [])}
+        trees = model_json["oblivious_trees"]
+        scale, bias = model_json.get("scale_and_bias", [1.0, [0.0]])
+        bias = np.atleast_1d(np.asarray(bias, dtype=np.float64))
+        num_outputs = len(bias)
+        max_depth = max([len(tree["splits"]) for tree in trees], default=0)
+
+        # Trees with fewer splits are padded with splits that always evaluate to 0 (x > +inf), keeping their leaf index unchanged
+        split_features = np.zeros((len(trees), max_depth), dtype=np.intp)
+        split_borders = np.full((len(trees), max_depth), np.inf, dtype=np.float32)
+        split_nan_values = np.zeros((len(trees), max_depth), dtype=bool)
+        leaf_values = np.zeros((len(trees), 2**max_depth, num_outputs), dtype=np.float64)
+        for i, tree in enumerate(trees):
+            for depth, split in enumerate(tree["splits"]):
+                if split.get("split_type", "FloatFeature") != "FloatFeature":
+                    raise ValueError(f"Unsupported CatBoost split type for compilation: {split['split_type']}")
+                feature = float_features[split["float_feature_index"]]
+                split_features[i, depth] = feature["flat_feature_index"]
+                split_borders[i, depth] = split["border"]
+                split_nan_values[i, depth] = _NAN_VALUE_TREATMENT_BITS[feature.get("nan_value_treatment", "AsIs")]
+            tree_leaf_values = np.asarray(tree["leaf_values"], dtype=np.float64).reshape(-1, num_outputs)
+            leaf_values[i, : len(tree_leaf_values)] = tree_leaf_values
+
+        ensemble = CompiledObliviousTreeEnsemble(
+            split_features=split_features,
+            split_borders=split_borders,
+            split_nan_values=split_nan_values,
+            leaf_values=leaf_values,
+            base_score=bias,
+            scale=scale,
+        )
+        return cls(ensemble=ensemble, transform=_LOSS_FUNCTION_TRANSFORMS[loss_function])
+
+    def predict(self, X, num_threads: int = None) -> np.ndarray:
+        """Returns the predictions of `CatBoostRegressor.predict`. For classifiers, use `predict_proba`."""
+        y_pred = self._predict(X, num_threads=num_threads)
+        if y_pred.shape[1] == 1:
+            y_pred = y_pred[:, 0]
+        return y_pred
+
+    def predict_proba(self, X, num_threads: int = None) -> np.ndarray:
+        """Returns the predictions of `CatBoostClassifier.predict_proba`, with 2 columns for binary classification."""
+        y_pred_proba = self._predict(X, num_threads=num_threads)
+        if y_pred_proba.shape[1] == 1:
+            y_pred_proba = np.hstack([1 - y_pred_proba, y_pred_proba])
+        return y_pred_proba
+
+    def _predict(self, X, num_threads: int = None) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            X = X.to_numpy(dtype=self.ensemble.dtype)
+        y_pred = self.ensemble.predict_raw(X, num_threads=num_threads)
+        if self.transform == "sigmoid":
+            y_pred = sigmoid(y_pred)
+        elif self.transform == "softmax":
+            y_pred = softmax(y_pred)
+        return y_pred
+
+
+class CatBoostNumbaCompiler(AbstractNativeCompiler):
+    """
+    Compiles a fitted `CatBoostClassifier` or `CatBoostRegressor` into a `CatBoostCompiledPredictor`, evaluated by numba kernels.
+    The compiled model is pickled with the model, and produces identical predictions to the estimator up to float32 precision.
+    """
+
+    name = "numba"
+    save_in_pkl = True
+
+    @staticmethod
+    def can_compile():
+        """Verify whether the required package has been installed."""
+        return importlib.util.find_spec("numba") is not None
+
+    @staticmethod
+    def can_compile_model(model) -> bool:
+        """Verify whether the model uses features that are supported by the compiler."""
+        if isinstance(model, CatBoostCompiledPredictor):
+            return True
+        if model.get_cat_feature_indices() or model.get_text_feature_indices():
+            return False
+        if model.get_all_params().get("grow_policy", "SymmetricTree") != "SymmetricTree":
+            return False
+        return _get_loss_function_name(model) in _LOSS_FUNCTION_TRANSFORMS
+
+    @staticmethod
+    def compile(model, path: str, input_types=None):
+        """
+        Compile the trained model for faster inference.
+
+        Parameters
+        ----------
+        model
+            The `CatBoostClassifier` or `CatBoostRegressor` that is expected to be compiled.
+        path : str
+            The path for saving the compiled model. Unused, as the compiled model is saved with the model pickle.
+        input_types : list, default=None
+            Unused, the compiled model supports any batch size.
+        """
+        if isinstance(model, CatBoostCompiledPredictor):
+            return model
+        predictor = CatBoostCompiledPredictor.from_model(model)
+        # Trigger the JIT compilation of the kernels, which are otherwise compiled on the first prediction
+        predictor.predict(np.zeros((1, len(model.feature_names_)), dtype=np.float32))
+        return predictor
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+
+from ..._utils.tree_utils import CompiledTreeEnsemble, TreeEnsembleBuilder, convert_sparse_to_dense, sigmoid, softmax
+from ...rf.compilers.native import AbstractNativeCompiler
+
+# Output transform of the raw scores for each LightGBM objective. Boosters trained with a custom objective have no objective and return raw scores.
+_OBJECTIVE_TRANSFORMS = {
+    None: "identity",
+    "regression": "identity",
+    "regression_l1": "identity",
+    "huber": "identity",
+    "fair": "identity",
+    # A single booster trained with the quantile objective. The QuantileBooster of quantile models is not a `lightgbm.Booster`, and is not compiled.
+    "quantile": "identity",
+    "mape": "identity",
+    "poisson": "exp",
+    "gamma": "exp",
+    "tweedie": "exp",
+    "binary": "sigmoid",
+    "cross_entropy": "sigmoid",
+    "multiclassova": "sigmoid",
+    "multiclass": "softmax",
+}
+
+
+def _parse_objective(objective: str | None) -> Tuple[str | None, dict, list]:
+    """Parses a LightGBM objective string such as "binary sigmoid:1" into its name, parameters and flags."""
+    if objective is None:
+        return None, dict(), []
+    name, *tokens = objective.split(" ")
+    params = dict(token.split(":", 1) for token in tokens if ":" in token)
+    flags = [token for token in tokens if token and ":" not in token]
+    return name, params, flags
+
+
+class LGBCompiledPredictor:
+    """
+    Compiled LightGBM booster with the same `predict` interface and outputs as `lightgbm.Booster.predict`.
+    The compiled trees are evaluated by numba kernels on contiguous arrays, falling back to numpy if numba is not installed.
+
+    Parameters
+    ----------
+    ensemble : CompiledTreeEnsemble
+        The compiled trees.
+    transform : str
+        The output transform applied to the raw scores, one of the values of `_OBJECTIVE_TRANSFORMS`.
+    sigmoid_scale : float, default = 1.0
+        The `sigmoid` parameter of the objective, used by the sigmoid transform.
+    pandas_categorical : list, default = None
+        The categories of each categorical column seen during training, used to map category codes identically to LightGBM.
+    """
+
+    def __init__(self, ensemble: CompiledTreeEnsemble, transform: str, sigmoid_scale: float = 1.0, pandas_categorical: list = None):
+        self.ensemble = ensemble
+        self.transform = transform
+        self.sigmoid_scale = sigmoid_scale
+        self.pandas_categorical = pandas_categorical
+
+    @classmethod
+    def from_booster(cls, booster) -> "LGBCompiledPredictor":
+        """Compiles the trees used by `booster.predict` (up to the best iteration if early stopping was used)."""
+        model = booster.dump_model()
+        name, params, flags = _parse_objective(model.get("objective", None))
+        if name not in _OBJECTIVE_TRANSFORMS or flags:
+            raise ValueError(f"Unsupported LightGBM objective for compilation: {model.get('objective', None)}")
+        num_outputs = model["num_tree_per_iteration"]
+        builder = TreeEnsembleBuilder(num_outputs=num_outputs)
+
+        def get_children(node):
+            if "leaf_value" in node:
+                return None
+            return node["left_child"], node["right_child"]
+
+        def add_node(node_id, node):
+            if "leaf_value" in node:
+                if "leaf_coeff" in node:
+                    raise ValueError("Linear trees are not supported for compilation.")
+                builder.set_leaf(node_id, node["leaf_value"])
+            elif node["decision_type"] == "==":
+                categories_left = [int(category) for category in str(node["threshold"]).split("||")]
+                builder.set_categorical_split(node_id, feature=node["split_feature"], categories_left=categories_left)
+            else:
+                threshold = float(node["threshold"])
+                missing_type = node["missing_type"]
+                default_left = node["default_left"]
+                if missing_type == "None":
+                    # NaN is converted to 0 before the comparison
+                    nan_left = 0.0 <= threshold
+                else:
+                    nan_left = default_left
+                builder.set_numerical_split(
+                    node_id,
+                    feature=node["split_feature"],
+                    threshold=threshold,
+                    nan_left=nan_left,
+                    zero_missing=missing_type == "Zero",
+                    zero_left=default_left,
+                )
+
+        tree_info = model["tree_info"]
+        for tree in tree_info:
+            builder.add_tree(tree["tree_structure"], get_children=get_children, add_node=add_node, output=tree["tree_index"] % num_outputs)
+        ensemble = builder.build()
+        if model.get("average_output", False) and tree_info:
+            ensemble.leaf_value /= len(tree_info) // num_outputs
+        return cls(
+            ensemble=ensemble,
+            transform=_OBJECTIVE_TRANSFORMS[name],
+            sigmoid_scale=float(params.get("sigmoid", 1.0)),
+            pandas_categorical=model.get("pandas_categorical", None),
+        )
+
+    def predict(self, X, num_threads: int = None, raw_score: bool = False) -> np.ndarray:
+        """
+        Returns predictions identical to `lightgbm.Booster.predict` for X as a DataFrame, numpy array or scipy sparse matrix.
+        Sparse matrices are converted to a dense array before prediction, see `convert_sparse_to_dense`.
+        """
+        X = self._to_numpy(X)
+        y_pred = self.ensemble.predict_raw(X, num_threads=num_threads)
+        if not raw_score:
+            if self.transform == "sigmoid":
+                y_pred = sigmoid(self.sigmoid_scale * y_pred)
+            elif self.transform == "softmax":
+                y_pred = softmax(y_pred)
+            elif self.transform == "exp":
+                y_pred = np.exp(y_pred)
+        if y_pred.shape[1] == 1:
+            y_pred = y_pred[:, 0]
+        return y_pred
+
+    def _to_numpy(self, X) -> np.ndarray:
+        if scipy.sparse.issparse(X):
+            return convert_sparse_to_dense(X, dtype=self.ensemble.dtype)
+        if not isinstance(X, pd.DataFrame):
+            return X
+        # Identical to the conversion of DataFrames in LightGBM: categorical columns are replaced by their codes in the training categories
+        cat_columns = [column for column, dtype in X.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+        if cat_columns:
+            X = X.copy(deep=False)
+            for i, column in enumerate(cat_columns):
+                values = X[column]
+                if self.pandas_categorical is not None and list(values.cat.categories) != self.pandas_categorical[i]:
+                    values = values.cat.set_categories(self.pandas_categorical[i])
+                codes = values.cat.codes.to_numpy()
+                X[column] = np.where(codes == -1, np.nan, codes)
+        return X.to_numpy(dtype=np.result_type(*X.dtypes, np.float32))
+
+
+class LGBNumbaCompiler(AbstractNativeCompiler):
+    """
+    Compiles a `lightgbm.Booster` into a `LGBCompiledPredictor`, evaluated by numba kernels.
+    The compiled model is pickled with the model, and produces identical predictions to the booster.
+    """
+
+    name = "numba"
+    save_in_pkl = True
+
+    @staticmethod
+    def can_compile():
+        """Verify whether the required package has been installed."""
+        return importlib.util.find_spec("numba") is not None
+
+    @staticmethod
+    def can_compile_model(model) -> bool:
+        """Verify whether the booster uses features that are supported by the compiler."""
+        import lightgbm
+
+        if isinstance(model, LGBCompiledPredictor):
+            return True
+        if not isinstance(model, lightgbm.Booster) or model.params.get("linear_tree", False):
+            return False
+        name, params, flags = _parse_objective(model.dump_model(num_iteration=1).get("objective", None))
+        return name in _OBJECTIVE_TRANSFORMS and not flags
+
+    @staticmethod
+    def compile(model, path: str, input_types=None):
+        """
+        Compile the trained model for faster inference.
+
+        Parameters
+        ----------
+        model
+            The `lightgbm.Booster` that is expected to be compiled.
+        path : str
+            The path for saving the compiled model. Unused, as the compiled model is saved with the model pickle.
+        input_types : list, default=None
+            Unused, the compiled model supports any batch size.
+        """
+        if isinstance(model, LGBCompiledPredictor):
+            return model
+        predictor = LGBCompiledPredictor.from_booster(model)
+        # Trigger the JIT compilation of the kernels, which are otherwise compiled on the first prediction
+        predictor.predict(np.zeros((1, model.num_feature()), dtype=np.float64))
+        return predictor
@@ -7,6 +7,7 @@ import time
 import warnings
 
 import numpy as np
+import pandas as pd
 from pandas import DataFrame, Series
 
 from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT
@@ -16,8 +17,11 @@ from autogluon.common.utils.try_import import try_import_lightgbm
 from autogluon.core.constants import BINARY, MULTICLASS, QUANTILE, REGRESSION, SOFTCLASS
 from autogluon.core.models import AbstractModel
 from autogluon.core.models._utils import get_early_stopping_rounds
+from autogluon.core.utils import convert_df_to_csr, has_sparse_features
 
 from . import lgb_utils
+from .compilers.native import LGBNativeCompiler
+from .compilers.numba import LGBNumbaCompiler
 from .hyperparameters.parameters import DEFAULT_NUM_BOOST_ROUND, get_lgb_objective, get_param_baseline
 from .hyperparameters.searchspaces import get_default_searchspace
 from .lgb_utils import construct_dataset, train_lgb_model
@@ -43,6 +47,8 @@ class LGBModel(AbstractModel):
         self._features_internal_map = None
         self._features_internal_list = None
         self._requires_remap = None
+        self._sparse_input = False  # If True, the data is converted to a CSR matrix so that sparse features are not densified
+        self._categorical_features_idx = None
 
     def _set_default_params(self):
         default_params = get_param_baseline(problem_type=self.problem_type)
@@ -296,6 +302,9 @@ class LGBModel(AbstractModel):
                 self._features_internal_list = np.array([self._features_internal_map[feature] for feature in list(X.columns)])
             else:
                 self._features_internal_list = self._features_internal
+            self._sparse_input = has_sparse_features(X)
+            if self._sparse_input:
+                self._categorical_features_idx = [i for i, dtype in enumerate(X.dtypes) if isinstance(dtype, pd.CategoricalDtype)]
 
         if self._requires_remap:
             X_new = X.copy(deep=False)
@@ -304,6 +313,13 @@ class LGBModel(AbstractModel):
         else:
             return X
 
+    def _preprocess(self, X, **kwargs):
+        X = super()._preprocess(X, **kwargs)
+        if self._sparse_input:
+            # Category features are represented by their category codes, which LightGBM treats as categorical via `categorical_feature`
+            X = convert_df_to_csr(X, dtype=np.float32)
+        return X
+
     def generate_datasets(self, X: DataFrame, y: Series, params, X_val=None, y_val=None, sample_weight=None, sample_weight_val=None, save=False):
         lgb_dataset_params_keys = ["two_round"]  # Keys that are specific to lightGBM Dataset object construction.
         data_params = {key: params[key] for key in lgb_dataset_params_keys if key in params}.copy()
@@ -322,9 +338,13 @@ class LGBModel(AbstractModel):
                 y_val_og = np.array(y_val)
                 y_val = None
 
+        dataset_kwargs = {}
+        if self._sparse_input:
+            dataset_kwargs = dict(feature_name=[str(feature) for feature in self._features_internal_list], categorical_feature=self._categorical_features_idx)
+
         # X, W_train = self.convert_to_weight(X=X)
         dataset_train = construct_dataset(
-            x=X, y=y, location=os.path.join("self.path", "datasets", "train"), params=data_params, save=save, weight=sample_weight
+            x=X, y=y, location=os.path.join("self.path", "datasets", "train"), params=data_params, save=save, weight=sample_weight, **dataset_kwargs
         )
         # dataset_train = construct_dataset_lowest_memory(X=X, y=y, location=self.path + 'datasets/train', params=data_params)
         if X_val is not None:
@@ -337,6 +357,7 @@ class LGBModel(AbstractModel):
                 params=data_params,
                 save=save,
                 weight=sample_weight_val,
+                **dataset_kwargs,
             )
             # dataset_val = construct_dataset_lowest_memory(X=X_val, y=y_val, location=self.path + 'datasets/val', reference=dataset_train, params=data_params)
         else:
@@ -406,6 +427,20 @@ class LGBModel(AbstractModel):
     def _ag_params(self) -> set:
         return {"early_stop"}
 
+    def can_compile(self, compiler_configs: dict = None) -> bool:
+        if not super().can_compile(compiler_configs=compiler_configs):
+            return False
+        if compiler_configs.get("compiler", "native") == LGBNumbaCompiler.name and LGBNumbaCompiler.can_compile():
+            # Quantile models (one booster per quantile level) and linear trees are not supported by the compiler
+            return LGBNumbaCompiler.can_compile_model(self.model)
+        return True
+
+    def _valid_compilers(self):
+        return [LGBNativeCompiler, LGBNumbaCompiler]
+
+    def _default_compiler(self):
+        return LGBNativeCompiler
+
     def _more_tags(self):
         # `can_refit_full=True` because num_boost_round is communicated at end of `_fit`
         return {"can_refit_full": True}
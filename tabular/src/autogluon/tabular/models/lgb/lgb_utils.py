@@ -98,11 +98,22 @@ def softclass_lgbobj(preds, train_data):
     return grad.flatten("F"), hess.flatten("F")
 
 
-def construct_dataset(x: DataFrame, y: Series, location=None, reference=None, params=None, save=False, weight=None):
+def construct_dataset(
+    x: DataFrame, y: Series, location=None, reference=None, params=None, save=False, weight=None, feature_name="auto", categorical_feature="auto"
+):
     try_import_lightgbm()
     import lightgbm as lgb
 
-    dataset = lgb.Dataset(data=x, label=y, reference=reference, free_raw_data=True, params=params, weight=weight)
+    dataset = lgb.Dataset(
+        data=x,
+        label=y,
+        reference=reference,
+        free_raw_data=True,
+        params=params,
+        weight=weight,
+        feature_name=feature_name,
+        categorical_feature=categorical_feature,
+    )
 
     if save:
         assert location is not None
@@ -9,12 +9,22 @@ from sklearn.compose import ColumnTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import QuantileTransformer, StandardScaler
-
-from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT, R_OBJECT, S_BOOL, S_TEXT_AS_CATEGORY
+from sklearn.preprocessing import FunctionTransformer, MaxAbsScaler, QuantileTransformer, StandardScaler
+
+from autogluon.common.features.types import (
+    R_BOOL,
+    R_CATEGORY,
+    R_FLOAT,
+    R_INT,
+    R_OBJECT,
+    S_BOOL,
+    S_SPARSE,
+    S_TEXT_AS_CATEGORY,
+)
 from autogluon.common.utils.log_utils import fix_sklearnex_logging_if_kaggle
 from autogluon.core.constants import BINARY, REGRESSION
 from autogluon.core.models import AbstractModel
+from autogluon.core.utils import convert_df_to_csr
 from autogluon.core.utils.exceptions import TimeLimitExceeded
 
 from .hyperparameters.parameters import IGNORE, INCLUDE, ONLY, _get_solver, get_param_baseline, preprocess_params_set
@@ -75,12 +85,13 @@ class LinearModel(AbstractModel):
         return re.split("[ ]+", s)
 
     def _get_types_of_features(self, df):
-        """Returns dict with keys: : 'continuous', 'skewed', 'onehot', 'embed', 'language', values = ordered list of feature-names falling into each category.
+        """Returns dict with keys: : 'continuous', 'skewed', 'onehot', 'embed', 'language', 'sparse', values = ordered list of feature-names falling into each category.
         Each value is a list of feature-names corresponding to columns in original dataframe.
         """
-        continuous_featnames = self._feature_metadata.get_features(valid_raw_types=[R_INT, R_FLOAT], invalid_special_types=[S_BOOL])
+        continuous_featnames = self._feature_metadata.get_features(valid_raw_types=[R_INT, R_FLOAT], invalid_special_types=[S_BOOL, S_SPARSE])
         categorical_featnames = self._feature_metadata.get_features(valid_raw_types=[R_CATEGORY, R_OBJECT])
-        bool_featnames = self._feature_metadata.get_features(required_special_types=[S_BOOL])
+        bool_featnames = self._feature_metadata.get_features(required_special_types=[S_BOOL], invalid_special_types=[S_SPARSE])
+        sparse_featnames = self._feature_metadata.get_features(valid_raw_types=[R_BOOL, R_INT, R_FLOAT], required_special_types=[S_SPARSE])
         language_featnames = []  # TODO: Disabled currently, have to pass raw text data features here to function properly
         return self._select_features(
             df=df,
@@ -88,6 +99,7 @@ class LinearModel(AbstractModel):
             language_featnames=language_featnames,
             continuous_featnames=continuous_featnames,
             bool_featnames=bool_featnames,
+            sparse_featnames=sparse_featnames,
         )
 
     def _select_features(self, df, **kwargs):
@@ -135,6 +147,10 @@ class LinearModel(AbstractModel):
         if feature_types.get("bool", None):
             pipeline = Pipeline(steps=[("scaler", StandardScaler())])
             transformer_list.append(("bool", pipeline, feature_types["bool"]))
+        if feature_types.get("sparse", None):
+            # Keep sparse features (such as sparse text ngrams) in CSR form. MaxAbsScaler rescales without centering, which preserves sparsity.
+            pipeline = Pipeline(steps=[("csr", FunctionTransformer(convert_df_to_csr, accept_sparse=True)), ("scaler", MaxAbsScaler())])
+            transformer_list.append(("sparse", pipeline, feature_types["sparse"]))
         if feature_types.get("skewed", None):
             pipeline = Pipeline(
                 steps=[
@@ -248,24 +264,26 @@ class LinearModel(AbstractModel):
         self.model = model
         self.params_trained["max_iter"] = total_iter
 
-    def _select_features_handle_text_include(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames):
+    def _select_features_handle_text_include(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames, sparse_featnames):
         types_of_features = dict()
         types_of_features.update(self._select_continuous(df, continuous_featnames))
         types_of_features.update(self._select_bool(df, bool_featnames))
         types_of_features.update(self._select_categorical(df, categorical_featnames))
         types_of_features.update(self._select_text(df, language_featnames))
+        types_of_features.update(self._select_sparse(df, sparse_featnames))
         return types_of_features
 
-    def _select_features_handle_text_only(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames):
+    def _select_features_handle_text_only(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames, sparse_featnames):
         types_of_features = dict()
         types_of_features.update(self._select_text(df, language_featnames))
         return types_of_features
 
-    def _select_features_handle_text_ignore(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames):
+    def _select_features_handle_text_ignore(self, df, categorical_featnames, language_featnames, continuous_featnames, bool_featnames, sparse_featnames):
         types_of_features = dict()
         types_of_features.update(self._select_continuous(df, continuous_featnames))
         types_of_features.update(self._select_bool(df, bool_featnames))
         types_of_features.update(self._select_categorical(df, categorical_featnames))
+        types_of_features.update(self._select_sparse(df, sparse_featnames))
         return types_of_features
 
     def _select_categorical(self, df, features):
@@ -289,6 +307,9 @@ class LinearModel(AbstractModel):
     def _select_bool(self, df, features):
         return dict(bool=features)
 
+    def _select_sparse(self, df, features):
+        return dict(sparse=features)
+
     def _get_default_auxiliary_params(self) -> dict:
         default_auxiliary_params = super()._get_default_auxiliary_params()
         extra_auxiliary_params = dict(
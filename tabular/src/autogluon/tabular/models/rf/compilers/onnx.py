@@ -1,18 +1,32 @@
 import os
+import threading
 
 import numpy as np
+import pandas as pd
 
 
 class InferenceSessionWrapper:
     """
     Wrap around InferenceSession in onnxruntime, since it cannot be pickled.
     See https://github.com/microsoft/onnxruntime/issues/10097
+
+    A separate session is lazily created for each thread that runs the model and is reused by later calls from the same thread,
+    so that the predictor can be used concurrently from multiple threads.
     """
 
     def __init__(self, onnx_bytes):
-        import onnxruntime as rt
+        self._onnx_bytes = onnx_bytes.SerializeToString()
+        self._local = threading.local()
+
+    @property
+    def sess(self):
+        sess = getattr(self._local, "sess", None)
+        if sess is None:
+            import onnxruntime as rt
 
-        self.sess = rt.InferenceSession(onnx_bytes.SerializeToString(), providers=["CPUExecutionProvider"])
+            sess = rt.InferenceSession(self._onnx_bytes, providers=["CPUExecutionProvider"])
+            self._local.sess = sess
+        return sess
 
     def run(self, *args):
         return self.sess.run(*args)
@@ -24,31 +38,67 @@ class InferenceSessionWrapper:
         return self.sess.get_outputs(*args)
 
     def __getstate__(self):
-        # No need to duplicate the model parameters here.
-        return {}
+        # The sessions are not picklable, and are recreated from the serialized model after unpickling.
+        return {"_onnx_bytes": self._onnx_bytes}
 
     def __setstate__(self, values):
-        pass
+        self.__dict__.update(values)
+        self._local = threading.local()
 
 
 class RFOnnxPredictor:
-    def __init__(self, model):
+    """
+    Runs a random forest or extra trees model compiled to ONNX.
+
+    Inputs are processed in chunks of `batch_size` rows, and the outputs of each chunk are written into a preallocated contiguous float32 array.
+
+    Parameters
+    ----------
+    model
+        The ONNX model, converted without the ZipMap operator so that probabilities are returned as a tensor.
+    batch_size : int, default = 65536
+        The maximum number of rows passed to a single run of the ONNX session, which bounds the memory usage of the session for large inputs.
+    """
+
+    def __init__(self, model, batch_size: int = 65536):
         self.sess = InferenceSessionWrapper(model)
+        self.batch_size = batch_size
+        self.input_name = self.sess.get_inputs()[0].name
+        self.output_names = [output.name for output in self.sess.get_outputs()]
         self.num_classes = self.sess.get_outputs()[-1].shape[1]
 
     def predict(self, X):
         """Run the model with the input and return the result."""
-        input_name = self.sess.get_inputs()[0].name
-        label_name = self.sess.get_outputs()[0].name
-        return self.sess.run([label_name], {input_name: X})[0].squeeze()
+        y_pred = self._run(X, output_name=self.output_names[0])
+        if y_pred.ndim == 2 and y_pred.shape[1] == 1:
+            y_pred = y_pred[:, 0]
+        return y_pred
 
     def predict_proba(self, X):
         """Run the model with the input, and return probabilities as result."""
-        input_name = self.sess.get_inputs()[0].name
-        label_name = self.sess.get_outputs()[1].name
-        pred_proba = self.sess.run([label_name], {input_name: X})[0]
-        pred_proba = np.array([[r[i] for i in range(self.num_classes)] for r in pred_proba])
-        return pred_proba
+        return self._run(X, output_name=self.output_names[1])
+
+    def _run(self, X, output_name: str) -> np.ndarray:
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        num_rows = X.shape[0]
+        if num_rows <= self.batch_size:
+            return self._to_numpy(self.sess.run([output_name], {self.input_name: X})[0])
+        out = None
+        for start in range(0, num_rows, self.batch_size):
+            pred = self._to_numpy(self.sess.run([output_name], {self.input_name: X[start : start + self.batch_size]})[0])
+            if out is None:
+                out = np.empty((num_rows,) + pred.shape[1:], dtype=pred.dtype)
+            out[start : start + self.batch_size] = pred
+        return out
+
+    @staticmethod
+    def _to_numpy(pred) -> np.ndarray:
+        if isinstance(pred, list):
+            # Models converted with the ZipMap operator return one dictionary per row, mapping each class to its probability
+            return pd.DataFrame.from_records(pred).sort_index(axis=1).to_numpy(dtype=np.float32)
+        if pred.dtype == np.float64:
+            pred = pred.astype(np.float32)
+        return pred
 
 
 class RFOnnxCompiler:
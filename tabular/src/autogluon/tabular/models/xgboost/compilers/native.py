@@ -0,0 +1,3 @@
+from ...rf.compilers.native import AbstractNativeCompiler
+
+XGBoostNativeCompiler = AbstractNativeCompiler
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+
+from ..._utils.tree_utils import CompiledTreeEnsemble, TreeEnsembleBuilder, convert_sparse_to_dense, sigmoid, softmax
+from ...rf.compilers.native import AbstractNativeCompiler
+
+# Output transform of the raw scores for each XGBoost objective
+_OBJECTIVE_TRANSFORMS = {
+    "reg:squarederror": "identity",
+    "reg:absoluteerror": "identity",
+    "reg:pseudohubererror": "identity",
+    "reg:logistic": "sigmoid",
+    "binary:logistic": "sigmoid",
+    "multi:softprob": "softmax",
+    "multi:softmax": "softmax",
+    "count:poisson": "exp",
+    "reg:gamma": "exp",
+    "reg:tweedie": "exp",
+}
+
+
+class XGBoostCompiledPredictor:
+    """
+    Compiled XGBoost gbtree model with the same `predict` and `predict_proba` outputs as the XGBoost scikit-learn estimators.
+    The compiled trees are evaluated by numba kernels on contiguous float32 arrays, falling back to numpy if numba is not installed.
+
+    Parameters
+    ----------
+    ensemble : CompiledTreeEnsemble
+        The compiled trees, including the base margin.
+    transform : str
+        The output transform applied to the raw scores, one of the values of `_OBJECTIVE_TRANSFORMS`.
+    """
+
+    def __init__(self, ensemble: CompiledTreeEnsemble, transform: str):
+        self.ensemble = ensemble
+        self.transform = transform
+
+    @classmethod
+    def from_booster(cls, booster) -> "XGBoostCompiledPredictor":
+        """Compiles the trees used by the scikit-learn estimator's predict (up to the best iteration if early stopping was used)."""
+        model = json.loads(booster.save_raw(raw_format="json"))
+        learner = model["learner"]
+        objective = learner["objective"]["name"]
+        if objective not in _OBJECTIVE_TRANSFORMS:
+            raise ValueError(f"Unsupported XGBoost objective for compilation: {objective}")
+        gradient_booster = learner["gradient_booster"]
+        if gradient_booster["name"] != "gbtree":
+            raise ValueError(f"Unsupported XGBoost booster for compilation: {gradient_booster['name']}")
+        learner_model_param = learner["learner_model_param"]
+        if int(learner_model_param.get("num_target", 1)) > 1:
+            raise ValueError("Multi-target XGBoost models are not supported for compilation.")
+        num_outputs = max(int(learner_model_param["num_class"]), 1)
+        transform = _OBJECTIVE_TRANSFORMS[objective]
+
+        # base_score is stored in the output space of the objective
+        base_score = float(learner_model_param["base_score"])
+        if transform == "sigmoid":
+            base_score = np.log(base_score / (1 - base_score))
+        elif transform == "exp":
+            base_score = np.log(base_score)
+
+        trees = gradient_booster["model"]["trees"]
+        tree_info = gradient_booster["model"]["tree_info"]
+        best_iteration = booster.attr("best_iteration")
+        if best_iteration is not None:
+            num_parallel_tree = int(gradient_booster["model"]["gbtree_model_param"].get("num_parallel_tree", 1))
+            num_trees = (int(best_iteration) + 1) * num_parallel_tree * num_outputs
+            trees = trees[:num_trees]
+
+        builder = TreeEnsembleBuilder(num_outputs=num_outputs, strict_less=True)
+        for tree, output in zip(trees, tree_info):
+            if any(split_type != 0 for split_type in tree.get("split_type", [])):
+                raise ValueError("Categorical splits are not supported for compilation.")
+            left_children = tree["left_children"]
+            right_children = tree["right_children"]
+            split_indices = tree["split_indices"]
+            # For leaves, split_conditions contains the leaf value
+            split_conditions = tree["split_conditions"]
+            default_left = tree["default_left"]
+
+            def get_children(node):
+                if left_children[node] == -1:
+                    return None
+                return left_children[node], right_children[node]
+
+            def add_node(node_id, node):
+                if left_children[node] == -1:
+                    builder.set_leaf(node_id, split_conditions[node])
+                else:
+                    builder.set_numerical_split(node_id, feature=split_indices[node], threshold=split_conditions[node], nan_left=bool(default_left[node]))
+
+            builder.add_tree(0, get_children=get_children, add_node=add_node, output=output)
+        ensemble = builder.build(base_score=np.full(num_outputs, base_score), threshold_dtype=np.float32)
+        return cls(ensemble=ensemble, transform=transform)
+
+    def predict(self, X, num_threads: int = None) -> np.ndarray:
+        """Returns the predictions of `XGBRegressor.predict`. For classifiers, use `predict_proba`."""
+        y_pred = self._predict(X, num_threads=num_threads)
+        if y_pred.shape[1] == 1:
+            y_pred = y_pred[:, 0]
+        return y_pred
+
+    def predict_proba(self, X, num_threads: int = None) -> np.ndarray:
+        """Returns the predictions of `XGBClassifier.predict_proba`, with 2 columns for binary classification."""
+        y_pred_proba = self._predict(X, num_threads=num_threads)
+        if y_pred_proba.shape[1] == 1:
+            y_pred_proba = np.hstack([1 - y_pred_proba, y_pred_proba])
+        return y_pred_proba
+
+    def _predict(self, X, num_threads: int = None) -> np.ndarray:
+        X = self._to_numpy(X)
+        y_pred = self.ensemble.predict_raw(X, num_threads=num_threads)
+        if self.transform == "sigmoid":
+            y_pred = sigmoid(y_pred)
+        elif self.transform == "softmax":
+            y_pred = softmax(y_pred)
+        elif self.transform == "exp":
+            y_pred = np.exp(y_pred)
+        return y_pred
+
+    def _to_numpy(self, X) -> np.ndarray:
+        if scipy.sparse.issparse(X):
+            # Identical to XGBoost, entries that are not stored in the sparse matrix are treated as missing.
+            # The whole matrix is densified, see `convert_sparse_to_dense` for the memory cost.
+            return convert_sparse_to_dense(X, dtype=self.ensemble.dtype, fill_value=np.nan)
+        if isinstance(X, pd.DataFrame):
+            return X.to_numpy(dtype=self.ensemble.dtype)
+        return X
+
+
+class XGBoostNumbaCompiler(AbstractNativeCompiler):
+    """
+    Compiles a fitted `XGBClassifier` or `XGBRegressor` into a `XGBoostCompiledPredictor`, evaluated by numba kernels.
+    The compiled model is pickled with the model, and produces identical predictions to the estimator up to float32 precision.
+    """
+
+    name = "numba"
+    save_in_pkl = True
+
+    @staticmethod
+    def can_compile():
+        """Verify whether the required package has been installed."""
+        return importlib.util.find_spec("numba") is not None
+
+    @staticmethod
+    def can_compile_model(model) -> bool:
+        """Verify whether the estimator uses features that are supported by the compiler."""
+        if isinstance(model, XGBoostCompiledPredictor):
+            return True
+        if callable(model.objective) or model.get_params().get("enable_categorical", False):
+            return False
+        booster = model.get_booster()
+        learner = json.loads(booster.save_config())["learner"]
+        return learner["objective"]["name"] in _OBJECTIVE_TRANSFORMS and learner["gradient_booster"]["name"] == "gbtree"
+
+    @staticmethod
+    def compile(model, path: str, input_types=None):
+        """
+        Compile the trained model for faster inference.
+
+        Parameters
+        ----------
+        model
+            The `XGBClassifier` or `XGBRegressor` that is expected to be compiled.
+        path : str
+            The path for saving the compiled model. Unused, as the compiled model is saved with the model pickle.
+        input_types : list, default=None
+            Unused, the compiled model supports any batch size.
+        """
+        if isinstance(model, XGBoostCompiledPredictor):
+            return model
+        booster = model.get_booster()
+        predictor = XGBoostCompiledPredictor.from_booster(booster)
+        # Trigger the JIT compilation of the kernels, which are otherwise compiled on the first prediction
+        predictor.predict(np.zeros((1, booster.num_features()), dtype=np.float32))
+        return predictor
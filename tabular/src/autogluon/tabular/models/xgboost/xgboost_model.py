@@ -13,6 +13,8 @@ from autogluon.core.models import AbstractModel
 from autogluon.core.models._utils import get_early_stopping_rounds
 
 from . import xgboost_utils
+from .compilers.native import XGBoostNativeCompiler
+from .compilers.numba import XGBoostCompiledPredictor, XGBoostNumbaCompiler
 from .hyperparameters.parameters import get_param_baseline
 from .hyperparameters.searchspaces import get_default_searchspace
 
@@ -163,6 +165,12 @@ class XGBoostModel(AbstractModel):
 
     def _predict_proba(self, X, num_cpus=-1, **kwargs):
         X = self.preprocess(X, **kwargs)
+        if self.get_compiler_name() != "native":
+            if self.problem_type == REGRESSION:
+                return self.model.predict(X, num_threads=num_cpus)
+            y_pred_proba = self.model.predict_proba(X, num_threads=num_cpus)
+            return self._convert_proba_to_unified_form(y_pred_proba)
+
         if self.problem_type in [MULTICLASS, SOFTCLASS]:
             # Bug fix for "xgboost>=2,<2.0.3" : https://github.com/dmlc/xgboost/issues/9807
             self.model.set_params(n_jobs=num_cpus, objective="multi:softprob")
@@ -193,6 +201,20 @@ class XGBoostModel(AbstractModel):
     def _ag_params(self) -> set:
         return {"early_stop"}
 
+    def can_compile(self, compiler_configs: dict = None) -> bool:
+        if not super().can_compile(compiler_configs=compiler_configs):
+            return False
+        if compiler_configs.get("compiler", "native") == XGBoostNumbaCompiler.name and XGBoostNumbaCompiler.can_compile():
+            # Custom objectives (softclass) and native categorical splits are not supported by the compiler
+            return XGBoostNumbaCompiler.can_compile_model(self.model)
+        return True
+
+    def _valid_compilers(self):
+        return [XGBoostNativeCompiler, XGBoostNumbaCompiler]
+
+    def _default_compiler(self):
+        return XGBoostNativeCompiler
+
     def _estimate_memory_usage(self, X, **kwargs):
         """
         Returns the expected peak memory usage in bytes of the XGBoost model during fit.
@@ -248,6 +270,10 @@ class XGBoostModel(AbstractModel):
 
     def save(self, path: str = None, verbose=True) -> str:
         _model = self.model
+        if isinstance(_model, XGBoostCompiledPredictor):
+            # Compiled models are saved in the model pickle
+            self._xgb_model_type = None
+            return super().save(path=path, verbose=verbose)
         self.model = None
         if _model is not None:
             self._xgb_model_type = _model.__class__
@@ -1,10 +1,11 @@
 from collections import OrderedDict
 
 import numpy as np
-from scipy.sparse import csr_matrix, hstack
+from scipy.sparse import hstack
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, SOFTCLASS
+from autogluon.core.utils import convert_df_to_csr
 
 from ..tabular_nn.utils.categorical_encoders import OneHotMergeRaresHandleUnknownEncoder
 
@@ -91,7 +92,8 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         if self.cat_cols:
             X_list.append(self.ohe_encs.transform(X[self.cat_cols]))
         if self.other_cols:
-            X_list.append(csr_matrix(X[self.other_cols]))
+            # Pandas sparse columns (such as sparse text ngrams) are converted without densifying them
+            X_list.append(convert_df_to_csr(X[self.other_cols]))
         return hstack(X_list, format="csr")
 
     def get_feature_names(self):
@@ -606,6 +606,10 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
                                 How many GPUs to use during model fit.
                                 If 'auto', model will decide. Some models can use GPUs but don't by default due to differences in model quality.
                                 Set to 0 to disable usage of GPUs.
+                            oob_buffer_min_size : (int, default=None)
+                                If specified, the model is saved with pickle protocol 5 and buffers (such as numpy arrays) of at least this many bytes are stored out-of-band in separate files.
+                                These files are memory-mapped copy-on-write when the model is loaded, which reduces load time and lets multiple inference processes share one copy of the model weights.
+                                Ignored when saving to a remote path or with compression.
                     ag_args_ensemble: Dictionary of hyperparameters shared by all models that control how they are ensembled, if bag mode is enabled.
                         Valid keys:
                             use_orig_features: (bool) Whether a stack model will use the original features along with the stack features to train (akin to skip-connections). If the model has no stack features (no base models), this value is ignored and the stack model will use the original features.
@@ -628,6 +632,12 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
                                 If auto, strategy will be determined by OS and whether ray is installed or not. MacOS support for parallel_local is unstable, and may crash if enabled.
                             num_folds_parallel: (int or str, default='auto') Number of folds to be trained in parallel if using ParallelLocalFoldFittingStrategy. Consider lowering this value if you encounter either out of memory issue or CUDA out of memory issue(when trained on gpu).
                                 if 'auto', will try to train all folds in parallel.
+                            fold_predict_strategy: (str, default='sequential') How to predict with the fold models of a bagged model during inference.
+                                If sequential, fold models predict one after the other.
+                                If thread, fold models predict concurrently in a thread pool, sharing the preprocessed input data without copying it.
+                                If process, fold models predict concurrently in a fork-based process pool that inherits the preprocessed input data via copy-on-write. Falls back to thread if forking is not supported by the OS.
+                            fold_predict_num_workers: (int or str, default='auto') Maximum number of fold models to predict with at the same time if `fold_predict_strategy` is not sequential.
+                                If 'auto', will use the number of CPUs. The value is further reduced if the fold models would not fit in the available memory.
 
         feature_metadata : :class:`autogluon.tabular.FeatureMetadata` or str, default = 'infer'
             The feature metadata used in various inner logic in feature preprocessing.
@@ -2349,6 +2359,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         refit_full: bool | None = None,
         set_refit_score_to_parent: bool = False,
         display: bool = False,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
         **kwargs,
     ) -> pd.DataFrame:
         """
@@ -2491,6 +2503,13 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             While this does not represent the genuine validation score of the refit model, it is a reasonable proxy.
         display : bool, default = False
             If True, the output DataFrame is printed to stdout.
+        num_workers : int, default = 1
+            The number of models to predict with at the same time when computing the predictions on `data`. Ignored if `data` is None.
+            If greater than 1, all models within a stack level are predicted in parallel. The predictions are identical to `num_workers=1`.
+        parallel_backend : str, default = "thread"
+            The executor used when `num_workers > 1`. Valid values:
+                "thread": Predict in a thread pool. Best for models whose inference releases the GIL, such as most tree and neural network models.
+                "process": Predict in a process pool. Only beneficial for models whose inference holds the GIL, as the data is serialized to each worker.
 
         Returns
         -------
@@ -2518,6 +2537,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             refit_full=refit_full,
             set_refit_score_to_parent=set_refit_score_to_parent,
             display=display,
+            num_workers=num_workers,
+            parallel_backend=parallel_backend,
         )
 
     def model_failures(self, verbose: bool = False) -> pd.DataFrame:
@@ -2574,6 +2595,9 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         as_multiclass: bool = True,
         transform_features: bool = True,
         inverse_transform: bool = True,
+        *,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ) -> dict:
         """
         Returns a dictionary of prediction probabilities where the key is
@@ -2616,6 +2640,13 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         inverse_transform : bool, default = True
             If True, will return prediction probabilities in the original format.
             If False (advanced), will return prediction probabilities in AutoGluon's internal format.
+        num_workers : int, default = 1
+            The number of models to predict with at the same time. Ignored if `data` is None and out-of-fold predictions are used.
+            If greater than 1, all models within a stack level are predicted in parallel. The predictions are identical to `num_workers=1`.
+        parallel_backend : str, default = "thread"
+            The executor used when `num_workers > 1`. Valid values:
+                "thread": Predict in a thread pool. Best for models whose inference releases the GIL, such as most tree and neural network models.
+                "process": Predict in a process pool. Only beneficial for models whose inference holds the GIL, as the data is serialized to each worker.
 
         Returns
         -------
@@ -2630,7 +2661,14 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             )
         data = self._get_dataset(data, allow_nan=True)
         return self._learner.predict_proba_multi(
-            X=data, models=models, as_pandas=as_pandas, as_multiclass=as_multiclass, transform_features=transform_features, inverse_transform=inverse_transform
+            X=data,
+            models=models,
+            as_pandas=as_pandas,
+            as_multiclass=as_multiclass,
+            transform_features=transform_features,
+            inverse_transform=inverse_transform,
+            num_workers=num_workers,
+            parallel_backend=parallel_backend,
         )
 
     def predict_multi(
@@ -2642,6 +2680,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         inverse_transform: bool = True,
         *,
         decision_threshold: float = None,
+        num_workers: int = 1,
+        parallel_backend: str = "thread",
     ) -> dict:
         """
         Returns a dictionary of predictions where the key is
@@ -2686,6 +2726,13 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             You can obtain an optimized `decision_threshold` by first calling `predictor.calibrate_decision_threshold()`.
             Useful to set for metrics such as `balanced_accuracy` and `f1` as `0.5` is often not an optimal threshold.
             Predictions are calculated via the following logic on the positive class: `1 if pred > decision_threshold else 0`
+        num_workers : int, default = 1
+            The number of models to predict with at the same time. Ignored if `data` is None and out-of-fold predictions are used.
+            If greater than 1, all models within a stack level are predicted in parallel. The predictions are identical to `num_workers=1`.
+        parallel_backend : str, default = "thread"
+            The executor used when `num_workers > 1`. Valid values:
+                "thread": Predict in a thread pool. Best for models whose inference releases the GIL, such as most tree and neural network models.
+                "process": Predict in a process pool. Only beneficial for models whose inference holds the GIL, as the data is serialized to each worker.
 
         Returns
         -------
@@ -2702,6 +2749,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             transform_features=transform_features,
             inverse_transform=inverse_transform,
             decision_threshold=decision_threshold,
+            num_workers=num_workers,
+            parallel_backend=parallel_backend,
         )
 
     def fit_summary(self, verbosity=3, show_plot=False):
@@ -2953,6 +3002,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         include_confidence_band: bool = True,
         confidence_level: float = 0.99,
         silent: bool = False,
+        num_workers: int = 1,
+        early_stop_p_value: float = None,
     ):
         """
         Calculates feature importance scores for the given model via permutation importance. Refer to https://explained.ai/rf-importance/ for an explanation of permutation importance.
@@ -3028,6 +3079,14 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             More generally, if `confidence_level` = 0.XX, then the columns containing the XX% confidence interval will be named 'pXX_high' and 'pXX_low'.
         silent : bool, default = False
             Whether to suppress logging output.
+        num_workers : int, default = 1
+            Number of threads used to concurrently predict permuted batches of features and shuffle sets.
+            Values greater than 1 are most useful when the model's inference does not already use all available CPU cores.
+        early_stop_p_value : float, default = None
+            If specified, features stop being shuffled once at least 3 shuffle sets were evaluated, their mean importance is not positive,
+            and their p-value is at least `early_stop_p_value` (or their importance was identical in every shuffle set).
+            This can greatly reduce runtime when many features are unimportant, such as `early_stop_p_value=0.9`.
+            The 'n' column of early stopped features will be smaller than `num_shuffle_sets`.
 
         Returns
         -------
@@ -3064,6 +3123,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             time_limit=time_limit,
             num_shuffle_sets=num_shuffle_sets,
             silent=silent,
+            num_workers=num_workers,
+            early_stop_p_value=early_stop_p_value,
         )
 
         if include_confidence_band:
@@ -3100,7 +3161,11 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
         Compile models for accelerated prediction.
         This can be helpful to reduce prediction latency and improve throughput.
 
-        Note that this is currently an experimental feature, the supported compilers can be ['native', 'onnx'].
+        Note that this is currently an experimental feature, the supported compilers can be ['native', 'onnx', 'numba'].
+        The 'numba' compiler is available for LightGBM, XGBoost and CatBoost models, and evaluates the trees with numba kernels
+        that produce the same predictions as the native model with lower latency, especially for small batch sizes.
+        It is not part of the "auto" preset and must be requested explicitly, e.g.
+        `compiler_configs={"GBM": {"compiler": "numba"}, "XGB": {"compiler": "numba"}, "CAT": {"compiler": "numba"}}`.
 
         In order to compile with a specific compiler, that compiler must be installed in the Python environment.
 
@@ -3513,6 +3578,8 @@ class TabularPredictor(TabularPredictorDeprecatedMixin):
             The number of decision thresholds on either side of `0.5` to search.
             The default of 25 will result in 51 searched thresholds: [0.00, 0.02, 0.04, ..., 0.48, 0.50, 0.52, ..., 0.96, 0.98, 1.00]
             Alternatively, a list of decision thresholds can be passed and only the thresholds in the list will be searched.
+            If int and `metric` is a confusion matrix based metric (accuracy, balanced_accuracy, f1, precision, recall, mcc),
+            an exact search over every unique predicted probability is performed instead, and `secondary_decision_thresholds` is ignored.
         secondary_decision_thresholds : int | None, default = 19
             The number of secondary decision thresholds to check on either side of the threshold identified in the first phase.
             Skipped if None.
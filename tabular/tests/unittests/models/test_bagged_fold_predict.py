@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.core.models import BaggedEnsembleModel
+from autogluon.tabular.models import RFModel
+
+
+@pytest.fixture(scope="module")
+def fitted_bag_and_data(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(600, 5)), columns=[f"f{i}" for i in range(5)])
+    y = pd.Series((X["f0"] + X["f1"] * X["f2"] > 0).astype(int))
+    X_test = X.iloc[500:]
+    bag = BaggedEnsembleModel(
+        model_base=RFModel,
+        model_base_kwargs=dict(problem_type="binary", hyperparameters={"n_estimators": 10}),
+        path=str(tmp_path_factory.mktemp("bag")),
+        hyperparameters={"fold_fitting_strategy": "sequential_local"},
+    )
+    bag.fit(X=X.iloc[:500], y=y.iloc[:500], k_fold=4, n_repeats=2)
+    bag.save()
+    return bag, X_test
+
+
+@pytest.mark.parametrize("fold_predict_strategy", ["thread", "process"])
+@pytest.mark.parametrize("persist_children", [False, True])
+def test_when_fold_predict_strategy_is_parallel_then_predictions_match_sequential(fitted_bag_and_data, fold_predict_strategy, persist_children):
+    bag, X_test = fitted_bag_and_data
+    bag = BaggedEnsembleModel.load(path=bag.path)
+    if persist_children:
+        bag.persist_child_models()
+    bag.params["fold_predict_strategy"] = "sequential"
+    expected_pred_proba = bag.predict_proba(X_test)
+    expected_pred_proba_children = bag.predict_proba_children(X_test)
+
+    bag.params["fold_predict_strategy"] = fold_predict_strategy
+    bag.params["fold_predict_num_workers"] = 3
+    assert bag._get_fold_predict_num_workers(children=bag.models) == 3
+    np.testing.assert_array_equal(bag.predict_proba(X_test), expected_pred_proba)
+    pred_proba_children = bag.predict_proba_children(X_test, children_idx=list(range(bag.n_children)))
+    assert len(pred_proba_children) == len(expected_pred_proba_children) == 8
+    for pred_proba_child, expected_pred_proba_child in zip(pred_proba_children, expected_pred_proba_children):
+        np.testing.assert_array_equal(pred_proba_child, expected_pred_proba_child)
+
+
+def test_when_fold_predict_strategy_is_invalid_then_exception_is_raised(fitted_bag_and_data):
+    bag, X_test = fitted_bag_and_data
+    bag = BaggedEnsembleModel.load(path=bag.path)
+    bag.params["fold_predict_strategy"] = "invalid"
+    with pytest.raises(ValueError):
+        bag.predict_proba(X_test)
+
+
+def test_when_fold_predict_strategy_is_thread_then_at_most_num_workers_children_are_in_flight(fitted_bag_and_data):
+    bag, X_test = fitted_bag_and_data
+    bag = BaggedEnsembleModel.load(path=bag.path)
+    bag.params["fold_predict_strategy"] = "thread"
+    bag.params["fold_predict_num_workers"] = 3
+    predict_proba_child = bag._predict_proba_child
+    predicted_children = []
+
+    def _predict_proba_child(child, X, normalize=None):
+        predicted_children.append(child)
+        return predict_proba_child(child=child, X=X, normalize=normalize)
+
+    bag._predict_proba_child = _predict_proba_child
+    X_test = bag.preprocess(X_test, model=bag.load_child(bag.models[0]))
+    pred_proba_children_iter = bag._predict_proba_children_iter(X=X_test, children=bag.models)
+    next(pred_proba_children_iter)
+    time.sleep(0.5)
+    # The first result was consumed, so only one more child than the number of workers can have been submitted
+    assert len(predicted_children) <= 4
+    assert len(list(pred_proba_children_iter)) == bag.n_children - 1
+    assert sorted(predicted_children) == sorted(bag.models)
+
+
+@pytest.mark.parametrize("fold_predict_strategy", ["sequential", "thread"])
+def test_when_predict_proba_then_children_are_summed_in_child_order_with_children_dtype(fitted_bag_and_data, fold_predict_strategy):
+    bag, X_test = fitted_bag_and_data
+    bag = BaggedEnsembleModel.load(path=bag.path)
+    bag.params["fold_predict_strategy"] = fold_predict_strategy
+    bag.params["fold_predict_num_workers"] = 3
+    pred_proba_children = bag.predict_proba_children(X_test)
+    expected_pred_proba = pred_proba_children[0].copy()
+    for pred_proba_child in pred_proba_children[1:]:
+        expected_pred_proba += pred_proba_child
+    expected_pred_proba = expected_pred_proba / bag.n_children
+    pred_proba = bag.predict_proba(X_test)
+    assert pred_proba.dtype == pred_proba_children[0].dtype
+    np.testing.assert_array_equal(pred_proba, expected_pred_proba)
+
+
+def test_when_predict_proba_children_then_first_child_is_loaded_once(fitted_bag_and_data):
+    bag, X_test = fitted_bag_and_data
+    bag = BaggedEnsembleModel.load(path=bag.path)
+    load_child = bag.load_child
+    loaded_children = []
+
+    def _load_child(model, **kwargs):
+        if isinstance(model, str):
+            loaded_children.append(model)
+        return load_child(model, **kwargs)
+
+    bag.load_child = _load_child
+    bag.predict_proba_children(X_test)
+    assert sorted(loaded_children) == sorted(bag.models)
@@ -1,8 +1,12 @@
 import sys
+import time
 
+import numpy as np
 import pytest
 
+from autogluon.tabular.models._utils.tree_utils import CompiledObliviousTreeEnsemble
 from autogluon.tabular.models.catboost.catboost_model import CatBoostModel
+from autogluon.tabular.models.catboost.compilers.numba import CatBoostCompiledPredictor
 
 
 @pytest.mark.skipif(sys.version_info >= (3, 11) and sys.platform == "darwin", reason="catboost has no wheel for py311 darwin")
@@ -42,3 +46,77 @@ def test_catboost_quantile(fit_helper):
     dataset_name = "ames"
     init_args = dict(problem_type="quantile", quantile_levels=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, init_args=init_args)
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 11) and sys.platform == "darwin", reason="catboost has no wheel for py311 darwin")
+def test_catboost_multiclass_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={CatBoostModel: {}},
+    )
+    # Only numerical features are supported by the compiler, covertype has no categorical features
+    dataset_name = "covertype_small"
+    compiler_configs = {CatBoostModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_compiled_oblivious_tree_ensemble(use_numba):
+    """Tests the oblivious tree evaluation used for compiled CatBoost models against a reference implementation"""
+    rng = np.random.default_rng(0)
+    num_trees, depth, num_outputs, num_features = 20, 4, 3, 6
+    split_features = rng.integers(0, num_features, size=(num_trees, depth))
+    split_borders = rng.normal(size=(num_trees, depth)).astype(np.float32)
+    split_nan_values = rng.random(size=(num_trees, depth)) < 0.5
+    leaf_values = rng.normal(size=(num_trees, 2**depth, num_outputs))
+    base_score = rng.normal(size=num_outputs)
+    ensemble = CompiledObliviousTreeEnsemble(
+        split_features=split_features,
+        split_borders=split_borders,
+        split_nan_values=split_nan_values,
+        leaf_values=leaf_values,
+        base_score=base_score,
+        scale=0.5,
+    )
+
+    X = rng.normal(size=(300, num_features)).astype(np.float32)
+    X[rng.random(size=X.shape) < 0.1] = np.nan
+    expected = np.tile(base_score, (len(X), 1))
+    for i, row in enumerate(X):
+        for tree in range(num_trees):
+            leaf = 0
+            for d in range(depth):
+                x = row[split_features[tree, d]]
+                if split_nan_values[tree, d] if np.isnan(x) else x > split_borders[tree, d]:
+                    leaf |= 1 << d
+            expected[i] += 0.5 * leaf_values[tree, leaf]
+    np.testing.assert_allclose(ensemble.predict_raw(X, use_numba=use_numba), expected, rtol=1e-10)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(sys.version_info >= (3, 11) and sys.platform == "darwin", reason="catboost has no wheel for py311 darwin")
+def test_catboost_compiled_predictor_benchmark():
+    """Compares the single-threaded latency of the compiled predictor to CatBoost at batch sizes of 1, 100 and 100000 rows"""
+    from catboost import CatBoostClassifier
+
+    rng = np.random.default_rng(0)
+    num_features = 10
+    X = rng.normal(size=(20000, num_features)).astype(np.float32)
+    X[rng.random(size=X.shape) < 0.05] = np.nan
+    y = (np.nan_to_num(X[:, 0]) + np.nan_to_num(X[:, 1]) * np.nan_to_num(X[:, 2]) > 0).astype(int)
+    model = CatBoostClassifier(iterations=300, depth=8, thread_count=1, random_seed=0, verbose=False)
+    model.fit(X, y)
+    predictor = CatBoostCompiledPredictor.from_model(model)
+
+    def _time(func, X, repeats):
+        func(X)
+        ts = time.perf_counter()
+        for _ in range(repeats):
+            func(X)
+        return (time.perf_counter() - ts) / repeats
+
+    for num_rows, repeats in [(1, 200), (100, 50), (100000, 2)]:
+        X_test = rng.normal(size=(num_rows, num_features)).astype(np.float32)
+        np.testing.assert_allclose(predictor.predict_proba(X_test, num_threads=1), model.predict_proba(X_test), rtol=1e-5, atol=1e-6)
+        time_native = _time(model.predict_proba, X_test, repeats)
+        time_compiled = _time(lambda X: predictor.predict_proba(X, num_threads=1), X_test, repeats)
+        print(f"{num_rows} rows: native={time_native * 1000:.3f}ms, compiled={time_compiled * 1000:.3f}ms, speedup={time_native / time_compiled:.2f}x")
@@ -1,6 +1,14 @@
+import time
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+import pytest
+
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION
 from autogluon.core.metrics import METRICS
 from autogluon.tabular import TabularPredictor
+from autogluon.tabular.models.lgb.compilers.numba import LGBCompiledPredictor
 from autogluon.tabular.models.lgb.lgb_model import LGBModel
 
 
@@ -170,3 +178,91 @@ def test_lightgbm_binary_with_calibrate_decision_threshold_bagged_refit(fit_help
     leaderboard = predictor.leaderboard(test_data)
     lb_score = leaderboard[leaderboard["model"] == predictor.model_best].iloc[0]["score_test"]
     assert lb_score == scores["f1"]
+
+
+def _generate_lgb_data(num_rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(num_rows, 10)), columns=[f"f{i}" for i in range(10)])
+    X.loc[rng.random(num_rows) < 0.1, "f0"] = np.nan
+    X.loc[rng.random(num_rows) < 0.1, "f1"] = 0.0
+    X["cat"] = pd.Categorical(rng.choice(["a", "b", "c", "d"], size=num_rows))
+    y = X["f0"].fillna(0) + X["f1"] * X["f2"] + (X["cat"] == "b") + rng.normal(scale=0.1, size=num_rows)
+    return X, y
+
+
+@pytest.mark.parametrize("objective", ["binary", "multiclass", "l2", "poisson"])
+def test_lightgbm_compiled_predictor_parity(objective):
+    """Tests that the compiled predictor exactly reproduces the LightGBM predictions, including NaN, zero and categorical splits"""
+    X, y = _generate_lgb_data(num_rows=2000)
+    params = dict(objective=objective, num_leaves=31, verbose=-1, zero_as_missing=objective == "l2")
+    if objective == "binary":
+        y = (y > y.median()).astype(int)
+    elif objective == "multiclass":
+        y = pd.qcut(y, 3, labels=False)
+        params["num_class"] = 3
+    elif objective == "poisson":
+        y = np.exp(y / y.abs().max())
+    booster = lgb.train(params, lgb.Dataset(X, y), num_boost_round=20)
+    predictor = LGBCompiledPredictor.from_booster(booster)
+
+    X_test, _ = _generate_lgb_data(num_rows=500, seed=1)
+    # Unseen and reordered categories are remapped identically to LightGBM
+    X_test["cat"] = pd.Categorical(X_test["cat"].astype(str).replace({"d": "e"}), categories=["e", "c", "b", "a"])
+    for raw_score in [False, True]:
+        y_pred_expected = booster.predict(X_test, raw_score=raw_score)
+        y_pred = predictor.predict(X_test, raw_score=raw_score)
+        assert y_pred.shape == y_pred_expected.shape
+        np.testing.assert_allclose(y_pred, y_pred_expected, rtol=1e-12, atol=1e-12)
+
+    # The numpy fallback, used if numba is not installed, is identical to the numba kernels
+    X_test_np = predictor._to_numpy(X_test)
+    np.testing.assert_allclose(predictor.ensemble.predict_raw(X_test_np, use_numba=False), predictor.ensemble.predict_raw(X_test_np), rtol=1e-12, atol=1e-12)
+
+
+def test_lightgbm_binary_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={LGBModel: {}},
+    )
+    dataset_name = "adult"
+    compiler_configs = {LGBModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+def test_lightgbm_multiclass_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={LGBModel: {}},
+    )
+    dataset_name = "covertype_small"
+    compiler_configs = {LGBModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+def test_lightgbm_regression_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={LGBModel: {}},
+    )
+    dataset_name = "ames"
+    compiler_configs = {LGBModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+@pytest.mark.slow
+def test_lightgbm_compiled_predictor_benchmark():
+    """Compares the single-threaded latency of the compiled predictor to LightGBM at batch sizes of 1, 100 and 100000 rows"""
+    X, y = _generate_lgb_data(num_rows=20000)
+    booster = lgb.train(dict(objective="binary", num_leaves=127, max_depth=15, verbose=-1, num_threads=1), lgb.Dataset(X, y > y.median()), num_boost_round=300)
+    predictor = LGBCompiledPredictor.from_booster(booster)
+
+    def _time(func, X, repeats):
+        func(X)
+        ts = time.perf_counter()
+        for _ in range(repeats):
+            func(X)
+        return (time.perf_counter() - ts) / repeats
+
+    for num_rows, repeats in [(1, 200), (100, 50), (100000, 2)]:
+        X_test, _ = _generate_lgb_data(num_rows=num_rows, seed=1)
+        time_native = _time(lambda X: booster.predict(X, num_threads=1), X_test, repeats)
+        time_compiled = _time(lambda X: predictor.predict(X, num_threads=1), X_test, repeats)
+        print(f"{num_rows} rows: native={time_native * 1000:.3f}ms, compiled={time_compiled * 1000:.3f}ms, speedup={time_native / time_compiled:.2f}x")
+        np.testing.assert_allclose(predictor.predict(X_test), booster.predict(X_test), rtol=1e-12, atol=1e-12)
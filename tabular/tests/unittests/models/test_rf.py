@@ -1,3 +1,12 @@
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+from autogluon.tabular.models.rf.compilers.onnx import RFOnnxCompiler
 from autogluon.tabular.models.rf.rf_model import RFModel
 
 
@@ -83,3 +92,64 @@ def test_rf_binary_compile_onnx_no_config_bagging(fit_helper):
         dataset_name = "adult"
         compiler_configs = "auto"
         fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+def test_rf_onnx_predictor_parity_threads_and_pickle(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("skl2onnx")
+    rng = np.random.default_rng(0)
+    num_features = 5
+    X = rng.normal(size=(500, num_features)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0).astype(int)
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+    predictor = RFOnnxCompiler.compile(model, path=str(tmp_path) + "/", input_types=[((None, num_features), np.float32)])
+    predictor.batch_size = 64
+    expected_pred_proba = model.predict_proba(X)
+    np.testing.assert_allclose(predictor.predict_proba(X), expected_pred_proba, rtol=1e-5, atol=1e-5)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pred_proba_threads = list(executor.map(predictor.predict_proba, [X] * 8))
+    for pred_proba in pred_proba_threads:
+        np.testing.assert_allclose(pred_proba, expected_pred_proba, rtol=1e-5, atol=1e-5)
+
+    predictor_unpickled = pickle.loads(pickle.dumps(predictor))
+    np.testing.assert_allclose(predictor_unpickled.predict_proba(X), expected_pred_proba, rtol=1e-5, atol=1e-5)
+    np.testing.assert_array_equal(predictor_unpickled.predict(X), predictor.predict(X))
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not RFOnnxCompiler.can_compile(), reason="onnxruntime and skl2onnx are required")
+def test_rf_onnx_predictor_benchmark(tmp_path):
+    """Compares the latency of the ONNX compiled random forest to the native sklearn model at different batch sizes"""
+    rng = np.random.default_rng(0)
+    num_features = 20
+    X = rng.normal(size=(20000, num_features)).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] * X[:, 2] > 0).astype(int) + (X[:, 3] > 1)
+    input_types = [((None, num_features), np.float32)]
+
+    def _time(func, X, repeats):
+        func(X)
+        ts = time.perf_counter()
+        for _ in range(repeats):
+            func(X)
+        return (time.perf_counter() - ts) / repeats
+
+    for model in [RandomForestClassifier(n_estimators=300, n_jobs=1, random_state=0), RandomForestRegressor(n_estimators=100, n_jobs=1, random_state=0)]:
+        model.fit(X, y)
+        predictor = RFOnnxCompiler.compile(model, path=str(tmp_path) + "/", input_types=input_types)
+        predictor.batch_size = 10000
+        is_classifier = isinstance(model, RandomForestClassifier)
+        func_native = model.predict_proba if is_classifier else model.predict
+        func_compiled = predictor.predict_proba if is_classifier else predictor.predict
+        for num_rows, repeats in [(1, 100), (1000, 20), (100000, 2)]:
+            X_test = rng.normal(size=(num_rows, num_features)).astype(np.float32)
+            y_pred_compiled = func_compiled(X_test)
+            assert y_pred_compiled.dtype == np.float32
+            assert y_pred_compiled.flags["C_CONTIGUOUS"]
+            np.testing.assert_allclose(y_pred_compiled, func_native(X_test), rtol=1e-4, atol=1e-4)
+            time_native = _time(func_native, X_test, repeats)
+            time_compiled = _time(func_compiled, X_test, repeats)
+            print(
+                f"{type(model).__name__} {num_rows} rows: native={time_native * 1000:.3f}ms, compiled={time_compiled * 1000:.3f}ms, "
+                f"speedup={time_native / time_compiled:.2f}x"
+            )
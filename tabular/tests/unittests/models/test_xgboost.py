@@ -1,3 +1,10 @@
+import time
+
+import numpy as np
+import pytest
+import xgboost as xgb
+
+from autogluon.tabular.models.xgboost.compilers.numba import XGBoostCompiledPredictor
 from autogluon.tabular.models.xgboost.xgboost_model import XGBoostModel
 
 
@@ -31,3 +38,57 @@ def test_xgboost_binary_enable_categorical(fit_helper):
     )
     dataset_name = "adult"
     fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args)
+
+
+def test_xgboost_binary_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={XGBoostModel: {}},
+    )
+    dataset_name = "adult"
+    compiler_configs = {XGBoostModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+def test_xgboost_multiclass_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={XGBoostModel: {}},
+    )
+    dataset_name = "covertype_small"
+    compiler_configs = {XGBoostModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+def test_xgboost_regression_compile_numba(fit_helper):
+    fit_args = dict(
+        hyperparameters={XGBoostModel: {}},
+    )
+    dataset_name = "ames"
+    compiler_configs = {XGBoostModel: {"compiler": "numba"}}
+    fit_helper.fit_and_validate_dataset(dataset_name=dataset_name, fit_args=fit_args, compile=True, compiler_configs=compiler_configs)
+
+
+@pytest.mark.slow
+def test_xgboost_compiled_predictor_benchmark():
+    """Compares the single-threaded latency of the compiled predictor to XGBoost at batch sizes of 1, 100 and 100000 rows"""
+    rng = np.random.default_rng(0)
+    num_features = 10
+    X = rng.normal(size=(20000, num_features)).astype(np.float32)
+    X[rng.random(size=X.shape) < 0.05] = np.nan
+    y = (np.nan_to_num(X[:, 0]) + np.nan_to_num(X[:, 1]) * np.nan_to_num(X[:, 2]) > 0).astype(int)
+    model = xgb.XGBClassifier(n_estimators=300, max_depth=8, n_jobs=1, tree_method="hist", random_state=0)
+    model.fit(X, y)
+    predictor = XGBoostCompiledPredictor.from_booster(model.get_booster())
+
+    def _time(func, X, repeats):
+        func(X)
+        ts = time.perf_counter()
+        for _ in range(repeats):
+            func(X)
+        return (time.perf_counter() - ts) / repeats
+
+    for num_rows, repeats in [(1, 200), (100, 50), (100000, 2)]:
+        X_test = rng.normal(size=(num_rows, num_features)).astype(np.float32)
+        np.testing.assert_allclose(predictor.predict_proba(X_test, num_threads=1), model.predict_proba(X_test), rtol=1e-5, atol=1e-6)
+        time_native = _time(model.predict_proba, X_test, repeats)
+        time_compiled = _time(lambda X: predictor.predict_proba(X, num_threads=1), X_test, repeats)
+        print(f"{num_rows} rows: native={time_native * 1000:.3f}ms, compiled={time_compiled * 1000:.3f}ms, speedup={time_native / time_compiled:.2f}x")
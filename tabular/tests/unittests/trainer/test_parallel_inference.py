@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.tabular import TabularPredictor
+
+
+@pytest.fixture(scope="module")
+def stacked_predictor(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 5)), columns=[f"f{i}" for i in range(5)])
+    X["label"] = (X["f0"] + X["f1"] * X["f2"] > 0).astype(int)
+    predictor = TabularPredictor(label="label", path=str(tmp_path_factory.mktemp("parallel_inference")), verbosity=0)
+    predictor.fit(
+        X,
+        hyperparameters={"GBM": {"num_boost_round": 20}, "RF": {"n_estimators": 10}, "KNN": {}},
+        num_stack_levels=1,
+        num_bag_folds=2,
+        ag_args_ensemble={"fold_fitting_strategy": "sequential_local"},
+    )
+    return predictor, X.drop(columns=["label"])
+
+
+@pytest.mark.parametrize("parallel_backend", ["thread", "process"])
+def test_when_num_workers_gt_1_then_pred_proba_dict_matches_sequential(stacked_predictor, parallel_backend):
+    predictor, X = stacked_predictor
+    trainer = predictor._trainer
+    X = predictor.transform_features(X)
+    models = trainer.get_model_names()
+    expected_pred, expected_time = trainer.get_model_pred_proba_dict(X=X, models=models, record_pred_time=True)
+    pred, pred_time = trainer.get_model_pred_proba_dict(X=X, models=models, record_pred_time=True, num_workers=3, parallel_backend=parallel_backend)
+    assert set(pred.keys()) == set(expected_pred.keys())
+    assert set(pred_time.keys()) == set(expected_time.keys())
+    for model in expected_pred:
+        np.testing.assert_array_equal(pred[model], expected_pred[model])
+
+
+def test_when_models_grouped_into_levels_then_dependencies_are_in_earlier_levels(stacked_predictor):
+    predictor, _ = stacked_predictor
+    trainer = predictor._trainer
+    model_pred_order = trainer._construct_model_pred_order(trainer.get_model_names())
+    model_pred_levels = trainer._construct_model_pred_levels(model_pred_order)
+    assert sorted(m for level in model_pred_levels for m in level) == sorted(model_pred_order)
+    seen = set()
+    for level in model_pred_levels:
+        for model in level:
+            assert set(trainer.model_graph.predecessors(model)).issubset(seen)
+        seen.update(level)
+    assert set(model_pred_levels[0]) == {m for m in model_pred_order if trainer.get_model_level(m) == 1}
+
+
+def test_when_cascade_and_num_workers_gt_1_then_exception_is_raised(stacked_predictor):
+    predictor, X = stacked_predictor
+    trainer = predictor._trainer
+    with pytest.raises(AssertionError):
+        trainer.get_model_pred_proba_dict(X=X, models=trainer.get_model_names(), cascade=True, num_workers=2)
+
+
+def test_when_num_workers_passed_to_predictor_then_results_match_sequential(stacked_predictor):
+    predictor, X = stacked_predictor
+    expected_pred_proba_dict = predictor.predict_proba_multi(X)
+    pred_proba_dict = predictor.predict_proba_multi(X, num_workers=3)
+    assert pred_proba_dict.keys() == expected_pred_proba_dict.keys()
+    for model in expected_pred_proba_dict:
+        pd.testing.assert_frame_equal(pred_proba_dict[model], expected_pred_proba_dict[model])
+
+    pred_dict = predictor.predict_multi(X, num_workers=3)
+    for model in expected_pred_proba_dict:
+        pd.testing.assert_series_equal(pred_dict[model], predictor.predict(X, model=model), check_names=False)
+
+    data = X.assign(label=predictor.predict(X))
+    columns = ["model", "score_test", "score_val"]
+    leaderboard = predictor.leaderboard(data, num_workers=3, parallel_backend="thread")
+    expected_leaderboard = predictor.leaderboard(data)
+    pd.testing.assert_frame_equal(
+        leaderboard[columns].sort_values("model").reset_index(drop=True), expected_leaderboard[columns].sort_values("model").reset_index(drop=True)
+    )
@@ -7,13 +7,15 @@ import reprlib
 from collections.abc import Iterable
 from itertools import islice
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 from joblib.parallel import Parallel, delayed
 from pandas.core.internals import ArrayManager, BlockManager
 
 from autogluon.common.loaders import load_pd
+from autogluon.common.utils.resource_utils import ResourceManager
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,181 @@ TIMESTAMP = "timestamp"
 IRREGULAR_TIME_INDEX_FREQSTR = "IRREG"
 
 
+class PackedTimeSeriesIndex(NamedTuple):
+    """Immutable CSR-style representation of the index of a ``TimeSeriesDataFrame``, where the rows of each item are
+    stored in a contiguous block.
+
+    Attributes
+    ----------
+    item_ids : pd.Index
+        Unique item_ids in the order in which they appear in the data frame.
+    indptr : np.ndarray
+        Array of shape [num_items + 1], rows of the i-th item are stored in ``indptr[i] : indptr[i + 1]``.
+    timestamps : np.ndarray
+        Timestamps of all rows represented as int64 values of ``timestamp_dtype``.
+    timestamp_dtype : np.dtype
+        The datetime64 dtype of the timestamps.
+    """
+
+    item_ids: pd.Index
+    indptr: np.ndarray
+    timestamps: np.ndarray
+    timestamp_dtype: np.dtype
+
+    @classmethod
+    def from_multi_index(cls, index: pd.MultiIndex) -> Optional[PackedTimeSeriesIndex]:
+        """Construct the packed index, or return None if the rows of some item are not stored contiguously."""
+        item_codes = index.codes[0]
+        timestamps = index.get_level_values(TIMESTAMP)
+        if (item_codes < 0).any() or not isinstance(timestamps.dtype, np.dtype):
+            return None
+        starts = np.flatnonzero(np.diff(item_codes, prepend=-1) != 0)
+        block_codes = item_codes[starts]
+        if len(np.unique(block_codes)) != len(block_codes):
+            return None
+        indptr = np.append(starts, len(item_codes)).astype(np.int64)
+        timestamps_int = timestamps.to_numpy().view(np.int64)
+        for array in [indptr, timestamps_int]:
+            array.flags.writeable = False
+        return cls(
+            item_ids=index.levels[0][block_codes],
+            indptr=indptr,
+            timestamps=timestamps_int,
+            timestamp_dtype=timestamps.dtype,
+        )
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of rows of each item."""
+        return np.diff(self.indptr)
+
+    def get_slice_indices(self, start_index: Optional[int] = None, end_index: Optional[int] = None) -> np.ndarray:
+        """Positions of the rows selected by the slice ``[start_index : end_index]`` of each item."""
+        lengths = self.lengths
+        start = _normalize_slice_bound(start_index, lengths, default=0)
+        end = _normalize_slice_bound(end_index, lengths, default=lengths)
+        num_selected = np.maximum(end - start, 0)
+        offsets = np.repeat(self.indptr[:-1] + start - (np.cumsum(num_selected) - num_selected), num_selected)
+        return offsets + np.arange(len(offsets))
+
+    def has_sorted_timestamps(self) -> bool:
+        """Check if the timestamps are sorted in non-decreasing order within each item."""
+        is_decreasing = np.diff(self.timestamps) < 0
+        # The timestamp may decrease between the last row of an item and the first row of the next item
+        is_decreasing[self.indptr[1:-1] - 1] = False
+        return not is_decreasing.any()
+
+    def get_last_timestamps(self) -> pd.DatetimeIndex:
+        """Last timestamp of each item."""
+        return pd.DatetimeIndex(self.timestamps[self.indptr[1:] - 1].view(self.timestamp_dtype))
+
+
+def _normalize_slice_bound(bound: Optional[int], lengths: np.ndarray, default) -> np.ndarray:
+    """Convert a slice bound into a non-negative position in each item, following the Python slicing semantics."""
+    if bound is None:
+        return np.broadcast_to(default, lengths.shape)
+    if bound >= 0:
+        return np.minimum(bound, lengths)
+    return np.maximum(lengths + bound, 0)
+
+
+def _segmented_fill(values: np.ndarray, indptr: np.ndarray, method: str) -> np.ndarray:
+    """Forward or backward fill NaNs in a 1D array, without propagating values between segments."""
+    is_nan = np.isnan(values)
+    if method == "ffill":
+        # Propagate the position of the last observed value forward. The first row of each segment always points to
+        # itself, so that values never cross segment boundaries and leading NaNs stay NaN.
+        source = np.where(is_nan, 0, np.arange(len(values)))
+        source[indptr[:-1]] = indptr[:-1]
+        np.maximum.accumulate(source, out=source)
+    else:
+        source = np.where(is_nan, len(values), np.arange(len(values)))
+        source[indptr[1:] - 1] = indptr[1:] - 1
+        source = np.minimum.accumulate(source[::-1])[::-1]
+    return values[source]
+
+
+def _segmented_interpolate(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """Linearly interpolate NaNs in a 1D array without crossing segment boundaries.
+
+    Matches ``pd.Series.interpolate()`` applied to each segment: leading NaNs stay NaN and trailing NaNs are filled
+    with the last observed value.
+    """
+    positions = np.arange(len(values), dtype=np.float64)
+    observed_positions = np.where(np.isnan(values), np.nan, positions)
+    prev_position = _segmented_fill(observed_positions, indptr, method="ffill")
+    next_position = _segmented_fill(observed_positions, indptr, method="bfill")
+    has_prev = ~np.isnan(prev_position)
+    # Trailing NaNs have no next observation and take the value of the previous one
+    next_position = np.where(np.isnan(next_position), prev_position, next_position)
+    prev_idx = np.where(has_prev, prev_position, 0).astype(np.int64)
+    next_idx = np.where(has_prev, next_position, 0).astype(np.int64)
+    gap = next_idx - prev_idx
+    weight = np.divide(positions - prev_idx, gap, out=np.zeros_like(positions), where=gap > 0)
+    result = values[prev_idx] + weight * (values[next_idx] - values[prev_idx])
+    result[~has_prev] = np.nan
+    return result.astype(values.dtype, copy=False)
+
+
+_ANCHORED_CALENDAR_OFFSETS = (
+    pd.offsets.MonthBegin,
+    pd.offsets.MonthEnd,
+    pd.offsets.QuarterBegin,
+    pd.offsets.QuarterEnd,
+    pd.offsets.YearBegin,
+    pd.offsets.YearEnd,
+)
+
+
+def _is_resampling_offset_item_independent(offset: pd.DateOffset, resample_kwargs: dict) -> bool:
+    """Check if resampling with the default origin produces the same bin edges for all items.
+
+    This holds for fixed frequencies that evenly divide a day (bins are anchored at midnight) and for anchored calendar
+    offsets (week, month, quarter, year) with ``n == 1`` and default resampling options (bins are anchored at the
+    calendar boundaries). Other offsets, such as business hours, depend on the observed timestamps of each item.
+    """
+    if isinstance(offset, pd.offsets.Tick):
+        return set(resample_kwargs).issubset({"closed", "label"}) and pd.Timedelta("1D").value % offset.nanos == 0
+    if isinstance(offset, pd.offsets.Week):
+        is_anchored_offset = offset.weekday is not None
+    else:
+        is_anchored_offset = isinstance(offset, _ANCHORED_CALENDAR_OFFSETS)
+    return is_anchored_offset and offset.n == 1 and len(resample_kwargs) == 0
+
+
+def _iter_item_groups(
+    batches: Iterable[pd.DataFrame], item_column: str, num_items_per_chunk: int
+) -> Iterator[pd.DataFrame]:
+    """Regroup a stream of row batches into data frames containing all rows of ``num_items_per_chunk`` items.
+
+    Rows of each item must be stored contiguously in the stream. The rows of the last item seen so far are held back
+    until a row of a different item is read, since the item may continue in the next batch.
+    """
+    pending: List[pd.DataFrame] = []
+    num_pending_items = 0
+    last_item_id = None
+    for batch in batches:
+        if len(batch) == 0:
+            continue
+        item_ids = batch[item_column].to_numpy()
+        num_new_items = int((item_ids[1:] != item_ids[:-1]).sum()) + 1
+        if num_pending_items > 0 and item_ids[0] == last_item_id:
+            num_new_items -= 1
+        pending.append(batch)
+        num_pending_items += num_new_items
+        last_item_id = item_ids[-1]
+        # All pending items except the last one are complete
+        while num_pending_items > num_items_per_chunk:
+            df = pd.concat(pending, ignore_index=True)
+            item_starts = np.flatnonzero(df[item_column].to_numpy()[1:] != df[item_column].to_numpy()[:-1]) + 1
+            split = item_starts[num_items_per_chunk - 1]
+            yield df.iloc[:split]
+            pending = [df.iloc[split:].reset_index(drop=True)]
+            num_pending_items -= num_items_per_chunk
+    if num_pending_items > 0:
+        yield pd.concat(pending, ignore_index=True)
+
+
 class TimeSeriesDataFrameDeprecatedMixin:
     """Contains deprecated methods from TimeSeriesDataFrame that shouldn't show up in API documentation."""
 
@@ -144,6 +321,12 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
 
     index: pd.MultiIndex
     _metadata = ["_static_features", "_cached_freq"]
+    # tuple (index, packed_index), where packed_index is computed from the index and reused while it stays the same
+    _packed_index_cache: Optional[Tuple[pd.MultiIndex, Optional[PackedTimeSeriesIndex]]] = None
+    # tuple (index, {(prediction_length, offset): forecast_index}), used by get_forecast_horizon_index_ts_dataframe
+    _forecast_horizon_index_cache: Optional[Tuple[pd.MultiIndex, Dict[Tuple[int, pd.DateOffset], pd.MultiIndex]]] = (
+        None
+    )
 
     def __init__(
         self,
@@ -226,21 +409,24 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
 
     @classmethod
     def _construct_tsdf_from_iterable_dataset(cls, iterable_dataset: Iterable, num_cpus: int = -1) -> pd.DataFrame:
-        def load_single_item(item_id: int, ts: dict) -> pd.DataFrame:
+        def load_single_item(ts: dict) -> Tuple[np.ndarray, np.ndarray]:
             start_timestamp = ts["start"]
             freq = start_timestamp.freq
             if isinstance(start_timestamp, pd.Period):
                 start_timestamp = start_timestamp.to_timestamp(how="S")
-            target = ts["target"]
-            datetime_index = tuple(pd.date_range(start_timestamp, periods=len(target), freq=freq))
-            idx = pd.MultiIndex.from_product([(item_id,), datetime_index], names=[ITEMID, TIMESTAMP])
-            return pd.Series(target, name="target", index=idx).to_frame()
+            target = np.asarray(ts["target"])
+            timestamps = pd.date_range(start_timestamp, periods=len(target), freq=freq).to_numpy()
+            return target, timestamps
 
         cls._validate_iterable(iterable_dataset)
-        all_ts = Parallel(n_jobs=num_cpus)(
-            delayed(load_single_item)(item_id, ts) for item_id, ts in enumerate(iterable_dataset)
+        # Workers return plain arrays instead of a data frame per item, and the index is constructed only once
+        all_ts = Parallel(n_jobs=num_cpus)(delayed(load_single_item)(ts) for ts in iterable_dataset)
+        lengths = [len(target) for target, _ in all_ts]
+        index = pd.MultiIndex.from_arrays(
+            [np.repeat(np.arange(len(all_ts)), lengths), np.concatenate([timestamps for _, timestamps in all_ts])],
+            names=[ITEMID, TIMESTAMP],
         )
-        return pd.concat(all_ts)
+        return pd.DataFrame({"target": np.concatenate([target for target, _ in all_ts])}, index=index)
 
     @classmethod
     def _validate_multi_index_data_frame(cls, data: pd.DataFrame):
@@ -385,6 +571,92 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         """
         return cls(path, static_features=static_features_path, id_column=id_column, timestamp_column=timestamp_column)
 
+    @classmethod
+    def iter_from_parquet(
+        cls,
+        path: Union[str, Path],
+        id_column: Optional[str] = None,
+        timestamp_column: Optional[str] = None,
+        static_features_path: Optional[Union[str, Path]] = None,
+        columns: Optional[List[str]] = None,
+        float32_columns: Optional[List[str]] = None,
+        num_items_per_chunk: int = 10_000,
+        batch_size: int = 131_072,
+    ) -> Iterator[TimeSeriesDataFrame]:
+        """Lazily read a (possibly partitioned) Parquet dataset as a sequence of ``TimeSeriesDataFrame`` chunks, each
+        containing all rows of up to ``num_items_per_chunk`` time series.
+
+        Unlike :meth:`from_path`, the data is never loaded into memory all at once, which makes it possible to process
+        datasets that are larger than the available memory (e.g., with
+        :meth:`~autogluon.timeseries.TimeSeriesPredictor.predict_to_parquet`). Requires ``pyarrow``.
+
+        The rows of each time series must be stored contiguously and sorted by timestamp, for example, by writing the
+        data sorted by item_id and timestamp. This is validated while reading, and a ``ValueError`` is raised as soon
+        as an unsorted chunk is encountered.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path to a Parquet file or to a directory with Parquet files (optionally with hive-style partitioning).
+            Files are read in the lexicographic order of their paths.
+        id_column : str, optional
+            Name of the 'item_id' column if column name is different
+        timestamp_column : str, optional
+            Name of the 'timestamp' column if column name is different
+        static_features_path : str or pathlib.Path, optional
+            Path to a file containing static features in CSV or Parquet format. Static features are loaded into memory
+            and assigned to the chunk that contains the respective items.
+        columns : List[str], optional
+            Columns to read. By default, all columns are read.
+        float32_columns : List[str], optional
+            Columns cast to float32 to reduce memory usage. Defaults to ``["target"]`` if the data contains a column
+            with this name.
+        num_items_per_chunk : int, default = 10000
+            Maximum number of time series in each chunk.
+        batch_size : int, default = 131072
+            Maximum number of rows read from disk at once.
+
+        Yields
+        ------
+        ts_df: TimeSeriesDataFrame
+            Chunk of the data in TimeSeriesDataFrame format.
+        """
+        try:
+            import pyarrow.dataset as pa_dataset
+        except ImportError:
+            raise ImportError(
+                "`pyarrow` is required to read Parquet files lazily. Please install it with `pip install pyarrow`."
+            )
+
+        dataset = pa_dataset.dataset(str(path), format="parquet", partitioning="hive")
+        item_column = ITEMID if id_column is None else id_column
+        if float32_columns is None:
+            float32_columns = ["target"] if "target" in (columns or dataset.schema.names) else []
+        static_features = None
+        if static_features_path is not None:
+            static_features = cls._construct_static_features(static_features_path, id_column=id_column)
+
+        batches = (
+            batch.to_pandas() for batch in dataset.to_batches(columns=columns, batch_size=batch_size, use_threads=True)
+        )
+        seen_item_ids = set()
+        for df in _iter_item_groups(batches, item_column=item_column, num_items_per_chunk=num_items_per_chunk):
+            df = df.astype({column: "float32" for column in float32_columns})
+            ts_df = cls(df, id_column=id_column, timestamp_column=timestamp_column)
+            packed_index = ts_df._get_packed_index()
+            if (
+                packed_index is None
+                or not packed_index.has_sorted_timestamps()
+                or not seen_item_ids.isdisjoint(packed_index.item_ids)
+            ):
+                raise ValueError(
+                    f"Rows of each time series in {path} must be stored contiguously and sorted by timestamp. "
+                    "Please sort the data by item_id and timestamp before writing it to Parquet."
+                )
+            seen_item_ids.update(packed_index.item_ids)
+            ts_df.static_features = static_features
+            yield ts_df
+
     @classmethod
     def from_iterable_dataset(cls, iterable_dataset: Iterable, num_cpus: int = -1) -> TimeSeriesDataFrame:
         """Construct a ``TimeSeriesDataFrame`` from an Iterable of dictionaries each of which
@@ -416,8 +688,26 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
 
     @property
     def item_ids(self) -> pd.Index:
+        packed_index = self._get_packed_index()
+        if packed_index is not None:
+            return packed_index.item_ids
         return self.index.unique(level=ITEMID)
 
+    def _get_packed_index(self) -> Optional[PackedTimeSeriesIndex]:
+        """Return the packed representation of the index, or None if rows of some item are not stored contiguously.
+
+        The result is cached and recomputed only if the index of the data frame is replaced.
+        """
+        index = self.index
+        if not isinstance(index, pd.MultiIndex) or index.nlevels != 2:
+            return None
+        cache = self._packed_index_cache
+        if cache is None or cache[0] is not index:
+            cache = (index, PackedTimeSeriesIndex.from_multi_index(index))
+            # bypass pandas.DataFrame.__setattr__, which treats new attributes as potential columns
+            object.__setattr__(self, "_packed_index_cache", cache)
+        return cache[1]
+
     @property
     def static_features(self):
         return self._static_features
@@ -504,6 +794,9 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
 
     def num_timesteps_per_item(self) -> pd.Series:
         """Length of each time series in the dataframe."""
+        packed_index = self._get_packed_index()
+        if packed_index is not None:
+            return pd.Series(packed_index.lengths, index=packed_index.item_ids)
         return self.groupby(level=ITEMID, sort=False).size()
 
     def copy(self: TimeSeriesDataFrame, deep: bool = True) -> pd.DataFrame:  # noqa
@@ -658,8 +951,12 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         if end_index is not None and not isinstance(end_index, int):
             raise ValueError(f"end_index must be of type int or None (got {type(end_index)})")
 
-        time_step_slice = slice(start_index, end_index)
-        result = self.groupby(level=ITEMID, sort=False, as_index=False).nth(time_step_slice)
+        packed_index = self._get_packed_index()
+        if packed_index is not None:
+            result = self.iloc[packed_index.get_slice_indices(start_index, end_index)]
+        else:
+            time_step_slice = slice(start_index, end_index)
+            result = self.groupby(level=ITEMID, sort=False, as_index=False).nth(time_step_slice)
         result.static_features = self.static_features
         result._cached_freq = self._cached_freq
         return result
@@ -772,6 +1069,21 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
                 "It is highly recommended to call `ts_df.sort_index()` before calling `ts_df.fill_missing_values()`"
             )
 
+        if method in ["auto", "ffill", "pad", "bfill", "backfill"]:
+            packed_index = self._get_packed_index()
+            if packed_index is not None and all(
+                isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in df.dtypes
+            ):
+                filled_df = df.copy()
+                for column in df.columns[df.isna().any(axis=0)]:
+                    values = df[column].to_numpy()
+                    if method in ["auto", "ffill", "pad"]:
+                        values = _segmented_fill(values, packed_index.indptr, method="ffill")
+                    if method in ["bfill", "backfill"] or (method == "auto" and np.isnan(values).any()):
+                        values = _segmented_fill(values, packed_index.indptr, method="bfill")
+                    filled_df[column] = values
+                return TimeSeriesDataFrame(filled_df, static_features=self.static_features)
+
         grouped_df = df.groupby(level=ITEMID, sort=False, group_keys=False)
         if method == "auto":
             filled_df = grouped_df.ffill()
@@ -785,7 +1097,15 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         elif method == "constant":
             filled_df = self.fillna(value=value)
         elif method == "interpolate":
-            filled_df = grouped_df.apply(lambda ts: ts.interpolate())
+            packed_index = self._get_packed_index()
+            if packed_index is not None and all(
+                isinstance(dtype, np.dtype) and dtype.kind == "f" for dtype in df.dtypes
+            ):
+                filled_df = df.copy()
+                for column in df.columns[df.isna().any(axis=0)]:
+                    filled_df[column] = _segmented_interpolate(df[column].to_numpy(), packed_index.indptr)
+            else:
+                filled_df = grouped_df.apply(lambda ts: ts.interpolate())
         else:
             raise ValueError(
                 "Invalid fill method. Expecting one of "
@@ -894,8 +1214,10 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         1. Converting an irregularly-sampled time series to a regular time index.
         2. Aggregating time series data by downsampling (e.g., convert daily sales into weekly sales)
 
-        Standard ``df.groupby(...).resample(...)`` can be extremely slow for large datasets, so we parallelize this
-        operation across multiple CPU cores.
+        Standard ``df.groupby(...).resample(...)`` can be extremely slow for large datasets. If the rows of each item
+        are sorted by timestamp and the bin edges do not depend on the start of each time series, all items are
+        resampled with a single vectorized aggregation, split across multiple CPU cores. Otherwise, the items are
+        resampled separately in parallel.
 
 
         Parameters
@@ -910,7 +1232,8 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         num_cpus : int, default = -1
             Number of CPU cores used when resampling in parallel. Set to -1 to use all cores.
         chunk_size : int, default = 100
-            Number of time series in a chunk assigned to each parallel worker.
+            Number of time series in a chunk assigned to each parallel worker. Only used if the items cannot be
+            resampled with the vectorized implementation.
         **kwargs
             Additional keywords arguments that will be passed to ``pandas.DataFrameGroupBy.resample``.
 
@@ -984,6 +1307,10 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
             else:
                 aggregation[col] = agg_categorical
 
+        resampled_df = self._convert_frequency_vectorized(offset, aggregation=aggregation, num_cpus=num_cpus, **kwargs)
+        if resampled_df is not None:
+            return resampled_df
+
         def split_into_chunks(iterable: Iterable, size: int) -> Iterable[Iterable]:
             # Based on https://stackoverflow.com/a/22045226/5497447
             iterable = iter(iterable)
@@ -1004,6 +1331,77 @@ class TimeSeriesDataFrame(pd.DataFrame, TimeSeriesDataFrameDeprecatedMixin):
         resampled_df.static_features = self.static_features
         return resampled_df
 
+    def _convert_frequency_vectorized(
+        self, offset: pd.DateOffset, aggregation: Dict[str, str], num_cpus: int = -1, **kwargs
+    ) -> Optional[TimeSeriesDataFrame]:
+        """Resample all items at once using the packed index, or return None if this is not possible.
+
+        The bin of each row is computed by resampling the unique timestamps of the whole dataset, which gives
+        identical bins to resampling each item separately if the bin edges do not depend on the start of each item.
+        Rows are then aggregated with a single groupby over (item, bin) codes, where the empty bins inside each time
+        series are kept as in ``resample``.
+        """
+        packed_index = self._get_packed_index()
+        if packed_index is None or len(self) == 0 or not _is_resampling_offset_item_independent(offset, kwargs):
+            return None
+        indptr = packed_index.indptr
+        num_items = len(packed_index.item_ids)
+        if not packed_index.has_sorted_timestamps():
+            return None
+
+        unique_timestamps, row_to_unique = np.unique(packed_index.timestamps, return_inverse=True)
+        unique_index = pd.DatetimeIndex(unique_timestamps.view(packed_index.timestamp_dtype))
+        bin_counts = pd.Series(1, index=unique_index).resample(offset, **kwargs).count()
+        bin_labels = bin_counts.index
+        bin_counts = bin_counts.to_numpy()
+        if bin_counts.sum() != len(unique_timestamps):
+            return None
+        row_bin = np.repeat(np.arange(len(bin_counts)), bin_counts)[row_to_unique]
+
+        # Each item covers all bins between the bins of its first and last rows
+        first_bin = row_bin[indptr[:-1]]
+        num_bins_per_item = row_bin[indptr[1:] - 1] - first_bin + 1
+        output_indptr = np.concatenate([[0], np.cumsum(num_bins_per_item)])
+        item_of_row = np.repeat(np.arange(num_items), np.diff(indptr))
+        row_output_position = output_indptr[item_of_row] + row_bin - first_bin[item_of_row]
+
+        df = pd.DataFrame(self)
+        df.index = pd.RangeIndex(len(df))
+
+        def resample_chunk(start_item: int, end_item: int) -> pd.DataFrame:
+            rows = slice(indptr[start_item], indptr[end_item])
+            chunk_start = output_indptr[start_item]
+            num_outputs = output_indptr[end_item] - chunk_start
+            # Categorical grouping key with observed=False keeps the empty bins in the output
+            codes = pd.Categorical.from_codes(row_output_position[rows] - chunk_start, categories=range(num_outputs))
+            return df.iloc[rows].groupby(codes, observed=False, sort=True).agg(aggregation)
+
+        if num_cpus is None or num_cpus < 1:
+            num_cpus = ResourceManager.get_cpu_count()
+        # Split items into contiguous blocks with similar number of rows. Blocks are views of the same arrays, so no
+        # data is copied when processing them in parallel threads.
+        num_chunks = max(1, min(num_cpus, num_items))
+        chunk_bounds = np.unique(np.searchsorted(indptr, np.linspace(0, len(df), num_chunks + 1)))
+        chunks = [(chunk_bounds[i], chunk_bounds[i + 1]) for i in range(len(chunk_bounds) - 1)]
+        if len(chunks) > 1:
+            resampled_chunks = Parallel(n_jobs=len(chunks), prefer="threads")(
+                delayed(resample_chunk)(start, end) for start, end in chunks
+            )
+        else:
+            resampled_chunks = [resample_chunk(start, end) for start, end in chunks]
+        resampled_df = pd.concat(resampled_chunks, ignore_index=True)
+
+        bin_codes = np.repeat(first_bin - output_indptr[:-1], num_bins_per_item) + np.arange(output_indptr[-1])
+        resampled_df.index = pd.MultiIndex(
+            levels=[packed_index.item_ids, bin_labels],
+            codes=[np.repeat(np.arange(num_items), num_bins_per_item), bin_codes],
+            names=[ITEMID, TIMESTAMP],
+            verify_integrity=False,
+        )
+        resampled_df = TimeSeriesDataFrame(resampled_df)
+        resampled_df.static_features = self.static_features
+        return resampled_df
+
     def __dir__(self) -> List[str]:
         # This hides method from IPython autocomplete, but not VSCode autocomplete
         deprecated = ["get_reindexed_view", "to_regular_index"]
@@ -78,6 +78,7 @@ class TimeSeriesLearner(AbstractLearner):
         time_limit: Optional[int] = None,
         val_splitter: Optional[AbstractWindowSplitter] = None,
         refit_every_n_windows: Optional[int] = 1,
+        warm_start_windows: bool = False,
         random_seed: Optional[int] = None,
         **kwargs,
     ) -> None:
@@ -105,6 +106,7 @@ class TimeSeriesLearner(AbstractLearner):
                 metadata=self.feature_generator.covariate_metadata,
                 val_splitter=val_splitter,
                 refit_every_n_windows=refit_every_n_windows,
+                warm_start_windows=warm_start_windows,
                 cache_predictions=self.cache_predictions,
             )
         )
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, Union
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -8,6 +8,26 @@ from autogluon.timeseries.utils.datetime import get_seasonality
 from autogluon.timeseries.utils.warning_filters import warning_filter
 
 
+class PreparedScoringData(NamedTuple):
+    """Ground truth data prepared by :meth:`~autogluon.timeseries.metrics.TimeSeriesScorer.prepare` for scoring many
+    predictions with :meth:`~autogluon.timeseries.metrics.TimeSeriesScorer.score_batch`.
+    """
+
+    data_past: TimeSeriesDataFrame
+    data_future: TimeSeriesDataFrame
+    target: str
+    seasonal_period: int
+    # target values during the forecast horizon, shape [num_items, prediction_length]
+    y_true: np.ndarray
+    # per-item scale computed on the past data (e.g., seasonal error for MASE), shape [num_items]
+    past_item_scale: Optional[np.ndarray]
+    kwargs: dict
+
+    @property
+    def item_ids(self) -> pd.Index:
+        return self.data_future.item_ids
+
+
 class TimeSeriesScorer:
     """Base class for all evaluation metrics used in AutoGluon-TimeSeries.
 
@@ -100,6 +120,184 @@ class TimeSeriesScorer:
 
     score = __call__
 
+    def prepare(
+        self,
+        data: TimeSeriesDataFrame,
+        prediction_length: int = 1,
+        target: str = "target",
+        seasonal_period: Optional[int] = None,
+        **kwargs,
+    ) -> PreparedScoringData:
+        """Split the data into past and future and compute the past metrics once, so that multiple predictions for
+        the same data can be scored with :meth:`score_batch`.
+        """
+        seasonal_period = get_seasonality(data.freq) if seasonal_period is None else seasonal_period
+        data_past = data.slice_by_timestep(None, -prediction_length)
+        data_future = data.slice_by_timestep(-prediction_length, None)
+        num_items = data_future.num_items
+        assert (
+            len(data_future) == num_items * prediction_length
+        ), "All time series must be longer than prediction_length"
+        y_true = data_future[target].to_numpy(dtype=np.float64).reshape([num_items, prediction_length])
+        with warning_filter():
+            past_item_scale = self._compute_past_item_scale(
+                data_past=data_past, target=target, seasonal_period=seasonal_period
+            )
+        if past_item_scale is not None:
+            # items without past observations get the same default scale as items with a single past observation
+            past_item_scale = past_item_scale.reindex(data_future.item_ids, fill_value=1.0).to_numpy(dtype=np.float64)
+        return PreparedScoringData(
+            data_past=data_past,
+            data_future=data_future,
+            target=target,
+            seasonal_period=seasonal_period,
+            y_true=y_true,
+            past_item_scale=past_item_scale,
+            kwargs=kwargs,
+        )
+
+    def score_batch(
+        self,
+        prepared_data: PreparedScoringData,
+        predictions: Union[Sequence[TimeSeriesDataFrame], np.ndarray],
+        columns: Optional[List[str]] = None,
+        per_item: bool = False,
+    ) -> np.ndarray:
+        """Score multiple predictions for the same data in a single vectorized pass.
+
+        Parameters
+        ----------
+        prepared_data : PreparedScoringData
+            Ground truth data returned by :meth:`prepare`.
+        predictions : List[TimeSeriesDataFrame] or np.ndarray
+            Either a list of prediction data frames with the same index as the forecast horizon of the data, or an
+            array of shape [num_predictions, num_items * prediction_length, len(columns)] with the prediction values.
+        columns : List[str], optional
+            Names of the prediction columns (e.g., ``["mean", "0.1", "0.5", "0.9"]``). Required if predictions are
+            provided as an array.
+        per_item : bool, default = False
+            If True, the metric is computed separately for each time series.
+
+        Returns
+        -------
+        scores : np.ndarray
+            Scores in greater-is-better format, identical to calling the scorer for each prediction. Has shape
+            [num_predictions] if ``per_item=False``, and [num_predictions, num_items] otherwise.
+        """
+        if isinstance(predictions, np.ndarray):
+            if columns is None:
+                raise ValueError("columns must be provided if predictions are given as an array")
+            y_pred = predictions
+        else:
+            columns = list(predictions[0].columns)
+            for pred in predictions:
+                assert not pred.isna().any().any(), "Predictions contain NaN values."
+                assert prepared_data.data_future.index.equals(pred.index), "Prediction and data indices do not match."
+                assert list(pred.columns) == columns, "All predictions must have the same columns."
+            y_pred = np.stack([pred.to_numpy(dtype=np.float64) for pred in predictions])
+        num_items, prediction_length = prepared_data.y_true.shape
+        y_pred = y_pred.reshape([len(y_pred), num_items, prediction_length, len(columns)])
+
+        with warning_filter(), np.errstate(all="ignore"):
+            if self._supports_batch_scoring():
+                metric_values = self._compute_metric_batch(
+                    y_true=prepared_data.y_true[None],
+                    y_pred=y_pred,
+                    columns=columns,
+                    past_item_scale=prepared_data.past_item_scale,
+                    axis=2 if per_item else (1, 2),
+                )
+            else:
+                metric_values = self._compute_metric_for_each_prediction(prepared_data, y_pred, columns, per_item)
+        return metric_values * self.sign
+
+    def _supports_batch_scoring(self) -> bool:
+        """Use the vectorized implementation only if it is provided by the same class as compute_metric, so that
+        subclasses that override compute_metric are scored correctly.
+        """
+
+        def get_owner(method_name: str) -> type:
+            return next(cls for cls in type(self).__mro__ if method_name in vars(cls))
+
+        return get_owner("_compute_metric_batch") is get_owner("compute_metric") is not TimeSeriesScorer
+
+    def _compute_metric_for_each_prediction(
+        self, prepared_data: PreparedScoringData, y_pred: np.ndarray, columns: List[str], per_item: bool
+    ) -> np.ndarray:
+        """Fallback for metrics without a vectorized implementation, which calls compute_metric for each prediction."""
+        if per_item:
+            item_data = [
+                (prepared_data.data_past.loc[[item_id]], prepared_data.data_future.loc[[item_id]])
+                for item_id in prepared_data.item_ids
+            ]
+        else:
+            item_data = [(prepared_data.data_past, prepared_data.data_future)]
+        metric_values = np.zeros([len(y_pred), len(item_data)])
+        for j, (data_past, data_future) in enumerate(item_data):
+            try:
+                self.save_past_metrics(
+                    data_past=data_past,
+                    target=prepared_data.target,
+                    seasonal_period=prepared_data.seasonal_period,
+                    **prepared_data.kwargs,
+                )
+                item_y_pred = y_pred[:, j : j + 1] if per_item else y_pred
+                for i in range(len(y_pred)):
+                    pred = TimeSeriesDataFrame(
+                        pd.DataFrame(
+                            item_y_pred[i].reshape([-1, len(columns)]), index=data_future.index, columns=columns
+                        )
+                    )
+                    metric_values[i, j] = self.compute_metric(
+                        data_future=data_future, predictions=pred, target=prepared_data.target, **prepared_data.kwargs
+                    )
+            finally:
+                self.clear_past_metrics()
+        return metric_values if per_item else metric_values[:, 0]
+
+    def _compute_past_item_scale(
+        self, data_past: TimeSeriesDataFrame, target: str = "target", seasonal_period: int = 1
+    ) -> Optional[pd.Series]:
+        """Compute the per-item scale used by :meth:`_compute_metric_batch` (e.g., the seasonal error for MASE), if
+        the metric requires it. Returns a series indexed by item_id.
+        """
+        return None
+
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        """Vectorized version of :meth:`compute_metric` for multiple predictions.
+
+        This method is optional. Metrics that do not implement it are scored by calling :meth:`compute_metric` for each
+        prediction.
+
+        Parameters
+        ----------
+        y_true : np.ndarray
+            Target values during the forecast horizon, shape [1, num_items, prediction_length].
+        y_pred : np.ndarray
+            Predictions, shape [num_predictions, num_items, prediction_length, len(columns)].
+        columns : List[str]
+            Names of the prediction columns.
+        past_item_scale : np.ndarray, optional
+            Per-item scale returned by :meth:`_compute_past_item_scale` aligned with the items, shape [num_items].
+        axis : int or Tuple[int, int]
+            Axes over which the metric is aggregated, ``(1, 2)`` for the overall metric and ``2`` for the metric of
+            each item.
+
+        Returns
+        -------
+        metric_values : np.ndarray
+            Metric values in the same format as :meth:`compute_metric`, with shape [num_predictions] if
+            ``axis=(1, 2)`` or [num_predictions, num_items] if ``axis=2``.
+        """
+        raise NotImplementedError
+
     def compute_metric(
         self,
         data_future: TimeSeriesDataFrame,
@@ -163,6 +361,26 @@ class TimeSeriesScorer:
         """Compute mean of a numpy array-like object, ignoring inf, -inf and nan values."""
         return np.mean(array[np.isfinite(array)])
 
+    @staticmethod
+    def _safemean_batch(array: np.ndarray, axis: Union[int, Tuple[int, ...]]) -> np.ndarray:
+        """Compute mean along the given axes, ignoring inf, -inf and nan values."""
+        is_finite = np.isfinite(array)
+        return np.where(is_finite, array, 0.0).sum(axis=axis) / is_finite.sum(axis=axis)
+
+    @staticmethod
+    def _get_point_forecast_batch_inputs(y_pred: np.ndarray, columns: List[str]) -> np.ndarray:
+        """Get point forecast of shape [num_predictions, num_items, prediction_length] for vectorized metrics."""
+        return y_pred[..., columns.index("mean")]
+
+    @staticmethod
+    def _get_quantile_forecast_batch_inputs(y_pred: np.ndarray, columns: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Get quantile forecast of shape [num_predictions, num_items, prediction_length, num_quantiles] and the
+        corresponding quantile levels.
+        """
+        quantile_indices = [i for i, col in enumerate(columns) if col != "mean"]
+        quantile_levels = np.array([columns[i] for i in quantile_indices], dtype=float)
+        return y_pred[..., quantile_indices], quantile_levels
+
     @staticmethod
     def _get_point_forecast_score_inputs(
         data_future: TimeSeriesDataFrame, predictions: TimeSeriesDataFrame, target: str = "target"
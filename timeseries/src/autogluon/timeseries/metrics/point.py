@@ -1,12 +1,12 @@
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from autogluon.timeseries import TimeSeriesDataFrame
 
-from .abstract import TimeSeriesScorer
+from .abstract import PreparedScoringData, TimeSeriesScorer
 from .utils import _in_sample_abs_seasonal_error, _in_sample_squared_seasonal_error
 
 logger = logging.getLogger(__name__)
@@ -42,6 +42,17 @@ class RMSE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return np.sqrt(self._safemean((y_true - y_pred) ** 2))
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return np.sqrt(self._safemean_batch((y_true - y_pred) ** 2, axis=axis))
+
 
 class MSE(TimeSeriesScorer):
     r"""Mean squared error.
@@ -73,6 +84,17 @@ class MSE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return self._safemean((y_true - y_pred) ** 2)
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return self._safemean_batch((y_true - y_pred) ** 2, axis=axis)
+
 
 class MAE(TimeSeriesScorer):
     r"""Mean absolute error.
@@ -102,6 +124,17 @@ class MAE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return self._safemean((y_true - y_pred).abs())
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return self._safemean_batch(np.abs(y_true - y_pred), axis=axis)
+
 
 class WAPE(TimeSeriesScorer):
     r"""Weighted absolute percentage error.
@@ -133,6 +166,17 @@ class WAPE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return (y_true - y_pred).abs().sum() / y_true.abs().sum()
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return np.nansum(np.abs(y_true - y_pred), axis=axis) / np.nansum(np.abs(y_true), axis=axis)
+
 
 class SMAPE(TimeSeriesScorer):
     r"""Symmetric mean absolute percentage error.
@@ -162,6 +206,17 @@ class SMAPE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return self._safemean(2 * ((y_true - y_pred).abs() / (y_true.abs() + y_pred.abs())))
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return self._safemean_batch(2 * (np.abs(y_true - y_pred) / (np.abs(y_true) + np.abs(y_pred))), axis=axis)
+
 
 class MAPE(TimeSeriesScorer):
     r"""Mean absolute percentage error.
@@ -191,6 +246,17 @@ class MAPE(TimeSeriesScorer):
         y_true, y_pred = self._get_point_forecast_score_inputs(data_future, predictions, target=target)
         return self._safemean((y_true - y_pred).abs() / y_true.abs())
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        return self._safemean_batch(np.abs(y_true - y_pred) / np.abs(y_true), axis=axis)
+
 
 class MASE(TimeSeriesScorer):
     r"""Mean absolute scaled error.
@@ -238,6 +304,11 @@ class MASE(TimeSeriesScorer):
     def clear_past_metrics(self) -> None:
         self._past_abs_seasonal_error = None
 
+    def _compute_past_item_scale(
+        self, data_past: TimeSeriesDataFrame, target: str = "target", seasonal_period: int = 1
+    ) -> Optional[pd.Series]:
+        return _in_sample_abs_seasonal_error(y_past=data_past[target], seasonal_period=seasonal_period)
+
     def compute_metric(
         self, data_future: TimeSeriesDataFrame, predictions: TimeSeriesDataFrame, target: str = "target", **kwargs
     ) -> float:
@@ -250,6 +321,18 @@ class MASE(TimeSeriesScorer):
         abs_errors = np.abs(y_true.values - y_pred.values).reshape([num_items, -1])
         return self._safemean(abs_errors / self._past_abs_seasonal_error.values[:, None])
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        scale = past_item_scale[None, :, None]
+        return self._safemean_batch(np.abs(y_true - y_pred) / scale, axis=axis)
+
 
 class RMSSE(TimeSeriesScorer):
     r"""Root mean squared scaled error.
@@ -298,6 +381,11 @@ class RMSSE(TimeSeriesScorer):
     def clear_past_metrics(self) -> None:
         self._past_squared_seasonal_error = None
 
+    def _compute_past_item_scale(
+        self, data_past: TimeSeriesDataFrame, target: str = "target", seasonal_period: int = 1
+    ) -> Optional[pd.Series]:
+        return _in_sample_squared_seasonal_error(y_past=data_past[target], seasonal_period=seasonal_period)
+
     def compute_metric(
         self, data_future: TimeSeriesDataFrame, predictions: TimeSeriesDataFrame, target: str = "target", **kwargs
     ) -> float:
@@ -310,6 +398,18 @@ class RMSSE(TimeSeriesScorer):
         squared_errors = ((y_true.values - y_pred.values) ** 2.0).reshape([num_items, -1])
         return np.sqrt(self._safemean(squared_errors / self._past_squared_seasonal_error.values[:, None]))
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        scale = past_item_scale[None, :, None]
+        return np.sqrt(self._safemean_batch((y_true - y_pred) ** 2.0 / scale, axis=axis))
+
 
 class RMSLE(TimeSeriesScorer):
     r"""Root mean squared logarithmic error.
@@ -340,6 +440,18 @@ class RMSLE(TimeSeriesScorer):
 
         return np.sqrt(np.power(np.log1p(y_pred) - np.log1p(y_true), 2).mean())
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        y_pred = self._get_point_forecast_batch_inputs(y_pred, columns)
+        y_pred = np.clip(y_pred, a_min=0.0, a_max=None)
+        return np.sqrt(np.nanmean(np.power(np.log1p(y_pred) - np.log1p(y_true), 2), axis=axis))
+
     def __call__(
         self,
         data: TimeSeriesDataFrame,
@@ -359,3 +471,21 @@ class RMSLE(TimeSeriesScorer):
             seasonal_period=seasonal_period,
             **kwargs,
         )
+
+    def prepare(
+        self,
+        data: TimeSeriesDataFrame,
+        prediction_length: int = 1,
+        target: str = "target",
+        seasonal_period: Optional[int] = None,
+        **kwargs,
+    ) -> PreparedScoringData:
+        if (data[target] < 0).any():
+            raise ValueError(f"{self.name} cannot be used if target time series contains negative values!")
+        return super().prepare(
+            data=data,
+            prediction_length=prediction_length,
+            target=target,
+            seasonal_period=seasonal_period,
+            **kwargs,
+        )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -45,6 +45,23 @@ class WQL(TimeSeriesScorer):
             / np.nansum(np.abs(values_true))
         )
 
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        q_pred, quantile_levels = self._get_quantile_forecast_batch_inputs(y_pred, columns)
+        values_true = y_true[..., None]  # shape [1, num_items, prediction_length, 1]
+
+        return 2 * np.mean(
+            np.nansum(np.abs((values_true - q_pred) * ((values_true <= q_pred) - quantile_levels)), axis=axis)
+            / np.nansum(np.abs(values_true), axis=axis),
+            axis=-1,
+        )
+
 
 class SQL(TimeSeriesScorer):
     r"""Scaled quantile loss.
@@ -92,6 +109,11 @@ class SQL(TimeSeriesScorer):
     def clear_past_metrics(self) -> None:
         self._past_abs_seasonal_error = None
 
+    def _compute_past_item_scale(
+        self, data_past: TimeSeriesDataFrame, target: str = "target", seasonal_period: int = 1
+    ) -> Optional[pd.Series]:
+        return _in_sample_abs_seasonal_error(y_past=data_past[target], seasonal_period=seasonal_period)
+
     def compute_metric(
         self, data_future: TimeSeriesDataFrame, predictions: TimeSeriesDataFrame, target: str = "target", **kwargs
     ) -> float:
@@ -107,3 +129,17 @@ class SQL(TimeSeriesScorer):
         # Reshape quantile losses values into [num_items, prediction_length] to normalize per item without groupby
         quantile_losses = ql.reshape([num_items, -1])
         return 2 * self._safemean(quantile_losses / self._past_abs_seasonal_error.values[:, None])
+
+    def _compute_metric_batch(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        columns: List[str],
+        past_item_scale: Optional[np.ndarray] = None,
+        axis: Union[int, Tuple[int, int]] = (1, 2),
+    ) -> np.ndarray:
+        q_pred, quantile_levels = self._get_quantile_forecast_batch_inputs(y_pred, columns)
+        values_true = y_true[..., None]  # shape [1, num_items, prediction_length, 1]
+
+        ql = np.abs((q_pred - values_true) * ((values_true <= q_pred) - quantile_levels)).mean(axis=-1)
+        return 2 * self._safemean_batch(ql / past_item_scale[None, :, None], axis=axis)
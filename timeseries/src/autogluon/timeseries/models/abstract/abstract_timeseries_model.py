@@ -463,6 +463,7 @@ class AbstractTimeSeriesModel(AbstractModel):
         fit_kwargs = dict(
             val_splitter=kwargs.get("val_splitter"),
             refit_every_n_windows=kwargs.get("refit_every_n_windows", 1),
+            warm_start_windows=kwargs.get("warm_start_windows", False),
         )
         train_fn_kwargs = self._get_hpo_train_fn_kwargs(
             model_cls=self.__class__,
@@ -534,9 +535,15 @@ class AbstractTimeSeriesModel(AbstractModel):
         - can_refit_full: Does it make sense to retrain the model without validation data?
             See `autogluon.core.models.abstract._tags._DEFAULT_TAGS` for more details.
         - can_use_val_data: Can model use val_data if it's provided to model.fit()?
+        - can_warm_start: Can model.fit() initialize the model from a fitted model of the same type, passed as
+            `init_model`, instead of training from scratch?
+        - predictions_depend_on_item_id: Does the forecast for a time series depend on its item_id (e.g., through
+            per-item statistics stored during fit), rather than only on its values?
         """
         return {
             "allow_nan": False,
             "can_refit_full": False,
             "can_use_val_data": False,
+            "can_warm_start": False,
+            "predictions_depend_on_item_id": False,
         }
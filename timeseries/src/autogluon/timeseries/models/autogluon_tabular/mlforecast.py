@@ -258,10 +258,14 @@ class AbstractMLForecastModel(AbstractTimeSeriesModel):
         data: TimeSeriesDataFrame,
         static_features: pd.DataFrame,
         include_target: bool = True,
+        past_data: Optional[TimeSeriesDataFrame] = None,
     ) -> pd.DataFrame:
         """Convert TimeSeriesDataFrame to a format expected by MLForecast methods `predict` and `preprocess`.
 
         Each row contains unique_id, ds, y, and (optionally) known covariates & static features.
+
+        If ``past_data`` is provided, the past values of the known covariates are included when computing their
+        per-item scale, as if ``data`` was appended to ``past_data``.
         """
         # TODO: Add support for past_covariates
         selected_columns = self.metadata.known_covariates.copy()
@@ -276,7 +280,15 @@ class AbstractMLForecastModel(AbstractTimeSeriesModel):
 
         for col in self._non_boolean_real_covariates:
             # Normalize non-boolean features using mean_abs scaling
-            df[f"__scaled_{col}"] = df[col] / df[col].abs().groupby(df[ITEMID]).mean().reindex(df[ITEMID]).values
+            abs_values_grouped = df[col].abs().groupby(df[ITEMID], sort=False)
+            if past_data is None:
+                mean_abs = abs_values_grouped.mean()
+            else:
+                past_abs_values_grouped = past_data[col].abs().groupby(level=ITEMID, sort=False)
+                mean_abs = abs_values_grouped.sum().add(past_abs_values_grouped.sum(), fill_value=0.0) / (
+                    abs_values_grouped.count().add(past_abs_values_grouped.count(), fill_value=0)
+                )
+            df[f"__scaled_{col}"] = df[col] / mean_abs.reindex(df[ITEMID]).values
 
         # Convert float64 to float32 to reduce memory usage
         float64_cols = list(df.select_dtypes(include="float64"))
@@ -415,7 +427,7 @@ class AbstractMLForecastModel(AbstractTimeSeriesModel):
         return predictions
 
     def _more_tags(self) -> dict:
-        return {"allow_nan": True, "can_refit_full": True}
+        return {"allow_nan": True, "can_refit_full": True, "predictions_depend_on_item_id": True}
 
 
 class DirectTabularModel(AbstractMLForecastModel):
@@ -509,21 +521,23 @@ class DirectTabularModel(AbstractMLForecastModel):
             # All time series are too short for chosen differences
             return forecast_for_short_series
 
-        if known_covariates is not None:
-            data_future = known_covariates.copy()
-        else:
-            future_index = get_forecast_horizon_index_ts_dataframe(data, self.prediction_length, freq=self.freq)
-            data_future = pd.DataFrame(columns=[self.target], index=future_index, dtype="float32")
-        # MLForecast raises exception of target contains NaN. We use inf as placeholder, replace them by NaN afterwards
-        data_future[self.target] = float("inf")
-        data_extended = pd.concat([data, data_future])
-        mlforecast_df = self._to_mlforecast_df(data_extended, data.static_features)
-        if self._max_ts_length is not None:
-            # We appended `prediction_length` time steps to each series, so increase length
-            mlforecast_df = self._shorten_all_series(mlforecast_df, self._max_ts_length + self.prediction_length)
-        df = self._mlf.preprocess(mlforecast_df, dropna=False, static_features=[])
-        df = df.groupby(MLF_ITEMID, sort=False).tail(self.prediction_length)
-        df = df.replace(float("inf"), float("nan"))
+        if not data.item_ids.is_monotonic_increasing:
+            # MLForecast target transforms expect the time series to be sorted by item_id
+            data = data.sort_index()
+        future_index = get_forecast_horizon_index_ts_dataframe(data, self.prediction_length, freq=self.freq)
+        if known_covariates is None:
+            known_covariates = pd.DataFrame(index=future_index)
+        elif not known_covariates.index.equals(future_index):
+            known_covariates = known_covariates.reindex(future_index)
+        df = self._to_mlforecast_df(known_covariates, data.static_features, include_target=False, past_data=data)
+
+        target_transforms = getattr(self._mlf.ts, "target_transforms", None) or []
+        transformed_target, window_indptr = self._get_transformed_target_window(data, target_transforms)
+        df = pd.concat([df, self._get_future_lag_features(transformed_target, window_indptr)], axis=1)
+        dates = pd.DatetimeIndex(df[MLF_TIMESTAMP])
+        for feature in self._mlf.ts.date_features:
+            feature_name, feature_values = self._mlf.ts._compute_date_feature(dates, feature)
+            df[feature_name] = feature_values
 
         raw_predictions = self._mlf.models_["mean"].predict(df)
         predictions = self._postprocess_predictions(raw_predictions, repeated_item_ids=df[MLF_ITEMID])
@@ -531,21 +545,76 @@ class DirectTabularModel(AbstractMLForecastModel):
         predictions[MLF_ITEMID] = df[MLF_ITEMID].values
         predictions[MLF_TIMESTAMP] = df[MLF_TIMESTAMP].values
 
-        if hasattr(self._mlf.ts, "target_transforms"):
-            # Ensure that transforms are fitted only on past data
-            mlforecast_df_past = self._to_mlforecast_df(data, None)
-            if self._max_ts_length is not None:
-                mlforecast_df_past = self._shorten_all_series(mlforecast_df_past, self._max_ts_length)
-            self._mlf.preprocess(mlforecast_df_past, static_features=[])
-            for tfm in self._mlf.ts.target_transforms[::-1]:
-                predictions = tfm.inverse_transform(predictions)
+        for tfm in target_transforms[::-1]:
+            predictions = tfm.inverse_transform(predictions)
         predictions = TimeSeriesDataFrame(predictions.rename(columns={MLF_ITEMID: ITEMID, MLF_TIMESTAMP: TIMESTAMP}))
 
         if forecast_for_short_series is not None:
             predictions = pd.concat([predictions, forecast_for_short_series])
+        if not predictions.item_ids.equals(original_item_id_order):
             predictions = predictions.reindex(original_item_id_order, level=ITEMID)
         return predictions
 
+    def _get_transformed_target_window(
+        self, data: TimeSeriesDataFrame, target_transforms: list
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fit the target transforms to the end of each time series and return the transformed target values.
+
+        The target transforms are fit to the last ``_max_ts_length`` observations of each series, exactly as during
+        training. If there are no target transforms, only the last ``max(lags)`` observations are needed to compute
+        the lag features.
+
+        Returns
+        -------
+        transformed_target : np.ndarray
+            Transformed target values in the window at the end of each time series.
+        window_indptr : np.ndarray
+            Array of shape [num_items + 1] such that the window of item i is
+            ``transformed_target[window_indptr[i] : window_indptr[i + 1]]``.
+        """
+        lengths = data.num_timesteps_per_item().to_numpy()
+        if len(target_transforms) == 0:
+            window_lengths = np.minimum(lengths, self._target_lags.max())
+        elif self._max_ts_length is not None:
+            window_lengths = np.minimum(lengths, self._max_ts_length)
+        else:
+            window_lengths = lengths
+        window_indptr = np.append(0, np.cumsum(window_lengths))
+        ends = np.cumsum(lengths)
+        # positions of the rows in the window relative to the start of the window of their time series
+        offsets = np.arange(window_indptr[-1]) - np.repeat(window_indptr[:-1], window_lengths)
+        window_idx = np.repeat(ends - window_lengths, window_lengths) + offsets
+
+        window_df = pd.DataFrame(
+            {
+                MLF_ITEMID: np.repeat(data.item_ids.to_numpy(), window_lengths),
+                MLF_TIMESTAMP: data.index.get_level_values(TIMESTAMP)[window_idx],
+                MLF_TARGET: data[self.target].to_numpy(dtype=np.float32)[window_idx],
+            }
+        )
+        for tfm in target_transforms:
+            tfm.set_column_names(MLF_ITEMID, MLF_TIMESTAMP, MLF_TARGET)
+            window_df = tfm.fit_transform(window_df)
+        return window_df[MLF_TARGET].to_numpy(), window_indptr
+
+    def _get_future_lag_features(self, transformed_target: np.ndarray, window_indptr: np.ndarray) -> pd.DataFrame:
+        """Compute lag features for the forecast horizon, where lags that refer to future values are set to NaN.
+
+        Returns a data frame with ``num_items * prediction_length`` rows and columns ``lag{lag}``.
+        """
+        lags = self._target_lags[None, None, :]
+        steps_ahead = np.arange(1, self.prediction_length + 1)[None, :, None]
+        # position of the lagged value in transformed_target, shape [num_items, prediction_length, len(lags)]
+        lag_idx = window_indptr[1:, None, None] - 1 + steps_ahead - lags
+        is_observed = (lags >= steps_ahead) & (lag_idx >= window_indptr[:-1, None, None])
+        lag_values = np.where(
+            is_observed, transformed_target[np.clip(lag_idx, 0, len(transformed_target) - 1)], np.nan
+        )
+        return pd.DataFrame(
+            lag_values.reshape(-1, lags.shape[-1]).astype(np.float32),
+            columns=[f"lag{lag}" for lag in self._target_lags],
+        )
+
     def _postprocess_predictions(self, predictions: np.ndarray, repeated_item_ids: pd.Series) -> pd.DataFrame:
         if self.is_quantile_model:
             predictions = pd.DataFrame(predictions, columns=[str(q) for q in self.quantile_levels])
@@ -263,7 +263,13 @@ class ChronosModel(AbstractTimeSeriesModel):
         num_workers: int = 0,
         time_limit: Optional[float] = None,
     ):
-        from .utils import ChronosInferenceDataLoader, ChronosInferenceDataset, timeout_callback
+        from .utils import (
+            ChronosInferenceDataLoader,
+            ChronosInferenceDataset,
+            LengthBucketedBatchSampler,
+            timeout_callback,
+            trim_padding_collate_fn,
+        )
 
         chronos_dataset = ChronosInferenceDataset(
             target_df=data,
@@ -271,10 +277,13 @@ class ChronosModel(AbstractTimeSeriesModel):
             context_length=context_length,
         )
 
+        # Series with similar lengths are batched together, so that less compute is spent on the padding
         return ChronosInferenceDataLoader(
             chronos_dataset,
-            batch_size=self.batch_size,
-            shuffle=False,
+            batch_sampler=LengthBucketedBatchSampler(
+                chronos_dataset.get_context_lengths(), batch_size=self.batch_size
+            ),
+            collate_fn=trim_padding_collate_fn,
             num_workers=num_workers,
             on_batch=timeout_callback(seconds=time_limit),
         )
@@ -323,7 +332,9 @@ class ChronosModel(AbstractTimeSeriesModel):
                     for batch in inference_data_loader
                 ]
 
-        samples = np.concatenate(prediction_samples, axis=0).swapaxes(1, 2).reshape(-1, self.num_samples)
+        # restore the original order of the items, which were sorted by length by the batch sampler
+        item_order = np.argsort(inference_data_loader.batch_sampler.order)
+        samples = np.concatenate(prediction_samples, axis=0)[item_order].swapaxes(1, 2).reshape(-1, self.num_samples)
 
         mean = samples.mean(axis=-1, keepdims=True)
         quantiles = np.quantile(samples, self.quantile_levels, axis=-1).T
@@ -290,6 +290,18 @@ def left_pad_and_stack_1D(tensors: List[torch.Tensor]):
     return torch.stack(padded)
 
 
+def trim_left_padding(context: torch.Tensor) -> torch.Tensor:
+    """Remove the leading time steps that are missing for all series in the batch.
+
+    Missing values are masked out by the tokenizer, so the padding shared by all series does not change the
+    forecasts, but it is still processed by the encoder and attended to by the decoder.
+    """
+    is_padding = torch.isnan(context).all(dim=0)
+    if not is_padding[0] or is_padding.all():
+        return context
+    return context[..., int(torch.argmin(is_padding.to(torch.uint8))) :]
+
+
 class ChronosPipeline:
     """
     A ``ChronosPipeline`` uses the given tokenizer and model to forecast
@@ -418,6 +430,7 @@ class ChronosPipeline:
 
         predictions = []
         remaining = prediction_length
+        context = trim_left_padding(context[..., -self.model.config.context_length :])
 
         while remaining > 0:
             token_ids, attention_mask, scale = self.tokenizer.input_transform(context)
@@ -438,7 +451,9 @@ class ChronosPipeline:
             if remaining <= 0:
                 break
 
+            # Only the last context_length time steps are used by the tokenizer, so older time steps are dropped
             context = torch.cat([context, prediction.median(dim=1).values], dim=-1)
+            context = trim_left_padding(context[..., -self.model.config.context_length :])
 
         return torch.cat(predictions, dim=-1)
 
@@ -1,5 +1,6 @@
+import math
 import time
-from typing import Callable, Optional
+from typing import Callable, Iterator, List, Optional
 
 import numpy as np
 import torch
@@ -29,11 +30,15 @@ class ChronosInferenceDataset:
     def __len__(self):
         return len(self.indptr) - 1  # noqa
 
+    def get_context_lengths(self) -> np.ndarray:
+        """Number of observed time steps in the context of each time series, excluding the padding."""
+        return np.minimum(np.diff(self.indptr), self.context_length)
+
     def _get_context(self, a: np.ndarray, pad_value=np.nan):
         a = a[-self.context_length :]
         pad_size = self.context_length - len(a)
         if pad_size > 0:
-            pad = np.full(shape=(pad_size,), fill_value=pad_value)
+            pad = np.full(shape=(pad_size,), fill_value=pad_value, dtype=a.dtype)
             a = np.concatenate((pad, a))
         return a
 
@@ -44,6 +49,35 @@ class ChronosInferenceDataset:
         return self._get_context(self.target_array[start_idx:end_idx])
 
 
+class LengthBucketedBatchSampler(torch.utils.data.Sampler):
+    """Batch sampler that groups time series with similar context lengths into the same batch.
+
+    Combined with ``trim_padding_collate_fn``, each batch is only padded to the length of its longest time series
+    instead of the context length of the longest time series in the dataset. The order in which the time series are
+    visited is stored in ``order``.
+    """
+
+    def __init__(self, lengths: np.ndarray, batch_size: int):
+        self.order = np.argsort(lengths, kind="stable")
+        self.batch_size = batch_size
+
+    def __len__(self):
+        return math.ceil(len(self.order) / self.batch_size)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        for start in range(0, len(self.order), self.batch_size):
+            yield self.order[start : start + self.batch_size].tolist()
+
+
+def trim_padding_collate_fn(batch: List[np.ndarray]) -> torch.Tensor:
+    """Stack the contexts of a batch, removing the left padding that is shared by all time series in the batch."""
+    context = np.stack(batch)
+    is_padding = np.isnan(context).all(axis=0)
+    # keep at least one time step, so that batches where all values are missing are still valid
+    num_padding = np.argmin(is_padding) if not is_padding.all() else len(is_padding) - 1
+    return torch.from_numpy(context[:, num_padding:])
+
+
 class ChronosInferenceDataLoader(torch.utils.data.DataLoader):
     def __init__(self, *args, **kwargs):
         self.callback: Callable = kwargs.pop("on_batch", lambda: None)
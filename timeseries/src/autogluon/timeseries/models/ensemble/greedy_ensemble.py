@@ -1,4 +1,3 @@
-import copy
 import logging
 import pprint
 from typing import Dict, List, Optional
@@ -51,51 +50,57 @@ class TimeSeriesEnsembleSelection(EnsembleSelection):
         time_limit: Optional[int] = None,
         sample_weight=None,
     ):
+        if sample_weight is not None:
+            # Time series metrics are computed from the forecast and past values of each item and cannot be reweighted
+            raise ValueError(f"{self.__class__.__name__} does not support sample_weight.")
         # Stack predictions for each model into a 3d tensor of shape [num_val_windows, num_rows, num_cols]
         stacked_predictions = [np.stack(preds) for preds in predictions]
 
-        self.dummy_pred_per_window = []
-        self.scorer_per_window = []
-        self.data_future_per_window = []
-
+        self.columns = list(predictions[0][0].columns)
+        self.prepared_data_per_window = []
         for window_idx, data in enumerate(labels):
-            dummy_pred = copy.deepcopy(predictions[0][window_idx])
             # This should never happen; sanity check to make sure that all predictions have the same index
-            assert all(dummy_pred.index.equals(pred[window_idx].index) for pred in predictions)
-
-            self.dummy_pred_per_window.append(dummy_pred)
-
-            scorer = copy.deepcopy(self.metric)
-            # Split the observed time series once to avoid repeated computations inside the evaluator
-            data_past = data.slice_by_timestep(None, -self.prediction_length)
-            data_future = data.slice_by_timestep(-self.prediction_length, None)
-            scorer.save_past_metrics(data_past, target=self.target, seasonal_period=self.eval_metric_seasonal_period)
-            self.scorer_per_window.append(scorer)
-            self.data_future_per_window.append(data_future)
+            assert all(predictions[0][window_idx].index.equals(pred[window_idx].index) for pred in predictions)
+            # Split the observed time series and compute the past metrics once to avoid repeated computations
+            prepared_data = self.metric.prepare(
+                data,
+                prediction_length=self.prediction_length,
+                target=self.target,
+                seasonal_period=self.eval_metric_seasonal_period,
+            )
+            self.prepared_data_per_window.append(prepared_data)
 
         super()._fit(
             predictions=stacked_predictions,
-            labels=data_future,
+            labels=prepared_data.data_future,
             time_limit=time_limit,
+            sample_weight=sample_weight,
         )
-        self.dummy_pred_per_window = None
-        self.evaluator_per_window = None
-        self.data_future_per_window = None
+        self.prepared_data_per_window = None
+        self.columns = None
+
+    def _get_regret_batch_func(self, sample_weight=None):
+        if sample_weight is not None:
+            return None
+
+        def regret_batch_func(y_true, y_pred_proba_batch: np.ndarray) -> np.ndarray:
+            # y_pred_proba_batch has shape [num_candidates, num_val_windows, num_rows, num_cols]
+            # Compute average score across all validation windows
+            total_score = np.zeros(len(y_pred_proba_batch))
+            for window_idx, prepared_data in enumerate(self.prepared_data_per_window):
+                total_score += self.metric.score_batch(
+                    prepared_data, y_pred_proba_batch[:, window_idx], columns=self.columns
+                )
+            avg_score = total_score / len(self.prepared_data_per_window)
+            # score: higher is better, regret: lower is better, so we flip the sign
+            return -avg_score
+
+        return regret_batch_func
 
     def _calculate_regret(self, y_true, y_pred_proba, metric=None, sample_weight=None):  # noqa
-        # Compute average score across all validation windows
-        total_score = 0.0
-        for window_idx, data_future in enumerate(self.data_future_per_window):
-            dummy_pred = self.dummy_pred_per_window[window_idx]
-            dummy_pred[list(dummy_pred.columns)] = y_pred_proba[window_idx]
-            # We use scorer.compute_metric instead of scorer.score to avoid repeated calls to scorer.save_past_metrics
-            metric_value = self.scorer_per_window[window_idx].compute_metric(
-                data_future, dummy_pred, target=self.target
-            )
-            total_score += metric.sign * metric_value
-        avg_score = total_score / len(self.data_future_per_window)
-        # score: higher is better, regret: lower is better, so we flip the sign
-        return -avg_score
+        if sample_weight is not None:
+            raise ValueError(f"{self.__class__.__name__} does not support sample_weight.")
+        return self._get_regret_batch_func()(y_true, y_pred_proba[None])[0]
 
 
 class TimeSeriesGreedyEnsemble(AbstractTimeSeriesEnsembleModel):
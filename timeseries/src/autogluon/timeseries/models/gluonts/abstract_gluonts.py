@@ -1,9 +1,10 @@
+import itertools
 import logging
 import os
 import shutil
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Type, Union
 
 import gluonts
 import gluonts.core.settings
@@ -26,7 +27,7 @@ from autogluon.tabular.models.tabular_nn.utils.categorical_encoders import (
 from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP, TimeSeriesDataFrame
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.utils.datetime import norm_freq_str
-from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe
+from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe, get_quantiles_from_samples
 from autogluon.timeseries.utils.warning_filters import disable_root_logger, warning_filter
 
 # NOTE: We avoid imports for torch and lightning.pytorch at the top level and hide them inside class methods.
@@ -515,6 +516,7 @@ class AbstractGluonTSModel(AbstractTimeSeriesModel):
         train_data: TimeSeriesDataFrame,
         val_data: Optional[TimeSeriesDataFrame] = None,
         time_limit: int = None,
+        init_model: Optional["AbstractGluonTSModel"] = None,
         **kwargs,
     ) -> None:
         # necessary to initialize the loggers
@@ -544,12 +546,22 @@ class AbstractGluonTSModel(AbstractTimeSeriesModel):
         self._deferred_init_params_aux(train_data)
 
         estimator = self._get_estimator()
+        init_predictor = self._get_init_predictor(estimator, init_model)
         with warning_filter(), disable_root_logger(), gluonts.core.settings.let(gluonts.env.env, use_tqdm=False):
-            self.gts_predictor = estimator.train(
-                self._to_gluonts_dataset(train_data),
-                validation_data=self._to_gluonts_dataset(val_data),
-                cache_data=True,
-            )
+            if init_predictor is not None:
+                # Training starts from the network weights of init_model (e.g., trained on the previous window)
+                self.gts_predictor = estimator.train_from(
+                    init_predictor,
+                    self._to_gluonts_dataset(train_data),
+                    validation_data=self._to_gluonts_dataset(val_data),
+                    cache_data=True,
+                )
+            else:
+                self.gts_predictor = estimator.train(
+                    self._to_gluonts_dataset(train_data),
+                    validation_data=self._to_gluonts_dataset(val_data),
+                    cache_data=True,
+                )
             # Increase batch size during prediction to speed up inference
             if init_args["predict_batch_size"] is not None:
                 self.gts_predictor.batch_size = init_args["predict_batch_size"]
@@ -559,6 +571,20 @@ class AbstractGluonTSModel(AbstractTimeSeriesModel):
             logger.debug(f"Removing lightning_logs directory {lightning_logs_dir}")
             shutil.rmtree(lightning_logs_dir)
 
+    @staticmethod
+    def _get_init_predictor(
+        estimator: GluonTSEstimator, init_model: Optional["AbstractGluonTSModel"]
+    ) -> Optional[GluonTSPredictor]:
+        """Return the predictor of init_model if its network weights can be loaded into the estimator's network."""
+        if init_model is None or init_model.gts_predictor is None:
+            return None
+        try:
+            estimator.create_lightning_module().load_state_dict(init_model.gts_predictor.network.state_dict())
+        except RuntimeError:
+            logger.debug(f"\tNetwork of {init_model.name} has a different architecture, training from scratch")
+            return None
+        return init_model.gts_predictor
+
     def _get_callbacks(
         self,
         time_limit: int,
@@ -593,40 +619,69 @@ class AbstractGluonTSModel(AbstractTimeSeriesModel):
 
     def _predict_gluonts_forecasts(
         self, data: TimeSeriesDataFrame, known_covariates: Optional[TimeSeriesDataFrame] = None, **kwargs
-    ) -> List[Forecast]:
+    ) -> Iterator[Forecast]:
         gts_data = self._to_gluonts_dataset(data, known_covariates=known_covariates)
 
         predictor_kwargs = dict(dataset=gts_data)
         predictor_kwargs["num_samples"] = kwargs.get("num_samples", self.default_num_samples)
 
-        return list(self.gts_predictor.predict(**predictor_kwargs))
+        return self.gts_predictor.predict(**predictor_kwargs)
 
-    def _stack_quantile_forecasts(self, forecasts: List[QuantileForecast], item_ids: pd.Index) -> pd.DataFrame:
+    @staticmethod
+    def _collect_forecast_arrays(
+        forecasts: Iterable[Forecast], item_ids: pd.Index, get_array: Callable[[Forecast], np.ndarray]
+    ) -> np.ndarray:
+        """Write the array of each forecast into a single preallocated array of shape [num_items, *array_shape], where
+        the forecasts are sorted in the same order as item_ids.
+
+        Forecasts are consumed one by one as they are generated, so the Forecast objects for all items are never held
+        in memory at the same time.
+        """
         # GluonTS always saves item_id as a string
-        item_id_to_forecast = {str(f.item_id): f for f in forecasts}
-        result_dfs = []
-        for item_id in item_ids:
-            forecast = item_id_to_forecast[str(item_id)]
-            result_dfs.append(pd.DataFrame(forecast.forecast_array.T, columns=forecast.forecast_keys))
-        forecast_df = pd.concat(result_dfs)
-        if "mean" not in forecast_df.columns:
-            forecast_df["mean"] = forecast_df["0.5"]
-        columns_order = ["mean"] + [str(q) for q in self.quantile_levels]
-        return forecast_df[columns_order]
-
-    def _stack_sample_forecasts(self, forecasts: List[SampleForecast], item_ids: pd.Index) -> pd.DataFrame:
-        item_id_to_forecast = {str(f.item_id): f for f in forecasts}
-        samples_per_item = []
-        for item_id in item_ids:
-            forecast = item_id_to_forecast[str(item_id)]
-            samples_per_item.append(forecast.samples.T)
-        samples = np.concatenate(samples_per_item, axis=0)
-        quantiles = np.quantile(samples, self.quantile_levels, axis=1).T
-        mean = samples.mean(axis=1, keepdims=True)
-        forecast_array = np.concatenate([mean, quantiles], axis=1)
+        item_id_to_position = {item_id: position for position, item_id in enumerate(item_ids.astype(str))}
+        is_collected = np.zeros(len(item_ids), dtype=bool)
+        result = None
+        for forecast in forecasts:
+            array = get_array(forecast)
+            if result is None:
+                result = np.empty((len(item_ids),) + array.shape, dtype=array.dtype)
+            position = item_id_to_position[str(forecast.item_id)]
+            result[position] = array
+            is_collected[position] = True
+        assert is_collected.all(), "GluonTS predictor did not return forecasts for all items"
+        return result
+
+    def _stack_quantile_forecasts(self, forecasts: Iterable[QuantileForecast], item_ids: pd.Index) -> pd.DataFrame:
+        forecast_keys = None
+
+        def get_forecast_array(forecast: QuantileForecast) -> np.ndarray:
+            nonlocal forecast_keys
+            if forecast_keys is None:
+                forecast_keys = list(forecast.forecast_keys)
+            assert list(forecast.forecast_keys) == forecast_keys, "All forecasts must have the same quantile levels"
+            return forecast.forecast_array
+
+        # shape [num_items, len(forecast_keys), prediction_length]
+        forecast_arrays = self._collect_forecast_arrays(forecasts, item_ids, get_array=get_forecast_array)
+        mean_key = "mean" if "mean" in forecast_keys else "0.5"
+        columns_order = [mean_key] + [str(q) for q in self.quantile_levels]
+        forecast_arrays = forecast_arrays[:, [forecast_keys.index(key) for key in columns_order]]
+        forecast_array = np.swapaxes(forecast_arrays, 1, 2).reshape(-1, len(columns_order))
         return pd.DataFrame(forecast_array, columns=["mean"] + [str(q) for q in self.quantile_levels])
 
-    def _stack_distribution_forecasts(self, forecasts: List[Forecast], item_ids: pd.Index) -> pd.DataFrame:
+    def _stack_sample_forecasts(self, forecasts: Iterable[SampleForecast], item_ids: pd.Index) -> pd.DataFrame:
+        # shape [num_items, num_samples, prediction_length]
+        samples = self._collect_forecast_arrays(forecasts, item_ids, get_array=lambda f: f.samples)
+        # Compute the mean and all quantiles for all items with a single vectorized call each
+        mean = samples.mean(axis=1)
+        quantiles = get_quantiles_from_samples(samples, self.quantile_levels, axis=1)
+        forecast_array = np.concatenate([mean[..., None], np.moveaxis(quantiles, 0, -1)], axis=-1)
+        return pd.DataFrame(
+            forecast_array.reshape(-1, forecast_array.shape[-1]),
+            columns=["mean"] + [str(q) for q in self.quantile_levels],
+        )
+
+    def _stack_distribution_forecasts(self, forecasts: Iterable[Forecast], item_ids: pd.Index) -> pd.DataFrame:
         import torch
         from gluonts.torch.distributions import AffineTransformed
         from torch.distributions import Distribution
@@ -674,23 +729,29 @@ class AbstractGluonTSModel(AbstractTimeSeriesModel):
 
     def _gluonts_forecasts_to_data_frame(
         self,
-        forecasts: List[Forecast],
+        forecasts: Iterable[Forecast],
         forecast_index: pd.MultiIndex,
     ) -> TimeSeriesDataFrame:
         from gluonts.torch.model.forecast import DistributionForecast
 
         item_ids = forecast_index.unique(level=ITEMID)
-        if isinstance(forecasts[0], SampleForecast):
+        # Peek at the first forecast to determine the forecast type without materializing all forecasts
+        forecasts = iter(forecasts)
+        first_forecast = next(forecasts, None)
+        if first_forecast is None:
+            raise ValueError("GluonTS predictor did not return any forecasts")
+        forecasts = itertools.chain([first_forecast], forecasts)
+        if isinstance(first_forecast, SampleForecast):
             forecast_df = self._stack_sample_forecasts(forecasts, item_ids)
-        elif isinstance(forecasts[0], QuantileForecast):
+        elif isinstance(first_forecast, QuantileForecast):
             forecast_df = self._stack_quantile_forecasts(forecasts, item_ids)
-        elif isinstance(forecasts[0], DistributionForecast):
+        elif isinstance(first_forecast, DistributionForecast):
             forecast_df = self._stack_distribution_forecasts(forecasts, item_ids)
         else:
-            raise ValueError(f"Unrecognized forecast type {type(forecasts[0])}")
+            raise ValueError(f"Unrecognized forecast type {type(first_forecast)}")
 
         forecast_df.index = forecast_index
         return TimeSeriesDataFrame(forecast_df)
 
     def _more_tags(self) -> dict:
-        return {"allow_nan": True, "can_use_val_data": True}
+        return {"allow_nan": True, "can_use_val_data": True, "can_warm_start": True}
@@ -1,15 +1,18 @@
 import logging
+import os
+import tempfile
 import time
 from multiprocessing import TimeoutError, cpu_count
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import joblib
 import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
 from scipy.stats import norm
 
 from autogluon.core.utils.exceptions import TimeLimitExceeded
-from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TimeSeriesDataFrame
+from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP, TimeSeriesDataFrame
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.utils.datetime import get_seasonality
 from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe
@@ -21,11 +24,16 @@ logger = logging.getLogger(__name__)
 # We use the same default n_jobs across AG-TS to ensure that Joblib reuses the process pool
 AG_DEFAULT_N_JOBS = max(int(cpu_count() * 0.5), 1)
 
+# Maximum number of time series that are predicted sequentially by a single job in _predict_each_series
+_MAX_NUM_ITEMS_PER_CHUNK = 256
+
 
 class AbstractLocalModel(AbstractTimeSeriesModel):
     """Abstract class for local forecasting models that are trained separately for each time series.
 
-    Prediction is parallelized across CPU cores using joblib.Parallel.
+    Prediction is parallelized across CPU cores using joblib.Parallel. Models that set
+    ``supports_panel_prediction = True`` instead compute the forecasts for all time series at once in
+    ``_predict_panel``, which avoids the overhead of sending each time series to a separate job.
 
     Attributes
     ----------
@@ -39,12 +47,16 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
     init_time_in_seconds : int
         Time that it takes to initialize the model in seconds (e.g., because of JIT compilation by Numba).
         If time_limit is below this number, model won't be trained.
+    supports_panel_prediction : bool
+        If True, predictions for all time series are computed at once by ``_predict_panel`` instead of calling
+        ``_predict_with_local_model`` for each time series.
     """
 
     allowed_local_model_args: List[str] = []
     default_n_jobs: Union[int, float] = AG_DEFAULT_N_JOBS
     default_max_ts_length: Optional[int] = 2500
     init_time_in_seconds: int = 0
+    supports_panel_prediction: bool = False
 
     def __init__(
         self,
@@ -139,35 +151,169 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
             logger.debug(f"Shortening all time series to at most {self.max_ts_length}")
             data = data.groupby(level=ITEMID, sort=False).tail(self.max_ts_length)
 
-        df = pd.DataFrame(data).reset_index(level=ITEMID)
-        all_series = (ts for _, ts in df.groupby(by=ITEMID, as_index=False, sort=False)[self.target])
+        # Panel prediction requires the rows of each time series to be stored contiguously
+        if self.supports_panel_prediction and data._get_packed_index() is not None:
+            predictions_df = self._predict_all_series_at_once(data, time_limit=kwargs.get("time_limit"))
+        else:
+            predictions_df = self._predict_each_series(data, time_limit=kwargs.get("time_limit"))
+        predictions_df.index = get_forecast_horizon_index_ts_dataframe(data, self.prediction_length, freq=self.freq)
+        return TimeSeriesDataFrame(predictions_df)
 
-        # timeout ensures that no individual job takes longer than time_limit
-        # TODO: a job started late may still exceed time_limit - how to prevent that?
-        time_limit = kwargs.get("time_limit")
+    def _predict_each_series(self, data: TimeSeriesDataFrame, time_limit: Optional[float] = None) -> pd.DataFrame:
+        """Fit a local model to each time series, processing contiguous chunks of time series in parallel jobs.
+
+        The worker processes are reused across calls (and across models with the same ``n_jobs``), so that the
+        initialization cost (e.g., Numba compilation) is paid once per worker. The target values are shared with the
+        workers through a memory-mapped file, so that each job receives only a reference to its chunk.
+        """
+        target, timestamps, indptr = self._get_packed_target_and_timestamps(data)
+        num_items = len(indptr) - 1
+        chunk_size = int(min(_MAX_NUM_ITEMS_PER_CHUNK, max(1, np.ceil(num_items / (self.n_jobs * 4)))))
+        chunk_indptr = indptr[::chunk_size]
+        if chunk_indptr[-1] != indptr[-1]:
+            chunk_indptr = np.append(chunk_indptr, indptr[-1])
+        chunk_item_bounds = range(0, num_items, chunk_size)
+
+        # joblib applies timeout to each chunk separately, so it only ensures that no individual chunk takes longer than time_limit
         timeout = None if self.n_jobs == 1 else time_limit
-        # end_time ensures that no new jobs are started after time_limit is exceeded
+        # end_time is the deadline for the whole batch: it is checked before each time series, so that all chunks stop
+        # at most one time series after time_limit is exceeded
         end_time = None if time_limit is None else time.time() + time_limit
         executor = Parallel(self.n_jobs, timeout=timeout)
 
-        try:
-            with warning_filter():
-                predictions_with_flags = executor(
-                    delayed(self._predict_wrapper)(ts, end_time=end_time) for ts in all_series
+        with tempfile.TemporaryDirectory() as temp_dir:
+            if self.n_jobs != 1:
+                arrays_path = os.path.join(temp_dir, "target_and_timestamps.joblib")
+                joblib.dump((target, timestamps), arrays_path)
+                target, timestamps = joblib.load(arrays_path, mmap_mode="r")
+            try:
+                with warning_filter():
+                    predictions_with_num_failed = executor(
+                        delayed(self._predict_chunk)(
+                            target[chunk_indptr[i] : chunk_indptr[i + 1]],
+                            timestamps[chunk_indptr[i] : chunk_indptr[i + 1]],
+                            indptr[start : start + chunk_size + 1] - indptr[start],
+                            end_time=end_time,
+                        )
+                        for i, start in enumerate(chunk_item_bounds)
+                    )
+            except TimeoutError:
+                raise TimeLimitExceeded
+
+        number_failed_models = sum(num_failed for _, num_failed in predictions_with_num_failed)
+        self._log_failed_models(number_failed_models, num_items=num_items)
+        return pd.DataFrame(
+            np.concatenate([pred for pred, _ in predictions_with_num_failed]),
+            columns=["mean"] + [str(q) for q in self.quantile_levels],
+        )
+
+    def _get_packed_target_and_timestamps(
+        self, data: TimeSeriesDataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the target values and timestamps with the rows of each time series stored contiguously, in the
+        order of ``data.item_ids``, and the array of shape [num_items + 1] with the offsets of each time series.
+        """
+        target = data[self.target].to_numpy(dtype=np.float64)
+        timestamps = data.index.get_level_values(TIMESTAMP).to_numpy()
+        packed_index = data._get_packed_index()
+        if packed_index is not None:
+            return target, timestamps, packed_index.indptr
+        item_codes, _ = pd.factorize(data.index.get_level_values(ITEMID))
+        indptr = np.append(0, np.cumsum(np.bincount(item_codes)))
+        order = np.argsort(item_codes, kind="stable")
+        return target[order], timestamps[order], indptr
+
+    def _predict_chunk(
+        self, target: np.ndarray, timestamps: np.ndarray, indptr: np.ndarray, end_time: Optional[float] = None
+    ) -> Tuple[np.ndarray, int]:
+        """Predict each time series ``target[indptr[i] : indptr[i + 1]]`` in a chunk.
+
+        Returns the predictions of shape [num_items * prediction_length, 1 + len(quantile_levels)] and the number of
+        time series for which the fallback model was used. Raises ``TimeLimitExceeded`` if ``end_time`` is reached
+        before all time series are predicted.
+        """
+        predictions = []
+        num_failed = 0
+        for i in range(len(indptr) - 1):
+            if end_time is not None and time.time() >= end_time:
+                raise TimeLimitExceeded
+            # copy the values, since the local model might modify them and target may be a read-only memmap
+            time_series = pd.Series(
+                np.array(target[indptr[i] : indptr[i + 1]]),
+                index=pd.DatetimeIndex(timestamps[indptr[i] : indptr[i + 1]], name=TIMESTAMP),
+                name=self.target,
+            )
+            result, model_failed = self._predict_wrapper(time_series)
+            predictions.append(result.to_numpy(dtype=np.float64))
+            num_failed += model_failed
+        return np.concatenate(predictions), num_failed
+
+    def _predict_all_series_at_once(
+        self, data: TimeSeriesDataFrame, time_limit: Optional[float] = None
+    ) -> pd.DataFrame:
+        """Compute the forecasts for all time series in a single pass over the packed target values.
+
+        Identical to ``_predict_each_series``, time series that contain only NaNs get the dummy forecast, and the
+        fallback model is used for time series where the forecast contains NaN or Inf values. The deadline given by
+        ``time_limit`` is checked before computing the model forecasts and before computing the fallback forecasts,
+        each of which is a single vectorized pass that cannot be interrupted.
+        """
+        target = data[self.target].to_numpy(dtype=np.float64)
+        indptr = data._get_packed_index().indptr
+        num_items = len(indptr) - 1
+        end_time = None if time_limit is None else time.time() + time_limit
+
+        def check_time_limit():
+            if end_time is not None and time.time() >= end_time:
+                raise TimeLimitExceeded
+
+        fallback_predictions = None
+        with warning_filter(), np.errstate(invalid="ignore", divide="ignore"):
+            check_time_limit()
+            try:
+                predictions = self._predict_panel(
+                    target=target, indptr=indptr, local_model_args=self._local_model_args.copy()
                 )
-        except TimeoutError:
-            raise TimeLimitExceeded
+                predictions = predictions.reshape(num_items, self.prediction_length, -1)
+            except Exception:
+                if not self.use_fallback_model:
+                    raise
+                predictions = None
+            if predictions is None or not np.isfinite(predictions).all():
+                check_time_limit()
+                fallback_predictions = seasonal_naive_forecast_panel(
+                    target=target,
+                    indptr=indptr,
+                    prediction_length=self.prediction_length,
+                    quantile_levels=self.quantile_levels,
+                    seasonal_period=self._seasonal_period,
+                ).reshape(num_items, self.prediction_length, -1)
+
+        if predictions is None:
+            predictions = fallback_predictions
+            is_failed = np.ones(num_items, dtype=bool)
+        else:
+            is_failed = ~np.isfinite(predictions).all(axis=(1, 2))
+        is_all_nan = ~np.logical_or.reduceat(~np.isnan(target), indptr[:-1])
+        is_failed &= ~is_all_nan
+        if is_failed.any():
+            if not self.use_fallback_model:
+                raise RuntimeError("Forecast contains NaN or Inf values.")
+            predictions[is_failed] = fallback_predictions[is_failed]
+        predictions[is_all_nan] = self._dummy_forecast.values
+        self._log_failed_models(is_failed.sum(), num_items=num_items)
+        return pd.DataFrame(
+            predictions.reshape(num_items * self.prediction_length, -1),
+            columns=["mean"] + [str(q) for q in self.quantile_levels],
+        )
 
-        number_failed_models = sum(failed_flag for _, failed_flag in predictions_with_flags)
+    def _log_failed_models(self, number_failed_models: int, num_items: int) -> None:
         if number_failed_models > 0:
-            fraction_failed_models = number_failed_models / len(predictions_with_flags)
+            fraction_failed_models = number_failed_models / num_items
             logger.warning(
                 f"\tWarning: {self.name} failed for {number_failed_models} time series "
                 f"({fraction_failed_models:.1%}). Fallback model SeasonalNaive was used for these time series."
             )
-        predictions_df = pd.concat([pred for pred, _ in predictions_with_flags])
-        predictions_df.index = get_forecast_horizon_index_ts_dataframe(data, self.prediction_length, freq=self.freq)
-        return TimeSeriesDataFrame(predictions_df)
 
     def score_and_cache_oof(
         self,
@@ -181,10 +327,7 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
             val_data, store_val_score, store_predict_time, time_limit=self.time_limit, **predict_kwargs
         )
 
-    def _predict_wrapper(self, time_series: pd.Series, end_time: Optional[float] = None) -> Tuple[pd.DataFrame, bool]:
-        if end_time is not None and time.time() >= end_time:
-            raise TimeLimitExceeded
-
+    def _predict_wrapper(self, time_series: pd.Series) -> Tuple[pd.DataFrame, bool]:
         model_failed = False
         if time_series.isna().all():
             result = self._dummy_forecast.copy()
@@ -216,6 +359,27 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
     ) -> pd.DataFrame:
         raise NotImplementedError
 
+    def _predict_panel(self, target: np.ndarray, indptr: np.ndarray, local_model_args: dict) -> np.ndarray:
+        """Compute the forecasts for all time series at once.
+
+        Parameters
+        ----------
+        target : np.ndarray
+            Target values of all time series, concatenated into a single array of shape [num_timesteps].
+        indptr : np.ndarray
+            Array of shape [num_items + 1], target values of the i-th time series are stored in
+            ``target[indptr[i] : indptr[i + 1]]``.
+        local_model_args : dict
+            Arguments passed to the local model.
+
+        Returns
+        -------
+        predictions : np.ndarray
+            Array of shape [num_items * prediction_length, 1 + len(quantile_levels)] containing the mean forecast and
+            the quantile forecasts for each time series.
+        """
+        raise NotImplementedError
+
 
 def seasonal_naive_forecast(
     target: np.ndarray, prediction_length: int, quantile_levels: List[float], seasonal_period: int
@@ -259,6 +423,115 @@ def seasonal_naive_forecast(
     return pd.DataFrame(forecast)
 
 
+def seasonal_naive_forecast_panel(
+    target: np.ndarray, indptr: np.ndarray, prediction_length: int, quantile_levels: List[float], seasonal_period: int
+) -> np.ndarray:
+    """Generate seasonal naive forecast for all time series at once.
+
+    Equivalent to calling ``seasonal_naive_forecast`` for each time series ``target[indptr[i] : indptr[i + 1]]``, and
+    stacking the results into an array of shape [num_items * prediction_length, 1 + len(quantile_levels)].
+    """
+    num_items = len(indptr) - 1
+    lengths = np.diff(indptr)
+    item_ids = np.repeat(np.arange(num_items), lengths)
+    positions = np.arange(len(target)) - indptr[item_ids]
+    is_nan = np.isnan(target)
+    horizon = np.arange(1, prediction_length + 1)
+
+    mean = np.empty([num_items, prediction_length])
+    sigma_per_timestep = np.empty([num_items, prediction_length])
+
+    # At least seasonal_period + 2 values are required to compute sigma for seasonal naive
+    is_seasonal = (lengths > seasonal_period + 1) & (seasonal_period > 1)
+    if is_seasonal.any():
+        # Forward fill NaNs in time series that have NaNs among the last seasonal_period + 2 values
+        is_nan_in_tail = is_nan & (positions >= (lengths - seasonal_period - 2)[item_ids])
+        needs_ffill = is_seasonal & (np.bincount(item_ids, weights=is_nan_in_tail, minlength=num_items) > 0)
+        seasonal_target = target
+        if needs_ffill.any():
+            last_observed = np.maximum.accumulate(np.where(is_nan, -1, np.arange(len(target))))
+            last_observed = np.maximum(last_observed, indptr[item_ids])
+            seasonal_target = np.where(needs_ffill[item_ids], target[last_observed], target)
+
+        seasonal_items = np.flatnonzero(is_seasonal)
+        indices = indptr[seasonal_items + 1][:, None] - seasonal_period + (horizon - 1) % seasonal_period
+        mean[seasonal_items] = seasonal_target[indices]
+        sigma = _get_residual_scale(seasonal_target, item_ids, positions, lag=seasonal_period, num_items=num_items)
+        num_full_seasons = horizon // seasonal_period
+        sigma_per_timestep[seasonal_items] = sigma[seasonal_items, None] * np.sqrt(num_full_seasons + 1)
+
+    if not is_seasonal.all():
+        # Fall back to naive forecast
+        naive_items = np.flatnonzero(~is_seasonal)
+        last_observed = np.maximum.reduceat(np.where(np.isfinite(target), np.arange(len(target)), -1), indptr[:-1])
+        last_observed_value = np.where(last_observed >= 0, target[last_observed], np.nan)
+        mean[naive_items] = last_observed_value[naive_items, None]
+        sigma = _get_residual_scale(target, item_ids, positions, lag=1, num_items=num_items)
+        # happens if there are no two consecutive non-nan observations
+        sigma[np.isnan(sigma)] = 0.0
+        sigma_per_timestep[naive_items] = sigma[naive_items, None] * np.sqrt(horizon)
+
+    forecast = np.empty([num_items, prediction_length, 1 + len(quantile_levels)])
+    forecast[:, :, 0] = mean
+    for i, q in enumerate(quantile_levels):
+        forecast[:, :, i + 1] = mean + norm.ppf(q) * sigma_per_timestep
+    return forecast.reshape(num_items * prediction_length, -1)
+
+
+def _get_residual_scale(
+    target: np.ndarray, item_ids: np.ndarray, positions: np.ndarray, lag: int, num_items: int
+) -> np.ndarray:
+    """Root mean square of the non-NaN residuals ``target[t] - target[t - lag]`` of each time series."""
+    residuals = target[lag:] - target[:-lag]
+    is_valid = (positions[lag:] >= lag) & ~np.isnan(residuals)
+    sum_squares = np.bincount(
+        item_ids[lag:], weights=np.where(is_valid, np.square(residuals), 0.0), minlength=num_items
+    )
+    counts = np.bincount(item_ids[lag:], weights=is_valid, minlength=num_items)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.sqrt(sum_squares / counts)
+
+
+def get_segment_mean_and_quantiles(
+    values: np.ndarray, segment_ids: np.ndarray, num_segments: int, quantile_levels: List[float]
+) -> np.ndarray:
+    """Compute the mean and quantiles of the non-NaN values in each segment.
+
+    Quantiles are computed with linear interpolation, identical to ``pandas.Series.quantile``.
+
+    Returns
+    -------
+    stats : np.ndarray
+        Array of shape [num_segments, 1 + len(quantile_levels)] containing the mean followed by the quantiles of each
+        segment. All statistics are NaN for segments that contain no non-NaN values.
+    """
+    is_valid = ~np.isnan(values)
+    values = values[is_valid]
+    segment_ids = segment_ids[is_valid]
+    counts = np.bincount(segment_ids, minlength=num_segments)
+    sums = np.bincount(segment_ids, weights=values, minlength=num_segments)
+
+    stats = np.full([num_segments, 1 + len(quantile_levels)], np.nan)
+    has_values = counts > 0
+    counts = counts[has_values]
+    stats[has_values, 0] = sums[has_values] / counts
+
+    sorted_values = values[np.lexsort((values, segment_ids))]
+    starts = (np.cumsum(counts) - counts)[:, None]
+    # pandas passes percentiles to numpy, we replicate the conversion to get the same virtual index
+    q = np.true_divide(np.asarray(quantile_levels, dtype=np.float64) * 100.0, 100)
+    virtual_index = (counts[:, None] - 1) * q[None, :]
+    previous_index = np.floor(virtual_index).astype(np.int64)
+    next_index = np.minimum(previous_index + 1, counts[:, None] - 1)
+    gamma = virtual_index - previous_index
+    a = sorted_values[starts + previous_index]
+    b = sorted_values[starts + next_index]
+    # Same linear interpolation as numpy.quantile
+    diff_b_a = b - a
+    stats[has_values, 1:] = np.where(gamma >= 0.5, b - diff_b_a * (1 - gamma), a + diff_b_a * gamma)
+    return stats
+
+
 def get_quantile_function(q: float) -> Callable:
     """Returns a function with name "q" that computes the q'th quantile of a pandas.Series."""
 
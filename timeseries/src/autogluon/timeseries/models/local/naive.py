@@ -4,7 +4,9 @@ import pandas as pd
 from autogluon.timeseries.models.local.abstract_local_model import (
     AbstractLocalModel,
     get_quantile_function,
+    get_segment_mean_and_quantiles,
     seasonal_naive_forecast,
+    seasonal_naive_forecast_panel,
 )
 
 
@@ -25,6 +27,7 @@ class NaiveModel(AbstractLocalModel):
     """
 
     allowed_local_model_args = ["seasonal_period"]
+    supports_panel_prediction = True
 
     def _predict_with_local_model(
         self,
@@ -38,6 +41,15 @@ class NaiveModel(AbstractLocalModel):
             seasonal_period=1,
         )
 
+    def _predict_panel(self, target: np.ndarray, indptr: np.ndarray, local_model_args: dict) -> np.ndarray:
+        return seasonal_naive_forecast_panel(
+            target=target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=1,
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -67,6 +79,7 @@ class SeasonalNaiveModel(AbstractLocalModel):
     """
 
     allowed_local_model_args = ["seasonal_period"]
+    supports_panel_prediction = True
 
     def _predict_with_local_model(
         self,
@@ -80,6 +93,15 @@ class SeasonalNaiveModel(AbstractLocalModel):
             seasonal_period=local_model_args["seasonal_period"],
         )
 
+    def _predict_panel(self, target: np.ndarray, indptr: np.ndarray, local_model_args: dict) -> np.ndarray:
+        return seasonal_naive_forecast_panel(
+            target=target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=local_model_args["seasonal_period"],
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -101,6 +123,7 @@ class AverageModel(AbstractLocalModel):
 
     allowed_local_model_args = ["seasonal_period"]
     default_max_ts_length = None
+    supports_panel_prediction = True
 
     def _predict_with_local_model(
         self,
@@ -112,6 +135,12 @@ class AverageModel(AbstractLocalModel):
         stats_repeated = np.tile(stats_marginal.values, [self.prediction_length, 1])
         return pd.DataFrame(stats_repeated, columns=stats_marginal.index)
 
+    def _predict_panel(self, target: np.ndarray, indptr: np.ndarray, local_model_args: dict) -> np.ndarray:
+        num_items = len(indptr) - 1
+        item_ids = np.repeat(np.arange(num_items), np.diff(indptr))
+        stats_marginal = get_segment_mean_and_quantiles(target, item_ids, num_items, self.quantile_levels)
+        return np.repeat(stats_marginal, self.prediction_length, axis=0)
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -140,6 +169,7 @@ class SeasonalAverageModel(AbstractLocalModel):
 
     allowed_local_model_args = ["seasonal_period"]
     default_max_ts_length = None
+    supports_panel_prediction = True
 
     def _predict_with_local_model(
         self,
@@ -164,5 +194,26 @@ class SeasonalAverageModel(AbstractLocalModel):
             result = result.fillna(stats_marginal)
         return result
 
+    def _predict_panel(self, target: np.ndarray, indptr: np.ndarray, local_model_args: dict) -> np.ndarray:
+        seasonal_period = local_model_args["seasonal_period"]
+        num_items = len(indptr) - 1
+        lengths = np.diff(indptr)
+        item_ids = np.repeat(np.arange(num_items), lengths)
+        seasons = (np.arange(len(target)) - indptr[item_ids]) % seasonal_period
+
+        # Compute mean & quantiles for each season
+        stats_per_season = get_segment_mean_and_quantiles(
+            target, item_ids * seasonal_period + seasons, num_items * seasonal_period, self.quantile_levels
+        ).reshape(num_items, seasonal_period, -1)
+
+        next_season = lengths % seasonal_period
+        season_in_forecast_horizon = (next_season[:, None] + np.arange(self.prediction_length)) % seasonal_period
+        result = np.take_along_axis(stats_per_season, season_in_forecast_horizon[:, :, None], axis=1)
+
+        # Use statistics over all timesteps to fill values for seasons that are missing from training data
+        stats_marginal = get_segment_mean_and_quantiles(target, item_ids, num_items, self.quantile_levels)
+        result = np.where(np.isnan(result), stats_marginal[:, None, :], result)
+        return result.reshape(num_items * self.prediction_length, -1)
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
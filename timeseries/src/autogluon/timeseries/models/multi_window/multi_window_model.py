@@ -89,9 +89,9 @@ class MultiWindowBacktestingModel(AbstractTimeSeriesModel):
         time_limit: Optional[int] = None,
         val_splitter: AbstractWindowSplitter = None,
         refit_every_n_windows: Optional[int] = 1,
+        warm_start_windows: bool = False,
         **kwargs,
     ):
-        # TODO: use incremental training for GluonTS models?
         # TODO: implement parallel fitting similar to ParallelLocalFoldFittingStrategy in tabular?
         if val_data is not None:
             raise ValueError(f"val_data should not be passed to {self.name}.fit()")
@@ -102,8 +102,13 @@ class MultiWindowBacktestingModel(AbstractTimeSeriesModel):
         if refit_every_n_windows is None:
             refit_every_n_windows = val_splitter.num_val_windows + 1  # only fit model for the first window
 
+        # Consecutive windows only differ by val_step_size time steps, so models that support it are initialized
+        # from the model trained on the previous window instead of being trained from scratch
+        warm_start_windows = warm_start_windows and self.model_base._get_tags()["can_warm_start"]
+
         oof_predictions_per_window = []
         global_fit_start_time = time.time()
+        model = None
 
         for window_index, (train_fold, val_fold) in enumerate(val_splitter.split(train_data)):
             logger.debug(f"\tWindow {window_index}")
@@ -125,14 +130,18 @@ class MultiWindowBacktestingModel(AbstractTimeSeriesModel):
                     # Reserve 10% of the remaining time for prediction, use 90% of time for training
                     time_left_for_window = 0.9 * time_left / num_refits_remaining
 
+            warm_start_this_window = refit_this_window and warm_start_windows and model is not None
             if refit_this_window:
+                fit_kwargs = kwargs.copy()
+                if warm_start_this_window:
+                    fit_kwargs["init_model"] = model
                 model = self.get_child_model(window_index)
                 model_fit_start_time = time.time()
                 model.fit(
                     train_data=train_fold,
                     val_data=val_fold,
                     time_limit=time_left_for_window,
-                    **kwargs,
+                    **fit_kwargs,
                 )
                 model.fit_time = time.time() - model_fit_start_time
                 most_recent_refit_window = f"W{window_index}"
@@ -143,7 +152,11 @@ class MultiWindowBacktestingModel(AbstractTimeSeriesModel):
             logger.debug(
                 f"\t\t{model.val_score:<7.4f}".ljust(15) + f"= Validation score ({model.eval_metric.name_with_sign})"
             )
-            logger.debug(f"\t\t{model.fit_time:<7.3f} s".ljust(15) + "= Training runtime")
+            logger.debug(
+                f"\t\t{model.fit_time:<7.3f} s".ljust(15)
+                + "= Training runtime"
+                + (" (warm-started from previous window)" if warm_start_this_window else "")
+            )
             logger.debug(f"\t\t{model.predict_time:<7.3f} s".ljust(15) + "= Prediction runtime")
 
             self.info_per_val_window.append(
@@ -151,6 +164,7 @@ class MultiWindowBacktestingModel(AbstractTimeSeriesModel):
                     "window_index": window_index,
                     "refit_this_window": refit_this_window,
                     "fit_time": model.fit_time if refit_this_window else float("nan"),
+                    "warm_started": warm_start_this_window,
                     "val_score": model.val_score,
                     "predict_time": model.predict_time,
                 }
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import math
@@ -5,10 +6,11 @@ import os
 import pprint
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 
 from autogluon.common.utils.deprecated_utils import Deprecated
 from autogluon.common.utils.log_utils import add_log_to_file, set_logger_verbosity
@@ -419,6 +421,7 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
         num_val_windows: int = 1,
         val_step_size: Optional[int] = None,
         refit_every_n_windows: int = 1,
+        warm_start_windows: bool = False,
         refit_full: bool = False,
         enable_ensemble: bool = True,
         skip_model_selection: bool = False,
@@ -638,6 +641,12 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
 
             If set to ``None``, models will only be fit once for the first (oldest) validation window. By default,
             `refit_every_n_windows=1`, i.e., all models will be refit for each validation window.
+        warm_start_windows : bool, default = False
+            If True, models that support incremental training (currently the GluonTS deep learning models) are
+            initialized from the model fitted on the previous validation window instead of being trained from scratch.
+            Since consecutive windows only differ by ``val_step_size`` time steps, this usually reduces the training
+            time when ``num_val_windows > 1``. The training time for each window is reported under
+            ``info_per_val_window`` in :meth:`~autogluon.timeseries.TimeSeriesPredictor.info`.
         refit_full : bool, default = False
             If True, after training is complete, AutoGluon will attempt to re-train all models using all of training
             data (including the data initially reserved for validation). This argument has no effect if ``tuning_data``
@@ -687,6 +696,7 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
             num_val_windows=num_val_windows,
             val_step_size=val_step_size,
             refit_every_n_windows=refit_every_n_windows,
+            warm_start_windows=warm_start_windows,
             refit_full=refit_full,
             skip_model_selection=skip_model_selection,
             enable_ensemble=enable_ensemble,
@@ -749,6 +759,7 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
             verbosity=verbosity,
             val_splitter=val_splitter,
             refit_every_n_windows=refit_every_n_windows,
+            warm_start_windows=warm_start_windows,
             skip_model_selection=skip_model_selection,
             enable_ensemble=enable_ensemble,
             random_seed=random_seed,
@@ -773,6 +784,8 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
         model: Optional[str] = None,
         use_cache: bool = True,
         random_seed: Optional[int] = 123,
+        batch_items: Optional[int] = None,
+        num_workers: int = 1,
     ) -> TimeSeriesDataFrame:
         """Return quantile and mean forecasts for the given dataset, starting from the end of each time series.
 
@@ -807,6 +820,15 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
         use_cache : bool, default = True
             If True, will attempt to use the cached predictions. If False, cached predictions will be ignored.
             This argument is ignored if ``cache_predictions`` was set to False when creating the ``TimeSeriesPredictor``.
+        batch_items : int, optional
+            If provided, the time series are split into shards of ``batch_items`` items that are predicted separately.
+            This bounds the peak memory usage of the models (e.g., the sampled paths of probabilistic models) when
+            predicting a large number of time series. Cached predictions are not used in this mode.
+        num_workers : int, default = 1
+            Number of worker processes used to predict the shards in parallel. Each worker loads the predictor saved in
+            ``self.path`` once and reuses it for all shards assigned to it. Set to -1 to use all CPU cores.
+            If ``num_workers != 1`` and ``batch_items`` is not provided, the time series are split into one shard per
+            worker.
 
 
         Examples
@@ -842,15 +864,174 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
         data = self._check_and_prepare_data_frame(data)
         if known_covariates is not None:
             known_covariates = self._to_data_frame(known_covariates)
-        predictions = self._learner.predict(
-            data,
-            known_covariates=known_covariates,
-            model=model,
-            use_cache=use_cache,
-            random_seed=random_seed,
-        )
+        if batch_items is None and num_workers != 1:
+            batch_items = math.ceil(data.num_items / effective_n_jobs(num_workers))
+        if batch_items is None:
+            predictions = self._learner.predict(
+                data,
+                known_covariates=known_covariates,
+                model=model,
+                use_cache=use_cache,
+                random_seed=random_seed,
+            )
+        else:
+            predictions = self._predict_sharded(
+                data,
+                known_covariates=known_covariates,
+                model=model,
+                random_seed=random_seed,
+                batch_items=batch_items,
+                num_workers=num_workers,
+            )
+        if predictions.item_ids.equals(original_item_id_order):
+            return predictions
         return predictions.reindex(original_item_id_order, level=ITEMID)
 
+    def _predict_sharded(
+        self,
+        data: TimeSeriesDataFrame,
+        known_covariates: Optional[TimeSeriesDataFrame],
+        model: Optional[str],
+        random_seed: Optional[int],
+        batch_items: int,
+        num_workers: int = 1,
+    ) -> TimeSeriesDataFrame:
+        """Predict shards of ``batch_items`` consecutive items separately, possibly in multiple worker processes."""
+        if batch_items < 1:
+            raise ValueError(f"batch_items must be a positive integer (received {batch_items})")
+        num_shards = math.ceil(data.num_items / batch_items)
+        shard_bounds = [(i * batch_items, min((i + 1) * batch_items, data.num_items)) for i in range(num_shards)]
+        # data is sorted by item_id, so the rows of each shard are a contiguous slice
+        indptr = np.concatenate([[0], np.cumsum(data.num_timesteps_per_item().to_numpy())])
+        data_shards = []
+        for start, end in shard_bounds:
+            shard = data.iloc[indptr[start] : indptr[end]]
+            shard.static_features = data.static_features
+            data_shards.append(shard)
+
+        if known_covariates is not None:
+            # Assign each row of known_covariates to the shard of its item with a single pass over the data
+            item_position = data.item_ids.get_indexer(known_covariates.index.get_level_values(ITEMID))
+            row_shard = np.where(item_position >= 0, item_position // batch_items, -1)
+            order = np.argsort(row_shard, kind="stable")
+            counts = np.bincount(row_shard[row_shard >= 0], minlength=num_shards)
+            offset = int((row_shard < 0).sum())
+            known_covariates_shards = []
+            for count in counts:
+                known_covariates_shards.append(known_covariates.iloc[order[offset : offset + count]])
+                offset += count
+        else:
+            known_covariates_shards = [None] * num_shards
+
+        if num_workers == 1 or num_shards == 1:
+            predictions = [
+                self._learner.predict(
+                    shard,
+                    known_covariates=shard_known_covariates,
+                    model=model,
+                    use_cache=False,
+                    random_seed=random_seed,
+                )
+                for shard, shard_known_covariates in zip(data_shards, known_covariates_shards)
+            ]
+        else:
+            if not os.path.exists(os.path.join(self.path, self.predictor_file_name)):
+                raise AssertionError("Predictor must be saved to disk before predicting with num_workers > 1.")
+            # Workers load the persisted predictor instead of receiving a pickled copy of the models with each shard
+            predictions = Parallel(n_jobs=num_workers, backend="loky")(
+                delayed(_predict_shard_with_saved_predictor)(
+                    self.path, shard, shard_known_covariates, model=model, random_seed=random_seed
+                )
+                for shard, shard_known_covariates in zip(data_shards, known_covariates_shards)
+            )
+        return TimeSeriesDataFrame(pd.concat(predictions, copy=False))
+
+    def predict_to_parquet(
+        self,
+        data: Union[Iterable[TimeSeriesDataFrame], Path, str],
+        path: Union[Path, str],
+        known_covariates: Optional[Union[TimeSeriesDataFrame, pd.DataFrame, Path, str]] = None,
+        model: Optional[str] = None,
+        random_seed: Optional[int] = 123,
+        num_items_per_chunk: int = 10_000,
+    ) -> List[str]:
+        """Generate forecasts for a dataset that does not fit into memory and write them to disk, one chunk of time
+        series at a time.
+
+        Each chunk of the data is preprocessed and forecast independently, and the predictions for each chunk are
+        written to a separate Parquet file in ``path`` as soon as they are available. Only a single chunk of the data
+        and its predictions are kept in memory at any time. Requires ``pyarrow``.
+
+        Parameters
+        ----------
+        data : Union[Iterable[TimeSeriesDataFrame], Path, str]
+            Time series data to forecast with, either as an iterable over ``TimeSeriesDataFrame`` chunks (e.g., as
+            returned by :meth:`~autogluon.timeseries.TimeSeriesDataFrame.iter_from_parquet`), or a path to a
+            (possibly partitioned) Parquet dataset that will be read lazily with
+            :meth:`~autogluon.timeseries.TimeSeriesDataFrame.iter_from_parquet`.
+
+            Each time series must be fully contained in a single chunk. See :meth:`predict` for the requirements on the
+            contents of the data.
+        path : Union[Path, str]
+            Directory where the predictions will be saved. Predictions for the i-th chunk are saved to
+            ``part-{i:05d}.parquet`` with columns ``item_id``, ``timestamp``, ``mean`` and the quantile levels.
+        known_covariates : Union[TimeSeriesDataFrame, pd.DataFrame, Path, str], optional
+            Values of the known covariates during the forecast horizon for all time series in ``data``. See
+            :meth:`predict` for more details. The rows corresponding to the items in each chunk are passed to the
+            models together with the chunk.
+        model : str, optional
+            Name of the model that you would like to use for prediction. By default, the best model during training
+            (with highest validation score) will be used.
+        random_seed : int or None, default = 123
+            If provided, fixes the seed of the random number generator for all models before predicting each chunk.
+        num_items_per_chunk : int, default = 10000
+            Number of time series per chunk if ``data`` is provided as a path.
+
+        Returns
+        -------
+        paths : List[str]
+            Paths to the saved prediction files, one for each chunk of the data.
+        """
+        if isinstance(data, (str, Path)):
+            data = TimeSeriesDataFrame.iter_from_parquet(data, num_items_per_chunk=num_items_per_chunk)
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        output_paths = []
+        for chunk_idx, predictions in enumerate(
+            self._predict_in_chunks(data, known_covariates=known_covariates, model=model, random_seed=random_seed)
+        ):
+            output_path = str(path / f"part-{chunk_idx:05d}.parquet")
+            pd.DataFrame(predictions).reset_index().to_parquet(output_path, index=False)
+            logger.debug(f"Saved predictions for {predictions.num_items} time series to {output_path}")
+            output_paths.append(output_path)
+        return output_paths
+
+    def _predict_in_chunks(
+        self,
+        data: Iterable[TimeSeriesDataFrame],
+        known_covariates: Optional[Union[TimeSeriesDataFrame, pd.DataFrame, Path, str]] = None,
+        model: Optional[str] = None,
+        random_seed: Optional[int] = 123,
+    ) -> Iterator[TimeSeriesDataFrame]:
+        """Generate predictions for each chunk of the data separately."""
+        if known_covariates is not None:
+            known_covariates = self._to_data_frame(known_covariates, name="known_covariates")
+        for chunk in data:
+            chunk = self._to_data_frame(chunk)
+            if known_covariates is not None:
+                is_in_chunk = known_covariates.index.get_level_values(ITEMID).isin(chunk.item_ids)
+                chunk_known_covariates = known_covariates[is_in_chunk]
+            else:
+                chunk_known_covariates = None
+            # Predictions for each chunk are computed only once, so caching them would only waste disk space
+            yield self.predict(
+                chunk,
+                known_covariates=chunk_known_covariates,
+                model=model,
+                use_cache=False,
+                random_seed=random_seed,
+            )
+
     def evaluate(
         self,
         data: Union[TimeSeriesDataFrame, pd.DataFrame, Path, str],
@@ -1532,3 +1713,22 @@ class TimeSeriesPredictor(TimeSeriesPredictorDeprecatedMixin):
             handles, labels = axes[0].get_legend_handles_labels()
             fig.legend(handles, labels, bbox_to_anchor=(0.5, 0.0), ncols=len(handles))
         return fig
+
+
+@functools.lru_cache(maxsize=None)
+def _load_predictor_in_worker(path: str) -> "TimeSeriesPredictor":
+    """Load the predictor once per worker process, so that it can be reused for all shards assigned to the worker."""
+    return TimeSeriesPredictor.load(path)
+
+
+def _predict_shard_with_saved_predictor(
+    path: str,
+    data: TimeSeriesDataFrame,
+    known_covariates: Optional[TimeSeriesDataFrame],
+    model: Optional[str] = None,
+    random_seed: Optional[int] = None,
+) -> TimeSeriesDataFrame:
+    predictor = _load_predictor_in_worker(path)
+    return predictor._learner.predict(
+        data, known_covariates=known_covariates, model=model, use_cache=False, random_seed=random_seed
+    )
@@ -12,18 +12,21 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
-from autogluon.common.utils.utils import hash_pandas_df, seed_everything
+from autogluon.common.utils.utils import seed_everything
 from autogluon.core.models import AbstractModel
 from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.core.utils.loaders import load_pkl
 from autogluon.core.utils.savers import save_json, save_pkl
 from autogluon.timeseries import TimeSeriesDataFrame
+from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP
 from autogluon.timeseries.metrics import TimeSeriesScorer, check_get_evaluation_metric
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.models.ensemble import AbstractTimeSeriesEnsembleModel, TimeSeriesGreedyEnsemble
 from autogluon.timeseries.models.presets import contains_searchspace
 from autogluon.timeseries.splitter import AbstractWindowSplitter, ExpandingWindowSplitter
+from autogluon.timeseries.trainer.prediction_cache import PredictionCache, compute_dataset_hash
 from autogluon.timeseries.utils.features import (
+    AbstractFeatureImportanceTransform,
     ConstantReplacementFeatureImportanceTransform,
     CovariateMetadata,
     PermutationFeatureImportanceTransform,
@@ -32,6 +35,10 @@ from autogluon.timeseries.utils.warning_filters import disable_tqdm
 
 logger = logging.getLogger("autogluon.timeseries.trainer")
 
+# Maximum number of rows in the data frame holding the copies of the data with replaced features that are predicted
+# together when computing feature importance
+_MAX_NUM_ROWS_PER_IMPORTANCE_BATCH = 2_000_000
+
 
 # TODO: This class is meant to be moved to `core`, where it will likely
 # TODO: be renamed `AbstractTrainer` and the current `AbstractTrainer`
@@ -244,7 +251,10 @@ class SimpleAbstractTrainer:
 
 
 class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
-    _cached_predictions_filename = "cached_predictions.pkl"
+    _cached_predictions_dirname = "cached_predictions"
+    # Predictions cached by older versions in a single file for all datasets
+    _legacy_cached_predictions_filename = "cached_predictions.pkl"
+    max_cached_predictions_size_bytes: int = 2 * 1024**3
 
     max_rel_importance_score: float = 1e5
     eps_abs_importance_score: float = 1e-5
@@ -261,6 +271,7 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
         verbosity: int = 2,
         val_splitter: Optional[AbstractWindowSplitter] = None,
         refit_every_n_windows: Optional[int] = 1,
+        warm_start_windows: bool = False,
         cache_predictions: bool = True,
         **kwargs,
     ):
@@ -289,12 +300,15 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
         assert isinstance(val_splitter, AbstractWindowSplitter), "val_splitter must be of type AbstractWindowSplitter"
         self.val_splitter = val_splitter
         self.refit_every_n_windows = refit_every_n_windows
+        self.warm_start_windows = warm_start_windows
         self.cache_predictions = cache_predictions
         self.hpo_results = {}
 
-        if self._cached_predictions_path.exists():
-            logger.debug(f"Removing existing cached predictions file {self._cached_predictions_path}")
-            self._cached_predictions_path.unlink()
+        self._prediction_cache.clear()
+        legacy_cached_predictions_path = Path(self.path) / self._legacy_cached_predictions_filename
+        if legacy_cached_predictions_path.exists():
+            logger.debug(f"Removing existing cached predictions file {legacy_cached_predictions_path}")
+            legacy_cached_predictions_path.unlink()
 
     def save_train_data(self, data: TimeSeriesDataFrame, verbose: bool = True) -> None:
         path = os.path.join(self.path_data, "train.pkl")
@@ -436,6 +450,7 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
             verbosity=self.verbosity,
             val_splitter=self.val_splitter,
             refit_every_n_windows=self.refit_every_n_windows,
+            warm_start_windows=self.warm_start_windows,
         )
         return model
 
@@ -463,6 +478,7 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
                 default_num_trials=default_num_trials,
                 val_splitter=self.val_splitter,
                 refit_every_n_windows=self.refit_every_n_windows,
+                warm_start_windows=self.warm_start_windows,
             )
         total_tuning_time = time.time() - tuning_start_time
 
@@ -789,14 +805,17 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
                 use_cache=use_cache,
             )
 
+            # Score all models in a single pass, so that the ground truth is only processed once
+            test_scores = self._score_batch_with_predictions(
+                data, {m: preds for m, preds in model_predictions.items() if preds is not None}
+            )
             for model_name in model_names:
-                model_preds = model_predictions[model_name]
-                if model_preds is None:
+                if model_predictions[model_name] is None:
                     # Model failed at prediction time
                     model_info[model_name]["score_test"] = float("nan")
                     model_info[model_name]["pred_time_test"] = float("nan")
                 else:
-                    model_info[model_name]["score_test"] = self._score_with_predictions(data, model_preds)
+                    model_info[model_name]["score_test"] = test_scores[model_name]
                     model_info[model_name]["pred_time_test"] = pred_time_dict[model_name]
 
         explicit_column_order = [
@@ -918,6 +937,45 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
             seasonal_period=self.eval_metric_seasonal_period,
         )
 
+    def _score_batch_with_predictions(
+        self,
+        data: TimeSeriesDataFrame,
+        model_predictions: Dict[str, TimeSeriesDataFrame],
+        metric: Union[str, TimeSeriesScorer, None] = None,
+    ) -> Dict[str, float]:
+        """Compute the scores of the predictions of multiple models for the same data.
+
+        If the predictions cannot be scored together, each model is scored separately and models whose predictions
+        fail to be scored get a NaN score.
+        """
+        if len(model_predictions) == 0:
+            return {}
+        eval_metric = self.eval_metric if metric is None else check_get_evaluation_metric(metric)
+        prepared_data = eval_metric.prepare(
+            data,
+            prediction_length=self.prediction_length,
+            target=self.target,
+            seasonal_period=self.eval_metric_seasonal_period,
+        )
+        # Predictions with NaNs, a wrong index or missing columns fail the checks of score_batch
+        scoring_errors = (AssertionError, KeyError, ValueError)
+        try:
+            scores = eval_metric.score_batch(prepared_data, list(model_predictions.values()))
+            return dict(zip(model_predictions.keys(), scores.tolist()))
+        except scoring_errors:
+            logger.debug("Failed to score all models together, scoring each model separately")
+            logger.debug(traceback.format_exc())
+
+        scores_dict = {}
+        for model_name, predictions in model_predictions.items():
+            try:
+                scores_dict[model_name] = float(eval_metric.score_batch(prepared_data, [predictions])[0])
+            except scoring_errors:
+                logger.error(f"Model {model_name} failed to score with the following exception:")
+                logger.error(traceback.format_exc())
+                scores_dict[model_name] = float("nan")
+        return scores_dict
+
     def score(
         self,
         data: TimeSeriesDataFrame,
@@ -1005,6 +1063,9 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
         # persist trainer to speed up repeated inference
         persisted_models = self.persist(model_names=[model], with_ancestors=True)
 
+        # override importance for unused features
+        used_features = [feature for feature in features if self._model_uses_feature(model, feature)]
+
         importance_samples = defaultdict(list)
         for n in range(num_iterations):
             if subsample_size < data.num_items:
@@ -1013,24 +1074,21 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
             else:
                 data_sample = data
 
-            base_score = self.evaluate(data=data_sample, model=model, metrics=metric, use_cache=False)[metric.name]
-
-            for feature in features:
-                # override importance for unused features
-                if not self._model_uses_feature(model, feature):
-                    continue
-                else:
-                    data_sample_replaced = importance_transform.transform(data_sample, feature_name=feature)
-                    score = self.evaluate(data=data_sample_replaced, model=model, metrics=metric, use_cache=False)[
-                        metric.name
-                    ]
+            base_score, scores = self._score_with_replaced_features(
+                data=data_sample,
+                model=model,
+                features=used_features,
+                importance_transform=importance_transform,
+                metric=metric,
+            )
 
-                    importance = base_score - score
-                    if relative_scores:
-                        importance /= np.abs(base_score - self.eps_abs_importance_score)
-                        importance = min(self.max_rel_importance_score, importance)
+            for feature in used_features:
+                importance = base_score - scores[feature]
+                if relative_scores:
+                    importance /= np.abs(base_score - self.eps_abs_importance_score)
+                    importance = min(self.max_rel_importance_score, importance)
 
-                    importance_samples[feature].append(importance)
+                importance_samples[feature].append(importance)
 
             if time_limit is not None and time.time() - time_start > time_limit:
                 logger.info(f"Time limit reached, stopping feature importance computation after {n} iterations")
@@ -1053,19 +1111,190 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
 
         return importance_df
 
-    def _model_uses_feature(self, model: Optional[Union[str, AbstractTimeSeriesModel]], feature: str) -> bool:
-        """Check if the given model uses the given feature."""
-        models_with_ancestors = set(self.get_minimum_model_set(model))
+    def _score_with_replaced_features(
+        self,
+        data: TimeSeriesDataFrame,
+        model: str,
+        features: List[str],
+        importance_transform: AbstractFeatureImportanceTransform,
+        metric: TimeSeriesScorer,
+    ) -> Tuple[float, Dict[str, float]]:
+        """Score the model on the data, and on copies of the data where each of the features is replaced with
+        ``importance_transform``.
+
+        Replaced copies of the data for multiple features are stacked along the item axis and forecast with a single
+        call to ``predict`` of each model. Models that do not consume a feature reuse their forecast for the original
+        data instead of predicting on its replaced copy.
 
+        Returns
+        -------
+        base_score : float
+            Score of the model on the original data.
+        scores : Dict[str, float]
+            Score of the model on the data where the given feature was replaced.
+        """
+        model_names = self.get_minimum_model_set(model)
+        model_to_level = self._get_model_levels()
+        model_names = sorted(model_names, key=model_to_level.get)
+        models = {m: self.load_model(m) for m in model_names}
+        ancestors = {m: self.get_minimum_model_set(m, include_self=False) for m in model_names}
+
+        past_data, known_covariates = data.get_model_inputs_for_scoring(
+            prediction_length=self.prediction_length, known_covariates_names=self.metadata.known_covariates
+        )
+        base_pred_dict = self.get_model_pred_dict(
+            model_names=model_names, data=past_data, known_covariates=known_covariates, use_cache=False
+        )
+        prepared_data = metric.prepare(
+            data,
+            prediction_length=self.prediction_length,
+            target=self.target,
+            seasonal_period=self.eval_metric_seasonal_period,
+        )
+        item_ids = data.item_ids
+        num_items = len(item_ids)
+        forecast_index = prepared_data.data_future.index
+        columns = {m: list(base_pred_dict[m].columns) for m in model_names}
+        base_values = {m: self._forecast_to_array(base_pred_dict[m], columns[m], item_ids) for m in model_names}
+        base_score = metric.score_batch(prepared_data, base_values[model][None], columns=columns[model])[0]
+
+        scores = {}
+        batch_size = max(1, _MAX_NUM_ROWS_PER_IMPORTANCE_BATCH // len(data))
+        for batch_start in range(0, len(features), batch_size):
+            batch_features = features[batch_start : batch_start + batch_size]
+            replaced_inputs = [
+                importance_transform.transform(data, feature_name=feature).get_model_inputs_for_scoring(
+                    prediction_length=self.prediction_length, known_covariates_names=self.metadata.known_covariates
+                )
+                for feature in batch_features
+            ]
+
+            # positions of the features in the batch that affect the forecast of each model
+            consumed = {}
+            for m in model_names:
+                consumed[m] = sorted(
+                    set().union(*[consumed[a] for a in ancestors[m]])
+                    | {
+                        k
+                        for k, feature in enumerate(batch_features)
+                        if self._model_consumes_feature(models[m], feature)
+                    }
+                )
+
+            # forecasts of each model for every replaced copy of the data, shape [num_features, num_items * H, C]
+            values = {m: np.repeat(base_values[m][None], len(batch_features), axis=0) for m in model_names}
+            for m in model_names:
+                positions = consumed[m]
+                if len(positions) == 0:
+                    continue
+                if models[m]._get_tags()["predictions_depend_on_item_id"]:
+                    # predict each copy separately so that the model sees the original item_ids
+                    for k in positions:
+                        if ancestors[m]:
+                            model_inputs = {
+                                a: TimeSeriesDataFrame(
+                                    pd.DataFrame(values[a][k], index=forecast_index, columns=columns[a])
+                                )
+                                for a in ancestors[m]
+                            }
+                        else:
+                            model_inputs = replaced_inputs[k][0]
+                        pred = models[m].predict(model_inputs, known_covariates=replaced_inputs[k][1])
+                        values[m][k] = self._forecast_to_array(pred, columns[m], item_ids)
+                else:
+                    # item with position i in the copy k is relabeled as k * num_items + i
+                    new_item_ids = [k * num_items + np.arange(num_items) for k in positions]
+                    if ancestors[m]:
+                        stacked_index = self._stack_index_along_item_axis(forecast_index, item_ids, new_item_ids)
+                        model_inputs = {
+                            a: TimeSeriesDataFrame(
+                                pd.DataFrame(
+                                    values[a][positions].reshape(-1, len(columns[a])),
+                                    index=stacked_index,
+                                    columns=columns[a],
+                                )
+                            )
+                            for a in ancestors[m]
+                        }
+                    else:
+                        model_inputs = self._stack_along_item_axis(
+                            [replaced_inputs[k][0] for k in positions], item_ids, new_item_ids
+                        )
+                    if known_covariates is not None:
+                        stacked_known_covariates = self._stack_along_item_axis(
+                            [replaced_inputs[k][1] for k in positions], item_ids, new_item_ids
+                        )
+                    else:
+                        stacked_known_covariates = None
+                    pred = models[m].predict(model_inputs, known_covariates=stacked_known_covariates)
+                    values[m][positions] = self._forecast_to_array(
+                        pred, columns[m], pd.Index(np.concatenate(new_item_ids))
+                    ).reshape(len(positions), -1, len(columns[m]))
+
+            batch_scores = metric.score_batch(prepared_data, values[model], columns=columns[model])
+            scores.update(zip(batch_features, batch_scores))
+        return base_score, scores
+
+    @staticmethod
+    def _forecast_to_array(forecast: TimeSeriesDataFrame, columns: List[str], item_ids: pd.Index) -> np.ndarray:
+        """Convert the forecast to an array of shape [len(forecast), len(columns)] with the time series ordered as
+        in item_ids.
+        """
+        item_codes = item_ids.get_indexer(forecast.item_ids)
+        row_codes = np.repeat(item_codes, forecast.num_timesteps_per_item().to_numpy())
+        order = np.argsort(row_codes, kind="stable")
+        return forecast[columns].to_numpy(dtype=np.float64)[order]
+
+    @staticmethod
+    def _stack_index_along_item_axis(
+        index: pd.MultiIndex, item_ids: pd.Index, new_item_ids: List[np.ndarray]
+    ) -> pd.MultiIndex:
+        """Repeat the index once per entry of new_item_ids, relabeling item_ids[i] as new_item_ids[k][i]."""
+        row_codes = item_ids.get_indexer(index.get_level_values(ITEMID))
+        return pd.MultiIndex.from_arrays(
+            [
+                np.concatenate([np.asarray(ids)[row_codes] for ids in new_item_ids]),
+                np.tile(index.get_level_values(TIMESTAMP), len(new_item_ids)),
+            ],
+            names=[ITEMID, TIMESTAMP],
+        )
+
+    @classmethod
+    def _stack_along_item_axis(
+        cls, frames: List[TimeSeriesDataFrame], item_ids: pd.Index, new_item_ids: List[np.ndarray]
+    ) -> TimeSeriesDataFrame:
+        """Concatenate data frames with identical indices along the item axis, relabeling item_ids[i] in frames[k]
+        as new_item_ids[k][i].
+        """
+        index = cls._stack_index_along_item_axis(frames[0].index, item_ids, new_item_ids)
+        df = pd.concat([pd.DataFrame(frame).reset_index(drop=True) for frame in frames], ignore_index=True)
+        df.index = index
+        static_features = None
+        if frames[0].static_features is not None:
+            static_features = pd.concat(
+                [
+                    frame.static_features.set_axis(np.asarray(ids)[item_ids.get_indexer(frame.static_features.index)])
+                    for frame, ids in zip(frames, new_item_ids)
+                ]
+            )
+            static_features.index.name = ITEMID
+        return TimeSeriesDataFrame(df, static_features=static_features)
+
+    def _model_consumes_feature(self, model: AbstractTimeSeriesModel, feature: str) -> bool:
+        """Check if the given model uses the given feature directly, ignoring its base models."""
         if feature in self.metadata.static_features:
-            return any(self.load_model(m).supports_static_features for m in models_with_ancestors)
+            return model.supports_static_features
         elif feature in self.metadata.known_covariates:
-            return any(self.load_model(m).supports_known_covariates for m in models_with_ancestors)
+            return model.supports_known_covariates
         elif feature in self.metadata.past_covariates:
-            return any(self.load_model(m).supports_past_covariates for m in models_with_ancestors)
-
+            return model.supports_past_covariates
         return False
 
+    def _model_uses_feature(self, model: Optional[Union[str, AbstractTimeSeriesModel]], feature: str) -> bool:
+        """Check if the given model uses the given feature."""
+        models_with_ancestors = set(self.get_minimum_model_set(model))
+        return any(self._model_consumes_feature(self.load_model(m), feature) for m in models_with_ancestors)
+
     def _add_ci_to_feature_importance(
         self, importance_df: pd.DataFrame, confidence_level: float = 0.99
     ) -> pd.DataFrame:
@@ -1219,47 +1448,29 @@ class AbstractTimeSeriesTrainer(SimpleAbstractTrainer):
 
     @property
     def _cached_predictions_path(self) -> Path:
-        return Path(self.path) / self._cached_predictions_filename
+        return Path(self.path) / self._cached_predictions_dirname
+
+    @property
+    def _prediction_cache(self) -> PredictionCache:
+        return PredictionCache(
+            path=str(self._cached_predictions_path), max_size_bytes=self.max_cached_predictions_size_bytes
+        )
 
     @staticmethod
     def _compute_dataset_hash(
         data: TimeSeriesDataFrame, known_covariates: Optional[TimeSeriesDataFrame] = None
     ) -> str:
         """Compute a unique string that identifies the time series dataset."""
-        combined_hash = hash_pandas_df(data) + hash_pandas_df(known_covariates) + hash_pandas_df(data.static_features)
-        return combined_hash
+        return compute_dataset_hash(data, known_covariates=known_covariates)
 
     def _get_cached_pred_dicts(self, dataset_hash: str) -> Tuple[Dict[str, TimeSeriesDataFrame], Dict[str, float]]:
         """Load cached predictions for given dataset_hash from disk, if possible. Otherwise returns empty dicts."""
-        if self._cached_predictions_path.exists():
-            cached_predictions = load_pkl.load(str(self._cached_predictions_path))
-            if dataset_hash in cached_predictions:
-                model_pred_dict = cached_predictions[dataset_hash]["model_pred_dict"]
-                pred_time_dict = cached_predictions[dataset_hash]["pred_time_dict"]
-                if model_pred_dict.keys() == pred_time_dict.keys():
-                    logger.debug(f"Loaded cached predictions for models {list(model_pred_dict.keys())}")
-                    return model_pred_dict, pred_time_dict
-                else:
-                    logger.warning(f"Found corrupted cached predictions in {self._cached_predictions_path}")
-        logger.debug("Found no cached predictions")
-        return {}, {}
+        return self._prediction_cache.get(dataset_hash)
 
     def _save_cached_pred_dicts(
         self, dataset_hash: str, model_pred_dict: Dict[str, TimeSeriesDataFrame], pred_time_dict: Dict[str, float]
     ) -> None:
-        # TODO: Save separate file for each dataset if _cached_predictions file grows large?
-        if self._cached_predictions_path.exists():
-            logger.debug("Extending existing cached predictions")
-            cached_predictions = load_pkl.load(str(self._cached_predictions_path))
-        else:
-            cached_predictions = {}
-        # Do not save results for models that failed
-        cached_predictions[dataset_hash] = {
-            "model_pred_dict": {k: v for k, v in model_pred_dict.items() if v is not None},
-            "pred_time_dict": {k: v for k, v in pred_time_dict.items() if v is not None},
-        }
-        save_pkl.save(str(self._cached_predictions_path), object=cached_predictions)
-        logger.debug(f"Cached predictions saved to {self._cached_predictions_path}")
+        self._prediction_cache.put(dataset_hash, model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
 
     def _merge_refit_full_data(
         self, train_data: TimeSeriesDataFrame, val_data: Optional[TimeSeriesDataFrame]
@@ -0,0 +1,198 @@
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from hashlib import md5
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from pandas.core.util.hashing import combine_hash_arrays, hash_array
+
+from autogluon.common.utils.resource_utils import ResourceManager
+from autogluon.core.utils.loaders import load_pkl
+from autogluon.core.utils.savers import save_pkl
+from autogluon.timeseries import TimeSeriesDataFrame
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """Persistent cache of the predictions made by the models of a trainer, stored in a separate file for each dataset.
+
+    Each file contains the predictions and the prediction times of all models for one dataset hash. Files are written
+    atomically, so that an interrupted write never leaves a corrupted entry behind. Once the total size of the cached
+    files exceeds ``max_size_bytes``, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    path : str
+        Directory where the cached predictions are stored.
+    max_size_bytes : int, default = 2 GiB
+        Maximum total size of the cached predictions. The most recently saved entry is always kept, even if it exceeds
+        this size.
+    """
+
+    _suffix = ".pkl"
+
+    def __init__(self, path: str, max_size_bytes: int = 2 * 1024**3):
+        self.path = Path(path)
+        self.max_size_bytes = max_size_bytes
+
+    def get(self, dataset_hash: str) -> Tuple[Dict[str, TimeSeriesDataFrame], Dict[str, float]]:
+        """Load cached predictions for given dataset_hash from disk, if possible. Otherwise returns empty dicts."""
+        entry_path = self._get_entry_path(dataset_hash)
+        try:
+            cached_predictions = load_pkl.load(str(entry_path), verbose=False)
+        except FileNotFoundError:
+            logger.debug("Found no cached predictions")
+            return {}, {}
+        except (OSError, EOFError, pickle.UnpicklingError):
+            logger.warning(f"Found corrupted cached predictions in {entry_path}")
+            return {}, {}
+        model_pred_dict = cached_predictions["model_pred_dict"]
+        pred_time_dict = cached_predictions["pred_time_dict"]
+        if model_pred_dict.keys() != pred_time_dict.keys():
+            logger.warning(f"Found corrupted cached predictions in {entry_path}")
+            return {}, {}
+        # Record the access time used for LRU eviction
+        self._touch(entry_path)
+        logger.debug(f"Loaded cached predictions for models {list(model_pred_dict.keys())}")
+        return model_pred_dict, pred_time_dict
+
+    def put(
+        self, dataset_hash: str, model_pred_dict: Dict[str, TimeSeriesDataFrame], pred_time_dict: Dict[str, float]
+    ) -> None:
+        """Save predictions for given dataset_hash, replacing the existing entry for this dataset_hash."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        entry_path = self._get_entry_path(dataset_hash)
+        # Do not save results for models that failed
+        cached_predictions = {
+            "model_pred_dict": {k: v for k, v in model_pred_dict.items() if v is not None},
+            "pred_time_dict": {k: v for k, v in pred_time_dict.items() if v is not None},
+        }
+        # Write to a temporary file in the same directory and move it in place, which is atomic
+        fd, temp_path = tempfile.mkstemp(dir=self.path, prefix=f".{dataset_hash}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            save_pkl.save(temp_path, object=cached_predictions, verbose=False)
+            os.replace(temp_path, entry_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._touch(entry_path)
+        logger.debug(f"Cached predictions saved to {entry_path}")
+        self._evict(keep=entry_path)
+
+    def clear(self) -> None:
+        """Remove all cached predictions."""
+        if self.path.exists():
+            logger.debug(f"Removing existing cached predictions in {self.path}")
+            shutil.rmtree(self.path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _get_entry_path(self, dataset_hash: str) -> Path:
+        return self.path / f"{dataset_hash}{self._suffix}"
+
+    @staticmethod
+    def _touch(entry_path: Path) -> None:
+        try:
+            os.utime(entry_path, ns=(time.time_ns(), time.time_ns()))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep: Path) -> None:
+        """Remove least recently used entries until the total size of the cache is below max_size_bytes."""
+        entries = []
+        for entry_path in self.path.glob(f"*{self._suffix}"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if entry_path == keep:
+                continue
+            logger.debug(f"Evicting cached predictions {entry_path}")
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def hash_data_frame(df: Optional[pd.DataFrame], chunk_size: int = 1_000_000, num_cpus: Optional[int] = None) -> str:
+    """Compute a hash string for a pandas DataFrame, independent of the order of its columns.
+
+    Rows are hashed in chunks of ``chunk_size`` rows that are processed in parallel by ``num_cpus`` threads. The values
+    of each index level are hashed only once per unique value, which avoids materializing the index for each row.
+    """
+    hasher = md5()
+    if df is None:
+        hasher.update("0".encode("utf-8"))
+        return hasher.hexdigest()
+
+    df = pd.DataFrame(df)
+    columns = sorted(df.columns, key=str)
+    hasher.update(repr((list(df.index.names), [str(c) for c in columns], len(df))).encode("utf-8"))
+
+    if isinstance(df.index, pd.MultiIndex):
+        index_levels = [_hash_level_values(level) for level in df.index.levels]
+        index_codes = list(df.index.codes)
+    else:
+        index_levels = None
+        index_codes = None
+
+    def hash_chunk(start: int, end: int) -> bytes:
+        if index_levels is not None:
+            hashes = [level_hashes[codes[start:end]] for level_hashes, codes in zip(index_levels, index_codes)]
+        else:
+            hashes = [hash_array(np.asarray(df.index[start:end], dtype=object))]
+        for column in columns:
+            hashes.append(pd.util.hash_pandas_object(df[column].iloc[start:end], index=False).to_numpy())
+        row_hashes = combine_hash_arrays(iter(hashes), len(hashes))
+        return md5(row_hashes.tobytes()).digest()
+
+    chunks: List[Tuple[int, int]] = [
+        (start, min(start + chunk_size, len(df))) for start in range(0, len(df), chunk_size)
+    ]
+    if num_cpus is None:
+        num_cpus = ResourceManager.get_cpu_count()
+    num_cpus = max(1, min(num_cpus, len(chunks)))
+    if num_cpus > 1:
+        chunk_digests = Parallel(n_jobs=num_cpus, prefer="threads")(
+            delayed(hash_chunk)(start, end) for start, end in chunks
+        )
+    else:
+        chunk_digests = [hash_chunk(start, end) for start, end in chunks]
+    for digest in chunk_digests:
+        hasher.update(digest)
+    return hasher.hexdigest()
+
+
+def _hash_level_values(level: pd.Index) -> np.ndarray:
+    """Hash each unique value of an index level. The hash of missing values (code -1) is stored in the last position."""
+    level_hashes = pd.util.hash_pandas_object(level, index=False).to_numpy()
+    missing_hash = hash_array(np.array([None], dtype=object))
+    return np.concatenate([level_hashes, missing_hash])
+
+
+def compute_dataset_hash(
+    data: TimeSeriesDataFrame, known_covariates: Optional[TimeSeriesDataFrame] = None, num_cpus: Optional[int] = None
+) -> str:
+    """Compute a unique string that identifies the time series dataset."""
+    static_features = data.static_features if isinstance(data, TimeSeriesDataFrame) else None
+    return (
+        hash_data_frame(data, num_cpus=num_cpus)
+        + hash_data_frame(known_covariates, num_cpus=num_cpus)
+        + hash_data_frame(static_features, num_cpus=num_cpus)
+    )
@@ -1,5 +1,5 @@
 import warnings
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
@@ -25,16 +25,91 @@ def get_forecast_horizon_index_ts_dataframe(
     Returns a pandas.MultiIndex, where
     - level 0 ("item_id") contains the same item_ids as the input ts_dataframe.
     - level 1 ("timestamp") contains the next prediction_length time steps starting from the end of each time series.
-    """
-    last = ts_dataframe.reset_index()[[ITEMID, TIMESTAMP]].groupby(by=ITEMID, sort=False, as_index=False).last()
-    item_ids = np.repeat(last[ITEMID], prediction_length)
 
+    The result is cached on ts_dataframe and reused while its index stays the same, so that all models predicting on
+    the same data share one computation.
+    """
     if freq is None:
         freq = ts_dataframe.freq
     offset = pd.tseries.frequencies.to_offset(freq)
-    last_ts = pd.DatetimeIndex(last[TIMESTAMP])
+
+    index = ts_dataframe.index
+    cache = ts_dataframe._forecast_horizon_index_cache
+    if cache is None or cache[0] is not index:
+        cache = (index, {})
+        # bypass pandas.DataFrame.__setattr__, which treats new attributes as potential columns
+        object.__setattr__(ts_dataframe, "_forecast_horizon_index_cache", cache)
+    key = (prediction_length, offset)
+    if key not in cache[1]:
+        cache[1][key] = _compute_forecast_horizon_index(ts_dataframe, prediction_length, offset)
+    # shallow copy, so that the cached index is not affected if the names of the returned index are modified in place
+    return cache[1][key].copy()
+
+
+def _compute_forecast_horizon_index(
+    ts_dataframe: TimeSeriesDataFrame, prediction_length: int, offset: pd.DateOffset
+) -> pd.MultiIndex:
+    packed_index = ts_dataframe._get_packed_index()
+    if packed_index is not None:
+        item_ids = packed_index.item_ids
+        last_ts = packed_index.get_last_timestamps()
+    else:
+        last = ts_dataframe.reset_index()[[ITEMID, TIMESTAMP]].groupby(by=ITEMID, sort=False, as_index=False).last()
+        item_ids = pd.Index(last[ITEMID])
+        last_ts = pd.DatetimeIndex(last[TIMESTAMP])
+    timestamps = _get_forecast_timestamps(last_ts, prediction_length, offset)
+
+    # Build the index from codes, so that the item_ids are factorized once per item and not once per row
+    item_level = item_ids.sort_values()
+    item_codes = np.repeat(item_level.get_indexer(item_ids), prediction_length)
+    timestamp_codes, timestamp_level = pd.factorize(timestamps, sort=True)
+    return pd.MultiIndex(
+        levels=[item_level, timestamp_level],
+        codes=[item_codes, timestamp_codes],
+        names=[ITEMID, TIMESTAMP],
+        verify_integrity=False,
+    )
+
+
+def _get_forecast_timestamps(last_ts: pd.DatetimeIndex, prediction_length: int, offset: pd.DateOffset) -> np.ndarray:
+    """Timestamps of the next prediction_length time steps after each of last_ts, flattened in item-major order."""
+    if isinstance(offset, pd.offsets.Tick) and last_ts.tz is None:
+        # Fixed frequencies correspond to a constant number of time units, so timestamps can be computed with integers
+        unit = last_ts.unit
+        step = pd.Timedelta(offset).as_unit(unit)
+        if step == pd.Timedelta(offset):
+            steps = step._value * np.arange(1, prediction_length + 1, dtype=np.int64)
+            timestamps = last_ts.asi8[:, None] + steps[None, :]
+            return timestamps.ravel().view(last_ts.dtype)
     # Non-vectorized offsets like BusinessDay may produce a PerformanceWarning - we filter them
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=pd.errors.PerformanceWarning)
-        timestamps = np.dstack([last_ts + step * offset for step in range(1, prediction_length + 1)]).ravel()
-    return pd.MultiIndex.from_arrays([item_ids, timestamps], names=[ITEMID, TIMESTAMP])
+        return np.dstack([last_ts + step * offset for step in range(1, prediction_length + 1)]).ravel()
+
+
+def get_quantiles_from_samples(samples: np.ndarray, quantile_levels: List[float], axis: int = -1) -> np.ndarray:
+    """Compute the quantiles of the samples along the given axis, equivalent to
+    ``np.quantile(samples, quantile_levels, axis=axis)`` with the default linear interpolation.
+
+    Sorting the samples once and interpolating between the neighboring order statistics is much faster than the
+    partitioning used by ``np.quantile`` when computing multiple quantiles of many small arrays.
+
+    Returns
+    -------
+    quantiles : np.ndarray
+        Array of shape [len(quantile_levels), *samples.shape without axis].
+    """
+    sorted_samples = np.sort(np.moveaxis(samples, axis, -1), axis=-1)
+    num_samples = sorted_samples.shape[-1]
+    virtual_indices = np.asarray(quantile_levels, dtype=np.float64) * (num_samples - 1)
+    prev_indices = np.floor(virtual_indices).astype(np.int64)
+    next_indices = np.minimum(prev_indices + 1, num_samples - 1)
+    gamma = virtual_indices - prev_indices
+    prev_values = sorted_samples[..., prev_indices]
+    next_values = sorted_samples[..., next_indices]
+    # Same interpolation formula as np.quantile, which is numerically stable for gamma close to 0 and 1
+    diff = next_values - prev_values
+    quantiles = np.where(gamma >= 0.5, next_values - diff * (1 - gamma), prev_values + diff * gamma)
+    # NaNs are sorted to the end, np.quantile returns NaN for all quantiles of samples containing NaN
+    quantiles[np.isnan(sorted_samples[..., -1])] = np.nan
+    return np.moveaxis(quantiles, -1, 0)
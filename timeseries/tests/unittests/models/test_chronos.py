@@ -1,16 +1,22 @@
+import time
 from typing import Optional
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 
 from autogluon.core.utils.exceptions import TimeLimitExceeded
-from autogluon.timeseries import TimeSeriesPredictor
+from autogluon.timeseries import TimeSeriesDataFrame, TimeSeriesPredictor
 from autogluon.timeseries.models import ChronosModel
+from autogluon.timeseries.models.chronos.pipeline import trim_left_padding
 from autogluon.timeseries.models.chronos.utils import (
     ChronosInferenceDataLoader,
     ChronosInferenceDataset,
+    LengthBucketedBatchSampler,
     timeout_callback,
+    trim_padding_collate_fn,
 )
 
 from ..common import (
@@ -196,6 +202,122 @@ def test_when_inference_dataset_initialized_then_indptr_set_correctly(item_id_to
     assert inference_dataset.indptr.tolist() == expected_indptr
 
 
+def test_when_length_bucketed_batch_sampler_used_then_batches_contain_series_of_similar_length():
+    data = get_data_frame_with_variable_lengths({"A": 3, "B": 30, "C": 5, "D": 40, "E": 2})
+    inference_dataset = ChronosInferenceDataset(data, context_length=32)
+    batch_sampler = LengthBucketedBatchSampler(inference_dataset.get_context_lengths(), batch_size=2)
+    loader = ChronosInferenceDataLoader(
+        inference_dataset, batch_sampler=batch_sampler, collate_fn=trim_padding_collate_fn
+    )
+
+    assert inference_dataset.get_context_lengths().tolist() == [3, 30, 5, 32, 2]
+    assert list(batch_sampler) == [[4, 0], [2, 1], [3]]
+    assert [batch.shape for batch in loader] == [(2, 3), (2, 30), (1, 32)]
+
+
+@pytest.mark.parametrize(
+    "context, expected_length",
+    [
+        ([[np.nan, np.nan, 1.0, 2.0], [np.nan, 3.0, np.nan, 4.0]], 3),
+        ([[1.0, 2.0], [np.nan, 3.0]], 2),
+        ([[np.nan, np.nan], [np.nan, np.nan]], 1),
+    ],
+)
+def test_when_padding_trimmed_then_only_padding_shared_by_all_series_is_removed(context, expected_length):
+    context = np.array(context, dtype=np.float32)
+    collated = trim_padding_collate_fn(list(context))
+    assert collated.shape == (2, expected_length)
+    np.testing.assert_array_equal(collated.numpy(), context[:, -expected_length:])
+    if not np.isnan(context).all():
+        np.testing.assert_array_equal(trim_left_padding(torch.from_numpy(context)).numpy(), collated.numpy())
+
+
+@pytest.mark.parametrize("prediction_length", [5, 70])
+def test_given_left_padded_context_when_predicting_then_predictions_match_unpadded_context(
+    hf_model_path, prediction_length
+):
+    model = ChronosModel(hyperparameters={"model_path": hf_model_path, "device": "cpu"})
+    model.persist()
+    context = torch.arange(1, 31, dtype=torch.float32)
+    padded_context = torch.cat([torch.full((100,), torch.nan), context])
+
+    predictions = []
+    for c in [context, padded_context]:
+        torch.manual_seed(123)
+        predictions.append(
+            model.model_pipeline.predict(
+                c, prediction_length=prediction_length, num_samples=3, limit_prediction_length=False
+            )
+        )
+    torch.testing.assert_close(*predictions)
+
+
+def test_given_variable_length_data_when_predicting_then_predictions_are_in_original_item_order(hf_model_path):
+    levels = {"A": 1.0, "B": 1000.0, "C": 10.0, "D": 100.0, "E": 10000.0}
+    lengths = {"A": 50, "B": 5, "C": 30, "D": 10, "E": 40}
+    data = TimeSeriesDataFrame(
+        pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "item_id": item_id,
+                        "timestamp": pd.date_range("2022-01-01", periods=lengths[item_id], freq="D"),
+                        "target": level,
+                    }
+                )
+                for item_id, level in levels.items()
+            ]
+        )
+    )
+    model = ChronosModel(
+        prediction_length=3, hyperparameters={"model_path": hf_model_path, "device": "cpu", "batch_size": 2}
+    )
+    model.persist()
+
+    def predict_last_value(context, prediction_length, num_samples, **kwargs):
+        return context[:, -1:, None].expand(-1, num_samples, prediction_length)
+
+    with mock.patch.object(model.model_pipeline, "predict", side_effect=predict_last_value):
+        predictions = model.predict(data)
+
+    assert all(predictions.item_ids == data.item_ids)
+    np.testing.assert_array_equal(predictions["mean"].to_numpy(), np.repeat(list(levels.values()), 3))
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("model_path", ["tiny", "mini"])
+def test_chronos_cpu_inference_throughput(model_path):
+    rng = np.random.default_rng(0)
+    num_items = 256
+    lengths = rng.integers(10, 512, size=num_items)
+    data = TimeSeriesDataFrame(
+        pd.DataFrame(
+            {
+                "item_id": np.repeat(np.arange(num_items), lengths),
+                "timestamp": np.concatenate([pd.date_range("2022-01-01", periods=n, freq="D") for n in lengths]),
+                "target": rng.normal(size=lengths.sum()).cumsum(),
+            }
+        )
+    )
+    print(f"\nChronos-{model_path} CPU throughput (series/sec) for {num_items} series of length 10 to 512")
+    for context_length in [64, 256, 512]:
+        for batch_size in [8, 32, 128]:
+            model = ChronosModel(
+                prediction_length=24,
+                hyperparameters={
+                    "model_path": model_path,
+                    "device": "cpu",
+                    "batch_size": batch_size,
+                    "context_length": context_length,
+                },
+            )
+            model.persist()
+            start_time = time.time()
+            model.predict(data)
+            throughput = num_items / (time.time() - start_time)
+            print(f"context_length={context_length:<4} batch_size={batch_size:<4} {throughput:8.1f}")
+
+
 @pytest.mark.parametrize("data", DATASETS)
 def test_when_cpu_models_saved_then_models_can_be_loaded_and_inferred(data, default_chronos_tiny_model):
     default_chronos_tiny_model.save()
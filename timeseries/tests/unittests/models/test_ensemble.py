@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
+from autogluon.timeseries.metrics import check_get_evaluation_metric
 from autogluon.timeseries.models import ETSModel
-from autogluon.timeseries.models.ensemble.greedy_ensemble import TimeSeriesGreedyEnsemble
+from autogluon.timeseries.models.ensemble.greedy_ensemble import TimeSeriesEnsembleSelection, TimeSeriesGreedyEnsemble
 
 from ..common import DUMMY_TS_DATAFRAME
 
@@ -14,3 +16,16 @@ def test_when_some_base_models_fail_during_prediction_then_ensemble_raises_runti
     ets_preds = ets.predict(DUMMY_TS_DATAFRAME)
     with pytest.raises(RuntimeError):
         ensemble.predict(data={"ARIMA": None, "ETS": ets_preds})
+
+
+def test_when_sample_weight_provided_then_ensemble_selection_raises_value_error():
+    ets = ETSModel(prediction_length=1, freq=DUMMY_TS_DATAFRAME.freq)
+    ets.fit(train_data=DUMMY_TS_DATAFRAME, hyperparameters={"maxiter": 1, "seasonal": None})
+    ets_preds = ets.predict(DUMMY_TS_DATAFRAME)
+    ensemble_selection = TimeSeriesEnsembleSelection(ensemble_size=5, metric=check_get_evaluation_metric("MASE"))
+    with pytest.raises(ValueError, match="sample_weight"):
+        ensemble_selection.fit(
+            predictions=[[ets_preds]],
+            labels=[DUMMY_TS_DATAFRAME],
+            sample_weight=np.ones(len(ets_preds)),
+        )
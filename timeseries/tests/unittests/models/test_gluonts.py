@@ -4,6 +4,7 @@ from unittest import mock
 import numpy as np
 import pandas as pd
 import pytest
+from gluonts.model.forecast import QuantileForecast, SampleForecast
 from gluonts.model.predictor import Predictor as GluonTSPredictor
 
 from autogluon.timeseries.models.gluonts import (
@@ -146,7 +147,7 @@ def test_given_fit_with_static_features_when_predicting_then_static_features_are
     with mock.patch(predictor_method) as mock_predict:
         try:
             model.predict(df)
-        except IndexError:  # expected because of mock
+        except ValueError:  # expected because of mock
             pass
         finally:
             gluonts_dataset = mock_predict.call_args[1]["dataset"]
@@ -409,3 +410,58 @@ def test_when_covariates_are_preprocessed_then_correct_transform_type_is_used():
     normal_pipeline, skewed_pipeline = pipeline.transformers
     assert normal_pipeline[-1] == ["normal"]
     assert skewed_pipeline[-1] == ["skewed"]
+
+
+@pytest.mark.parametrize("forecast_type", ["sample", "quantile"])
+def test_when_forecasts_are_not_sorted_then_stacked_forecasts_follow_order_of_forecast_index(forecast_type):
+    model = DeepARModel(prediction_length=3, quantile_levels=[0.1, 0.5, 0.9])
+    forecast_index = DUMMY_TS_DATAFRAME.slice_by_timestep(-3, None).index
+    item_ids = forecast_index.unique(level="item_id")
+    start_date = pd.Period("2020-01-01", freq="D")
+    forecasts = []
+    for item_id in item_ids[::-1]:
+        # Each forecast is constant and equal to its position in the forecast index
+        value = float(item_ids.get_loc(item_id))
+        if forecast_type == "sample":
+            forecasts.append(SampleForecast(np.full([10, 3], value), start_date=start_date, item_id=str(item_id)))
+        else:
+            forecasts.append(
+                QuantileForecast(
+                    np.full([3, 3], value),
+                    start_date=start_date,
+                    item_id=str(item_id),
+                    forecast_keys=["0.9", "0.1", "0.5"],
+                )
+            )
+    predictions = model._gluonts_forecasts_to_data_frame(iter(forecasts), forecast_index=forecast_index)
+    assert predictions.index.equals(forecast_index)
+    assert list(predictions.columns) == ["mean", "0.1", "0.5", "0.9"]
+    expected_values = np.repeat(np.arange(len(item_ids), dtype=float), 3)
+    for column in predictions.columns:
+        assert np.array_equal(predictions[column].to_numpy(), expected_values)
+
+
+def test_when_init_model_provided_then_training_starts_from_its_network_weights():
+    from gluonts.torch.model.estimator import PyTorchLightningEstimator
+
+    init_model = DeepARModel(freq=DUMMY_TS_DATAFRAME.freq, hyperparameters=DUMMY_HYPERPARAMETERS)
+    init_model.fit(train_data=DUMMY_TS_DATAFRAME)
+    model = DeepARModel(freq=DUMMY_TS_DATAFRAME.freq, hyperparameters=DUMMY_HYPERPARAMETERS)
+    with mock.patch.object(
+        PyTorchLightningEstimator, "train_from", autospec=True, side_effect=PyTorchLightningEstimator.train_from
+    ) as mock_train_from:
+        model.fit(train_data=DUMMY_TS_DATAFRAME, init_model=init_model)
+    assert mock_train_from.call_count == 1
+    assert mock_train_from.call_args[0][1] is init_model.gts_predictor
+
+
+def test_when_init_model_has_different_architecture_then_model_is_trained_from_scratch():
+    from gluonts.torch.model.estimator import PyTorchLightningEstimator
+
+    init_model = DeepARModel(freq=DUMMY_TS_DATAFRAME.freq, hyperparameters={**DUMMY_HYPERPARAMETERS, "hidden_size": 8})
+    init_model.fit(train_data=DUMMY_TS_DATAFRAME)
+    model = DeepARModel(freq=DUMMY_TS_DATAFRAME.freq, hyperparameters={**DUMMY_HYPERPARAMETERS, "hidden_size": 16})
+    with mock.patch.object(PyTorchLightningEstimator, "train_from") as mock_train_from:
+        model.fit(train_data=DUMMY_TS_DATAFRAME, init_model=init_model)
+    assert mock_train_from.call_count == 0
+    assert model.gts_predictor is not None
@@ -1,10 +1,13 @@
 import logging
+import time
 from typing import Dict
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.timeseries import TimeSeriesDataFrame
 from autogluon.timeseries.models.local import (
     ADIDAModel,
@@ -185,6 +188,7 @@ def test_when_fallback_model_disabled_and_model_fails_then_exception_is_raised(t
     )
     model.fit(train_data=DUMMY_TS_DATAFRAME)
     model._predict_with_local_model = failing_predict
+    model._predict_panel = failing_predict
     with pytest.raises(RuntimeError, match="Custom error message"):
         model.predict(DUMMY_TS_DATAFRAME)
 
@@ -196,6 +200,7 @@ def test_when_fallback_model_enabled_and_model_fails_then_no_exception_is_raised
     )
     model.fit(train_data=DUMMY_TS_DATAFRAME)
     model._predict_with_local_model = failing_predict
+    model._predict_panel = failing_predict
     predictions = model.predict(DUMMY_TS_DATAFRAME)
     assert isinstance(predictions, TimeSeriesDataFrame)
 
@@ -408,3 +413,104 @@ def test_when_local_models_fit_then_quantiles_are_present_and_ranked(model_class
 
     assert set(model.quantile_levels) == set(float(q) for q in quantile_columns)
     assert np.diff(predictions[quantile_columns].values, axis=1).min() >= 0
+
+
+@pytest.mark.parametrize("model_class", [NaiveModel, SeasonalNaiveModel, AverageModel, SeasonalAverageModel])
+@pytest.mark.parametrize("seasonal_period", [1, 3, 12])
+@pytest.mark.parametrize("use_fallback_model", [True, False])
+def test_when_panel_prediction_used_then_predictions_match_predictions_for_each_series(
+    model_class, seasonal_period, use_fallback_model, temp_model_path
+):
+    data = DUMMY_VARIABLE_LENGTH_TS_DATAFRAME.copy()
+    # Time series containing only NaNs receive the dummy forecast
+    data.loc[data.item_ids[0], "target"] = np.nan
+    model = model_class(
+        path=temp_model_path,
+        prediction_length=5,
+        hyperparameters={"seasonal_period": seasonal_period, "n_jobs": 1, "use_fallback_model": use_fallback_model},
+        freq=data.freq,
+    )
+    assert model.supports_panel_prediction
+    model.fit(train_data=data)
+
+    predictions_panel = model._predict_all_series_at_once(data)
+    predictions_each_series = model._predict_each_series(data)
+    assert (predictions_panel.columns == predictions_each_series.columns).all()
+    assert np.allclose(predictions_panel.values, predictions_each_series.values, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("model_class", [ETSModel, ThetaModel, NPTSModel])
+def test_when_series_predicted_in_chunks_in_parallel_then_predictions_match_sequential_prediction(
+    model_class, temp_model_path
+):
+    data = DUMMY_VARIABLE_LENGTH_TS_DATAFRAME.copy()
+    data.loc[data.item_ids[0], "target"] = np.nan
+    predictions = {}
+    for n_jobs in [1, 2]:
+        model = model_class(
+            path=temp_model_path, prediction_length=3, freq=data.freq, hyperparameters={"n_jobs": n_jobs}
+        )
+        model.fit(train_data=data)
+        with mock.patch("autogluon.timeseries.models.local.abstract_local_model._MAX_NUM_ITEMS_PER_CHUNK", 2):
+            predictions[n_jobs] = model.predict(data)
+    assert predictions[1].index.equals(predictions[2].index)
+    if model_class is not NPTSModel:
+        # NPTS draws random samples, so its forecasts differ between calls
+        assert np.allclose(predictions[1], predictions[2])
+
+
+def test_when_time_limit_exceeded_then_no_new_chunks_are_started(temp_model_path):
+    data = DUMMY_TS_DATAFRAME
+    model = ETSModel(path=temp_model_path, prediction_length=3, freq=data.freq, hyperparameters={"n_jobs": 1})
+    model.fit(train_data=data)
+    patch_chunk_size = mock.patch("autogluon.timeseries.models.local.abstract_local_model._MAX_NUM_ITEMS_PER_CHUNK", 1)
+    patch_predict_wrapper = mock.patch.object(model, "_predict_wrapper", wraps=model._predict_wrapper)
+    with patch_chunk_size, patch_predict_wrapper as mock_predict_wrapper, pytest.raises(TimeLimitExceeded):
+        model._predict_each_series(data, time_limit=0)
+    assert mock_predict_wrapper.call_count == 0
+
+
+def test_when_time_limit_exceeded_during_chunk_then_remaining_series_are_not_predicted(temp_model_path):
+    data = DUMMY_TS_DATAFRAME
+    model = ETSModel(path=temp_model_path, prediction_length=3, freq=data.freq, hyperparameters={"n_jobs": 1})
+    model.fit(train_data=data)
+    target, timestamps, indptr = model._get_packed_target_and_timestamps(data)
+    assert len(indptr) - 1 > 2
+
+    predict_wrapper = model._predict_wrapper
+
+    def slow_predict_wrapper(time_series):
+        time.sleep(0.5)
+        return predict_wrapper(time_series)
+
+    patch_predict_wrapper = mock.patch.object(model, "_predict_wrapper", side_effect=slow_predict_wrapper)
+    with patch_predict_wrapper as mock_predict_wrapper, pytest.raises(TimeLimitExceeded):
+        model._predict_chunk(target, timestamps, indptr, end_time=time.time() + 0.25)
+    # The deadline passed while the first time series was predicted, so the remaining ones in the chunk are skipped
+    assert mock_predict_wrapper.call_count == 1
+
+
+def test_when_time_limit_exceeded_then_panel_prediction_is_not_started(temp_model_path):
+    data = DUMMY_TS_DATAFRAME
+    model = NaiveModel(path=temp_model_path, prediction_length=3, freq=data.freq)
+    model.fit(train_data=data)
+    patch_predict_panel = mock.patch.object(model, "_predict_panel", wraps=model._predict_panel)
+    with patch_predict_panel as mock_predict_panel, pytest.raises(TimeLimitExceeded):
+        model.predict(data, time_limit=0)
+    assert mock_predict_panel.call_count == 0
+
+
+def test_when_time_limit_exceeded_during_panel_prediction_then_fallback_forecast_is_not_computed(temp_model_path):
+    data = DUMMY_TS_DATAFRAME
+    model = NaiveModel(path=temp_model_path, prediction_length=3, freq=data.freq)
+    model.fit(train_data=data)
+
+    def slow_failing_predict_panel(*args, **kwargs):
+        time.sleep(0.5)
+        raise RuntimeError
+
+    patch_predict_panel = mock.patch.object(model, "_predict_panel", side_effect=slow_failing_predict_panel)
+    patch_fallback = mock.patch("autogluon.timeseries.models.local.abstract_local_model.seasonal_naive_forecast_panel")
+    with patch_predict_panel, patch_fallback as mock_fallback, pytest.raises(TimeLimitExceeded):
+        model.predict(data, time_limit=0.25)
+    assert mock_fallback.call_count == 0
@@ -277,3 +277,51 @@ def test_when_trained_model_moved_to_different_folder_then_loaded_model_can_pred
     loaded_model = model_type.load(os.path.join(new_model_dir, model.name))
     predictions = loaded_model.predict(data)
     assert isinstance(predictions, TimeSeriesDataFrame)
+
+
+@pytest.mark.parametrize("differences", [[], [3], [1, 4]])
+@pytest.mark.parametrize("scaler", ["standard", "mean_abs", None])
+def test_when_direct_tabular_predicts_then_lag_features_match_mlforecast_preprocess(
+    temp_model_path, differences, scaler
+):
+    prediction_length = 4
+    data = get_data_frame_with_variable_lengths({"A": 30, "B": 45, "C": 25}, freq="h")
+    model = DirectTabularModel(
+        path=temp_model_path,
+        freq=data.freq,
+        prediction_length=prediction_length,
+        hyperparameters={"differences": differences, "scaler": scaler, "lags": [1, 2, 5, 12]},
+    )
+    model.fit(train_data=data)
+
+    future_index = get_forecast_horizon_index_ts_dataframe(data, prediction_length, freq=data.freq)
+    data_future = pd.DataFrame({"target": float("inf")}, index=future_index)
+    mlforecast_df = model._to_mlforecast_df(pd.concat([data, data_future]), None)
+    expected_df = model._mlf.preprocess(mlforecast_df, dropna=False, static_features=[])
+    expected_df = expected_df.groupby("unique_id", sort=False).tail(prediction_length).replace(float("inf"), np.nan)
+
+    with mock.patch.object(
+        model._mlf.models_["mean"], "predict", wraps=model._mlf.models_["mean"].predict
+    ) as mock_predict:
+        model.predict(data)
+    received_df = mock_predict.call_args[0][0]
+    lag_columns = [f"lag{lag}" for lag in [1, 2, 5, 12]]
+    assert np.allclose(received_df[lag_columns].values, expected_df[lag_columns].values, equal_nan=True)
+    for date_feature in model._mlf.ts.date_features:
+        name = date_feature if isinstance(date_feature, str) else date_feature.__name__
+        assert np.allclose(received_df[name].values, expected_df[name].values)
+
+
+@pytest.mark.parametrize("differences", [[], [3]])
+def test_when_direct_tabular_predicts_then_predictions_do_not_depend_on_item_order(temp_model_path, differences):
+    data = get_data_frame_with_variable_lengths({"A": 30, "B": 45, "C": 25}, freq="h")
+    model = DirectTabularModel(
+        path=temp_model_path, freq=data.freq, prediction_length=4, hyperparameters={"differences": differences}
+    )
+    model.fit(train_data=data)
+    predictions = model.predict(data)
+
+    data_reversed = data.loc[["C", "B", "A"]]
+    predictions_reversed = model.predict(data_reversed)
+    assert predictions_reversed.item_ids.equals(data_reversed.item_ids)
+    assert np.allclose(predictions_reversed.loc[predictions.index], predictions)
@@ -67,3 +67,25 @@ def test_when_saved_model_moved_then_model_can_be_loaded_with_updated_path():
 
     shutil.rmtree(original_path)
     shutil.rmtree(new_path)
+
+
+@pytest.mark.parametrize("warm_start_windows", [True, False])
+def test_when_warm_start_windows_set_then_models_after_first_window_are_warm_started(
+    temp_model_path, warm_start_windows
+):
+    val_splitter = ExpandingWindowSplitter(prediction_length=1, num_val_windows=3)
+    mw_model = get_multi_window_deepar(path=temp_model_path, prediction_length=1, freq=DUMMY_TS_DATAFRAME.freq)
+    mw_model.fit(train_data=DUMMY_TS_DATAFRAME, val_splitter=val_splitter, warm_start_windows=warm_start_windows)
+
+    warm_started = [info["warm_started"] for info in mw_model.info_per_val_window]
+    assert warm_started == [False, warm_start_windows, warm_start_windows]
+
+
+def test_when_base_model_cannot_warm_start_then_warm_start_windows_is_ignored(temp_model_path):
+    val_splitter = ExpandingWindowSplitter(prediction_length=1, num_val_windows=2)
+    mw_model = MultiWindowBacktestingModel(
+        model_base=ETSModel, model_base_kwargs={"prediction_length": 1}, path=temp_model_path, prediction_length=1
+    )
+    mw_model.fit(train_data=DUMMY_TS_DATAFRAME, val_splitter=val_splitter, warm_start_windows=True)
+
+    assert not any(info["warm_started"] for info in mw_model.info_per_val_window)
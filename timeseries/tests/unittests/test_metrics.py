@@ -20,7 +20,13 @@ from gluonts.model.evaluation import evaluate_forecasts
 from gluonts.model.forecast import QuantileForecast
 
 from autogluon.timeseries import TimeSeriesPredictor
-from autogluon.timeseries.metrics import AVAILABLE_METRICS, DEFAULT_METRIC_NAME, check_get_evaluation_metric
+from autogluon.timeseries.metrics import (
+    AVAILABLE_METRICS,
+    DEFAULT_METRIC_NAME,
+    TimeSeriesScorer,
+    check_get_evaluation_metric,
+)
+from autogluon.timeseries.metrics.point import MASE as MASE_AG
 from autogluon.timeseries.metrics.utils import _in_sample_abs_seasonal_error, _in_sample_squared_seasonal_error
 from autogluon.timeseries.models.gluonts.abstract_gluonts import AbstractGluonTSModel
 
@@ -326,3 +332,85 @@ def test_when_better_predictions_passed_to_metric_then_score_improves(metric_nam
     good_score = eval_metric.score(data, predictions + 1, prediction_length=prediction_length)
     bad_score = eval_metric.score(data, predictions + 50, prediction_length=prediction_length)
     assert good_score > bad_score
+
+
+def get_data_and_predictions_for_batch_scoring(prediction_length=5, num_predictions=4):
+    # RMSLE requires non-negative target values and predictions
+    data = DUMMY_TS_DATAFRAME.abs()
+    train, test = data.train_test_split(prediction_length)
+    predictions = [get_prediction_for_df(train, prediction_length).abs() for _ in range(num_predictions)]
+    return test, predictions
+
+
+@pytest.mark.parametrize("metric_name", AVAILABLE_METRICS)
+@pytest.mark.parametrize("seasonal_period", [None, 3])
+def test_when_predictions_scored_in_batch_then_scores_equal_to_scoring_each_prediction(metric_name, seasonal_period):
+    prediction_length = 5
+    eval_metric = check_get_evaluation_metric(metric_name)
+    data, predictions = get_data_and_predictions_for_batch_scoring(prediction_length)
+    prepared_data = eval_metric.prepare(data, prediction_length=prediction_length, seasonal_period=seasonal_period)
+    batch_scores = eval_metric.score_batch(prepared_data, predictions)
+    expected_scores = [
+        eval_metric(data, pred, prediction_length=prediction_length, seasonal_period=seasonal_period)
+        for pred in predictions
+    ]
+    assert np.allclose(batch_scores, expected_scores)
+
+
+@pytest.mark.parametrize("metric_name", AVAILABLE_METRICS)
+def test_when_predictions_scored_in_batch_per_item_then_scores_equal_to_scoring_each_item(metric_name):
+    prediction_length = 5
+    eval_metric = check_get_evaluation_metric(metric_name)
+    data, predictions = get_data_and_predictions_for_batch_scoring(prediction_length)
+    prepared_data = eval_metric.prepare(data, prediction_length=prediction_length)
+    batch_scores = eval_metric.score_batch(prepared_data, predictions, per_item=True)
+    assert batch_scores.shape == (len(predictions), data.num_items)
+    for i, pred in enumerate(predictions):
+        for j, item_id in enumerate(data.item_ids):
+            expected_score = eval_metric(
+                data.loc[[item_id]],
+                pred.loc[[item_id]],
+                prediction_length=prediction_length,
+                seasonal_period=prepared_data.seasonal_period,
+            )
+            assert np.isclose(batch_scores[i, j], expected_score, equal_nan=True)
+
+
+@pytest.mark.parametrize("metric_name", AVAILABLE_METRICS)
+def test_when_predictions_scored_in_batch_as_array_then_scores_equal_to_scoring_data_frames(metric_name):
+    prediction_length = 5
+    eval_metric = check_get_evaluation_metric(metric_name)
+    data, predictions = get_data_and_predictions_for_batch_scoring(prediction_length)
+    prepared_data = eval_metric.prepare(data, prediction_length=prediction_length)
+    array_scores = eval_metric.score_batch(
+        prepared_data, np.stack([pred.to_numpy() for pred in predictions]), columns=list(predictions[0].columns)
+    )
+    assert np.allclose(array_scores, eval_metric.score_batch(prepared_data, predictions))
+
+
+def test_when_custom_metric_does_not_implement_batch_scoring_then_scores_computed_for_each_prediction():
+    class CustomMetric(TimeSeriesScorer):
+        def compute_metric(self, data_future, predictions, target="target", **kwargs):
+            return (data_future[target] - predictions["mean"]).abs().max()
+
+    prediction_length = 5
+    eval_metric = CustomMetric()
+    data, predictions = get_data_and_predictions_for_batch_scoring(prediction_length)
+    prepared_data = eval_metric.prepare(data, prediction_length=prediction_length)
+    batch_scores = eval_metric.score_batch(prepared_data, predictions)
+    expected_scores = [eval_metric(data, pred, prediction_length=prediction_length) for pred in predictions]
+    assert np.allclose(batch_scores, expected_scores)
+
+
+def test_when_subclass_overrides_compute_metric_then_batch_scoring_uses_overridden_method():
+    class CustomMASE(MASE_AG):
+        def compute_metric(self, data_future, predictions, target="target", **kwargs):
+            return 2 * super().compute_metric(data_future, predictions, target=target, **kwargs)
+
+    prediction_length = 5
+    eval_metric = CustomMASE()
+    data, predictions = get_data_and_predictions_for_batch_scoring(prediction_length)
+    prepared_data = eval_metric.prepare(data, prediction_length=prediction_length)
+    batch_scores = eval_metric.score_batch(prepared_data, predictions)
+    expected_scores = [eval_metric(data, pred, prediction_length=prediction_length) for pred in predictions]
+    assert np.allclose(batch_scores, expected_scores)
@@ -21,6 +21,10 @@ from autogluon.timeseries.metrics import DEFAULT_METRIC_NAME
 from autogluon.timeseries.models import DeepARModel, SimpleFeedForwardModel
 from autogluon.timeseries.models.ensemble.greedy_ensemble import TimeSeriesGreedyEnsemble
 from autogluon.timeseries.predictor import TimeSeriesPredictor
+from autogluon.timeseries.utils.features import (
+    ConstantReplacementFeatureImportanceTransform,
+    PermutationFeatureImportanceTransform,
+)
 
 from .common import (
     DATAFRAME_WITH_COVARIATES,
@@ -1586,6 +1590,13 @@ def importance_dataset_and_predictors(request, tmp_path_factory):
     return df_train, predictors
 
 
+def get_mock_scores_with_replaced_features(scores_returned):
+    def side_effect(data, model, features, importance_transform, metric):
+        return scores_returned[0], dict(zip(features, scores_returned[1:]))
+
+    return side_effect
+
+
 @pytest.mark.parametrize("num_iterations", [1, 2, 5])
 @pytest.mark.parametrize("relative_scores", [True, False])
 @pytest.mark.parametrize("method", ["naive", "permutation"])
@@ -1616,9 +1627,9 @@ def test_when_feature_importance_called_with_improvements_then_improvements_are_
     predictor = predictors["all_features"]
 
     with mock.patch(
-        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer.evaluate"
-    ) as mock_evaluate:
-        mock_evaluate.side_effect = [{"MAPE": v} for v in scores_returned] * num_iterations  # baseline, feature
+        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer._score_with_replaced_features"
+    ) as mock_score:
+        mock_score.side_effect = get_mock_scores_with_replaced_features(scores_returned)  # baseline, features
 
         feature_importance = predictor.feature_importance(
             df_train,
@@ -1631,7 +1642,7 @@ def test_when_feature_importance_called_with_improvements_then_improvements_are_
         if relative_scores:
             expected_score /= 0.22
 
-        assert mock_evaluate.call_count == len(scores_returned) * (num_iterations if method == "permutation" else 1)
+        assert mock_score.call_count == (num_iterations if method == "permutation" else 1)
         assert np.allclose(feature_importance["importance"], expected_score, atol=1e-3)
 
 
@@ -1663,11 +1674,9 @@ def test_given_predictor_takes_no_features_when_feature_importance_called_with_i
     predictor = predictors["no_features"]
 
     with mock.patch(
-        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer.evaluate"
-    ) as mock_evaluate:
-        mock_evaluate.side_effect = [
-            {"MAPE": v} for v in scores_returned
-        ] * num_iterations  # baseline, feature taken out
+        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer._score_with_replaced_features"
+    ) as mock_score:
+        mock_score.side_effect = get_mock_scores_with_replaced_features(scores_returned)  # baseline, features
 
         feature_importance = predictor.feature_importance(
             df_train,
@@ -1708,11 +1717,9 @@ def test_given_predictor_takes_known_only_when_feature_importance_called_with_im
     predictor = predictors["no_features"]
 
     with mock.patch(
-        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer.evaluate"
-    ) as mock_evaluate:
-        mock_evaluate.side_effect = [
-            {"MAPE": v} for v in scores_returned
-        ] * num_iterations  # baseline, feature taken out
+        "autogluon.timeseries.trainer.abstract_trainer.AbstractTimeSeriesTrainer._score_with_replaced_features"
+    ) as mock_score:
+        mock_score.side_effect = get_mock_scores_with_replaced_features(scores_returned)  # baseline, features
 
         feature_importance = predictor.feature_importance(
             df_train,
@@ -1729,6 +1736,51 @@ def test_given_predictor_takes_known_only_when_feature_importance_called_with_im
                 assert np.isfinite(importance)
 
 
+@pytest.mark.parametrize("method", ["naive", "permutation"])
+def test_when_replaced_features_scored_in_batch_then_scores_match_evaluating_each_feature(temp_model_path, method):
+    item_id_to_length = {"A": 30, "B": 25, "C": 40}
+    data = get_data_frame_with_variable_lengths(
+        item_id_to_length,
+        static_features=get_static_features(item_id_to_length.keys(), ["feat1", "feat2"]),
+        covariates_names=["cov1", "cov2", "cov3"],
+    )
+    predictor = TimeSeriesPredictor(
+        path=temp_model_path, prediction_length=3, eval_metric="WQL", known_covariates_names=["cov1", "cov2"]
+    ).fit(
+        data,
+        hyperparameters={
+            "DirectTabular": {"model_name": "GBM"},
+            "RecursiveTabular": {"model_name": "GBM"},
+            "SeasonalNaive": {},
+        },
+    )
+    trainer = predictor._trainer
+    importance_transform = {
+        "permutation": PermutationFeatureImportanceTransform,
+        "naive": ConstantReplacementFeatureImportanceTransform,
+    }[method](covariate_metadata=trainer.metadata, prediction_length=trainer.prediction_length, random_seed=123)
+    features = ["cov1", "cov2", "cov3", "feat1", "feat2"]
+
+    for model in trainer.get_model_names():
+        with mock.patch(
+            "autogluon.timeseries.trainer.abstract_trainer._MAX_NUM_ROWS_PER_IMPORTANCE_BATCH", 2 * len(data)
+        ):
+            base_score, scores = trainer._score_with_replaced_features(
+                data,
+                model=model,
+                features=features,
+                importance_transform=importance_transform,
+                metric=trainer.eval_metric,
+            )
+
+        assert np.isclose(base_score, trainer.score(data, model=model, use_cache=False))
+        for feature in features:
+            expected_score = trainer.score(
+                importance_transform.transform(data, feature_name=feature), model=model, use_cache=False
+            )
+            assert np.isclose(scores[feature], expected_score)
+
+
 def test_when_predictor_saved_to_same_directory_then_leaderboard_works(temp_model_path):
     data = DUMMY_TS_DATAFRAME
     old_predictor = TimeSeriesPredictor(path=temp_model_path).fit(data, hyperparameters={"Naive": {}})
@@ -1751,3 +1803,74 @@ def test_when_predictor_saved_to_same_directory_and_loaded_then_number_of_models
         == set(loaded_predictor.model_names())
         == set(hyperparameters).union({"WeightedEnsemble"})
     )
+
+
+@pytest.mark.parametrize("known_covariates_names", [[], ["cov1"]])
+def test_when_predicting_in_chunks_then_predictions_match_predicting_all_items(
+    temp_model_path, known_covariates_names
+):
+    data = get_data_frame_with_variable_lengths(
+        {f"item_{i}": 20 + i for i in range(7)}, covariates_names=known_covariates_names
+    )
+    train_data, known_covariates = data.get_model_inputs_for_scoring(3, known_covariates_names)
+    predictor = TimeSeriesPredictor(
+        path=temp_model_path, prediction_length=3, known_covariates_names=known_covariates_names
+    ).fit(train_data, hyperparameters=DUMMY_HYPERPARAMETERS)
+    item_groups = [train_data.item_ids[:3], train_data.item_ids[3:5], train_data.item_ids[5:]]
+    chunks = [train_data.loc[item_ids] for item_ids in item_groups]
+    chunk_predictions = list(predictor._predict_in_chunks(chunks, known_covariates=known_covariates))
+    assert [pred.item_ids.tolist() for pred in chunk_predictions] == [item_ids.tolist() for item_ids in item_groups]
+    expected = predictor.predict(train_data, known_covariates=known_covariates)
+    pd.testing.assert_frame_equal(pd.concat(chunk_predictions), expected)
+
+
+def test_when_predict_to_parquet_called_then_predictions_are_saved_for_each_chunk(temp_model_path, tmp_path):
+    pytest.importorskip("pyarrow.dataset")
+    data = get_data_frame_with_variable_lengths({f"item_{i}": 20 + i for i in range(7)})
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=3).fit(
+        data, hyperparameters=DUMMY_HYPERPARAMETERS
+    )
+    pd.DataFrame(data).reset_index().to_parquet(tmp_path / "data.parquet")
+    output_paths = predictor.predict_to_parquet(tmp_path / "data.parquet", tmp_path / "preds", num_items_per_chunk=3)
+    assert len(output_paths) == 3
+    predictions = pd.concat([TimeSeriesDataFrame.from_path(p) for p in output_paths])
+    pd.testing.assert_frame_equal(predictions, predictor.predict(data), check_dtype=False)
+
+
+@pytest.mark.parametrize("batch_items", [1, 3, 100])
+@pytest.mark.parametrize("known_covariates_names", [[], ["cov1"]])
+def test_when_predicting_in_shards_then_predictions_match_predicting_all_items(
+    temp_model_path, batch_items, known_covariates_names
+):
+    data = get_data_frame_with_variable_lengths(
+        {f"item_{i}": 20 + i for i in range(7)}, covariates_names=known_covariates_names
+    )
+    train_data, known_covariates = data.get_model_inputs_for_scoring(3, known_covariates_names)
+    predictor = TimeSeriesPredictor(
+        path=temp_model_path, prediction_length=3, known_covariates_names=known_covariates_names
+    ).fit(train_data, hyperparameters=DUMMY_HYPERPARAMETERS)
+    # Use an item order that differs from the sorted order of the data
+    shuffled_data = train_data.loc[train_data.item_ids[::-1]]
+    predictions = predictor.predict(shuffled_data, known_covariates=known_covariates, batch_items=batch_items)
+    expected = predictor.predict(shuffled_data, known_covariates=known_covariates)
+    pd.testing.assert_frame_equal(predictions, expected)
+
+
+def test_when_predicting_in_shards_with_multiple_workers_then_predictions_match_predicting_all_items(temp_model_path):
+    data = get_data_frame_with_variable_lengths({f"item_{i}": 20 + i for i in range(7)})
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=3).fit(
+        data, hyperparameters=DUMMY_HYPERPARAMETERS
+    )
+    predictions = predictor.predict(data, batch_items=2, num_workers=2)
+    pd.testing.assert_frame_equal(predictions, predictor.predict(data))
+
+
+def test_when_num_workers_provided_without_batch_items_then_data_is_split_into_one_shard_per_worker(temp_model_path):
+    data = get_data_frame_with_variable_lengths({f"item_{i}": 20 + i for i in range(7)})
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=3).fit(
+        data, hyperparameters=DUMMY_HYPERPARAMETERS
+    )
+    with mock.patch.object(predictor, "_predict_sharded", wraps=predictor._predict_sharded) as mock_predict_sharded:
+        predictions = predictor.predict(data, num_workers=2)
+    assert mock_predict_sharded.call_args.kwargs["batch_items"] == 4
+    pd.testing.assert_frame_equal(predictions, predictor.predict(data))
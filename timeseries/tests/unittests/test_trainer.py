@@ -17,6 +17,7 @@ from autogluon.timeseries.dataset import TimeSeriesDataFrame
 from autogluon.timeseries.models import DeepARModel, ETSModel
 from autogluon.timeseries.models.ensemble.greedy_ensemble import TimeSeriesGreedyEnsemble
 from autogluon.timeseries.trainer.auto_trainer import AutoTimeSeriesTrainer
+from autogluon.timeseries.trainer.prediction_cache import PredictionCache, hash_data_frame
 
 from .common import DATAFRAME_WITH_COVARIATES, DUMMY_TS_DATAFRAME, dict_equal_primitive, get_data_frame_with_item_index
 
@@ -104,6 +105,25 @@ def test_given_test_data_when_trainer_called_then_leaderboard_is_correct(
     assert np.all(leaderboard["score_test"] < 0)  # all MAPEs should be negative
 
 
+def test_given_predictions_of_one_model_cannot_be_scored_when_leaderboard_called_then_other_models_are_scored(
+    trained_trainers,
+):
+    trainer = trained_trainers[repr({"DeepAR": {"epochs": 1}, "ETS": {}})]
+    test_data = get_data_frame_with_item_index(["A", "B", "C"])
+    get_model_pred_dict = trainer.get_model_pred_dict
+
+    def get_model_pred_dict_with_nan_predictions(*args, **kwargs):
+        model_pred_dict, pred_time_dict = get_model_pred_dict(*args, **kwargs)
+        model_pred_dict["DeepAR"] = model_pred_dict["DeepAR"] * np.nan
+        return model_pred_dict, pred_time_dict
+
+    with mock.patch.object(trainer, "get_model_pred_dict", side_effect=get_model_pred_dict_with_nan_predictions):
+        leaderboard = trainer.leaderboard(test_data).set_index("model")
+
+    assert np.isnan(leaderboard.loc["DeepAR", "score_test"])
+    assert not np.any(np.isnan(leaderboard.drop("DeepAR")["score_test"]))
+
+
 @pytest.mark.parametrize(
     "hyperparameters, expected_board_length",
     zip(TEST_HYPERPARAMETER_SETTINGS, TEST_HYPERPARAMETER_SETTINGS_EXPECTED_LB_LENGTHS),
@@ -568,6 +588,80 @@ def test_given_cache_predictions_is_false_when_calling_get_model_pred_dict_then_
     assert not trainer._cached_predictions_path.exists()
 
 
+def test_given_dfs_are_different_then_different_hash_is_computed(temp_model_path):
+    trainer = AutoTimeSeriesTrainer(path=temp_model_path)
+    df = DATAFRAME_WITH_COVARIATES
+    df_other = DATAFRAME_WITH_COVARIATES.copy()
+    df_other.iloc[-1, 0] += 1.0
+    df_renamed = df.rename(columns={df.columns[0]: "other_name"})
+    assert trainer._compute_dataset_hash(df) != trainer._compute_dataset_hash(df_other)
+    assert trainer._compute_dataset_hash(df) != trainer._compute_dataset_hash(df_renamed)
+    assert trainer._compute_dataset_hash(df) != trainer._compute_dataset_hash(df, known_covariates=df)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1_000_000])
+def test_when_dataset_hash_computed_in_parallel_then_hash_does_not_depend_on_num_cpus(chunk_size):
+    df = DATAFRAME_WITH_COVARIATES
+    assert hash_data_frame(df, chunk_size=chunk_size, num_cpus=1) == hash_data_frame(
+        df, chunk_size=chunk_size, num_cpus=4
+    )
+
+
+def test_given_cache_predictions_is_true_when_predicting_different_datasets_then_predictions_cached_in_separate_files(
+    temp_model_path,
+):
+    trainer = AutoTimeSeriesTrainer(path=temp_model_path)
+    trainer.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+    other_data = DUMMY_TS_DATAFRAME.copy()
+    other_data["target"] += 1.0
+    trainer.predict(DUMMY_TS_DATAFRAME, model="Naive")
+    trainer.predict(other_data, model="Naive")
+    assert len(list(trainer._cached_predictions_path.glob("*.pkl"))) == 2
+    for data in [DUMMY_TS_DATAFRAME, other_data]:
+        model_pred_dict, _ = trainer._get_cached_pred_dicts(trainer._compute_dataset_hash(data))
+        assert list(model_pred_dict.keys()) == ["Naive"]
+
+
+def test_when_prediction_cache_exceeds_max_size_then_least_recently_used_entries_are_evicted(temp_model_path):
+    cache = PredictionCache(path=temp_model_path, max_size_bytes=1)
+    model_pred_dict = {"Naive": DUMMY_TS_DATAFRAME}
+    pred_time_dict = {"Naive": 1.0}
+    cache.put("first", model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
+    cache.max_size_bytes = 10 * (cache.path / "first.pkl").stat().st_size
+    cache.put("second", model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
+    cache.get("first")
+    cache.max_size_bytes = 1
+    cache.put("third", model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
+    assert sorted(p.name for p in cache.path.glob("*.pkl")) == ["third.pkl"]
+
+    cache.max_size_bytes = 2 * (cache.path / "third.pkl").stat().st_size
+    cache.put("fourth", model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
+    cache.get("third")
+    cache.put("fifth", model_pred_dict=model_pred_dict, pred_time_dict=pred_time_dict)
+    assert sorted(p.name for p in cache.path.glob("*.pkl")) == ["fifth.pkl", "third.pkl"]
+
+
+def test_when_saving_to_prediction_cache_fails_then_existing_entry_is_preserved(temp_model_path):
+    cache = PredictionCache(path=temp_model_path)
+    cache.put("hash", model_pred_dict={"Naive": DUMMY_TS_DATAFRAME}, pred_time_dict={"Naive": 1.0})
+    with mock.patch("autogluon.core.utils.savers.save_pkl.save", side_effect=RuntimeError), pytest.raises(
+        RuntimeError
+    ):
+        cache.put("hash", model_pred_dict={"SeasonalNaive": DUMMY_TS_DATAFRAME}, pred_time_dict={"Naive": 1.0})
+    model_pred_dict, _ = cache.get("hash")
+    assert list(model_pred_dict.keys()) == ["Naive"]
+    assert [p.name for p in cache.path.iterdir()] == ["hash.pkl"]
+
+
+@pytest.mark.parametrize("truncate", [True, False])
+def test_when_prediction_cache_entry_is_corrupted_then_cache_returns_empty_dicts(temp_model_path, truncate):
+    cache = PredictionCache(path=temp_model_path)
+    cache.put("hash", model_pred_dict={"Naive": DUMMY_TS_DATAFRAME}, pred_time_dict={"Naive": 1.0})
+    entry_path = cache.path / "hash.pkl"
+    entry_path.write_bytes(entry_path.read_bytes()[:10] if truncate else b"not a pickle")
+    assert cache.get("hash") == ({}, {})
+
+
 @pytest.mark.parametrize("use_test_data", [True, False])
 def test_given_no_models_trained_during_fit_then_empty_leaderboard_returned(use_test_data, temp_model_path):
     trainer = AutoTimeSeriesTrainer(path=temp_model_path)
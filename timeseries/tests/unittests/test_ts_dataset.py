@@ -16,6 +16,7 @@ from autogluon.timeseries.dataset.ts_dataframe import (
     ITEMID,
     TIMESTAMP,
     TimeSeriesDataFrame,
+    _iter_item_groups,
 )
 
 from .common import get_data_frame_with_variable_lengths, to_supported_pandas_freq
@@ -1011,3 +1012,206 @@ def test_when_timestamps_have_datetime64_type_then_tsdf_can_be_constructed(dtype
     df[TIMESTAMP] = df[TIMESTAMP].astype(dtype)
     assert df[TIMESTAMP].dtype == dtype
     TimeSeriesDataFrame.from_data_frame(df)
+
+
+def _get_contiguous_unsorted_data_with_nans(seed: int = 0) -> TimeSeriesDataFrame:
+    rng = np.random.default_rng(seed)
+    dfs = []
+    for item_id in rng.permutation(20):
+        length = int(rng.integers(1, 12))
+        values = rng.normal(size=[length, 2])
+        values[rng.random(size=values.shape) < 0.4] = np.nan
+        df = pd.DataFrame(values, columns=["target", "covariate"])
+        df[ITEMID] = f"item_{item_id}"
+        df[TIMESTAMP] = pd.date_range("2020-01-01", periods=length, freq="D")
+        dfs.append(df)
+    return TimeSeriesDataFrame(pd.concat(dfs))
+
+
+def test_when_items_are_stored_contiguously_then_packed_index_matches_data():
+    data = _get_contiguous_unsorted_data_with_nans()
+    packed_index = data._get_packed_index()
+    assert packed_index is not None
+    assert packed_index.item_ids.equals(data.index.unique(level=ITEMID))
+    assert (packed_index.lengths == data.groupby(level=ITEMID, sort=False).size().values).all()
+    assert (packed_index.timestamps == data.index.get_level_values(TIMESTAMP).asi8).all()
+    # Packed index is cached and reused
+    assert data._get_packed_index() is packed_index
+
+
+def test_when_items_are_not_stored_contiguously_then_packed_index_is_not_used():
+    data = _get_contiguous_unsorted_data_with_nans()
+    shuffled_data = TimeSeriesDataFrame(pd.DataFrame(data).sample(frac=1.0, random_state=0))
+    assert shuffled_data._get_packed_index() is None
+    assert shuffled_data.item_ids.equals(shuffled_data.index.unique(level=ITEMID))
+    assert shuffled_data.num_timesteps_per_item().equals(shuffled_data.groupby(level=ITEMID, sort=False).size())
+
+
+def test_when_index_is_replaced_then_packed_index_is_recomputed():
+    data = _get_contiguous_unsorted_data_with_nans()
+    packed_index = data._get_packed_index()
+    data.index = data.index.set_levels(data.index.levels[0] + "_new", level=ITEMID)
+    assert data._get_packed_index() is not packed_index
+    assert data.item_ids.equals(data.index.unique(level=ITEMID))
+
+
+@pytest.mark.parametrize("start_index", [None, 0, 1, 5, -1, -5, -20, 20])
+@pytest.mark.parametrize("end_index", [None, 0, 1, 5, -1, -5, -20, 20])
+def test_when_packed_index_is_used_then_slice_by_timestep_matches_groupby(start_index, end_index):
+    data = _get_contiguous_unsorted_data_with_nans()
+    result = data.slice_by_timestep(start_index, end_index)
+    expected = data.groupby(level=ITEMID, sort=False, as_index=False).nth(slice(start_index, end_index))
+    pd.testing.assert_frame_equal(pd.DataFrame(result), pd.DataFrame(expected))
+
+
+@pytest.mark.parametrize("method", ["auto", "ffill", "bfill", "interpolate"])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_when_packed_index_is_used_then_fill_missing_values_matches_groupby(method, dtype):
+    data = _get_contiguous_unsorted_data_with_nans().astype(dtype)
+    result = data.fill_missing_values(method=method)
+    grouped_df = pd.DataFrame(data).groupby(level=ITEMID, sort=False, group_keys=False)
+    if method == "ffill":
+        expected = grouped_df.ffill()
+    elif method == "bfill":
+        expected = grouped_df.bfill()
+    elif method == "interpolate":
+        expected = grouped_df.apply(lambda ts: ts.interpolate())
+    else:
+        expected = grouped_df.ffill().groupby(level=ITEMID, sort=False, group_keys=False).bfill()
+    pd.testing.assert_frame_equal(pd.DataFrame(result), expected)
+
+
+def _get_irregular_data_with_categorical_column(seed: int = 0) -> TimeSeriesDataFrame:
+    rng = np.random.default_rng(seed)
+    dfs = []
+    for item_id in range(10):
+        length = int(rng.integers(1, 50))
+        start = pd.Timestamp("2020-01-01 03:17") + pd.Timedelta(minutes=int(rng.integers(0, 100_000)))
+        df = pd.DataFrame({"target": rng.normal(size=length), "category": rng.choice(["a", "b"], size=length)})
+        df.loc[rng.random(length) < 0.2, "target"] = np.nan
+        df[ITEMID] = item_id
+        df[TIMESTAMP] = start + pd.to_timedelta(np.sort(rng.integers(0, 100_000, size=length)), unit="min")
+        dfs.append(df)
+    return TimeSeriesDataFrame(pd.concat(dfs))
+
+
+@pytest.mark.parametrize("freq", ["h", "15min", "D", "W", "ME", "MS", "QE", "7h", "2W"])
+@pytest.mark.parametrize("agg_numeric", ["mean", "sum", "first", "last", "median"])
+@pytest.mark.parametrize("resample_kwargs", [{}, {"closed": "right"}])
+def test_when_convert_frequency_called_then_result_matches_resampling_each_item(freq, agg_numeric, resample_kwargs):
+    data = _get_irregular_data_with_categorical_column()
+    result = data.convert_frequency(freq, agg_numeric=agg_numeric, **resample_kwargs)
+    expected = pd.concat(
+        {
+            item_id: df.droplevel(ITEMID)
+            .resample(freq, **resample_kwargs)
+            .agg({"target": agg_numeric, "category": "first"})
+            for item_id, df in pd.DataFrame(data).groupby(level=ITEMID, sort=False)
+        },
+        names=[ITEMID],
+    )
+    pd.testing.assert_frame_equal(pd.DataFrame(result), expected)
+
+
+def _get_hourly_data_with_different_start_times(seed: int = 0) -> TimeSeriesDataFrame:
+    # pandas fails to resample some hourly series to business hours, these start times and lengths are supported
+    rng = np.random.default_rng(seed)
+    start_times_and_lengths = [
+        ("2020-01-01 00:00", 100),
+        ("2020-01-02 12:00", 50),
+        ("2020-01-05 18:00", 150),
+        ("2020-01-03 07:00", 50),
+    ]
+    dfs = []
+    for item_id, (start, length) in enumerate(start_times_and_lengths):
+        df = pd.DataFrame({"target": rng.normal(size=length), "category": rng.choice(["a", "b"], size=length)})
+        df[ITEMID] = item_id
+        df[TIMESTAMP] = pd.date_range(start, periods=length, freq="h")
+        dfs.append(df)
+    return TimeSeriesDataFrame(pd.concat(dfs))
+
+
+@pytest.mark.parametrize("freq", ["h", "D", "W", "W-WED", "ME", "MS", "QS", "YE", "bh", "B", "SME", "BME", "2ME"])
+def test_when_convert_frequency_called_with_any_offset_then_result_matches_resampling_each_item(freq):
+    data = _get_hourly_data_with_different_start_times()
+    result = data.convert_frequency(freq)
+    expected = pd.concat(
+        {
+            item_id: df.droplevel(ITEMID).resample(freq).agg({"target": "mean", "category": "first"})
+            for item_id, df in pd.DataFrame(data).groupby(level=ITEMID, sort=False)
+        },
+        names=[ITEMID],
+    )
+    pd.testing.assert_frame_equal(pd.DataFrame(result), expected)
+
+
+@pytest.mark.parametrize(
+    "freq, is_vectorized",
+    [("h", True), ("ME", True), ("W-WED", True), ("7h", False), ("2W", False), ("bh", False), ("B", False)],
+)
+def test_when_convert_frequency_called_then_vectorized_implementation_is_used_if_bins_are_same_for_all_items(
+    freq, is_vectorized
+):
+    data = _get_irregular_data_with_categorical_column()
+    result = data._convert_frequency_vectorized(pd.tseries.frequencies.to_offset(freq), aggregation={"target": "mean"})
+    assert (result is not None) == is_vectorized
+
+
+def test_given_items_are_not_stored_contiguously_when_convert_frequency_called_then_result_matches_sorted_data():
+    data = _get_irregular_data_with_categorical_column()
+    shuffled_data = TimeSeriesDataFrame(pd.DataFrame(data).sample(frac=1.0, random_state=0))
+    result = shuffled_data.convert_frequency("h")
+    expected = data.convert_frequency("h")
+    pd.testing.assert_frame_equal(pd.DataFrame(result).sort_index(), pd.DataFrame(expected).sort_index())
+
+
+def _split_into_row_batches(df: pd.DataFrame, batch_size: int) -> Iterable[pd.DataFrame]:
+    for start in range(0, len(df), batch_size):
+        yield df.iloc[start : start + batch_size]
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 30, 1000])
+@pytest.mark.parametrize("num_items_per_chunk", [1, 3, 10])
+def test_when_batches_regrouped_by_items_then_each_chunk_contains_complete_items(batch_size, num_items_per_chunk):
+    df = pd.DataFrame(get_data_frame_with_variable_lengths({f"item_{i}": 2 + 3 * i for i in range(8)})).reset_index()
+    chunks = list(
+        _iter_item_groups(
+            _split_into_row_batches(df, batch_size), item_column=ITEMID, num_items_per_chunk=num_items_per_chunk
+        )
+    )
+    assert all(chunk[ITEMID].nunique() <= num_items_per_chunk for chunk in chunks)
+    assert all(chunk[ITEMID].nunique() == num_items_per_chunk for chunk in chunks[:-1])
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+def test_when_parquet_dataset_read_lazily_then_chunks_match_data(tmp_path):
+    pytest.importorskip("pyarrow.dataset")
+    data = get_data_frame_with_variable_lengths({f"item_{i:02d}": 5 + i for i in range(20)})
+    static_features = pd.DataFrame({"feat": np.arange(20.0)}, index=pd.Index(data.item_ids, name=ITEMID))
+    df = pd.DataFrame(data).reset_index()
+    df["group"] = df[ITEMID].str[-1]
+    df.to_parquet(tmp_path / "data", partition_cols=["group"])
+    static_features.to_parquet(tmp_path / "static.parquet")
+
+    chunks = list(
+        TimeSeriesDataFrame.iter_from_parquet(
+            tmp_path / "data",
+            columns=[ITEMID, TIMESTAMP, "target"],
+            static_features_path=tmp_path / "static.parquet",
+            num_items_per_chunk=3,
+        )
+    )
+    assert all(chunk.num_items <= 3 for chunk in chunks)
+    assert all(chunk["target"].dtype == np.float32 for chunk in chunks)
+    result = pd.concat([pd.DataFrame(chunk) for chunk in chunks]).sort_index()
+    pd.testing.assert_frame_equal(result, pd.DataFrame(data).astype("float32"))
+    for chunk in chunks:
+        assert chunk.static_features.equals(static_features.loc[chunk.item_ids])
+
+
+def test_given_parquet_dataset_is_not_sorted_when_read_lazily_then_exception_is_raised(tmp_path):
+    pytest.importorskip("pyarrow.dataset")
+    data = get_data_frame_with_variable_lengths({f"item_{i:02d}": 5 + i for i in range(20)})
+    pd.DataFrame(data).reset_index().sample(frac=1.0, random_state=0).to_parquet(tmp_path / "data.parquet")
+    with pytest.raises(ValueError, match="must be stored contiguously and sorted by timestamp"):
+        list(TimeSeriesDataFrame.iter_from_parquet(tmp_path / "data.parquet", num_items_per_chunk=3))
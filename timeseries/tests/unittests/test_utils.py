@@ -1,15 +1,17 @@
 from typing import Callable
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import pytest
 
 from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP, TimeSeriesDataFrame
+from autogluon.timeseries.utils import forecast as forecast_utils
 from autogluon.timeseries.utils.datetime import get_lags_for_frequency, get_time_features_for_frequency, norm_freq_str
 from autogluon.timeseries.utils.datetime.seasonality import DEFAULT_SEASONALITIES
 from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe
 
-from .common import ALL_PANDAS_FREQUENCIES, to_supported_pandas_freq
+from .common import ALL_PANDAS_FREQUENCIES, get_data_frame_with_item_index, to_supported_pandas_freq
 
 
 @pytest.mark.parametrize("freq", ["D", "W", "ME", "QE", "YE", "h", "min", "s", "30min", "2h", "17s"])
@@ -37,6 +39,59 @@ def test_when_start_times_dont_match_freq_then_forecast_timestamps_are_correct(f
             assert timestamp == ts_dataframe.loc[item_id].index[-1] + (i + 1) * offset
 
 
+@pytest.mark.parametrize("freq", ["D", "h", "17s", "ME", "B"])
+def test_when_items_are_not_contiguous_then_forecast_horizon_index_matches_contiguous_data(freq):
+    freq = to_supported_pandas_freq(freq)
+    dfs = []
+    for item_id, length in {"B": 14, "A": 12, "1": 7}.items():
+        timestamps = pd.date_range(start="2020-01-05 12:05:01", periods=length, freq=freq)
+        dfs.append(pd.DataFrame({ITEMID: item_id, TIMESTAMP: timestamps, "target": np.random.rand(length)}))
+    df = pd.concat(dfs)
+    ts_dataframe = TimeSeriesDataFrame(df)
+    interleaved_ts_dataframe = TimeSeriesDataFrame(df.sort_values(TIMESTAMP, kind="stable"))
+    assert interleaved_ts_dataframe._get_packed_index() is None
+
+    prediction_index = get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=4, freq=freq)
+    interleaved_prediction_index = get_forecast_horizon_index_ts_dataframe(
+        interleaved_ts_dataframe, prediction_length=4, freq=freq
+    )
+    assert prediction_index.equals(
+        interleaved_prediction_index.to_frame(index=False)
+        .set_index(ITEMID)
+        .loc[ts_dataframe.item_ids]
+        .set_index(TIMESTAMP, append=True)
+        .index
+    )
+
+
+def test_when_forecast_horizon_index_computed_multiple_times_then_cached_result_is_reused():
+    ts_dataframe = TimeSeriesDataFrame(get_data_frame_with_item_index(["B", "A", "C"], data_length=10, freq="h"))
+    with mock.patch(
+        "autogluon.timeseries.utils.forecast._compute_forecast_horizon_index",
+        wraps=forecast_utils._compute_forecast_horizon_index,
+    ) as compute_index:
+        first = get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3)
+        second = get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3)
+        assert compute_index.call_count == 1
+        assert first.equals(second)
+
+        get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=5)
+        get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3, freq="2h")
+        assert compute_index.call_count == 3
+
+        ts_dataframe.index = ts_dataframe.index.set_levels(ts_dataframe.index.levels[1] + pd.Timedelta("1h"), level=1)
+        shifted = get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3)
+        assert compute_index.call_count == 4
+        assert (shifted.get_level_values(TIMESTAMP) == first.get_level_values(TIMESTAMP) + pd.Timedelta("1h")).all()
+
+
+def test_when_names_of_forecast_horizon_index_modified_then_cached_index_is_not_modified():
+    ts_dataframe = TimeSeriesDataFrame(get_data_frame_with_item_index(["B", "A", "C"], data_length=10, freq="h"))
+    prediction_index = get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3)
+    prediction_index.names = ["foo", "bar"]
+    assert get_forecast_horizon_index_ts_dataframe(ts_dataframe, prediction_length=3).names == [ITEMID, TIMESTAMP]
+
+
 @pytest.mark.parametrize("freq", ALL_PANDAS_FREQUENCIES)
 @pytest.mark.parametrize("multiplier", ["", 1, 3])
 def test_when_computing_seasonality_then_all_pandas_frequencies_are_supported(freq, multiplier):
@@ -60,3 +115,15 @@ def test_when_computing_time_features_then_all_pandas_frequencies_are_supported(
     freq_str = f"{multiplier}{freq}"
     time_features = get_time_features_for_frequency(freq_str)
     assert all(isinstance(f, Callable) for f in time_features)
+
+
+@pytest.mark.parametrize("shape, axis", [((5, 7, 3), 1), ((4, 1), -1), ((3, 2, 100), -1), ((10,), 0)])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_when_quantiles_computed_from_samples_then_result_matches_numpy(shape, axis, dtype):
+    samples = np.random.normal(size=shape).astype(dtype)
+    samples.flat[0] = np.nan
+    quantile_levels = [0.0, 0.01, 0.1, 0.5, 0.75, 0.99, 1.0]
+    result = forecast_utils.get_quantiles_from_samples(samples, quantile_levels, axis=axis)
+    expected = np.quantile(samples, quantile_levels, axis=axis)
+    assert result.dtype == expected.dtype
+    assert np.array_equal(result, expected, equal_nan=True)